@@ -1,17 +1,25 @@
 import logging
 import os
 from functools import lru_cache
-from typing import Any, TypeVar
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+
+import budget
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+# Whether the provider keeps previous responses so a follow-up can pass previous_response_id
+# instead of re-sending the conversation. OpenRouter's Responses API is stateless, so off by default.
+STATEFUL_RESPONSES = os.environ.get("LLM_STATEFUL_RESPONSES") == "1"
 
 # Prices per million tokens
 MODEL_PRICES: dict[str, dict[str, float]] = {
@@ -30,9 +38,26 @@ MODEL_PRICES: dict[str, dict[str, float]] = {
 T = TypeVar("T", bound=BaseModel)
 
 
+class OutputValidationError(ValueError):
+    """Structured output that failed validation, with what a follow-up correction needs.
+
+    output_text is the model's raw answer, response_id the provider response id (None if
+    unknown) and cost the USD already spent on the call.
+    """
+
+    def __init__(self, error: Exception, output_text: str, response_id: str | None, cost: float):
+        super().__init__(str(error))
+        self.error = error
+        self.output_text = output_text
+        self.response_id = response_id
+        self.cost = cost
+
+
 @lru_cache
-def _get_client() -> AsyncOpenAI:
-    """Get cached AsyncOpenAI client configured for OpenRouter."""
+def _get_client() -> "AsyncOpenAI":
+    """Get cached AsyncOpenAI client configured for OpenRouter. The SDK is imported on first use."""
+    from openai import AsyncOpenAI
+
     api_key = os.environ.get("OPEN_ROUTER_API_KEY")
     if not api_key:
         raise ValueError("OPEN_ROUTER_API_KEY not found in environment")
@@ -85,6 +110,7 @@ def _log_usage(response) -> float:
     if output_details:
         reasoning_tokens = getattr(output_details, "reasoning_tokens", 0) or 0
 
+    budget.record_usage(input_tokens or 0, output_tokens or 0, reasoning_tokens)
     single_total = _cost_from_response(response)
     million_cost = single_total * 1_000_000
 
@@ -98,6 +124,41 @@ def _log_usage(response) -> float:
     return single_total
 
 
+def _failed_response(payload: dict) -> SimpleNamespace:
+    """Id, model, answer text and usage of a raw Responses payload whose output failed validation.
+
+    Read straight from the JSON rather than Response.model_validate, which is stricter than the
+    SDK's own parsing: a payload missing an optional field would otherwise lose the answer and its cost.
+    """
+    usage = payload.get("usage")
+    if isinstance(usage, dict):
+        details = usage.get("output_tokens_details") or {}
+        usage = SimpleNamespace(
+            input_tokens=usage.get("input_tokens") or 0,
+            output_tokens=usage.get("output_tokens") or 0,
+            output_tokens_details=SimpleNamespace(reasoning_tokens=details.get("reasoning_tokens") or 0),
+        )
+    else:
+        usage = None
+    text = "".join(
+        part.get("text") or ""
+        for item in payload.get("output") or []
+        if isinstance(item, dict) and item.get("type") == "message"
+        for part in item.get("content") or []
+        if isinstance(part, dict) and part.get("type") == "output_text"
+    )
+    return SimpleNamespace(id=payload.get("id"), model=payload.get("model", "unknown"), output_text=text, usage=usage)
+
+
+def estimate_call_cost(model: str, input: str | list, text_format: type | None = None) -> float:
+    """Pre-call USD estimate from prompt size and the expected output size for text_format."""
+    prices = MODEL_PRICES.get(model, {"input": 0, "output": 0})
+    input_tokens = budget.prompt_chars(input) // budget.CHARS_PER_TOKEN
+    name = text_format.__name__ if text_format is not None else None
+    output_tokens = budget.EXPECTED_OUTPUT_TOKENS.get(name, budget.DEFAULT_OUTPUT_TOKENS)
+    return budget.estimate_cost(prices, input_tokens, output_tokens)
+
+
 async def responses(
     model: str,
     input: str | list,
@@ -107,18 +168,52 @@ async def responses(
     """
     Call OpenRouter responses API with automatic token usage logging.
 
+    If a run-level budget.CostGovernor is active, an estimate is reserved before the call
+    (raising budget.BudgetExceeded if it does not fit) and settled to the actual cost after.
+    If the call fails, the estimate is charged since the real cost is unknown; an output that
+    fails validation (OutputValidationError) is charged its actual cost.
+
     Returns (parsed_result_or_response, cost_usd).
     OpenAI Responses API: https://platform.openai.com/docs/api-reference/responses
     """
+    governor = budget.current_governor()
+    if governor is None:
+        return await _responses(model, input, text_format, **kwargs)
+    reservation = governor.reserve(estimate_call_cost(model, input, text_format))
+    try:
+        result, cost = await _responses(model, input, text_format, **kwargs)
+    except OutputValidationError as e:
+        governor.settle(reservation, e.cost)
+        raise
+    except BaseException:
+        governor.settle(reservation, reservation.amount)
+        raise
+    governor.settle(reservation, cost)
+    return (result, cost)
+
+
+async def _responses(
+    model: str,
+    input: str | list,
+    text_format: type[T] | None = None,
+    **kwargs,
+) -> tuple[T | Any, float]:
     client = _get_client()
 
     if text_format is not None:
-        response = await client.responses.parse(
+        # Raw response first so an output that fails validation keeps its id, text and usage.
+        raw = await client.responses.with_raw_response.parse(
             model=model,
             input=input,
             text_format=text_format,
             **kwargs,
         )
+        try:
+            response = raw.parse()
+        except ValidationError as e:
+            failed = _failed_response(raw.http_response.json())
+            cost = _log_usage(failed)
+            raise OutputValidationError(e, failed.output_text, failed.id, cost) from e
         cost = _log_usage(response)
         return (response.output_parsed, cost)
     else:
@@ -1,5 +1,38 @@
-"""Run the FastAPI server. The app is defined in the api package so uvicorn can resolve api:app."""
+"""Run the FastAPI server. The app is defined in the api package so uvicorn can resolve api:app.
+
+Development (default): single process with auto-reload, reading data/data_out.csv.
+Production (--serve): N workers that all memory-map the same immutable catalog snapshot
+(see snapshot.py), so adding workers does not add a parsed copy of the catalog each.
+"""
+import argparse
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
+    parser = argparse.ArgumentParser(description="Run the PDP Extraction API.")
+    parser.add_argument("--serve", action="store_true", help="Production mode: multiple workers, no reload, shared catalog snapshot")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes in --serve mode (default: CPU count)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    if args.serve:
+        import snapshot
+        from api.routers.products import DATA_CSV, _load_products
+        from facets import catalog_version
+
+        # Publish a snapshot for the current CSV if ingest has not already done so.
+        version = catalog_version(DATA_CSV)
+        current = snapshot.current_path()
+        try:
+            stale = current is None or snapshot.Snapshot(current).version != version
+        except ValueError:  # written by an older snapshot format
+            stale = True
+        if stale:
+            snapshot.build_snapshot(_load_products(), version)
+        # Inherited by the worker processes uvicorn spawns.
+        os.environ["CATALOG_SNAPSHOT"] = "1"
+        uvicorn.run("api:app", host=args.host, port=args.port, workers=args.workers)
+    else:
+        uvicorn.run("api:app", host=args.host, port=args.port, reload=True)
@@ -1,9 +1,4 @@
-import asyncio
-
-from fastapi import APIRouter, HTTPException
-from bs4 import BeautifulSoup, Comment
-from pydantic import ValidationError as PydanticValidationError
-import logging
+from fastapi import APIRouter
 
 router = APIRouter()
 
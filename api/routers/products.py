@@ -1,15 +1,37 @@
 import csv
+import gzip
+import hashlib
+import json
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+
+import facets
+from catalog import CompactCatalog
+from snapshot import CURRENT_NAME, SNAPSHOT_DIR, Snapshot, current_path as current_snapshot_path
+
+if TYPE_CHECKING:
+    from similar import SimilarityIndex
 
 router = APIRouter()
 
-DATA_CSV = Path(__file__).resolve().parent.parent.parent / "data" / "data_out.csv"
+# CATALOG_CSV points the API at another catalog file (e.g. the synthetic one from scripts.load_test).
+DATA_CSV = Path(
+    os.environ.get("CATALOG_CSV") or Path(__file__).resolve().parent.parent.parent / "data" / "data_out.csv"
+)
+# Bodies at least this large are also kept gzip-compressed for clients that accept it.
+GZIP_MIN_BYTES = 1024
+# Cap on cached payloads per catalog version, since filter values come from the client.
+PAYLOAD_CACHE_MAX = 4096
+SIMILAR_MAX_K = 50
+# Set by `api.py --serve`: workers serve the shared mmap snapshot instead of parsing data_out.csv.
+SNAPSHOT_MODE = os.environ.get("CATALOG_SNAPSHOT") == "1"
 
 
 def _load_products() -> list[dict]:
-    """Load products from data_out.csv. Returns list of dicts with string values."""
+    """Load raw rows from data_out.csv as dicts of strings (the API itself serves catalog.CompactCatalog)."""
     if not DATA_CSV.exists():
         return []
     with open(DATA_CSV, newline="", encoding="utf-8") as f:
@@ -29,20 +51,280 @@ def _load_products() -> list[dict]:
     return products
 
 
+class _Payload:
+    """Pre-serialized JSON body with its strong ETag and optional gzip variant.
+
+    With a known tag, body may be a zero-argument callable so a 304 never builds it.
+    """
+
+    __slots__ = ("_body", "etag", "gzip_body", "gzip_etag")
+
+    def __init__(
+        self,
+        body: bytes | memoryview | Callable[[], bytes],
+        tag: str | None = None,
+        gzip_body: bytes | memoryview | None = None,
+        compress: bool = True,
+    ):
+        self._body = body
+        tag = tag or hashlib.sha256(body).hexdigest()[:32]
+        self.etag = f'"{tag}"'
+        if gzip_body is None and compress and not callable(body) and len(body) >= GZIP_MIN_BYTES:
+            gzip_body = gzip.compress(body, compresslevel=6, mtime=0)
+        self.gzip_body = gzip_body
+        self.gzip_etag = f'"{tag}-gzip"' if gzip_body is not None else None
+
+    @property
+    def body(self) -> bytes | memoryview:
+        return self._body() if callable(self._body) else self._body
+
+    @classmethod
+    def from_obj(cls, obj: dict) -> "_Payload":
+        return cls(json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+class _BaseCatalog:
+    """Shared payload cache and derived indexes for one catalog version."""
+
+    def __init__(self, version: tuple):
+        self.version = version
+        self.payloads: dict[tuple, _Payload] = {}
+        self._facet_cells: list[list] | None = None
+        self._similarity: "SimilarityIndex | None" = None
+
+    def rows(self):
+        """All products as dicts (only used to rebuild derived indexes)."""
+        raise NotImplementedError
+
+    @property
+    def facet_cells(self) -> list[list]:
+        """Facet cube written at ingest time; rebuilt once from the loaded rows if missing or stale."""
+        if self._facet_cells is None:
+            cells = facets.load_cube(self.version)
+            self._facet_cells = cells if cells is not None else facets.build_cube(self.rows())
+        return self._facet_cells
+
+    @property
+    def similarity(self) -> "SimilarityIndex":
+        """Similar-products index kept current at ingest time; built once from the loaded rows if missing or stale."""
+        if self._similarity is None:
+            # NumPy is only needed once someone asks for similar products.
+            from similar import SimilarityIndex
+
+            # Mapped read-only: every worker shares the arrays written at ingest time.
+            loaded = SimilarityIndex.load(mmap=True)
+            if loaded is not None and loaded[1] == self.version:
+                self._similarity = loaded[0]
+            else:
+                self._similarity = SimilarityIndex.build(self.rows())
+        return self._similarity
+
+    def cached(self, key: tuple, build) -> _Payload:
+        """Payload for key, made by build() on first use and kept while the cache has room."""
+        payload = self.payloads.get(key)
+        if payload is not None:
+            return payload
+        payload = build()
+        if len(self.payloads) < PAYLOAD_CACHE_MAX:
+            self.payloads[key] = payload
+        return payload
+
+    def payload(self, key: tuple, build) -> _Payload:
+        """Cached payload serialized from the object build() returns."""
+        return self.cached(key, lambda: _Payload.from_obj(build()))
+
+
+class _Catalog(_BaseCatalog):
+    """Typed, compact in-memory copy of one version of data_out.csv (see catalog.CompactCatalog)."""
+
+    def __init__(self, version: tuple, compact: CompactCatalog):
+        super().__init__(version)
+        self.compact = compact
+
+    def rows(self):
+        return self.compact.iter_rows()
+
+    def get(self, filename: str) -> dict | None:
+        i = self.compact.find(filename)
+        return json.loads(self.compact.record(i)) if i is not None else None
+
+    def list_payload(self, brand: str | None) -> _Payload:
+        if brand is None:
+            # The full listing body already exists; only its ETag and gzip variant are computed (once).
+            return self.cached(("list", None), lambda: _Payload(self.compact.list_body()))
+        return self.cached(
+            ("list", brand),
+            lambda: _Payload(b'{"products":[' + b",".join(self.compact.brand_records(brand)) + b"]}"),
+        )
+
+    def product_payload(self, filename: str) -> _Payload | None:
+        i = self.compact.find(filename)
+        if i is None:
+            return None
+        return self.cached(("product", filename), lambda: _Payload(b'{"product":' + self.compact.record(i) + b"}"))
+
+
+class _SnapshotCatalog(_BaseCatalog):
+    """Catalog served straight from a shared memory-mapped snapshot (production workers)."""
+
+    def __init__(self, snap: Snapshot):
+        super().__init__(snap.version)
+        self.snap = snap
+
+    def rows(self):
+        return self.snap.iter_rows()
+
+    def get(self, filename: str) -> dict | None:
+        i = self.snap.find(filename)
+        return json.loads(self.snap.record(i)) if i is not None else None
+
+    def list_payload(self, brand: str | None) -> _Payload:
+        if brand is None:
+            # Built once per snapshot from memoryviews into the mapping: nothing is copied into the worker.
+            return self.cached(
+                ("list", None),
+                lambda: _Payload(self.snap.list_body(), tag=self.snap.digest, gzip_body=self.snap.list_gzip_body()),
+            )
+        return self.cached(
+            ("list", brand),
+            lambda: _Payload(b'{"products":[' + b",".join(self.snap.brand_records(brand)) + b"]}"),
+        )
+
+    def product_payload(self, filename: str) -> _Payload | None:
+        i = self.snap.find(filename)
+        if i is None:
+            return None
+        return _Payload(lambda: b'{"product":' + self.snap.record(i) + b"}", tag=f"{self.snap.digest}-{i}", compress=False)
+
+
+_catalog: _BaseCatalog | None = None
+_snapshot_pointer: int | None = None
+
+
+def _catalog_version() -> tuple:
+    """Catalog version from data_out.csv's mtime and size; changes whenever the file is rewritten."""
+    return facets.catalog_version(DATA_CSV)
+
+
+def _get_snapshot_catalog() -> _BaseCatalog:
+    """Catalog backed by the published snapshot, re-mapped when CURRENT is swapped."""
+    global _catalog, _snapshot_pointer
+    try:
+        pointer = (SNAPSHOT_DIR / CURRENT_NAME).stat().st_mtime_ns
+    except FileNotFoundError:
+        pointer = None
+    if _catalog is None or pointer != _snapshot_pointer:
+        path = current_snapshot_path()
+        if path is None:
+            raise HTTPException(status_code=503, detail="No catalog snapshot published")
+        try:
+            snap = Snapshot(path)
+        except ValueError:
+            raise HTTPException(status_code=503, detail="Catalog snapshot has an outdated format; rebuild it")
+        # The previous mapping is released once the last reference to the old catalog goes away.
+        _catalog = _SnapshotCatalog(snap)
+        _snapshot_pointer = pointer
+    return _catalog
+
+
+def _get_catalog() -> _BaseCatalog:
+    """Current catalog, reloading data_out.csv only when its version changed."""
+    global _catalog
+    if SNAPSHOT_MODE:
+        return _get_snapshot_catalog()
+    version = _catalog_version()
+    if _catalog is None or _catalog.version != version:
+        _catalog = _Catalog(version, CompactCatalog.load(DATA_CSV))
+    return _catalog
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip: listed (or matched by "*") with a non-zero q-value."""
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qualities[coding.strip().lower()] = q
+    q = qualities.get("gzip", qualities.get("x-gzip", qualities.get("*", 0.0)))
+    return q > 0
+
+
+def _etag_tags(if_none_match: str) -> set[str]:
+    """Entity tags of an If-None-Match header, weak prefixes dropped (If-None-Match compares weakly)."""
+    tags = set()
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        tags.add(tag[2:] if tag[:2] in ("W/", "w/") else tag)
+    return tags
+
+
+def _respond(request: Request, payload: _Payload) -> Response:
+    """Serve a payload: 304 if If-None-Match matches, gzip if accepted and available, else the plain bytes."""
+    accepts_gzip = payload.gzip_body is not None and _accepts_gzip(request.headers.get("accept-encoding", ""))
+    etag = payload.gzip_etag if accepts_gzip else payload.etag
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = _etag_tags(if_none_match)
+        if "*" in tags or payload.etag in tags or (payload.gzip_etag and payload.gzip_etag in tags):
+            return Response(status_code=304, headers=headers)
+
+    if accepts_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=payload.gzip_body, media_type="application/json", headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
+
+
 @router.get("/products")
-async def list_products(brand: str | None = None):
+async def list_products(request: Request, brand: str | None = None):
     """List all products, optionally filtered by brand."""
-    products = _load_products()
-    if brand is not None:
-        products = [p for p in products if p.get("brand") == brand]
-    return {"products": products}
+    return _respond(request, _get_catalog().list_payload(brand))
+
+
+@router.get("/facets")
+async def get_facets(
+    request: Request,
+    brand: str | None = None,
+    category: str | None = None,
+    price: str | None = None,
+):
+    """Product counts by brand, category path level and price bucket, optionally filtered.
+
+    category matches by path prefix; price is a bucket label such as "25-50" or "1000+".
+    """
+    catalog = _get_catalog()
+    key = ("facets", brand, category, price)
+    return _respond(request, catalog.payload(key, lambda: facets.facet_counts(catalog.facet_cells, brand, category, price)))
+
+
+# Registered before get_product so the catch-all {filename:path} does not swallow "/similar".
+@router.get("/products/{filename:path}/similar")
+async def similar_products(request: Request, filename: str, k: int = 10):
+    """Top-k products most similar to the given one (local TF-IDF over name, description, features, category)."""
+    catalog = _get_catalog()
+    if catalog.get(filename) is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    k = max(1, min(k, SIMILAR_MAX_K))
+
+    def build() -> dict:
+        matches = catalog.similarity.similar(filename, k)
+        return {"products": [{**catalog.get(key), "score": round(score, 4)} for key, score in matches]}
+
+    return _respond(request, catalog.payload(("similar", filename, k), build))
 
 
 @router.get("/products/{filename:path}")
-async def get_product(filename: str):
+async def get_product(request: Request, filename: str):
     """Get a single product by filename (slug)."""
-    products = _load_products()
-    for p in products:
-        if p.get("filename") == filename:
-            return {"product": p}
-    raise HTTPException(status_code=404, detail="Not found")
+    payload = _get_catalog().product_payload(filename)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    return _respond(request, payload)
@@ -0,0 +1,152 @@
+"""Run-level LLM budget shared by every call in a batch.
+
+A CostGovernor is installed for a batch with use_governor(); ai.responses then reserves an
+estimate (from prompt size and MODEL_PRICES) before each call and settles it to the actual
+cost afterwards. A call whose estimate does not fit in the remaining budget raises
+BudgetExceeded instead of being sent.
+"""
+
+import logging
+import math
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger(__name__)
+
+# Rough prompt size → token conversion for estimates (English text / HTML).
+CHARS_PER_TOKEN = 4
+# Expected output (incl. reasoning) tokens per structured-output type; DEFAULT otherwise.
+EXPECTED_OUTPUT_TOKENS = {"Category": 600, "Product": 4000, "ProductWire": 2800, "ProductDiff": 1500, "PriceRefresh": 400}
+DEFAULT_OUTPUT_TOKENS = 2000
+
+
+class BudgetExceeded(Exception):
+    """Raised when a call's estimated cost does not fit in the remaining run budget."""
+
+
+class Reservation:
+    __slots__ = ("amount",)
+
+    def __init__(self, amount: float):
+        self.amount = amount
+
+
+class CostGovernor:
+    """Tracks spent and reserved USD against a run budget. Single event loop; no locking needed."""
+
+    def __init__(self, budget_usd: float | None):
+        self.budget_usd = budget_usd  # None: unlimited (still tracks spend and estimates)
+        self.spent_usd = 0.0
+        self.reserved_usd = 0.0
+        self.calls = 0
+        self.estimated_usd = 0.0  # sum of settled estimates, to report estimate accuracy
+
+    @property
+    def remaining_usd(self) -> float:
+        if self.budget_usd is None:
+            return math.inf
+        return self.budget_usd - self.spent_usd - self.reserved_usd
+
+    def can_afford(self, estimate_usd: float) -> bool:
+        return estimate_usd <= self.remaining_usd
+
+    def reserve(self, estimate_usd: float) -> Reservation:
+        """Hold estimate_usd of the budget. Raises BudgetExceeded if it does not fit."""
+        if not self.can_afford(estimate_usd):
+            raise BudgetExceeded(
+                f"estimated ${estimate_usd:.6f} exceeds remaining ${self.remaining_usd:.6f} of ${self.budget_usd:.2f}"
+            )
+        self.reserved_usd += estimate_usd
+        return Reservation(estimate_usd)
+
+    def settle(self, reservation: Reservation, actual_usd: float) -> None:
+        """Release a reservation and charge the actual cost (also to the current page, if tracked)."""
+        self.reserved_usd -= reservation.amount
+        self.spent_usd += actual_usd
+        self.estimated_usd += reservation.amount
+        self.calls += 1
+        page = _page_spend.get()
+        if page is not None:
+            page[0] += actual_usd
+
+    def report(self) -> dict:
+        return {
+            "budget_usd": self.budget_usd,
+            "spent_usd": round(self.spent_usd, 6),
+            "remaining_usd": round(self.remaining_usd, 6) if self.budget_usd is not None else None,
+            "llm_calls": self.calls,
+            "estimated_usd": round(self.estimated_usd, 6),
+        }
+
+
+_current: ContextVar[CostGovernor | None] = ContextVar("cost_governor", default=None)
+# One-element list accumulating spend for the page being processed in this context.
+_page_spend: ContextVar[list[float] | None] = ContextVar("page_spend", default=None)
+# Token counts accumulated for the calls made in this context (see track_usage).
+_usage: ContextVar[dict[str, int] | None] = ContextVar("token_usage", default=None)
+
+
+def current_governor() -> CostGovernor | None:
+    return _current.get()
+
+
+@contextmanager
+def use_governor(governor: CostGovernor):
+    """Install governor for calls made in this context (and tasks started from it)."""
+    token = _current.set(governor)
+    try:
+        yield governor
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def track_page():
+    """Accumulate settled spend for calls made in this context. Yields a one-element list [usd]."""
+    spend = [0.0]
+    token = _page_spend.set(spend)
+    try:
+        yield spend
+    finally:
+        _page_spend.reset(token)
+
+
+@contextmanager
+def track_usage():
+    """Accumulate token usage for calls made in this context.
+
+    Yields {"calls", "input_tokens", "output_tokens", "reasoning_tokens"}, filled in by ai._log_usage.
+    """
+    usage = {"calls": 0, "input_tokens": 0, "output_tokens": 0, "reasoning_tokens": 0}
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def record_usage(input_tokens: int, output_tokens: int, reasoning_tokens: int) -> None:
+    """Add one call's token counts to the current track_usage() context, if any."""
+    usage = _usage.get()
+    if usage is None:
+        return
+    usage["calls"] += 1
+    usage["input_tokens"] += input_tokens
+    usage["output_tokens"] += output_tokens
+    usage["reasoning_tokens"] += reasoning_tokens
+
+
+def prompt_chars(input: str | list) -> int:
+    """Characters of prompt text in a string or a list of chat messages."""
+    if isinstance(input, str):
+        return len(input)
+    total = 0
+    for message in input:
+        content = message.get("content", "") if isinstance(message, dict) else ""
+        total += len(content) if isinstance(content, str) else len(str(content))
+    return total
+
+
+def estimate_cost(prices: dict[str, float], input_tokens: int, output_tokens: int) -> float:
+    """USD for the given token counts at per-million prices."""
+    return (input_tokens / 1_000_000) * prices["input"] + (output_tokens / 1_000_000) * prices["output"]
@@ -0,0 +1,165 @@
+"""Compact, typed in-memory catalog for the API.
+
+data_out.csv keeps every cell as a string: prices as text, key_features / image_urls /
+colors pipe-joined and variants as a JSON string. Loading it as one dict per row costs a
+hash table plus a str object per cell for every product. It also leaves every client to
+split and parse the same cells again.
+
+Each CSV row is parsed once at load time into its typed JSON shape (typed_row). Instead of
+row objects, CompactCatalog keeps column arrays: filename, interned brand and category, and
+price in a float array. Every typed product is pre-serialized into one contiguous
+/api/products body and addressed by offset and length, so responses are slices of it with
+no per-request conversion. The mmap snapshot (snapshot.py) stores the same typed records.
+
+Typed shape served by the API:
+
+  {"filename", "name", "brand", "category", "price": float | null, "currency",
+   "compare_at_price": float | null, "description", "key_features": [str],
+   "image_urls": [str], "video_url": str | null, "colors": [str],
+   "variants": [{"title", "options": [{"value", "available", "price"}]}]}
+"""
+
+import csv
+import json
+import math
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+
+LIST_SEPARATOR = "|"
+LIST_PREFIX = b'{"products":['
+LIST_SUFFIX = b"]}"
+
+
+def _float(cell) -> float | None:
+    if cell is None or cell == "":
+        return None
+    try:
+        value = float(cell)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(value) else value
+
+
+def _split(cell) -> list[str]:
+    if not cell:
+        return []
+    if not isinstance(cell, str):  # already a list (typed row)
+        return [str(x) for x in cell if x]
+    return [x for x in cell.split(LIST_SEPARATOR) if x]
+
+
+def _variants(cell) -> list[dict]:
+    if not cell:
+        return []
+    if isinstance(cell, str):
+        try:
+            cell = json.loads(cell)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(cell, list):
+        return []
+    return [
+        {
+            "title": str(v.get("title", "")),
+            "options": [
+                {"value": str(o.get("value", "")), "available": bool(o.get("available", True)), "price": _float(o.get("price"))}
+                for o in v.get("options") or [] if isinstance(o, dict)
+            ],
+        }
+        for v in cell if isinstance(v, dict)
+    ]
+
+
+def typed_row(row: dict) -> dict:
+    """The typed API shape of a data_out.csv row (an already typed row passes through unchanged)."""
+    return {
+        "filename": row.get("filename") or "",
+        "name": row.get("name") or "",
+        "brand": row.get("brand") or "",
+        "category": row.get("category") or "",
+        "price": _float(row.get("price")),
+        "currency": row.get("currency") or "",
+        "compare_at_price": _float(row.get("compare_at_price")),
+        "description": row.get("description") or "",
+        "key_features": _split(row.get("key_features")),
+        "image_urls": _split(row.get("image_urls")),
+        "video_url": row.get("video_url") or None,
+        "colors": _split(row.get("colors")),
+        "variants": _variants(row.get("variants")),
+    }
+
+
+def dumps(obj) -> bytes:
+    """Compact UTF-8 JSON, as served by the API."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class CompactCatalog:
+    """Column arrays over one contiguous, pre-serialized listing body.
+
+    The /api/products body is built once at load time; each product's typed JSON is a
+    slice of it (offsets / lengths arrays). Brand and category are interned per row,
+    prices are a float array (NaN = missing), and a single dict maps filename -> row.
+    """
+
+    __slots__ = ("filenames", "brands", "categories", "prices", "_offsets", "_lengths", "_body", "_positions")
+
+    def __init__(self, rows: Iterable[dict]):
+        self.filenames: list[str] = []
+        self.brands: list[str] = []
+        self.categories: list[str] = []
+        self.prices = array("d")
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        body = bytearray(LIST_PREFIX)
+        for row in rows:
+            typed = typed_row(row)
+            if not typed["filename"].strip():
+                continue
+            record = dumps(typed)
+            if self.filenames:
+                body.extend(b",")
+            self._offsets.append(len(body))
+            self._lengths.append(len(record))
+            body.extend(record)
+            self.filenames.append(typed["filename"])
+            self.brands.append(sys.intern(typed["brand"]))
+            self.categories.append(sys.intern(typed["category"]))
+            self.prices.append(math.nan if typed["price"] is None else typed["price"])
+        body.extend(LIST_SUFFIX)
+        self._body = bytes(body)
+        self._positions = {name: i for i, name in enumerate(self.filenames)}
+
+    @classmethod
+    def load(cls, path: Path) -> "CompactCatalog":
+        """Catalog of a data_out.csv file (empty if it does not exist)."""
+        if not path.exists():
+            return cls([])
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls(csv.DictReader(f))
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+    def find(self, filename: str) -> int | None:
+        return self._positions.get(filename)
+
+    def record(self, i: int) -> bytes:
+        """Typed JSON object of row i."""
+        offset = self._offsets[i]
+        return self._body[offset:offset + self._lengths[i]]
+
+    def list_body(self) -> bytes:
+        """The full {"products": [...]} body, in catalog order."""
+        return self._body
+
+    def brand_records(self, brand: str) -> list[bytes]:
+        """Typed JSON objects of the rows whose brand matches exactly, in catalog order."""
+        return [self.record(i) for i, b in enumerate(self.brands) if b == brand]
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Decoded typed rows (for building derived indexes when they are missing)."""
+        for i in range(len(self.filenames)):
+            yield json.loads(self.record(i))
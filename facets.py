@@ -0,0 +1,119 @@
+"""Precomputed facet aggregates over brand, category path and price bucket.
+
+At ingest time the catalog is reduced to a cube of (brand, category, price_bucket) -> count
+cells and written to data/facets.json next to data_out.csv. Facet queries then sum
+over the cube cells, whose number is bounded by distinct combinations rather than rows.
+"""
+
+import json
+import math
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Iterable
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+FACETS_PATH = DATA_DIR / "facets.json"
+
+# Upper bounds of the price buckets; the last bucket is open-ended.
+PRICE_EDGES = [25, 50, 100, 200, 500, 1000]
+UNKNOWN_BUCKET = "unknown"
+CATEGORY_SEPARATOR = " > "
+
+
+def catalog_version(path: Path) -> tuple[int, int]:
+    """(mtime_ns, size) of a catalog file; (0, 0) if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def price_bucket(price) -> str:
+    """Bucket label for a price, e.g. "25-50" or "1000+"; "unknown" if missing or unparsable."""
+    try:
+        value = float(price)
+    except (TypeError, ValueError):
+        return UNKNOWN_BUCKET
+    if math.isnan(value):
+        return UNKNOWN_BUCKET
+    low = 0
+    for edge in PRICE_EDGES:
+        if value < edge:
+            return f"{low}-{edge}"
+        low = edge
+    return f"{low}+"
+
+
+def price_bucket_labels() -> list[str]:
+    """All bucket labels in ascending order."""
+    lows = [0] + PRICE_EDGES[:-1]
+    return [f"{lo}-{hi}" for lo, hi in zip(lows, PRICE_EDGES)] + [f"{PRICE_EDGES[-1]}+", UNKNOWN_BUCKET]
+
+
+def build_cube(rows: Iterable[dict]) -> list[list]:
+    """Reduce catalog rows to [brand, category, price_bucket, count] cells."""
+    counts = Counter(
+        (row.get("brand") or "", row.get("category") or "", price_bucket(row.get("price")))
+        for row in rows
+    )
+    return [[brand, category, bucket, n] for (brand, category, bucket), n in sorted(counts.items())]
+
+
+def write_facets(rows: Iterable[dict], version: tuple[int, int], path: Path = FACETS_PATH) -> None:
+    """Build the cube and write it atomically, tagged with the catalog version it was built from."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": list(version), "cells": build_cube(rows)}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_cube(version: tuple[int, int], path: Path = FACETS_PATH) -> list[list] | None:
+    """Cube cells if the facets file exists and matches the catalog version, else None."""
+    if not path.exists():
+        return None
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if tuple(data.get("version", ())) != tuple(version):
+        return None
+    return data["cells"]
+
+
+def facet_counts(
+    cells: list[list],
+    brand: str | None = None,
+    category: str | None = None,
+    price_bucket: str | None = None,
+) -> dict:
+    """Counts by brand, by each category path level and by price bucket for cells matching the filters.
+
+    category filters by path prefix ("Apparel & Accessories" matches all of its subcategories).
+    """
+    by_brand: Counter = Counter()
+    by_level: dict[int, Counter] = {}
+    by_price: Counter = Counter()
+    total = 0
+    for cell_brand, cell_category, cell_bucket, n in cells:
+        if brand is not None and cell_brand != brand:
+            continue
+        if category is not None and not (
+            cell_category == category or cell_category.startswith(category + CATEGORY_SEPARATOR)
+        ):
+            continue
+        if price_bucket is not None and cell_bucket != price_bucket:
+            continue
+        total += n
+        by_brand[cell_brand] += n
+        by_price[cell_bucket] += n
+        parts = cell_category.split(CATEGORY_SEPARATOR) if cell_category else []
+        for depth in range(1, len(parts) + 1):
+            by_level.setdefault(depth, Counter())[CATEGORY_SEPARATOR.join(parts[:depth])] += n
+    return {
+        "total": total,
+        "brand": dict(by_brand.most_common()),
+        "category": {str(depth): dict(c.most_common()) for depth, c in sorted(by_level.items())},
+        "price": {label: by_price[label] for label in price_bucket_labels() if by_price[label]},
+    }
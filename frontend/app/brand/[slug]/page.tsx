@@ -5,13 +5,14 @@ import { useParams } from "next/navigation";
 import { useEffect, useState } from "react";
 import { ProductListSkeleton } from "@/components/ProductListSkeleton";
 import { VirtualizedProductList } from "@/components/VirtualizedProductList";
-import { productsUrl } from "@/lib/api";
-import type { Product } from "@/lib/types";
+import { facetsUrl, productsUrl } from "@/lib/api";
+import type { Facets, Product } from "@/lib/types";
 
 export default function BrandPage() {
   const params = useParams();
   const slug = params.slug as string;
   const [products, setProducts] = useState<Product[]>([]);
+  const [facets, setFacets] = useState<Facets | null>(null);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [listHeight, setListHeight] = useState(600);
@@ -44,6 +45,11 @@ export default function BrandPage() {
       .finally(() => {
         setLoading(false);
       });
+    // Counts come precomputed from /api/facets; the summary is optional, so failures are ignored.
+    fetch(facetsUrl({ brand }))
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data: Facets | null) => setFacets(data))
+      .catch(() => setFacets(null));
   }, [slug]);
 
   const brandName = slug ? decodeURIComponent(slug) : "";
@@ -52,9 +58,28 @@ export default function BrandPage() {
     <div className="min-h-screen bg-background font-sans">
       <main className="mx-auto max-w-5xl px-4 py-12">
        
-        <h1 className="mb-8 text-4xl font-semibold tracking-tight text-foreground">
+        <h1 className="mb-2 text-4xl font-semibold tracking-tight text-foreground">
           {brandName}
         </h1>
+        <div className="mb-8 space-y-1 text-sm text-muted-foreground">
+          {facets && facets.total > 0 && (
+            <>
+              <p>
+                {facets.total} {facets.total === 1 ? "product" : "products"}
+              </p>
+              <p>
+                {Object.entries(facets.category["1"] ?? {})
+                  .map(([name, n]) => `${name} (${n})`)
+                  .join(" · ")}
+              </p>
+              <p>
+                {Object.entries(facets.price)
+                  .map(([bucket, n]) => `${bucket} (${n})`)
+                  .join(" · ")}
+              </p>
+            </>
+          )}
+        </div>
         {loading && <ProductListSkeleton />}
         {error && (
           <p className="text-destructive">{error}</p>
@@ -3,31 +3,16 @@
 import { ChevronLeft, ChevronRight } from "lucide-react";
 import Image from "next/image";
 import Link from "next/link";
-import { useState, useMemo } from "react";
-import type { Product, ProductVariant } from "@/lib/types";
+import { useState } from "react";
+import type { Product } from "@/lib/types";
 
 export function ProductCard({ product }: { product: Product }) {
-  const imageUrls = product.image_urls
-    ? product.image_urls.split("|").filter(Boolean)
-    : [];
+  const imageUrls = product.image_urls ?? [];
   const [currentIndex, setCurrentIndex] = useState(0);
-  const features = product.key_features
-    ? product.key_features.split("|").filter(Boolean)
-    : [];
-  const colorOptions = product.colors
-    ? product.colors.split("|").filter(Boolean)
-    : [];
+  const features = product.key_features ?? [];
+  const colorOptions = product.colors ?? [];
   const brandSlug = encodeURIComponent(product.brand);
-
-  const variants: ProductVariant[] = useMemo(() => {
-    if (!product.variants?.trim()) return [];
-    try {
-      const parsed = JSON.parse(product.variants) as ProductVariant[];
-      return Array.isArray(parsed) ? parsed : [];
-    } catch {
-      return [];
-    }
-  }, [product.variants]);
+  const variants = product.variants ?? [];
 
   const goPrev = () =>
     setCurrentIndex((i) => (i <= 0 ? imageUrls.length - 1 : i - 1));
@@ -112,7 +97,7 @@ export function ProductCard({ product }: { product: Product }) {
               {product.name}
             </h1>
             <div className="mt-2 flex flex-wrap items-baseline gap-2">
-              {product.compare_at_price && Number(product.compare_at_price) > 0 && (
+              {product.compare_at_price != null && product.compare_at_price > 0 && (
                 <span className="text-md text-muted-foreground line-through">
                   {product.currency} {product.compare_at_price}
                 </span>
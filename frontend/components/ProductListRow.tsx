@@ -17,10 +17,7 @@ export function ProductListRow({
   product: Product;
   className?: string;
 }) {
-  const imageUrls = product.image_urls
-    ? product.image_urls.split("|").filter(Boolean)
-    : [];
-  const firstImage = imageUrls[0];
+  const firstImage = product.image_urls?.[0];
   const productSlug = encodeURIComponent(product.filename);
   const brandSlug = encodeURIComponent(product.brand);
 
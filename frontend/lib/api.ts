@@ -12,3 +12,12 @@ export function productsUrl(brand?: string): string {
 export function productBySlugUrl(slug: string): string {
   return `${API_BASE_URL}/api/products/${encodeURIComponent(slug)}`;
 }
+
+export function facetsUrl(filters?: { brand?: string; category?: string; price?: string }): string {
+  const params = new URLSearchParams();
+  if (filters?.brand) params.set("brand", filters.brand);
+  if (filters?.category) params.set("category", filters.category);
+  if (filters?.price) params.set("price", filters.price);
+  const query = params.toString();
+  return `${API_BASE_URL}/api/facets${query ? `?${query}` : ""}`;
+}
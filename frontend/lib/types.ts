@@ -9,18 +9,29 @@ export type ProductVariant = {
   options: VariantOption[];
 };
 
+/** Product as served by the API: fields are typed and nested fields already parsed. */
 export type Product = {
   filename: string;
   name: string;
   brand: string;
   category: string;
-  price: string;
+  price: number | null;
   currency: string;
-  compare_at_price?: string;
+  compare_at_price: number | null;
   description: string;
-  key_features: string;
-  image_urls: string;
-  colors: string;
-  video_url: string;
-  variants?: string;
+  key_features: string[];
+  image_urls: string[];
+  colors: string[];
+  video_url: string | null;
+  variants: ProductVariant[];
+};
+
+/** GET /api/facets: product counts precomputed at ingest time, optionally filtered. */
+export type Facets = {
+  total: number;
+  brand: Record<string, number>;
+  /** Keyed by category path depth ("1", "2", ...), then by path prefix. */
+  category: Record<string, Record<string, number>>;
+  /** Keyed by price bucket label such as "25-50" or "1000+", ascending. */
+  price: Record<string, number>;
 };
@@ -1,16 +1,19 @@
-import ai
 import argparse
 import asyncio
+import json
 import logging
 import re
 from pathlib import Path
 
 from fastapi import HTTPException
-from pydantic import BaseModel
-from scripts.extract import extract
-import models
+from budget import BudgetExceeded
+from scripts.extract import MAX_RETRIES, batched_output, extract_stored
+from scripts.routing import routing_report
+from scripts.scheduler import estimate_page_cost, run_batch
+from store import HtmlStore, sync_dir
 
 DATA_DIR = Path(__file__).resolve().parent / "data"
+DEFAULT_REPORT = DATA_DIR / "run_report.json"
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -23,9 +26,20 @@ if __name__ == "__main__":
         default=None,
         help="HTML filename (e.g. nike.html). If omitted, process all .html files in data/.",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recrawl mode: for already extracted pages only refresh price and variant availability.",
+    )
+    parser.add_argument("--budget", type=float, default=None, help="Run-level LLM budget in USD (default: unlimited)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Pages extracted concurrently")
+    parser.add_argument("--priorities", type=Path, default=None, help='JSON file of {"page.html": priority}; higher runs first')
+    parser.add_argument("--report", type=Path, default=DEFAULT_REPORT, help="Where to write the run report JSON")
     args = parser.parse_args()
 
     async def run():
+        # Raw pages are read from the content-addressed store (data/store); files in data/ are synced into it first.
+        store = HtmlStore()
         # If a file is provided, process only that file.
         if args.file is not None:
             # Grab the path to the file
@@ -33,38 +47,42 @@ if __name__ == "__main__":
             # If the path is not absolute, make it absolute by appending the name of the file to the data directory (data folder)
             if not path.is_absolute():
                 path = DATA_DIR / path.name
-            # If the path does not exist, raise an error.
-            if not path.exists():
+            # If the file exists, add (or refresh) it in the store.
+            if path.exists():
+                store.add_file(path)
+                store.save()
+            # If it is neither on disk nor in the store, raise an error.
+            elif path.name not in store:
                 raise FileNotFoundError(f"File not found: {path}")
-            paths = [path]
-         # If no file is provided, process all files in the data directory.
+            names = [path.name]
+         # If no file is provided, process all pages in the store (including the data directory's files).
         else:
-            # Get all the html files in the data directory and sort them by name.
-            paths = sorted(DATA_DIR.glob("*.html"))
-            # If no files are found, log a warning and return.
-            if not paths:
-                logging.warning("No .html files found in %s", DATA_DIR)
+            sync_dir(store, DATA_DIR)
+            names = sorted(store.names)
+            # If no pages are found, log a warning and return.
+            if not names:
+                logging.warning("No .html files found in %s or the HTML store", DATA_DIR)
                 return
 
-        # Process each file in the paths list.
-        for p in paths:
-            # Log the name of the file being processed.
-            logging.info("Processing %s", p.name)
+        # Process each page in the names list.
+        # Process one page; failures are logged here and re-raised so the scheduler can count them.
+        async def process(name: str):
+            p = DATA_DIR / name
+            # Log the name of the page being processed.
+            logging.info("Processing %s", name)
             try:
-                # Read the content of the file.
-                content = p.read_text(encoding="utf-8", errors="replace")
-                # Run the extract function on the file which parses and saves the data to the data_out.csv file.
-                result = await extract(
-                    models.ExtractRequest(html_content=content),
-                    source_filename=p.name,
-                )
+                # Run the extract function on the stored page which parses and saves the data to the data_out.csv file.
+                result = await extract_stored(name, store, refresh_only=args.refresh)
                 logging.info("Result: %s", result)
                 
                 logging.info("\n\n")
                 logging.info("-" * 100)
                 logging.info("\n\n")
+                return result
 
-
+            # Run budget refusals are handled by the scheduler (it stops the run and reports).
+            except BudgetExceeded:
+                raise
             except HTTPException as e:
                 detail = e.detail if isinstance(e.detail, dict) else {}
                 validation_error = detail.get("validation_error") or str(e.detail)
@@ -82,6 +100,7 @@ if __name__ == "__main__":
                     category or "(unknown)",
                     validation_error.split("\n")[0] if validation_error else str(detail),
                 )
+                raise
             except Exception as e:
                 logging.error(
                     "Extraction failed for %s: %s",
@@ -89,5 +108,34 @@ if __name__ == "__main__":
                     e,
                     exc_info=True,
                 )
-    
+                raise
+
+        # Run all pages under the run-level budget, highest priority and cheapest expected cost first.
+        priorities = json.loads(args.priorities.read_text(encoding="utf-8")) if args.priorities else {}
+        expected_costs = {name: estimate_page_cost(store.raw_size(name)) for name in names}
+        # data_out.csv and its derived artifacts are rebuilt once for the whole run, not per page.
+        with batched_output():
+            report = await run_batch(
+                names,
+                process,
+                budget_usd=args.budget,
+                expected_costs=expected_costs,
+                priorities=priorities,
+                concurrency=args.concurrency,
+            )
+        # Cumulative routing stats: blended cost per successful page vs retrying the cheapest model alone.
+        report["model_routing"] = routing_report(MAX_RETRIES)
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logging.info(
+            "Run finished: %d ok, %d failed, %d skipped | spent $%.6f of $%s | %d LLM calls saved by near-duplicate reuse | report: %s",
+            report["pages_ok"],
+            report["pages_failed"],
+            report["pages_skipped"] + report["pages_budget_exceeded"],
+            report["spent_usd"],
+            args.budget if args.budget is not None else "unlimited",
+            report["llm_calls_saved"],
+            args.report,
+        )
+
     asyncio.run(run())
\ No newline at end of file
@@ -1,16 +1,8 @@
 from typing import Any
-from pathlib import Path
-from pydantic import BaseModel, field_validator
-
-# Load categories once at module level
-CATEGORIES_FILE = Path(__file__).parent / "categories.txt"
-VALID_CATEGORIES = set()
-if CATEGORIES_FILE.exists():
-    with open(CATEGORIES_FILE, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                VALID_CATEGORIES.add(line)
+from pydantic import BaseModel, field_validator, model_validator
+
+# Categories are parsed once into the prebuilt taxonomy artifact (see taxonomy.py)
+from taxonomy import CATEGORIES_FILE, VALID_CATEGORIES
 
 class Category(BaseModel):
     # A category from Google's Product Taxonomy
@@ -58,6 +50,131 @@ class Product(BaseModel):
     variants: list[Variant]
 
 
+# Diff-only extraction for near-duplicate pages: only fields that differ from the
+# stored product of the matching page are filled in; None means "unchanged".
+class ProductDiff(BaseModel):
+    name: str | None = None
+    price: Price | None = None
+    description: str | None = None
+    key_features: list[str] | None = None
+    image_urls: list[str] | None = None
+    video_url: str | None = None
+    brand: str | None = None
+    colors: list[str] | None = None
+    variants: list[Variant] | None = None
+
+    def apply(self, product: Product) -> Product:
+        """Return product with this diff's non-None fields replaced."""
+        changes = {k: getattr(self, k) for k in type(self).model_fields if getattr(self, k) is not None}
+        return product.model_copy(update=changes)
+
+
+# ---- Compact wire format for the product call ----
+# Output tokens cost several times input tokens, so the LLM returns short keys, no category
+# (it is fixed by the category step) and per-variant option arrays instead of one object per
+# option; availability is listed only for the exceptions. ProductWire.expand() rebuilds the
+# exact Product dict, which is then validated as a Product.
+class PriceWire(BaseModel):
+    p: float  # price
+    c: str  # currency
+    cp: float | None = None  # compare_at_price
+
+
+class VariantWire(BaseModel):
+    t: str  # title
+    v: list[str]  # option values
+    na: list[int] = []  # indexes into v of unavailable options
+    vp: list[float | None] | None = None  # per-option prices aligned with v; None if no option has its own price
+
+    @model_validator(mode="after")
+    def check_aligned(self) -> "VariantWire":
+        # Misaligned arrays cannot be expanded without losing data, so the answer is rejected (and retried).
+        if self.vp is not None and len(self.vp) != len(self.v):
+            raise ValueError(
+                f"variant '{self.t}': vp has {len(self.vp)} prices for {len(self.v)} options in v; "
+                "give one per option (null if none) or omit vp"
+            )
+        bad = [i for i in self.na if not 0 <= i < len(self.v)]
+        if bad:
+            raise ValueError(f"variant '{self.t}': na indexes {bad} are out of range for {len(self.v)} options in v")
+        return self
+
+
+class ProductWire(BaseModel):
+    n: str  # name
+    pr: PriceWire
+    d: str  # description
+    kf: list[str]  # key_features
+    img: list[str]  # image_urls
+    vid: str | None = None  # video_url
+    b: str  # brand
+    col: list[str]  # colors
+    var: list[VariantWire]  # variants
+
+    def expand(self, category_name: str) -> dict:
+        """Lossless expansion to the Product dict (category filled in from the category step).
+
+        Relies on VariantWire.check_aligned, which rejects misaligned vp and out-of-range na.
+        """
+        variants = []
+        for w in self.var:
+            prices = w.vp if w.vp is not None else [None] * len(w.v)
+            unavailable = set(w.na)
+            variants.append({
+                "title": w.t,
+                "options": [
+                    {"value": value, "available": i not in unavailable, "price": prices[i]}
+                    for i, value in enumerate(w.v)
+                ],
+            })
+        return {
+            "name": self.n,
+            "price": {"price": self.pr.p, "currency": self.pr.c, "compare_at_price": self.pr.cp},
+            "description": self.d,
+            "key_features": self.kf,
+            "image_urls": self.img,
+            "video_url": self.vid,
+            "category": {"name": category_name},
+            "brand": self.b,
+            "colors": self.col,
+            "variants": variants,
+        }
+
+    def to_product(self, category_name: str) -> Product:
+        """Expand and validate; raises pydantic.ValidationError like a direct Product parse."""
+        return Product.model_validate(self.expand(category_name))
+
+    @classmethod
+    def from_product(cls, product: Product) -> "ProductWire":
+        """Compact form of a Product (used to measure and test the round trip)."""
+        var = []
+        for v in product.variants:
+            prices = [o.price for o in v.options]
+            var.append(VariantWire(
+                t=v.title,
+                v=[o.value for o in v.options],
+                na=[i for i, o in enumerate(v.options) if not o.available],
+                vp=prices if any(p is not None for p in prices) else None,
+            ))
+        return cls(
+            n=product.name,
+            pr=PriceWire(p=product.price.price, c=product.price.currency, cp=product.price.compare_at_price),
+            d=product.description,
+            kf=product.key_features,
+            img=product.image_urls,
+            vid=product.video_url,
+            b=product.brand,
+            col=product.colors,
+            var=var,
+        )
+
+
+# Refresh mode for already extracted pages: only price and out-of-stock options.
+class PriceRefresh(BaseModel):
+    price: Price
+    unavailable: list[str] = []  # "Title=Value" of options that are currently out of stock
+
+
 class ExtractRequest(BaseModel):
     html_content: str
     
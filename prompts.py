@@ -4,7 +4,7 @@ Flow: (1) Extract category from HTML, retry until valid. (2) Extract full Produc
 from HTML using that category, retry until valid.
 """
 
-from pathlib import Path
+from taxonomy import CATEGORY_LIST_TEXT
 
 # ---- Step 1: Extract category only (Google Product Taxonomy) ----
 # Ideally we do not need to give the entire possible list of categories to the llm, but will log success rate in order to balance prompt size and success rate.
@@ -23,25 +23,9 @@ _CATEGORY_INSTRUCTION = (
     "Choose the most specific applicable category. Output only the Category object."
 )
 
-_CATEGORIES_FILE = Path(__file__).resolve().parent / "categories.txt"
-
-
-def _load_category_list() -> str:
-    """Load category lines from categories.txt, skipping comments and blanks."""
-    if not _CATEGORIES_FILE.exists():
-        return ""
-    lines = []
-    with open(_CATEGORIES_FILE, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                lines.append(line)
-    return "\n".join(lines)
-
-
 # Build system prompt once at import: instruction + full taxonomy for exact matching.
 # Large static prefix is cached by the provider to reduce per-request input cost.
-_category_list = _load_category_list()
+_category_list = CATEGORY_LIST_TEXT
 CATEGORY_SYSTEM = f"{_CATEGORY_INSTRUCTION}\n\nValid categories (use one exactly as written):\n\n{_category_list}"
 
 CATEGORY_USER = "From this HTML, extract the product category (Google Product Taxonomy). Output a Category with field name.\n\n{html}"
@@ -93,3 +77,76 @@ PRODUCT_USER = (
 )
 
 RETRY_PRODUCT_APPEND = "\n\nPrevious attempt failed: {retry_error}. Fix and output a valid Product. Keep category as: {category_name}."
+
+# ---- Retries that continue the previous exchange ----
+# On a validation failure the retry sends the model's previous answer plus the correction
+# instead of the HTML again (see scripts.extractors). With a stateful provider only the
+# correction is sent, chained via previous_response_id. Without one, the system prompt is
+# resent unchanged (a cached prefix) and CONTINUE_USER stands in for the HTML turn.
+CONTINUE_USER = "[Product page HTML from the first request; omitted on this retry.]"
+
+CONTINUE_CATEGORY = "Your previous output failed validation: {retry_error}. Output a corrected Category whose name is exactly one of the valid categories listed in the system prompt."
+
+CONTINUE_PRODUCT = "Your previous output failed validation: {retry_error}. Output the corrected Product JSON; keep category as: {category_name}."
+
+CONTINUE_PRODUCT_COMPACT = "Your previous output failed validation: {retry_error}. Output the corrected ProductWire JSON."
+
+# ---- Step 2 (compact wire format, default): same data, short keys, columnar options ----
+# Cuts output tokens: no category echo, no per-option objects, availability only for exceptions.
+# The result is expanded losslessly into Product (models.ProductWire.expand) before validation.
+PRODUCT_COMPACT_SYSTEM = """You extract product data from HTML and output a valid ProductWire (a compact Product). Prefer full-resolution image URLs when possible.
+
+Exact data model (short keys):
+
+ProductWire:
+  n: str  (name)
+  pr: PriceWire
+  d: str  (description)
+  kf: list[str]  (key features)
+  img: list[str]  (image URLs, FULL URLS)
+  vid: str | None = None  (video URL)
+  b: str  (brand)
+  col: list[str]  (colors)
+  var: list[VariantWire]  (variants)
+
+PriceWire:
+  p: float  (price)
+  c: str  (currency)
+  cp: float | None = None  (original price if the product is on sale)
+
+VariantWire:
+  t: str  (variant title, e.g. "Size")
+  v: list[str]  (option values, e.g. ["9", "9.5", "10"])
+  na: list[int] = []  (indexes into v of options that are NOT available; empty if all are available)
+  vp: list[float | None] | None = None  (option prices aligned with v, only if some option has its own price)
+
+Output only one valid ProductWire JSON that matches this schema."""
+
+PRODUCT_COMPACT_USER = "Extract product data from this HTML (product category: {category_name}).\n\n{html}"
+
+RETRY_PRODUCT_COMPACT_APPEND = "\n\nPrevious attempt failed: {retry_error}. Fix and output a valid ProductWire."
+
+# ---- Near-duplicate pages: extract only what differs from a stored product ----
+# Used when the page's MinHash fingerprint closely matches an already extracted page
+# (e.g. a color/size variant or a regional mirror). Skips the category call entirely and
+# keeps output tokens to the changed fields.
+DIFF_SYSTEM = """You compare a product page against a previously extracted Product from a near-identical page (e.g. another color, size or region of the same product).
+Output a ProductDiff: set only the fields whose values on THIS page differ from the previous Product, and leave every unchanged field null.
+Typical differences: price, colors, image_urls, variants availability, name suffixes. Never output the category.
+Field types follow the Product schema (price: {price, currency, compare_at_price}; variants: [{title, options: [{value, available, price}]}]).
+Output only one valid ProductDiff JSON."""
+
+DIFF_USER = "Previous Product (from a near-identical page):\n{previous_product}\n\nHTML of this page:\n\n{html}"
+
+RETRY_DIFF_APPEND = "\n\nPrevious attempt failed: {retry_error}. Output a valid ProductDiff with null for unchanged fields."
+
+# ---- Refresh mode: price and availability only for an already extracted page ----
+# Used on recrawls when JSON-LD does not carry an offer price. Small schema, small prompt.
+REFRESH_SYSTEM = """You refresh price and stock for a known product page. Output a PriceRefresh:
+  price: {price: float, currency: str, compare_at_price: float | null (original price if on sale)}
+  unavailable: list of the given "Title=Value" options that are currently out of stock (copy them exactly)
+Output only one valid PriceRefresh JSON."""
+
+REFRESH_USER = "Known options:\n{options}\n\nHTML:\n\n{html}"
+
+RETRY_REFRESH_APPEND = "\n\nPrevious attempt failed: {retry_error}. Output a valid PriceRefresh."
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Offline micro-benchmarks for the CPU-side hot paths, with baseline regression gates.
+
+Benchmarks (time in seconds, peak traced memory in MB):
+- filter_html:        scripts.extract.filter_html on every data/*.html (page already parsed).
+- product_validate:   models.Product.model_validate over N synthetic product dicts.
+- product_to_csv_row: scripts.extract._product_to_csv_row over N validated products.
+- load_products:      api.routers.products._load_products on an N-row data_out.csv.
+- load_catalog:       catalog.CompactCatalog.load (typed in-memory catalog the API serves) on the same file.
+- upsert_row:         scripts.extract._upsert_row of one product into an N-row catalog
+                      (CSV rewrite + facets + similarity index + snapshot + columnar partition).
+
+Synthetic catalogs (1k / 100k / 1M rows by default) are generated with the seeded
+scripts.load_test generator. Everything runs in a throwaway copy of the project so ingest
+side effects (data/*.json, snapshots, indexes) never touch the real data/ directory. Each
+benchmark runs in its own process with ai.responses replaced by a stub that raises, so no
+LLM call or network access can happen.
+
+Time is the median of --repeat runs; memory is the tracemalloc peak of one extra run, above
+what was allocated before the measured call. With a baseline (scripts/bench_baseline.json),
+the run fails (exit 1) if any benchmark is slower than baseline * (1 + --time-threshold) or
+uses more than baseline * (1 + --mem-threshold) memory.
+
+Usage:
+  python -m scripts.bench_hotpaths [--sizes 1000,100000,1000000] [--benchmarks a,b] [--repeat N]
+                                   [--full] [--save-baseline] [--baseline path] [--out path]
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data"
+DEFAULT_OUT = Path(__file__).resolve().parent / "bench_results.json"
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "bench_baseline.json"
+DEFAULT_SIZES = "1000,100000,1000000"
+BENCHMARKS = ("filter_html", "product_validate", "product_to_csv_row", "load_products", "load_catalog", "upsert_row")
+# Benchmarks that do not depend on catalog size.
+SIZELESS = {"filter_html"}
+# Largest catalog each benchmark runs on unless --full (1M rows keeps every product dict, or a
+# pandas rewrite of a ~1 GB CSV plus a 1M-row similarity index, in memory).
+SIZE_LIMITS = {"product_validate": 100_000, "product_to_csv_row": 100_000, "upsert_row": 100_000}
+DEFAULT_TIME_THRESHOLD = 0.20
+DEFAULT_MEM_THRESHOLD = 0.10
+# Differences below these are noise and never count as regressions.
+TIME_NOISE_S = 0.002
+MEM_NOISE_MB = 1.0
+SEED = 0
+_COPY_IGNORE = shutil.ignore_patterns(".git", "data", "frontend", "node_modules", ".venv", "__pycache__", "*.jsonl")
+
+
+# ---- workspace (parent process) ----
+def prepare_workspace(root: Path, sizes: list[int]) -> None:
+    """Copy the project into root with its own data/: the HTML pages and one catalog per size."""
+    from scripts.load_test import write_catalog
+
+    shutil.copytree(ROOT, root, ignore=_COPY_IGNORE, dirs_exist_ok=True)
+    data = root / "data"
+    data.mkdir(exist_ok=True)
+    for page in DATA_DIR.glob("*.html"):
+        shutil.copy2(page, data / page.name)
+    for size in sizes:
+        start = time.perf_counter()
+        write_catalog(data / f"catalog-{size}.csv", size, SEED)
+        print(f"Synthetic catalog {size} rows in {time.perf_counter() - start:.1f}s", flush=True)
+
+
+def run_child(root: Path, name: str, size: int | None, repeat: int) -> dict:
+    """Run one benchmark in a fresh interpreter inside the workspace. Returns its result dict."""
+    args = [sys.executable, "-m", "scripts.bench_hotpaths", "--child", name, "--repeat", str(repeat)]
+    if size is not None:
+        args += ["--child-size", str(size)]
+    env = {k: v for k, v in os.environ.items() if k != "OPEN_ROUTER_API_KEY"}
+    proc = subprocess.run(args, cwd=root, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{name} failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ---- benchmarks (child process, cwd = workspace) ----
+def _row_to_product(row: dict) -> dict:
+    """Product dict (models.Product shape) from a data_out.csv row."""
+    def split(cell: str) -> list[str]:
+        return [x for x in cell.split("|") if x]
+
+    return {
+        "name": row["name"],
+        "price": {
+            "price": float(row["price"]),
+            "currency": row["currency"],
+            "compare_at_price": float(row["compare_at_price"]) if row["compare_at_price"] else None,
+        },
+        "description": row["description"],
+        "key_features": split(row["key_features"]),
+        "image_urls": split(row["image_urls"]),
+        "video_url": row["video_url"] or None,
+        "category": {"name": row["category"]},
+        "brand": row["brand"],
+        "colors": split(row["colors"]),
+        "variants": json.loads(row["variants"]) if row["variants"] else [],
+    }
+
+
+def _product_dicts(size: int) -> list[dict]:
+    with open(Path("data") / f"catalog-{size}.csv", newline="", encoding="utf-8") as f:
+        return [_row_to_product(row) for row in csv.DictReader(f)]
+
+
+def _setup(name: str, size: int | None):
+    """Untimed setup. Returns a zero-argument callable that performs the measured work once."""
+    if name == "filter_html":
+        from bs4 import BeautifulSoup
+
+        from scripts.extract import filter_html
+
+        soups = [BeautifulSoup(p.read_text(encoding="utf-8", errors="replace"), "html.parser")
+                 for p in sorted(Path("data").glob("*.html"))]
+        return lambda: [filter_html(soup) for soup in soups]
+
+    if name == "product_validate":
+        import models
+
+        dicts = _product_dicts(size)
+        return lambda: [models.Product.model_validate(d) for d in dicts]
+
+    if name == "product_to_csv_row":
+        import models
+        from scripts.extract import _product_to_csv_row
+
+        products = [(f"p{i}.html", models.Product.model_validate(d)) for i, d in enumerate(_product_dicts(size))]
+        return lambda: [_product_to_csv_row(p, filename) for filename, p in products]
+
+    if name == "load_products":
+        from api.routers import products as products_router
+
+        products_router.DATA_CSV = Path("data") / f"catalog-{size}.csv"
+        return products_router._load_products
+
+    if name == "load_catalog":
+        from catalog import CompactCatalog
+
+        path = Path("data") / f"catalog-{size}.csv"
+        return lambda: CompactCatalog.load(path)
+
+    if name == "upsert_row":
+        import models
+        from scripts import columnar
+        from scripts.extract import DATA_OUT_PATH, _upsert_row
+
+        catalog = Path("data") / f"catalog-{size}.csv"
+        shutil.copy2(catalog, DATA_OUT_PATH)
+        dicts = _product_dicts(size)
+        with open(catalog, newline="", encoding="utf-8") as f:
+            names = [row["filename"] for row in csv.DictReader(f)]
+        columnar.save_products(dict(zip(names, dicts)))
+        product = models.Product.model_validate(dicts[0])
+        counter = itertools.count()
+        # Bring the derived indexes in step with the CSV once, so runs measure the incremental path.
+        _upsert_row("bench-warmup.html", product)
+        return lambda: _upsert_row(f"bench-{next(counter)}.html", product)
+
+    raise ValueError(f"unknown benchmark {name!r}")
+
+
+def _stub_llm() -> None:
+    import ai
+
+    async def _offline(*args, **kwargs):
+        raise RuntimeError("LLM call attempted during an offline benchmark")
+
+    ai.responses = _offline
+
+
+def child_main(name: str, size: int | None, repeat: int) -> None:
+    """Measure one benchmark and print its result as a JSON line."""
+    _stub_llm()
+    work = _setup(name, size)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        work()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    work()
+    peak = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    print(json.dumps({
+        "time_s": round(statistics.median(times), 6),
+        "min_time_s": round(min(times), 6),
+        "peak_mb": round(peak / 1e6, 3),
+    }))
+
+
+# ---- regression gates ----
+def compare(results: dict, baseline: dict, time_threshold: float, mem_threshold: float) -> list[str]:
+    """Regressions of results against baseline, as readable lines (empty if none)."""
+    regressions = []
+    for key, r in results.items():
+        base = baseline.get(key)
+        if base is None or "time_s" not in r:
+            continue
+        if r["time_s"] > base["time_s"] * (1 + time_threshold) and r["time_s"] - base["time_s"] > TIME_NOISE_S:
+            regressions.append(f"{key}: time {r['time_s']}s vs baseline {base['time_s']}s (+{r['time_s'] / base['time_s'] - 1:.0%})")
+        if r["peak_mb"] > base["peak_mb"] * (1 + mem_threshold) and r["peak_mb"] - base["peak_mb"] > MEM_NOISE_MB:
+            regressions.append(f"{key}: peak {r['peak_mb']}MB vs baseline {base['peak_mb']}MB")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline hot-path micro-benchmarks with regression gates.")
+    parser.add_argument("--sizes", type=str, default=DEFAULT_SIZES, help=f"Synthetic catalog sizes (default: {DEFAULT_SIZES})")
+    parser.add_argument("--benchmarks", type=str, default=",".join(BENCHMARKS), help="Comma-separated subset to run")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (median is reported)")
+    parser.add_argument("--full", action="store_true", help="Ignore SIZE_LIMITS and run every benchmark at every size")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run's results as the new baseline")
+    parser.add_argument("--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD, help="Allowed slowdown fraction")
+    parser.add_argument("--mem-threshold", type=float, default=DEFAULT_MEM_THRESHOLD, help="Allowed peak memory growth fraction")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="Output JSON path")
+    parser.add_argument("--child", type=str, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--child-size", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, os.getcwd())
+        child_main(args.child, args.child_size, args.repeat)
+        return
+
+    sys.path.insert(0, str(ROOT))
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    names = [b.strip() for b in args.benchmarks.split(",") if b.strip()]
+    unknown = [b for b in names if b not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks {unknown}; choose from {', '.join(BENCHMARKS)}")
+
+    plan = []
+    for name in names:
+        if name in SIZELESS:
+            plan.append((name, None))
+            continue
+        for size in sizes:
+            if not args.full and size > SIZE_LIMITS.get(name, size):
+                print(f"skip {name}@{size}: over SIZE_LIMITS (use --full)")
+                continue
+            plan.append((name, size))
+    needed = sorted({size for _, size in plan if size is not None})
+
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        workspace = Path(tmp)
+        prepare_workspace(workspace, needed)
+        for name, size in plan:
+            key = name if size is None else f"{name}@{size}"
+            results[key] = run_child(workspace, name, size, args.repeat)
+            r = results[key]
+            print(f"{key}: median={r['time_s']}s min={r['min_time_s']}s peak={r['peak_mb']}MB", flush=True)
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Wrote results to {args.out}")
+
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2), encoding="utf-8")
+        print(f"Saved baseline to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.time_threshold, args.mem_threshold)
+    if regressions:
+        print("Regressions:\n  " + "\n  ".join(regressions), file=sys.stderr)
+        sys.exit(1)
+    print(f"No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark: cold import time of the API and main.py time-to-first-request.
+
+Each measurement runs in a fresh interpreter so nothing is cached in-process:
+- api_import: wall time of `python -c "import api"`.
+- main_first_request: wall time from launching main.py on one page until the first LLM
+  request would be sent (ai.responses is replaced by a stub that reports and exits, so no
+  network or API key is needed).
+- scripts_extract_import: wall time of `python -c "import scripts.extract"`.
+
+Usage:
+  python -m scripts.bench_startup [--runs N] [--html nike.html] [--out path]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = Path(__file__).resolve().parent / "startup_results.json"
+
+# Child snippet for main.py: stub the LLM call, print the wall clock at the first request, exit.
+_FIRST_REQUEST_SNIPPET = """
+import os, runpy, sys, time
+import ai
+async def _first_request(*args, **kwargs):
+    print(time.time(), flush=True)
+    os._exit(0)
+ai.responses = _first_request
+sys.argv = ["main.py", {html!r}]
+runpy.run_path("main.py", run_name="__main__")
+"""
+
+
+def _time_command(args: list[str]) -> float:
+    """Wall seconds for a child process to exit successfully."""
+    start = time.perf_counter()
+    subprocess.run(args, cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def _time_first_request(html: str) -> float:
+    """Wall seconds from spawning main.py until it reaches its first LLM request."""
+    start = time.time()
+    out = subprocess.run(
+        [sys.executable, "-c", _FIRST_REQUEST_SNIPPET.format(html=html)],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout.strip().splitlines()
+    if not out:
+        raise RuntimeError("main.py exited before making an LLM request")
+    return float(out[-1]) - start
+
+
+def _summary(samples: list[float]) -> dict:
+    return {
+        "runs": len(samples),
+        "median_s": round(statistics.median(samples), 4),
+        "min_s": round(min(samples), 4),
+        "max_s": round(max(samples), 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure API import time and main.py time-to-first-request.")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh-process runs per measurement")
+    parser.add_argument("--html", type=str, default="nike.html", help="Page main.py processes for time-to-first-request")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="Output JSON path")
+    args = parser.parse_args()
+
+    results = {
+        "api_import": _summary([_time_command([sys.executable, "-c", "import api"]) for _ in range(args.runs)]),
+        "scripts_extract_import": _summary(
+            [_time_command([sys.executable, "-c", "import scripts.extract"]) for _ in range(args.runs)]
+        ),
+        "main_first_request": _summary([_time_first_request(args.html) for _ in range(args.runs)]),
+    }
+    for name, r in results.items():
+        print(f"{name}: median={r['median_s']}s min={r['min_s']}s max={r['max_s']}s")
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Wrote results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
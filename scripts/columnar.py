@@ -0,0 +1,273 @@
+"""Columnar (Parquet / Arrow IPC) export of the extracted catalog.
+
+data_out.csv flattens lists with "|", embeds variants as JSON strings and truncates the
+description. Alongside it, ingest keeps every full product in data/products.json and
+rewrites only the affected partition of a columnar dataset under data/catalog/, where
+key_features, image_urls, colors and variants are native list / struct columns:
+
+  data/catalog/brand=<brand>/part-0.parquet      (or category=<top level>/..., .arrow)
+
+Arrow IPC files are written uncompressed so readers can memory-map them zero-copy. The
+dataset's layout (partition column and format) is kept in data/catalog/_layout.json, which
+dataset readers skip, so ingest keeps updating it in whatever layout the last rebuild chose.
+
+Pages extracted before data/products.json existed are only in data_out.csv. A full rebuild
+backfills them from their CSV rows first; their description_truncated column is true (the
+CSV keeps 500 characters of description and at most 10 image_urls).
+
+Full rebuild:
+  python -m scripts.columnar [--format parquet|arrow] [--partition brand|category] [--no-backfill]
+(format and partition default to the current layout)
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from urllib.parse import quote
+
+from catalog import typed_row
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+PRODUCTS_PATH = DATA_DIR / "products.json"
+DATA_OUT_PATH = DATA_DIR / "data_out.csv"
+CATALOG_DIR = DATA_DIR / "catalog"
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+PARTITIONS = ("brand", "category")
+DEFAULT_FORMAT = "parquet"
+DEFAULT_PARTITION = "brand"
+LAYOUT_NAME = "_layout.json"
+
+
+# ---- full-product store (source of truth for the export) ----
+def load_products(path: Path = PRODUCTS_PATH) -> dict[str, dict]:
+    """filename -> full Product dump. {} if not written yet."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_products(products: dict[str, dict], path: Path = PRODUCTS_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(products, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def product_from_row(row: dict) -> dict:
+    """Product dump rebuilt from a data_out.csv row.
+
+    Only as complete as the row: the CSV truncates description to 500 characters and keeps at
+    most 10 image_urls.
+    """
+    typed = typed_row(row)
+    return {
+        "name": typed["name"],
+        "price": {"price": typed["price"], "currency": typed["currency"], "compare_at_price": typed["compare_at_price"]},
+        "description": typed["description"],
+        "key_features": typed["key_features"],
+        "image_urls": typed["image_urls"],
+        "video_url": typed["video_url"],
+        "category": {"name": typed["category"]},
+        "brand": typed["brand"],
+        "colors": typed["colors"],
+        "variants": typed["variants"],
+    }
+
+
+def backfill_from_csv(products: dict[str, dict], path: Path = DATA_OUT_PATH) -> int:
+    """Add data_out.csv rows missing from products, flagged description_truncated. Returns how many were added."""
+    if not path.exists():
+        return 0
+    added = 0
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            filename = (row.get("filename") or "").strip()
+            if filename and filename not in products:
+                products[filename] = {**product_from_row(row), "description_truncated": True}
+                added += 1
+    return added
+
+
+# ---- dataset layout ----
+def load_layout(out_dir: Path = CATALOG_DIR) -> tuple[str, str]:
+    """(partition, format) the dataset in out_dir was written with; the defaults if none is recorded."""
+    try:
+        layout = json.loads((out_dir / LAYOUT_NAME).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return DEFAULT_PARTITION, DEFAULT_FORMAT
+    partition, fmt = layout.get("partition"), layout.get("format")
+    if partition not in PARTITIONS or fmt not in FORMATS:
+        return DEFAULT_PARTITION, DEFAULT_FORMAT
+    return partition, fmt
+
+
+def save_layout(partition: str, fmt: str, out_dir: Path = CATALOG_DIR) -> None:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = out_dir / (LAYOUT_NAME + ".tmp")
+    tmp.write_text(json.dumps({"partition": partition, "format": fmt}), encoding="utf-8")
+    os.replace(tmp, out_dir / LAYOUT_NAME)
+
+
+# ---- Arrow conversion ----
+def _schema():
+    import pyarrow as pa
+
+    option = pa.struct([("value", pa.string()), ("available", pa.bool_()), ("price", pa.float64())])
+    variant = pa.struct([("title", pa.string()), ("options", pa.list_(option))])
+    return pa.schema([
+        ("filename", pa.string()),
+        ("name", pa.string()),
+        ("brand", pa.string()),
+        ("category", pa.string()),
+        ("category_top", pa.string()),
+        ("price", pa.float64()),
+        ("currency", pa.string()),
+        ("compare_at_price", pa.float64()),
+        ("description", pa.string()),
+        ("description_truncated", pa.bool_()),
+        ("key_features", pa.list_(pa.string())),
+        ("image_urls", pa.list_(pa.string())),
+        ("video_url", pa.string()),
+        ("colors", pa.list_(pa.string())),
+        ("variants", pa.list_(variant)),
+    ])
+
+
+def _partition_value(product: dict, partition: str) -> str:
+    if partition == "brand":
+        return product.get("brand") or ""
+    return ((product.get("category") or {}).get("name") or "").split(" > ")[0]
+
+
+def to_table(products: dict[str, dict]):
+    """Arrow table (one row per product) with native list/struct columns."""
+    import pyarrow as pa
+
+    rows = []
+    for filename, p in sorted(products.items()):
+        price = p.get("price") or {}
+        category = (p.get("category") or {}).get("name") or ""
+        rows.append({
+            "filename": filename,
+            "name": p.get("name"),
+            "brand": p.get("brand"),
+            "category": category,
+            "category_top": category.split(" > ")[0],
+            "price": price.get("price"),
+            "currency": price.get("currency"),
+            "compare_at_price": price.get("compare_at_price"),
+            "description": p.get("description"),
+            "description_truncated": bool(p.get("description_truncated")),
+            "key_features": p.get("key_features") or [],
+            "image_urls": p.get("image_urls") or [],
+            "video_url": p.get("video_url"),
+            "colors": p.get("colors") or [],
+            "variants": p.get("variants") or [],
+        })
+    return pa.Table.from_pylist(rows, schema=_schema())
+
+
+def _partition_dir(out_dir: Path, partition: str, value: str) -> Path:
+    # Hive-style directory names so pyarrow.dataset / DuckDB / Spark discover the partition column.
+    return out_dir / f"{partition}={quote(value, safe='')}"
+
+
+def _write_table(table, path: Path, fmt: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, tmp, compression="zstd")
+    else:
+        import pyarrow as pa
+
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp, path)
+
+
+def write_partition(
+    products: dict[str, dict],
+    value: str,
+    partition: str = DEFAULT_PARTITION,
+    fmt: str = DEFAULT_FORMAT,
+    out_dir: Path = CATALOG_DIR,
+) -> None:
+    """Rewrite one partition from the products that belong to it (removing it if none do)."""
+    members = {k: p for k, p in products.items() if _partition_value(p, partition) == value}
+    directory = _partition_dir(out_dir, partition, value)
+    if not members:
+        shutil.rmtree(directory, ignore_errors=True)
+        return
+    _write_table(to_table(members), directory / f"part-0{FORMATS[fmt]}", fmt)
+
+
+def export_catalog(
+    products: dict[str, dict] | None = None,
+    partition: str = DEFAULT_PARTITION,
+    fmt: str = DEFAULT_FORMAT,
+    out_dir: Path = CATALOG_DIR,
+) -> int:
+    """Rebuild the whole partitioned dataset and record its layout. Returns the number of partitions written."""
+    products = load_products() if products is None else products
+    shutil.rmtree(out_dir, ignore_errors=True)
+    save_layout(partition, fmt, out_dir)
+    values = {_partition_value(p, partition) for p in products.values()}
+    for value in values:
+        write_partition(products, value, partition, fmt, out_dir)
+    return len(values)
+
+
+def upsert_product(filename: str, product: dict, out_dir: Path = CATALOG_DIR) -> None:
+    """Store the full product and rewrite only the partition(s) it leaves or joins, in the dataset's layout."""
+    upsert_products({filename: product}, out_dir)
+
+
+def upsert_products(updates: dict[str, dict], out_dir: Path = CATALOG_DIR) -> None:
+    """upsert_product for several products: one products.json write, each affected partition rewritten once."""
+    partition, fmt = load_layout(out_dir)
+    if not (out_dir / LAYOUT_NAME).exists():
+        save_layout(partition, fmt, out_dir)
+    products = load_products()
+    affected = set()
+    for filename, product in updates.items():
+        old = products.get(filename)
+        products[filename] = product
+        affected.add(_partition_value(product, partition))
+        if old is not None:
+            affected.add(_partition_value(old, partition))
+    save_products(products)
+    for value in affected:
+        write_partition(products, value, partition, fmt, out_dir)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the columnar catalog export from data/products.json.")
+    parser.add_argument("--format", choices=sorted(FORMATS), help="Default: the current layout's (parquet if none)")
+    parser.add_argument("--partition", choices=PARTITIONS, help="Default: the current layout's (brand if none)")
+    parser.add_argument("--out", type=Path, default=CATALOG_DIR, help="Output directory")
+    parser.add_argument("--no-backfill", action="store_true", help="Do not add data_out.csv rows missing from products.json")
+    args = parser.parse_args()
+    partition, fmt = load_layout(args.out)
+    args.partition = args.partition or partition
+    args.format = args.format or fmt
+
+    products = load_products()
+    if not args.no_backfill:
+        added = backfill_from_csv(products)
+        if added:
+            save_products(products)
+            print(f"Backfilled {added} products from {DATA_OUT_PATH.name} (descriptions truncated)")
+    n = export_catalog(products, args.partition, args.format, args.out)
+    print(f"Wrote {len(products)} products in {n} {args.partition} partitions ({args.format}) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,48 @@
-import asyncio
+import csv
 import json
+import math
+import operator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import TypedDict
+from typing import TYPE_CHECKING, Annotated, TypedDict
 
-import pandas as pd
-from fastapi import APIRouter, HTTPException
-from bs4 import BeautifulSoup, Comment
-from langchain_core.runnables import RunnableSerializable
-from langgraph.graph import StateGraph, START, END
+from fastapi import HTTPException
 from pydantic import ValidationError as PydanticValidationError
 import logging
 
-import ai as ai_module
+import facets
 import models
-# Import the prompts for each of our langchain nodes steps
-from prompts import (
-    CATEGORY_SYSTEM,
-    CATEGORY_USER,
-    RETRY_CATEGORY_APPEND,
-    PRODUCT_SYSTEM,
-    PRODUCT_USER,
-    RETRY_PRODUCT_APPEND,
-)
+from ai import STATEFUL_RESPONSES, OutputValidationError
+import snapshot
+from store import HtmlStore
+from scripts import columnar
+from scripts import refresh
+from scripts.fingerprints import FingerprintIndex, content_digest, signature
+from scripts.routing import MODEL_CASCADE, model_for_attempt, page_domain, record_outcome, start_tier
+
+# Heavy dependencies (pandas, BeautifulSoup, LangChain, LangGraph, OpenAI SDK, NumPy) are
+# imported inside the functions that use them so importing this module stays cheap.
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter() 
-
-
-EXTRACT_MODEL = "openai/gpt-5-nano"
+EXTRACT_MODEL = MODEL_CASCADE[0]
 MAX_RETRIES = 5
+# Retries after a validation failure that continue the failed exchange (previous answer +
+# correction, no HTML) before falling back to resending the whole request.
+CONTINUE_RETRIES = 2
+# Failed diff-only attempts before falling back to the full category + product flow.
+DIFF_MAX_RETRIES = 1
+# Failed refresh attempts before falling back to a full extraction.
+REFRESH_MAX_RETRIES = 2
 LLM_COST_LIMIT_USD = 5.0
 DATA_OUT_PATH = Path(__file__).resolve().parent.parent / "data" / "data_out.csv"
 KEY_COLUMN = "filename"
+# Retry error for a call that returned no structured output (refusal or empty answer).
+EMPTY_OUTPUT_ERROR = "The previous answer was empty or a refusal. Answer with the requested structured output."
 
 
 # ---- Graph state: single context for the whole extraction flow ----
@@ -41,116 +51,210 @@ class ExtractState(TypedDict, total=False):
     html_content: str
     html_filtered: str
     source_filename: str | None
+    skip_dedup: bool  # never look up near-duplicates (model tests must always call the LLM)
     category: models.Category | None
     category_retry_error: str | None
+    category_retry_context: dict | None  # failed answer to continue from: {"output", "response_id", "model"}
     category_attempt: int
     product: models.Product | None
     product_retry_error: str | None
+    product_retry_context: dict | None
     product_attempt: int
     llm_cost_so_far: float
     llm_cost_limit: float
     cost_exceeded: bool
-    model: str | None  # override EXTRACT_MODEL when set (e.g. for testing)
+    model: str | None  # pin a single model instead of the cascade when set (e.g. for testing)
+    wire: str | None  # product-call output format override ("compact" / "full"); extractor default if unset
+    domain: str
+    cascade: list[str]
+    category_tier: int  # cascade index the category step starts from (learned per domain)
+    product_tier: int
+    attempts: Annotated[list[dict], operator.add]  # one entry per LLM call: step, model, cost_usd, ok
+    fingerprint: list[int] | None  # MinHash signature of html_filtered
+    digest: str | None  # SHA-256 of html_filtered
+    duplicate_of: str | None  # already extracted page to build on: identical or near enough
+    duplicate_similarity: float
+    duplicate_kind: str | None  # "reuse" (identical filtered HTML) or "diff" (near duplicate)
+    diff_retry_error: str | None
+    diff_attempt: int
+    llm_calls_saved: int
+    saving_kind: str | None  # "reused", "diffed" or "refreshed" when LLM calls were avoided
+    refresh_product: dict | None  # stored product of an already extracted page (refresh mode)
+    refresh_ld_checked: bool
+    refresh_retry_error: str | None
+    refresh_attempt: int
+    refresh_source: str | None  # "json-ld" or "llm"
 
 
 def _sanitize_csv_cell(val: str | float | None) -> str:
     """Ensure a CSV cell has no newlines so one logical row = one physical line."""
-    if val is None or (isinstance(val, float) and pd.isna(val)):
+    if val is None or (isinstance(val, float) and math.isnan(val)):
         return ""
     s = str(val).strip()
     return s.replace("\r\n", " ").replace("\r", " ").replace("\n", " ")
 
 
-class OpenRouterCategoryExtractor(RunnableSerializable[dict, models.Category]):
-    """Extract Category from HTML (Google Product Taxonomy). Uses ai.responses → _log_usage."""
-
-    model: str = EXTRACT_MODEL
-
-    def invoke(self, input: dict, **kwargs) -> models.Category:
-        return asyncio.run(self.ainvoke(input, **kwargs))
-
-    async def ainvoke(self, input: dict, **kwargs) -> models.Category:
-        html = input["html"]
-        model = input.get("model") or self.model
-        retry_error = input.get("retry_error")
-        user = CATEGORY_USER.format(html=html)
-        if retry_error:
-            user += RETRY_CATEGORY_APPEND.format(retry_error=retry_error)
-        messages = [
-            {"role": "system", "content": CATEGORY_SYSTEM},
-            {"role": "user", "content": user},
-        ]
-        result, cost = await ai_module.responses(
-            model,
-            messages,
-            text_format=models.Category,
-        )
-        return (result, cost)
-
-
-class OpenRouterProductExtractor(RunnableSerializable[dict, models.Product]):
-    """Extract full Product from HTML with category fixed. Uses ai.responses → _log_usage."""
-
-    model: str = EXTRACT_MODEL
-
-    def invoke(self, input: dict, **kwargs) -> models.Product:
-        return asyncio.run(self.ainvoke(input, **kwargs))
-
-    async def ainvoke(self, input: dict, **kwargs) -> models.Product:
-        html = input["html"]
-        model = input.get("model") or self.model
-        category_name = input["category_name"]
-        retry_error = input.get("retry_error")
-        user = PRODUCT_USER.format(html=html, category_name=category_name)
-        if retry_error:
-            user += RETRY_PRODUCT_APPEND.format(retry_error=retry_error, category_name=category_name)
-        messages = [
-            {"role": "system", "content": PRODUCT_SYSTEM},
-            {"role": "user", "content": user},
-        ]
-        result, cost = await ai_module.responses(
-            model,
-            messages,
-            text_format=models.Product,
-        )
-        return (result, cost)
+@lru_cache
+def _runnables() -> dict:
+    """Extractor runnables by step, built on first use so LangChain and the SDK load lazily."""
+    from scripts.extractors import (
+        OpenRouterCategoryExtractor,
+        OpenRouterDiffExtractor,
+        OpenRouterProductExtractor,
+        OpenRouterRefreshExtractor,
+    )
+
+    return {
+        "category": OpenRouterCategoryExtractor(),
+        "product": OpenRouterProductExtractor(),
+        "diff": OpenRouterDiffExtractor(),
+        "refresh": OpenRouterRefreshExtractor(),
+    }
 
 
-category_runnable = OpenRouterCategoryExtractor()
-product_runnable = OpenRouterProductExtractor()
+@lru_cache
+def _fingerprint_index() -> FingerprintIndex:
+    """Process-wide near-duplicate index, loaded once and saved after each write."""
+    return FingerprintIndex()
 
 
 # ---- Graph nodes: each updates shared state (context + retries) ----
 async def _prepare_context(state: ExtractState) -> dict:
-    """Build filtered HTML and initialize retry counters."""
+    """Build filtered HTML, resolve the page domain, fingerprint the page and initialize retry counters and cascade tiers."""
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(state["html_content"], "html.parser")
     html_filtered = filter_html(soup)
+    source = state.get("source_filename")
+    domain = page_domain(soup, fallback=Path(source).stem if source else None)
+    cascade = state.get("cascade") or MODEL_CASCADE
+    tier = start_tier(domain, cascade)
+    # Look for an already extracted near-duplicate (never the page itself, so recrawls re-extract).
+    # A page without a filename cannot exclude itself, so it is never matched.
+    fingerprint = signature(html_filtered)
+    digest = content_digest(html_filtered)
+    match = None
+    if fingerprint and source and not state.get("skip_dedup"):
+        match = _fingerprint_index().duplicate(fingerprint, digest, exclude=source)
     return {
         "html_filtered": html_filtered,
         "category_attempt": 0,
         "product_attempt": 0,
-        "llm_cost_so_far": 0.0,
+        "diff_attempt": 0,
+        # Keep spend from a refresh attempt that fell back to full extraction.
+        "llm_cost_so_far": state.get("llm_cost_so_far", 0.0),
+        "llm_calls_saved": 0,
+        "domain": domain,
+        "cascade": cascade,
+        "category_tier": tier,
+        "product_tier": tier,
+        "fingerprint": fingerprint,
+        "digest": digest,
+        "duplicate_of": match[0] if match else None,
+        "duplicate_similarity": match[1] if match else 0.0,
+        "duplicate_kind": match[2] if match else None,
+    }
+
+
+def _pick_model(state: ExtractState, tier_key: str, attempt_key: str) -> str:
+    """Pinned model if set, else the cascade model for this step's attempt number."""
+    if state.get("model"):
+        return state["model"]
+    return model_for_attempt(state["cascade"], state.get(tier_key, 0), state.get(attempt_key, 0))
+
+
+def _can_escalate(state: ExtractState, tier_key: str, attempt_key: str) -> bool:
+    """True if a later attempt on this step would run a stronger model than the current one."""
+    if state.get("model"):
+        return False
+    cascade = state["cascade"]
+    current = _pick_model(state, tier_key, attempt_key)
+    if cascade.index(current) >= len(cascade) - 1:
+        return False
+    return state.get(attempt_key, 0) + 1 < MAX_RETRIES
+
+
+def _retry_context(state: ExtractState, context_key: str, attempt_key: str, model: str) -> dict | None:
+    """The failed answer to continue from on this retry, or None to resend the full request.
+
+    Only the model that gave the failed answer continues it; an escalated model needs the page itself.
+    """
+    if state.get(attempt_key, 0) > CONTINUE_RETRIES:
+        return None
+    context = state.get(context_key)
+    if context is None or context.get("model") != model:
+        return None
+    return context
+
+
+def _validation_failure(state: ExtractState, step: str, model: str, e: OutputValidationError, continued: bool) -> dict:
+    """State update for an answer that failed validation: keep it (and its cost) for a continuation retry."""
+    attempt = state.get(f"{step}_attempt", 0) + 1
+    attempts = [{"step": step, "model": model, "cost_usd": e.cost, "ok": False, "continued": continued}]
+    return {
+        f"{step}_retry_error": str(e),
+        f"{step}_retry_context": {"output": e.output_text, "response_id": e.response_id, "model": model},
+        f"{step}_attempt": attempt,
+        "llm_cost_so_far": state.get("llm_cost_so_far", 0) + e.cost,
+        "attempts": attempts,
     }
 
 
+def _empty_output(state: ExtractState, step: str, model: str, cost: float, new_total: float) -> dict:
+    """State update for a call that parsed to nothing (refusal or empty answer): a failed attempt, retried like one."""
+    update = {
+        f"{step}_retry_error": EMPTY_OUTPUT_ERROR,
+        f"{step}_attempt": state.get(f"{step}_attempt", 0) + 1,
+        "llm_cost_so_far": new_total,
+        "attempts": [{"step": step, "model": model, "cost_usd": cost, "ok": False, "empty": True}],
+    }
+    if step in ("category", "product"):
+        # There is no answer to continue from; the retry resends the page.
+        update[f"{step}_retry_context"] = None
+    return update
+
+
+def _low_confidence_reason(product: models.Product) -> str | None:
+    """Cheap sanity checks on a schema-valid product. Returns why it looks wrong, or None."""
+    if not product.name.strip():
+        return "name is empty"
+    if product.price.price <= 0:
+        return "price must be greater than 0"
+    if not product.image_urls:
+        return "image_urls is empty; include the product image URLs"
+    return None
+
+
 async def _extract_category_node(state: ExtractState) -> dict:
     """Extract category; on validation error set retry_error and bump attempt. Enforces LLM cost limit."""
     limit = state.get("llm_cost_limit", LLM_COST_LIMIT_USD)
     if state.get("llm_cost_so_far", 0) >= limit:
         return {"cost_exceeded": True}
 
-    inp = {"html": state["html_filtered"], "model": state.get("model") or EXTRACT_MODEL}
+    model = _pick_model(state, "category_tier", "category_attempt")
+    inp = {"html": state["html_filtered"], "model": model}
     if state.get("category_retry_error"):
         inp["retry_error"] = state["category_retry_error"]
+        # A stateless continuation resends the system prompt, which here is the whole taxonomy, so it
+        # would save almost nothing over a fresh call: category retries only continue server-side.
+        context = _retry_context(state, "category_retry_context", "category_attempt", model)
+        if context is not None and STATEFUL_RESPONSES and context.get("response_id"):
+            inp["retry_context"] = context
     try:
-        category, cost = await category_runnable.ainvoke(inp)
+        category, cost = await _runnables()["category"].ainvoke(inp)
         new_total = state.get("llm_cost_so_far", 0) + cost
+        attempts = [{"step": "category", "model": model, "cost_usd": cost, "ok": category is not None}]
         if new_total > limit:
-            return {"llm_cost_so_far": new_total, "cost_exceeded": True}
-        return {"category": category, "category_retry_error": None, "llm_cost_so_far": new_total}
+            return {"llm_cost_so_far": new_total, "cost_exceeded": True, "attempts": attempts}
+        if category is None:
+            return _empty_output(state, "category", model, cost, new_total)
+        return {"category": category, "category_retry_error": None, "llm_cost_so_far": new_total, "attempts": attempts}
+    except OutputValidationError as e:
+        return _validation_failure(state, "category", model, e, continued=inp.get("retry_context") is not None)
     except PydanticValidationError as e:
         attempt = state.get("category_attempt", 0) + 1
-        return {"category_retry_error": str(e), "category_attempt": attempt}
+        attempts = [{"step": "category", "model": model, "cost_usd": 0.0, "ok": False}]
+        return {"category_retry_error": str(e), "category_retry_context": None, "category_attempt": attempt, "attempts": attempts}
 
 
 async def _extract_product_node(state: ExtractState) -> dict:
@@ -160,29 +264,223 @@ async def _extract_product_node(state: ExtractState) -> dict:
         return {"cost_exceeded": True}
 
     category = state["category"]
-    inp = {"html": state["html_filtered"], "category_name": category.name, "model": state.get("model") or EXTRACT_MODEL}
+    model = _pick_model(state, "product_tier", "product_attempt")
+    inp = {"html": state["html_filtered"], "category_name": category.name, "model": model}
+    if state.get("wire"):
+        inp["wire"] = state["wire"]
     if state.get("product_retry_error"):
         inp["retry_error"] = state["product_retry_error"]
+        inp["retry_context"] = _retry_context(state, "product_retry_context", "product_attempt", model)
     try:
-        product, cost = await product_runnable.ainvoke(inp)
+        product, cost = await _runnables()["product"].ainvoke(inp)
         new_total = state.get("llm_cost_so_far", 0) + cost
         if new_total > limit:
-            return {"llm_cost_so_far": new_total, "cost_exceeded": True}
-        return {"product": product, "product_retry_error": None, "llm_cost_so_far": new_total}
+            attempts = [{"step": "product", "model": model, "cost_usd": cost, "ok": product is not None}]
+            return {"llm_cost_so_far": new_total, "cost_exceeded": True, "attempts": attempts}
+        if product is None:
+            return _empty_output(state, "product", model, cost, new_total)
+        # Schema-valid but suspicious output escalates to a stronger model while one is left.
+        reason = _low_confidence_reason(product)
+        if reason and _can_escalate(state, "product_tier", "product_attempt"):
+            attempt = state.get("product_attempt", 0) + 1
+            attempts = [{"step": "product", "model": model, "cost_usd": cost, "ok": False, "low_confidence": reason}]
+            # The stronger model needs the page itself, so this retry resends the HTML.
+            return {
+                "product_retry_error": reason,
+                "product_retry_context": None,
+                "product_attempt": attempt,
+                "llm_cost_so_far": new_total,
+                "attempts": attempts,
+            }
+        attempts = [{"step": "product", "model": model, "cost_usd": cost, "ok": True}]
+        return {"product": product, "product_retry_error": None, "llm_cost_so_far": new_total, "attempts": attempts}
+    except OutputValidationError as e:
+        return _validation_failure(state, "product", model, e, continued=inp.get("retry_context") is not None)
     except PydanticValidationError as e:
         attempt = state.get("product_attempt", 0) + 1
-        return {"product_retry_error": str(e), "product_attempt": attempt}
+        attempts = [{"step": "product", "model": model, "cost_usd": 0.0, "ok": False}]
+        return {"product_retry_error": str(e), "product_retry_context": None, "product_attempt": attempt, "attempts": attempts}
+
+
+def _reuse_product_node(state: ExtractState) -> dict:
+    """Identical filtered HTML: take the matching page's stored product with no LLM call."""
+    stored = models.Product.model_validate(_fingerprint_index().product(state["duplicate_of"]))
+    logger.info(
+        "Reusing product from %s (similarity %.2f); skipped 2 LLM calls",
+        state["duplicate_of"], state["duplicate_similarity"],
+    )
+    return {"category": stored.category, "product": stored, "llm_calls_saved": 2, "saving_kind": "reused"}
+
+
+async def _extract_diff_node(state: ExtractState) -> dict:
+    """Near duplicate: extract only the fields that differ from the matching page's stored product."""
+    limit = state.get("llm_cost_limit", LLM_COST_LIMIT_USD)
+    if state.get("llm_cost_so_far", 0) >= limit:
+        return {"cost_exceeded": True}
+
+    stored = models.Product.model_validate(_fingerprint_index().product(state["duplicate_of"]))
+    model = _pick_model(state, "product_tier", "diff_attempt")
+    inp = {"html": state["html_filtered"], "previous_product": stored.model_dump_json(), "model": model}
+    if state.get("diff_retry_error"):
+        inp["retry_error"] = state["diff_retry_error"]
+    try:
+        diff, cost = await _runnables()["diff"].ainvoke(inp)
+        new_total = state.get("llm_cost_so_far", 0) + cost
+        attempts = [{"step": "diff", "model": model, "cost_usd": cost, "ok": diff is not None}]
+        if new_total > limit:
+            return {"llm_cost_so_far": new_total, "cost_exceeded": True, "attempts": attempts}
+        if diff is None:
+            # Counts against DIFF_MAX_RETRIES; after that the full category + product flow runs.
+            return _empty_output(state, "diff", model, cost, new_total)
+        product = diff.apply(stored)
+        logger.info(
+            "Diff-only extraction against %s (similarity %.2f); skipped the category call",
+            state["duplicate_of"], state["duplicate_similarity"],
+        )
+        return {
+            "category": stored.category,
+            "product": product,
+            "llm_cost_so_far": new_total,
+            "llm_calls_saved": 1,
+            "saving_kind": "diffed",
+            "attempts": attempts,
+        }
+    except (OutputValidationError, PydanticValidationError) as e:
+        cost = getattr(e, "cost", 0.0)
+        attempts = [{"step": "diff", "model": model, "cost_usd": cost, "ok": False}]
+        return {
+            "diff_retry_error": str(e),
+            "diff_attempt": state.get("diff_attempt", 0) + 1,
+            "llm_cost_so_far": state.get("llm_cost_so_far", 0) + cost,
+            "attempts": attempts,
+        }
 
 
 def _write_output_node(state: ExtractState) -> dict:
-    """Upsert row to CSV if source_filename is set. No state change."""
+    """Upsert row to CSV and the page's fingerprint to the near-duplicate index if source_filename is set. No state change."""
     filename = state.get("source_filename")
     product = state.get("product")
     if filename and product:
         _upsert_row(filename, product)
+        index = _fingerprint_index()
+        if state.get("fingerprint"):
+            index.upsert(filename, state["fingerprint"], state.get("digest"), product.model_dump())
+        else:
+            # Refresh mode does not fingerprint the page; keep its stored product current anyway.
+            index.update_product(filename, product.model_dump())
+        saved = state.get("llm_calls_saved", 0)
+        if saved:
+            index.record_saving(state.get("saving_kind") or "reused", saved)
+        index.save()
     return {}
 
 
+async def _refresh_price_node(state: ExtractState) -> dict:
+    """Refresh mode: update price and option availability on the stored product.
+
+    JSON-LD is tried first (no LLM call); otherwise a small PriceRefresh call runs on the filtered HTML.
+    """
+    stored = models.Product.model_validate(state["refresh_product"])
+    if not state.get("refresh_ld_checked"):
+        from_ld = refresh.price_from_json_ld(state["html_content"], stored)
+        if from_ld is not None:
+            price, variants = from_ld
+            product = stored.model_copy(update={"price": price, "variants": variants})
+            return {
+                "category": stored.category,
+                "product": product,
+                "refresh_source": "json-ld",
+                "llm_calls_saved": 2,
+                "saving_kind": "refreshed",
+                "refresh_ld_checked": True,
+            }
+
+    limit = state.get("llm_cost_limit", LLM_COST_LIMIT_USD)
+    if state.get("llm_cost_so_far", 0) >= limit:
+        return {"cost_exceeded": True}
+    update: dict = {"refresh_ld_checked": True}
+    html_filtered = state.get("html_filtered")
+    if html_filtered is None:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(state["html_content"], "html.parser")
+        html_filtered = filter_html(soup)
+        source = state.get("source_filename")
+        update["html_filtered"] = html_filtered
+        update["domain"] = page_domain(soup, fallback=Path(source).stem if source else None)
+
+    model = state.get("model") or MODEL_CASCADE[0]
+    inp = {"html": html_filtered, "options": refresh.option_keys(stored), "model": model}
+    if state.get("refresh_retry_error"):
+        inp["retry_error"] = state["refresh_retry_error"]
+    try:
+        result, cost = await _runnables()["refresh"].ainvoke(inp)
+        new_total = state.get("llm_cost_so_far", 0) + cost
+        attempts = [{"step": "refresh", "model": model, "cost_usd": cost, "ok": result is not None}]
+        if new_total > limit:
+            return {**update, "llm_cost_so_far": new_total, "cost_exceeded": True, "attempts": attempts}
+        if result is None:
+            # Counts against REFRESH_MAX_RETRIES; after that the page is extracted in full.
+            return {**update, **_empty_output(state, "refresh", model, cost, new_total)}
+        return {
+            **update,
+            "category": stored.category,
+            "product": refresh.apply_llm_refresh(stored, result),
+            "refresh_source": "llm",
+            "llm_cost_so_far": new_total,
+            "llm_calls_saved": 1,
+            "saving_kind": "refreshed",
+            "attempts": attempts,
+        }
+    except (OutputValidationError, PydanticValidationError) as e:
+        cost = getattr(e, "cost", 0.0)
+        attempts = [{"step": "refresh", "model": model, "cost_usd": cost, "ok": False}]
+        return {
+            **update,
+            "llm_cost_so_far": state.get("llm_cost_so_far", 0) + cost,
+            "refresh_retry_error": str(e),
+            "refresh_attempt": state.get("refresh_attempt", 0) + 1,
+            "attempts": attempts,
+        }
+
+
+def _route_start(state: ExtractState) -> str:
+    """Route: known page in refresh mode -> refresh_price, else the normal flow."""
+    return "refresh_price" if state.get("refresh_product") else "prepare_context"
+
+
+def _after_refresh(state: ExtractState) -> str:
+    """Route: success -> write_output, retry -> refresh, out of retries -> full extraction, cost exceeded -> end."""
+    if state.get("cost_exceeded"):
+        return "__end__"
+    if state.get("product") is not None:
+        return "write_output"
+    if state.get("refresh_attempt", 0) >= REFRESH_MAX_RETRIES:
+        return "prepare_context"
+    return "refresh_price"
+
+
+def _after_prepare(state: ExtractState) -> str:
+    """Route: identical page -> reuse, near duplicate -> diff-only, else the full category flow."""
+    kind = state.get("duplicate_kind")
+    if kind == "reuse":
+        return "reuse_product"
+    if kind == "diff":
+        return "extract_diff"
+    return "extract_category"
+
+
+def _after_diff(state: ExtractState) -> str:
+    """Route: success -> write_output, retry -> diff, out of diff retries -> full category flow, cost exceeded -> end."""
+    if state.get("cost_exceeded"):
+        return "__end__"
+    if state.get("product") is not None:
+        return "write_output"
+    if state.get("diff_attempt", 0) >= DIFF_MAX_RETRIES:
+        return "extract_category"
+    return "extract_diff"
+
+
 def _after_category(state: ExtractState) -> str:
     """Route: success -> product, retry -> category, max retries -> end, cost exceeded -> end."""
     if state.get("cost_exceeded"):
@@ -227,10 +525,28 @@ def _after_product(state: ExtractState) -> str:
 #
 #                    START
 #                      │
-#                      ▼
+#         ┌────────────┴──────────────┐
+#         ▼                           ▼
+#   refresh_price ──(fails)──▶  prepare_context
+#   (refresh mode, known page:
+#    JSON-LD or small LLM call)
+#         │
+#         ▼
+#    write_output
+#
 #              prepare_context
 #                      │
-#                      ▼
+#         ┌────────────┼─────────────────────────┐
+#         │            │                         │
+#         ▼            ▼                         ▼
+#  reuse_product   extract_diff             extract_category
+#  (identical      (near duplicate:         (new page; also the
+#   filtered HTML)  changed fields only)     fallback if diff fails)
+#         │            │
+#         └─────┬──────┘
+#               ▼
+#          write_output
+#
 #              extract_category
 #                      │
 #         ┌────────────┼────────────┐
@@ -251,25 +567,65 @@ def _after_product(state: ExtractState) -> str:
 #     ▼
 #    END
 #
-_extraction_graph = StateGraph(ExtractState)
-_extraction_graph.add_node("prepare_context", _prepare_context)
-_extraction_graph.add_node("extract_category", _extract_category_node)
-_extraction_graph.add_node("extract_product", _extract_product_node)
-_extraction_graph.add_node("write_output", _write_output_node)
-_extraction_graph.add_edge(START, "prepare_context")
-_extraction_graph.add_edge("prepare_context", "extract_category")
-_extraction_graph.add_conditional_edges("extract_category", _after_category, path_map={
-    "extract_product": "extract_product",
-    "extract_category": "extract_category",
-    "__end__": END,
-})
-_extraction_graph.add_conditional_edges("extract_product", _after_product, path_map={
-    "write_output": "write_output",
-    "extract_product": "extract_product",
-    "__end__": END,
-})
-_extraction_graph.add_edge("write_output", END)
-extraction_graph = _extraction_graph.compile()
+@lru_cache
+def get_extraction_graph():
+    """Compile the extraction graph on first use (LangGraph is imported here, not at module import)."""
+    from langgraph.graph import StateGraph, START, END
+
+    graph = StateGraph(ExtractState)
+    graph.add_node("prepare_context", _prepare_context)
+    graph.add_node("extract_category", _extract_category_node)
+    graph.add_node("extract_product", _extract_product_node)
+    graph.add_node("reuse_product", _reuse_product_node)
+    graph.add_node("extract_diff", _extract_diff_node)
+    graph.add_node("refresh_price", _refresh_price_node)
+    graph.add_node("write_output", _write_output_node)
+    graph.add_conditional_edges(START, _route_start, path_map={
+        "refresh_price": "refresh_price",
+        "prepare_context": "prepare_context",
+    })
+    graph.add_conditional_edges("refresh_price", _after_refresh, path_map={
+        "write_output": "write_output",
+        "refresh_price": "refresh_price",
+        "prepare_context": "prepare_context",
+        "__end__": END,
+    })
+    graph.add_conditional_edges("prepare_context", _after_prepare, path_map={
+        "reuse_product": "reuse_product",
+        "extract_diff": "extract_diff",
+        "extract_category": "extract_category",
+    })
+    graph.add_edge("reuse_product", "write_output")
+    graph.add_conditional_edges("extract_diff", _after_diff, path_map={
+        "write_output": "write_output",
+        "extract_diff": "extract_diff",
+        "extract_category": "extract_category",
+        "__end__": END,
+    })
+    graph.add_conditional_edges("extract_category", _after_category, path_map={
+        "extract_product": "extract_product",
+        "extract_category": "extract_category",
+        "__end__": END,
+    })
+    graph.add_conditional_edges("extract_product", _after_product, path_map={
+        "write_output": "write_output",
+        "extract_product": "extract_product",
+        "__end__": END,
+    })
+    graph.add_edge("write_output", END)
+    return graph.compile()
+
+
+def __getattr__(name: str):
+    """Lazy module attributes kept for callers that import extraction_graph or the runnables directly."""
+    if name == "extraction_graph":
+        return get_extraction_graph()
+    if name == "category_runnable":
+        return _runnables()["category"]
+    if name == "product_runnable":
+        return _runnables()["product"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 
 
@@ -298,11 +654,45 @@ def _product_to_csv_row(product: models.Product, filename: str) -> dict:
     return {k: _sanitize_csv_cell(v) for k, v in raw.items()}
 
 
+# filename -> product rows upserted inside batched_output(), written when the batch ends.
+_pending_rows: ContextVar[dict[str, models.Product] | None] = ContextVar("pending_rows", default=None)
+
+
+@contextmanager
+def batched_output():
+    """Defer data_out.csv and its derived artifacts to one rebuild when the context exits.
+
+    Outside it every upsert rewrites the CSV, facets, similarity index, snapshot and columnar
+    export, which is O(catalog) per page. A batch run collects its rows here instead (tasks
+    started inside share the same pending dict) and writes them all at once, also on error.
+    The API serves the previous catalog version until then.
+    """
+    pending: dict[str, models.Product] = {}
+    token = _pending_rows.set(pending)
+    try:
+        yield
+    finally:
+        _pending_rows.reset(token)
+        if pending:
+            _write_rows(pending)
+
+
 def _upsert_row(filename: str, product: models.Product) -> None:
-    """Append or overwrite row in data_out.csv by filename (key). Uses pandas."""
+    """Append or overwrite row in data_out.csv by filename (key), or queue it inside batched_output()."""
+    pending = _pending_rows.get()
+    if pending is not None:
+        pending[filename] = product
+        return
+    _write_rows({filename: product})
+
+
+def _write_rows(products: dict[str, models.Product]) -> None:
+    """Upsert rows into data_out.csv by filename (key) and rebuild its derived artifacts once. Uses pandas."""
+    import pandas as pd
+
     DATA_OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    row = _product_to_csv_row(product, filename)
-    column_order = list(row.keys())
+    rows = {filename: _product_to_csv_row(product, filename) for filename, product in products.items()}
+    column_order = list(next(iter(rows.values())).keys())
 
     try:
         if DATA_OUT_PATH.exists():
@@ -311,24 +701,81 @@ def _upsert_row(filename: str, product: models.Product) -> None:
                 df = pd.DataFrame(columns=column_order)
             else:
                 if KEY_COLUMN in df.columns:
-                    df = df[df[KEY_COLUMN].astype(str) != filename]
+                    df = df[~df[KEY_COLUMN].astype(str).isin(rows)]
         else:
             df = pd.DataFrame(columns=column_order)
     except pd.errors.EmptyDataError:
         df = pd.DataFrame(columns=column_order)
 
-    new_df = pd.DataFrame([row])
+    new_df = pd.DataFrame(list(rows.values()))
     df = pd.concat([df, new_df], ignore_index=True)
     df = df.reindex(columns=column_order, fill_value="")
+    previous_version = facets.catalog_version(DATA_OUT_PATH)
     df.to_csv(DATA_OUT_PATH, index=False)
-    logger.info("Upserted row for %r to %s", filename, DATA_OUT_PATH)
-
-
-async def extract(html_request: models.ExtractRequest, source_filename: str | None = None, model: str | None = None):
+    version = facets.catalog_version(DATA_OUT_PATH)
+    records = df.fillna("").astype(str).to_dict("records")
+    # Refresh the precomputed facet cube so /api/facets never scans the catalog per request.
+    facets.write_facets(records, version)
+    _update_similarity_index(rows, records, previous_version, version)
+    # Publish a new immutable snapshot; API workers in --serve mode swap to it on their next request.
+    snapshot.build_snapshot(records, version)
+    # Keep the full (untruncated, nested) products and their columnar partitions in step with the CSV.
+    columnar.upsert_products({filename: product.model_dump() for filename, product in products.items()})
+    logger.info("Upserted %d row(s) to %s: %s", len(rows), DATA_OUT_PATH, ", ".join(map(repr, rows)))
+
+
+def _update_similarity_index(rows: dict[str, dict], records: list[dict], previous_version: tuple, version: tuple) -> None:
+    """Upsert rows into the similar-products index, rebuilding it if it did not match the previous CSV."""
+    from similar import SimilarityIndex
+
+    loaded = SimilarityIndex.load()
+    if loaded is not None and loaded[1] == previous_version:
+        index = loaded[0]
+        for filename, row in rows.items():
+            index.upsert(filename, row)
+    else:
+        index = SimilarityIndex.build(records, key=KEY_COLUMN)
+    index.save(version)
+
+
+def _stored_product(filename: str) -> dict | None:
+    """The stored product of an already extracted page for refresh mode, or None to extract it in full.
+
+    data/products.json is preferred; pages extracted before it existed fall back to their
+    data_out.csv row (truncated description, at most 10 image_urls).
+    """
+    stored = columnar.load_products().get(filename)
+    if stored is not None:
+        return stored
+    row = None
+    if DATA_OUT_PATH.exists():
+        with open(DATA_OUT_PATH, newline="", encoding="utf-8") as f:
+            row = next((r for r in csv.DictReader(f) if r.get(KEY_COLUMN) == filename), None)
+    if row is None:
+        logger.info("No stored product for %r; running a full extraction instead of a refresh", filename)
+        return None
+    try:
+        product = models.Product.model_validate(columnar.product_from_row(row))
+    except PydanticValidationError:
+        logger.info("data_out.csv row for %r is not a valid product; running a full extraction instead of a refresh", filename)
+        return None
+    logger.info("Refreshing %r from its data_out.csv row (not in %s)", filename, columnar.PRODUCTS_PATH.name)
+    return product.model_dump()
+
+
+async def extract(
+    html_request: models.ExtractRequest,
+    source_filename: str | None = None,
+    model: str | None = None,
+    refresh_only: bool = False,
+):
     """Extract product data from raw HTML via a single LangGraph (context + retries).
     html_request: models.ExtractRequest
     source_filename: if set, upsert result to data_out.csv (overwrite if key exists, else append).
-    model: optional model override (e.g. for testing); default EXTRACT_MODEL.
+    model: optional model override (e.g. for testing); default is the MODEL_CASCADE, escalating on failures.
+    Every LLM call is recorded in the result's "attempts" and, unless model is pinned, folded into the per-domain routing stats.
+    refresh_only: if the page was extracted before (data/products.json or data_out.csv), keep its stored product
+    and only refresh price and availability.
     """
     initial: ExtractState = {
         "html_content": html_request.html_content,
@@ -337,7 +784,15 @@ async def extract(html_request: models.ExtractRequest, source_filename: str | No
     }
     if model is not None:
         initial["model"] = model
-    final = await extraction_graph.ainvoke(initial)
+    if refresh_only and source_filename:
+        stored = _stored_product(source_filename)
+        if stored is not None:
+            initial["refresh_product"] = stored
+    final = await get_extraction_graph().ainvoke(initial)
+    attempts = final.get("attempts") or []
+    # A pinned model bypasses the cascade, so its outcomes say nothing about routing.
+    if attempts and model is None:
+        record_outcome(final.get("domain") or "unknown", attempts, success=final.get("product") is not None and not final.get("cost_exceeded"))
 
     if final.get("cost_exceeded"):
         raise HTTPException(
@@ -359,15 +814,36 @@ async def extract(html_request: models.ExtractRequest, source_filename: str | No
             detail={"step": "product", "validation_error": final.get("product_retry_error") or "Max retries exceeded"},
         )
 
-    return {"status": "ok", "product": final["product"].model_dump()}
+    return {
+        "status": "ok",
+        "product": final["product"].model_dump(),
+        "attempts": attempts,
+        "duplicate_of": final.get("duplicate_of"),
+        "llm_calls_saved": final.get("llm_calls_saved", 0),
+        "refresh_source": final.get("refresh_source"),
+    }
+
 
+async def extract_stored(name: str, store: HtmlStore | None = None, model: str | None = None, refresh_only: bool = False):
+    """Extract a page read from the content-addressed HTML store; the page name is the CSV key."""
+    store = store or HtmlStore()
+    html_content = store.get_text(name)
+    return await extract(
+        models.ExtractRequest(html_content=html_content),
+        source_filename=name,
+        model=model,
+        refresh_only=refresh_only,
+    )
 
 
 
 
-def filter_html(soup: BeautifulSoup) -> str:
+
+def filter_html(soup: "BeautifulSoup") -> str:
     """Filter the html to remove noise and only include product-relevant content.
     """
+    from bs4 import BeautifulSoup, Comment
+
     # Work on a copy so we don't mutate the original
     soup = BeautifulSoup(str(soup), "html.parser")
 
@@ -0,0 +1,218 @@
+"""LangChain runnables that call the LLM for each extraction step.
+
+Kept apart from scripts.extract so LangChain, the OpenAI SDK and the taxonomy prompt are
+only imported when an extraction actually runs.
+"""
+
+import asyncio
+
+from langchain_core.runnables import RunnableSerializable
+from pydantic import ValidationError
+
+import ai as ai_module
+import models
+# Import the prompts for each of our langchain nodes steps
+from prompts import (
+    CATEGORY_SYSTEM,
+    CATEGORY_USER,
+    RETRY_CATEGORY_APPEND,
+    PRODUCT_SYSTEM,
+    PRODUCT_USER,
+    RETRY_PRODUCT_APPEND,
+    PRODUCT_COMPACT_SYSTEM,
+    PRODUCT_COMPACT_USER,
+    RETRY_PRODUCT_COMPACT_APPEND,
+    CONTINUE_USER,
+    CONTINUE_CATEGORY,
+    CONTINUE_PRODUCT,
+    CONTINUE_PRODUCT_COMPACT,
+    DIFF_SYSTEM,
+    DIFF_USER,
+    RETRY_DIFF_APPEND,
+    REFRESH_SYSTEM,
+    REFRESH_USER,
+    RETRY_REFRESH_APPEND,
+)
+from scripts.routing import MODEL_CASCADE
+
+EXTRACT_MODEL = MODEL_CASCADE[0]
+# Structured-output format of the product call: "compact" (models.ProductWire, expanded to
+# Product before validation) or "full" (models.Product verbatim).
+WIRE_FORMATS = ("compact", "full")
+PRODUCT_WIRE = "compact"
+
+
+def _continuation(system: str, retry_context: dict, correction: str) -> tuple[list[dict], dict]:
+    """(messages, extra request kwargs) for a retry that continues the failed exchange without the HTML.
+
+    retry_context is {"output": previous answer, "response_id": provider id or None}.
+    Without a stateful provider the system prompt is resent, so the saving is only the HTML;
+    the category step (whose system prompt is the taxonomy) therefore continues only statefully.
+    """
+    if ai_module.STATEFUL_RESPONSES and retry_context.get("response_id"):
+        return [{"role": "user", "content": correction}], {"previous_response_id": retry_context["response_id"]}
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": CONTINUE_USER},
+        {"role": "assistant", "content": retry_context["output"]},
+        {"role": "user", "content": correction},
+    ]
+    return messages, {}
+
+
+class OpenRouterCategoryExtractor(RunnableSerializable[dict, models.Category]):
+    """Extract Category from HTML (Google Product Taxonomy). Uses ai.responses → _log_usage."""
+
+    model: str = EXTRACT_MODEL
+
+    def invoke(self, input: dict, **kwargs) -> models.Category:
+        return asyncio.run(self.ainvoke(input, **kwargs))
+
+    async def ainvoke(self, input: dict, **kwargs) -> models.Category:
+        html = input["html"]
+        model = input.get("model") or self.model
+        retry_error = input.get("retry_error")
+        retry_context = input.get("retry_context")
+        extra = {}
+        if retry_error and retry_context:
+            messages, extra = _continuation(
+                CATEGORY_SYSTEM, retry_context, CONTINUE_CATEGORY.format(retry_error=retry_error)
+            )
+        else:
+            user = CATEGORY_USER.format(html=html)
+            if retry_error:
+                user += RETRY_CATEGORY_APPEND.format(retry_error=retry_error)
+            messages = [
+                {"role": "system", "content": CATEGORY_SYSTEM},
+                {"role": "user", "content": user},
+            ]
+        result, cost = await ai_module.responses(
+            model,
+            messages,
+            text_format=models.Category,
+            **extra,
+        )
+        return (result, cost)
+
+
+class OpenRouterProductExtractor(RunnableSerializable[dict, models.Product]):
+    """Extract full Product from HTML with category fixed. Uses ai.responses → _log_usage.
+
+    input["wire"] (or self.wire) selects the structured-output format; see WIRE_FORMATS.
+    With input["retry_context"], a retry continues the failed exchange instead of resending the HTML.
+    """
+
+    model: str = EXTRACT_MODEL
+    wire: str = PRODUCT_WIRE
+
+    def invoke(self, input: dict, **kwargs) -> models.Product:
+        return asyncio.run(self.ainvoke(input, **kwargs))
+
+    async def ainvoke(self, input: dict, **kwargs) -> models.Product:
+        html = input["html"]
+        model = input.get("model") or self.model
+        category_name = input["category_name"]
+        retry_error = input.get("retry_error")
+        retry_context = input.get("retry_context")
+        extra = {}
+        if (input.get("wire") or self.wire) == "compact":
+            if retry_error and retry_context:
+                messages, extra = _continuation(
+                    PRODUCT_COMPACT_SYSTEM, retry_context, CONTINUE_PRODUCT_COMPACT.format(retry_error=retry_error)
+                )
+            else:
+                user = PRODUCT_COMPACT_USER.format(html=html, category_name=category_name)
+                if retry_error:
+                    user += RETRY_PRODUCT_COMPACT_APPEND.format(retry_error=retry_error)
+                messages = [
+                    {"role": "system", "content": PRODUCT_COMPACT_SYSTEM},
+                    {"role": "user", "content": user},
+                ]
+            wire, cost = await ai_module.responses(
+                model,
+                messages,
+                text_format=models.ProductWire,
+                **extra,
+            )
+            if wire is None:
+                return (None, cost)
+            try:
+                return (wire.to_product(category_name), cost)
+            except ValidationError as e:
+                # The wire parsed but its expansion is not a valid Product; keep the answer for a follow-up.
+                raise ai_module.OutputValidationError(e, wire.model_dump_json(), None, cost) from e
+        if retry_error and retry_context:
+            messages, extra = _continuation(
+                PRODUCT_SYSTEM,
+                retry_context,
+                CONTINUE_PRODUCT.format(retry_error=retry_error, category_name=category_name),
+            )
+        else:
+            user = PRODUCT_USER.format(html=html, category_name=category_name)
+            if retry_error:
+                user += RETRY_PRODUCT_APPEND.format(retry_error=retry_error, category_name=category_name)
+            messages = [
+                {"role": "system", "content": PRODUCT_SYSTEM},
+                {"role": "user", "content": user},
+            ]
+        result, cost = await ai_module.responses(
+            model,
+            messages,
+            text_format=models.Product,
+            **extra,
+        )
+        return (result, cost)
+
+
+class OpenRouterDiffExtractor(RunnableSerializable[dict, models.ProductDiff]):
+    """Extract only the fields that differ from a near-duplicate page's stored Product."""
+
+    model: str = EXTRACT_MODEL
+
+    def invoke(self, input: dict, **kwargs) -> models.ProductDiff:
+        return asyncio.run(self.ainvoke(input, **kwargs))
+
+    async def ainvoke(self, input: dict, **kwargs) -> models.ProductDiff:
+        html = input["html"]
+        model = input.get("model") or self.model
+        retry_error = input.get("retry_error")
+        user = DIFF_USER.format(previous_product=input["previous_product"], html=html)
+        if retry_error:
+            user += RETRY_DIFF_APPEND.format(retry_error=retry_error)
+        messages = [
+            {"role": "system", "content": DIFF_SYSTEM},
+            {"role": "user", "content": user},
+        ]
+        result, cost = await ai_module.responses(
+            model,
+            messages,
+            text_format=models.ProductDiff,
+        )
+        return (result, cost)
+
+
+class OpenRouterRefreshExtractor(RunnableSerializable[dict, models.PriceRefresh]):
+    """Extract only price and out-of-stock options for an already extracted page."""
+
+    model: str = EXTRACT_MODEL
+
+    def invoke(self, input: dict, **kwargs) -> models.PriceRefresh:
+        return asyncio.run(self.ainvoke(input, **kwargs))
+
+    async def ainvoke(self, input: dict, **kwargs) -> models.PriceRefresh:
+        html = input["html"]
+        model = input.get("model") or self.model
+        retry_error = input.get("retry_error")
+        user = REFRESH_USER.format(options="\n".join(input["options"]) or "(none)", html=html)
+        if retry_error:
+            user += RETRY_REFRESH_APPEND.format(retry_error=retry_error)
+        messages = [
+            {"role": "system", "content": REFRESH_SYSTEM},
+            {"role": "user", "content": user},
+        ]
+        result, cost = await ai_module.responses(
+            model,
+            messages,
+            text_format=models.PriceRefresh,
+        )
+        return (result, cost)
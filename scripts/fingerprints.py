@@ -0,0 +1,173 @@
+"""Near-duplicate page detection with MinHash + LSH over filter_html output.
+
+Each extracted page's filtered HTML is reduced to word 5-gram shingles, hashed (crc32)
+and summarized by a NUM_PERM-value MinHash signature (multiply-shift permutations,
+vectorized with NumPy). Signatures are split into LSH_BANDS bands; pages sharing any band
+are candidates, and the fraction of equal signature values estimates their Jaccard
+similarity.
+
+The index (data/fingerprints.json) also keeps each page's full extracted product and a
+SHA-256 digest of its filtered HTML. A page whose digest matches reuses that product
+outright; a near-duplicate (>= DIFF_THRESHOLD) runs a diff-only extraction against it
+instead of the full two-call graph. Similarity alone never triggers reuse: color/size
+variant pages differ in only a few shingles and can score close to 1.0.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import zlib
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = Path(__file__).resolve().parent.parent / "data" / "fingerprints.json"
+
+NUM_PERM = 64
+LSH_BANDS = 16  # 16 bands x 4 rows: pages above ~0.5 Jaccard usually collide in some band
+SHINGLE_WORDS = 5
+# Estimated Jaccard at or above which only a diff against the stored product is extracted.
+DIFF_THRESHOLD = 0.75
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_TOKEN_RE = re.compile(r"\w+")
+_SEED = 0x5EED
+
+
+def _permutations():
+    import numpy as np
+
+    rng = np.random.default_rng(_SEED)
+    a = rng.integers(1, 2**32, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint64)
+    return a, b
+
+
+def signature(html_filtered: str) -> list[int] | None:
+    """MinHash signature of the page's text shingles, or None if the page has too little text."""
+    import numpy as np
+
+    tokens = _TOKEN_RE.findall(_TAG_RE.sub(" ", html_filtered).lower())
+    if len(tokens) < SHINGLE_WORDS:
+        return None
+    shingles = {" ".join(tokens[i:i + SHINGLE_WORDS]) for i in range(len(tokens) - SHINGLE_WORDS + 1)}
+    hashes = np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+    a, b = _permutations()
+    # Multiply-shift hashing: (a*h + b) mod 2^64, keep the high 32 bits. Overflow wraps by design.
+    with np.errstate(over="ignore"):
+        permuted = (a[:, None] * hashes[None, :] + b[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).astype(np.uint32).tolist()
+
+
+def content_digest(html_filtered: str) -> str:
+    """SHA-256 of the filtered HTML; equal digests mean the model would see the same page."""
+    return hashlib.sha256(html_filtered.encode("utf-8")).hexdigest()
+
+
+def similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity: fraction of equal MinHash values."""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def _bands(sig: list[int]) -> list[str]:
+    rows = NUM_PERM // LSH_BANDS
+    return [f"{i}:" + ",".join(map(str, sig[i * rows:(i + 1) * rows])) for i in range(LSH_BANDS)]
+
+
+class FingerprintIndex:
+    """Signatures and stored products keyed by filename, with in-memory LSH buckets."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = path
+        data = {}
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                logger.warning("Could not read %s; starting with an empty fingerprint index", path)
+        # filename -> {"signature": [...], "digest": str | None, "product": {...}}
+        self.pages: dict[str, dict] = data.get("pages", {})
+        self.stats: dict[str, int] = data.get("stats", {"reused": 0, "diffed": 0, "llm_calls_saved": 0})
+        self._buckets: dict[str, set[str]] = {}
+        self._digests: dict[str, set[str]] = {}
+        for name, entry in self.pages.items():
+            self._add_to_buckets(name, entry)
+
+    def _add_to_buckets(self, name: str, entry: dict) -> None:
+        for band in _bands(entry["signature"]):
+            self._buckets.setdefault(band, set()).add(name)
+        if entry.get("digest"):
+            self._digests.setdefault(entry["digest"], set()).add(name)
+
+    def _remove_from_buckets(self, name: str, entry: dict) -> None:
+        for band in _bands(entry["signature"]):
+            self._buckets.get(band, set()).discard(name)
+        if entry.get("digest"):
+            self._digests.get(entry["digest"], set()).discard(name)
+
+    def nearest(self, sig: list[int], exclude: str | None = None) -> tuple[str, float] | None:
+        """Most similar indexed page among LSH candidates (excluding one filename), or None."""
+        candidates: set[str] = set()
+        for band in _bands(sig):
+            candidates |= self._buckets.get(band, set())
+        candidates.discard(exclude)
+        best = None
+        for name in candidates:
+            score = similarity(sig, self.pages[name]["signature"])
+            if best is None or score > best[1]:
+                best = (name, score)
+        return best
+
+    def exact(self, digest: str, exclude: str | None = None) -> str | None:
+        """An indexed page (other than exclude) whose filtered HTML has this digest, or None."""
+        return min(self._digests.get(digest, set()) - {exclude}, default=None)
+
+    def duplicate(self, sig: list[int], digest: str, exclude: str | None = None) -> tuple[str, float, str] | None:
+        """(filename, similarity, "reuse" | "diff") of the page to build on, or None to extract from scratch.
+
+        Only a page with identical filtered HTML is reused; a near-duplicate is diffed against.
+        """
+        name = self.exact(digest, exclude)
+        if name is not None:
+            return name, 1.0, "reuse"
+        match = self.nearest(sig, exclude)
+        if match is not None and match[1] >= DIFF_THRESHOLD:
+            return match[0], match[1], "diff"
+        return None
+
+    def product(self, name: str) -> dict | None:
+        entry = self.pages.get(name)
+        return entry["product"] if entry else None
+
+    def upsert(self, name: str, sig: list[int], digest: str | None, product: dict) -> None:
+        old = self.pages.get(name)
+        if old is not None:
+            self._remove_from_buckets(name, old)
+        self.pages[name] = {"signature": sig, "digest": digest, "product": product}
+        self._add_to_buckets(name, self.pages[name])
+
+    def update_product(self, name: str, product: dict) -> None:
+        """Replace an indexed page's stored product without re-fingerprinting it (refresh mode).
+
+        The digest described the previous HTML, so it is dropped: the page can still be diffed
+        against, but is no longer reused as-is.
+        """
+        entry = self.pages.get(name)
+        if entry is None:
+            return
+        self._remove_from_buckets(name, entry)
+        self.pages[name] = {**entry, "digest": None, "product": product}
+        self._add_to_buckets(name, self.pages[name])
+
+    def record_saving(self, kind: str, calls_saved: int) -> None:
+        """Count a reuse ("reused") or diff-only extraction ("diffed") and the LLM calls it avoided."""
+        self.stats[kind] = self.stats.get(kind, 0) + 1
+        self.stats["llm_calls_saved"] = self.stats.get("llm_calls_saved", 0) + calls_saved
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"stats": self.stats, "pages": self.pages}), encoding="utf-8")
+        os.replace(tmp, self.path)
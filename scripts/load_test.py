@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+API load test: synthetic catalog, local server, concurrent request mix, latency percentiles.
+
+Steps:
+- Generate a synthetic catalog of --products rows in the data_out.csv schema (seeded, so the
+  same arguments always produce the same file) in a temporary directory.
+- Start the FastAPI app with uvicorn on that catalog (CATALOG_CSV; data/ is never touched),
+  or target an already running server with --url.
+- Build a seeded sequence of --requests requests drawn from the --mix weights, send --warmup
+  of them unmeasured, then the rest with --concurrency clients.
+- Report throughput and p50/p95/p99 latency overall and per request kind; write JSON.
+
+Request kinds (name=weight in --mix):
+  list      GET /api/products
+  brand     GET /api/products?brand=<brand>
+  product   GET /api/products/<filename>
+  missing   GET /api/products/<unknown filename>   (404 path)
+  facets    GET /api/facets?brand=<brand>
+  similar   GET /api/products/<filename>/similar
+New endpoints (e.g. search) are added as another entry in REQUEST_KINDS.
+
+Usage:
+  python -m scripts.load_test [--products N] [--requests N] [--concurrency N] [--mix product=8,list=1,...]
+                              [--workers N] [--url http://host:port] [--out path]
+"""
+import argparse
+import asyncio
+import csv
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from taxonomy import CATEGORIES
+
+DEFAULT_OUT = Path(__file__).resolve().parent / "load_test_results.json"
+DEFAULT_MIX = "product=8,brand=2,list=1,facets=2,similar=1,missing=1"
+# Columns of data/data_out.csv (see scripts.extract._product_to_csv_row).
+CSV_COLUMNS = [
+    "filename", "name", "brand", "category", "price", "currency", "compare_at_price", "description",
+    "key_features", "image_urls", "video_url", "colors", "variants",
+]
+BRANDS = 200
+SERVER_START_TIMEOUT_S = 60
+_WORDS = (
+    "classic premium lightweight waterproof cordless compact organic slim pro ultra everyday "
+    "stainless ergonomic wireless vintage modern insulated breathable durable recycled portable"
+).split()
+_NOUNS = "drill jacket sneaker lamp backpack kettle headphones chair watch blender tent mug".split()
+_COLORS = "Black White Red Blue Green Grey Navy Beige Olive Pink".split()
+
+
+# ---- synthetic catalog ----
+def _synthetic_row(i: int, rng: random.Random, categories: list[str]) -> dict:
+    brand = f"Brand {rng.randrange(BRANDS):03d}"
+    name = f"{brand} {' '.join(rng.sample(_WORDS, 2)).title()} {rng.choice(_NOUNS).title()} {i}"
+    price = round(rng.lognormvariate(4, 1), 2)
+    on_sale = rng.random() < 0.2
+    colors = rng.sample(_COLORS, rng.randint(1, 4))
+    variants = [
+        {"title": "Size", "options": [
+            {"value": str(size), "available": rng.random() < 0.8, "price": None} for size in range(6, 6 + rng.randint(2, 8))
+        ]},
+    ] if rng.random() < 0.6 else []
+    return {
+        "filename": f"product-{i:07d}.html",
+        "name": name,
+        "brand": brand,
+        "category": rng.choice(categories),
+        "price": price,
+        "currency": "USD",
+        "compare_at_price": round(price * 1.25, 2) if on_sale else "",
+        "description": " ".join(rng.choices(_WORDS + _NOUNS, k=rng.randint(30, 80)))[:500],
+        "key_features": "|".join(" ".join(rng.sample(_WORDS, 3)) for _ in range(rng.randint(2, 6))),
+        "image_urls": "|".join(f"https://cdn.example.com/p/{i}/{n}.jpg" for n in range(rng.randint(1, 8))),
+        "video_url": f"https://cdn.example.com/p/{i}/video.mp4" if rng.random() < 0.1 else "",
+        "colors": "|".join(colors),
+        "variants": json.dumps(variants) if variants else "",
+    }
+
+
+def write_catalog(path: Path, n: int, seed: int) -> list[dict]:
+    """Write n synthetic rows to path in the data_out.csv schema. Returns [{filename, brand}] for request building."""
+    rng = random.Random(seed)
+    # A few hundred categories is enough spread for facets without making every bucket tiny.
+    categories = rng.sample(list(CATEGORIES), min(300, len(CATEGORIES)))
+    keys = []
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        for i in range(n):
+            row = _synthetic_row(i, rng, categories)
+            writer.writerow(row)
+            keys.append({"filename": row["filename"], "brand": row["brand"]})
+    return keys
+
+
+# ---- requests ----
+REQUEST_KINDS = {
+    "list": lambda rng, keys: "/api/products",
+    "brand": lambda rng, keys: f"/api/products?brand={quote(rng.choice(keys)['brand'])}",
+    "product": lambda rng, keys: f"/api/products/{quote(rng.choice(keys)['filename'])}",
+    "missing": lambda rng, keys: f"/api/products/missing-{rng.randrange(10**9)}.html",
+    "facets": lambda rng, keys: f"/api/facets?brand={quote(rng.choice(keys)['brand'])}",
+    "similar": lambda rng, keys: f"/api/products/{quote(rng.choice(keys)['filename'])}/similar",
+}
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """'product=8,list=1' -> {"product": 8.0, "list": 1.0}. Raises ValueError on unknown kinds."""
+    mix = {}
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in REQUEST_KINDS:
+            raise ValueError(f"unknown request kind {name!r}; choose from {', '.join(REQUEST_KINDS)}")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("mix needs at least one kind with a positive weight")
+    return mix
+
+
+def build_requests(n: int, mix: dict[str, float], keys: list[dict], seed: int) -> list[tuple[str, str]]:
+    """Seeded sequence of (kind, path)."""
+    rng = random.Random(seed + 1)
+    kinds = rng.choices(list(mix), weights=list(mix.values()), k=n)
+    return [(kind, REQUEST_KINDS[kind](rng, keys)) for kind in kinds]
+
+
+# ---- server ----
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(catalog: Path, port: int, workers: int) -> subprocess.Popen:
+    """Start uvicorn on the catalog and wait for /health. Raises RuntimeError if it does not come up."""
+    env = {**os.environ, "CATALOG_CSV": str(catalog)}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=ROOT, env=env,
+    )
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_S
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"server exited with code {proc.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"server did not answer /health within {SERVER_START_TIMEOUT_S}s")
+
+
+# ---- load ----
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _latency_summary(samples: list[dict], elapsed: float | None = None) -> dict:
+    ms = [s["ms"] for s in samples]
+    out = {
+        "requests": len(samples),
+        "errors": sum(s["status"] is None or s["status"] >= 500 for s in samples),
+        "status": {str(k): sum(s["status"] == k for s in samples) for k in sorted({s["status"] for s in samples}, key=str)},
+        "p50_ms": _round(_percentile(ms, 50)),
+        "p95_ms": _round(_percentile(ms, 95)),
+        "p99_ms": _round(_percentile(ms, 99)),
+        "max_ms": _round(max(ms) if ms else None),
+        "mean_bytes": round(sum(s["bytes"] for s in samples) / len(samples)) if samples else None,
+    }
+    if elapsed is not None:
+        out["throughput_rps"] = round(len(samples) / elapsed, 1) if elapsed > 0 else None
+    return out
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+async def run_load(base_url: str, requests: list[tuple[str, str]], concurrency: int, warmup: int) -> dict:
+    """Send warmup requests unmeasured, then the rest with concurrency clients. Returns the report dict."""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        for _, path in requests[:warmup]:
+            await client.get(path)
+
+        measured = requests[warmup:]
+        samples: list[dict] = []
+        next_index = 0
+
+        async def worker() -> None:
+            nonlocal next_index
+            while next_index < len(measured):
+                kind, path = measured[next_index]
+                next_index += 1
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    status, size = response.status_code, len(response.content)
+                except httpx.HTTPError:
+                    status, size = None, 0
+                samples.append({"kind": kind, "ms": (time.perf_counter() - start) * 1000, "status": status, "bytes": size})
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    kinds = sorted({s["kind"] for s in samples})
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "overall": _latency_summary(samples, elapsed),
+        "by_kind": {k: _latency_summary([s for s in samples if s["kind"] == k]) for k in kinds},
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load-test the products API on a synthetic catalog.")
+    parser.add_argument("--products", type=int, default=10_000, help="Synthetic catalog size (rows)")
+    parser.add_argument("--requests", type=int, default=5_000, help="Measured requests")
+    parser.add_argument("--warmup", type=int, default=200, help="Unmeasured requests sent first")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients")
+    parser.add_argument("--mix", type=str, default=DEFAULT_MIX, help=f"Request mix as kind=weight,... (default: {DEFAULT_MIX})")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes for the local server")
+    parser.add_argument("--url", type=str, default=None, help="Target a running server instead of starting one (its own catalog is used for keys)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the catalog and the request sequence")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="Output JSON path")
+    args = parser.parse_args()
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    with tempfile.TemporaryDirectory(prefix="load-test-") as tmp:
+        server = None
+        if args.url:
+            base_url = args.url.rstrip("/")
+            listing = httpx.get(f"{base_url}/api/products", timeout=60).json()["products"]
+            keys = [{"filename": p["filename"], "brand": p.get("brand", "")} for p in listing]
+            if not keys:
+                sys.exit(f"{base_url} serves an empty catalog")
+        else:
+            catalog = Path(tmp) / "data_out.csv"
+            start = time.perf_counter()
+            keys = write_catalog(catalog, args.products, args.seed)
+            print(f"Synthetic catalog: {len(keys)} rows, {catalog.stat().st_size / 1e6:.1f} MB "
+                  f"in {time.perf_counter() - start:.1f}s", flush=True)
+            port = _free_port()
+            server = start_server(catalog, port, args.workers)
+            base_url = f"http://127.0.0.1:{port}"
+        try:
+            requests = build_requests(args.warmup + args.requests, mix, keys, args.seed)
+            print(f"Load: {args.requests} requests, concurrency {args.concurrency}, mix {args.mix}", flush=True)
+            report = asyncio.run(run_load(base_url, requests, args.concurrency, args.warmup))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=30)
+
+    results = {
+        "config": {
+            "products": len(keys),
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "mix": mix,
+            "workers": None if args.url else args.workers,
+            "url": args.url,
+            "seed": args.seed,
+        },
+        "environment": {"git_commit": _git_commit(), "python": platform.python_version(), "cpus": os.cpu_count()},
+        **report,
+    }
+    o = report["overall"]
+    print(f"overall: {o['throughput_rps']} req/s p50={o['p50_ms']}ms p95={o['p95_ms']}ms p99={o['p99_ms']}ms errors={o['errors']}")
+    for kind, r in report["by_kind"].items():
+        print(f"  {kind}: n={r['requests']} p50={r['p50_ms']}ms p95={r['p95_ms']}ms p99={r['p99_ms']}ms")
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Wrote results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Price / availability refresh for pages that were already extracted.
+
+Recrawls mostly change price and stock, so refresh mode keeps the stored product and only
+updates Price and each variant option's availability. The deterministic path reads
+schema.org JSON-LD (Product / ProductGroup offers and hasVariant) straight from the raw
+HTML; only pages without usable JSON-LD fall back to a small LLM call (models.PriceRefresh).
+"""
+
+import json
+import math
+import re
+
+import models
+
+_LD_JSON_RE = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+# Separators between the parts of a variant name like "Tee - Slate / M" (a hyphen inside a
+# word, as in "X-Large", is not one).
+_NAME_PARTS_RE = re.compile(r"\s*[/,|]\s*|\s+-\s+")
+_IN_STOCK = ("instock", "limitedavailability", "onlineonly", "presale", "preorder")
+
+
+def _ld_objects(html: str) -> list[dict]:
+    """All JSON-LD objects in the page, flattening arrays and @graph."""
+    out: list[dict] = []
+
+    def walk(node) -> None:
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+        elif isinstance(node, dict):
+            out.append(node)
+            if "@graph" in node:
+                walk(node["@graph"])
+
+    for block in _LD_JSON_RE.findall(html):
+        try:
+            walk(json.loads(block.strip()))
+        except json.JSONDecodeError:
+            continue
+    return out
+
+
+def _types(obj: dict) -> set[str]:
+    t = obj.get("@type")
+    return {x.lower() for x in (t if isinstance(t, list) else [t]) if isinstance(x, str)}
+
+
+def _offers(obj: dict) -> list[dict]:
+    offers = obj.get("offers")
+    if isinstance(offers, dict):
+        return [offers]
+    return [o for o in offers if isinstance(o, dict)] if isinstance(offers, list) else []
+
+
+def _float(value) -> float | None:
+    try:
+        return float(str(value).replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _in_stock(offer: dict) -> bool | None:
+    availability = offer.get("availability")
+    if not isinstance(availability, str):
+        return None
+    return availability.rsplit("/", 1)[-1].lower() in _IN_STOCK
+
+
+def _price_from_offers(offers: list[dict], currency_hint: str) -> models.Price | None:
+    for offer in offers:
+        price = _float(offer.get("price") if offer.get("price") is not None else offer.get("lowPrice"))
+        if price is None:
+            spec = offer.get("priceSpecification")
+            if isinstance(spec, dict):
+                price = _float(spec.get("price"))
+        if price is not None:
+            return models.Price(price=price, currency=offer.get("priceCurrency") or currency_hint)
+    return None
+
+
+def price_from_json_ld(html: str, stored: models.Product) -> tuple[models.Price, list[models.Variant]] | None:
+    """(price, variants with refreshed availability) from JSON-LD, or None if the page has no usable offer price.
+
+    A stored compare_at_price is kept only while the price is unchanged (sale state is not in JSON-LD).
+    """
+    products = [o for o in _ld_objects(html) if _types(o) & {"product", "productgroup"}]
+    if not products:
+        return None
+    price = None
+    ld_variants: list[dict] = []
+    for obj in products:
+        price = price or _price_from_offers(_offers(obj), stored.price.currency)
+        variants = obj.get("hasVariant")
+        if isinstance(variants, list):
+            ld_variants.extend(v for v in variants if isinstance(v, dict))
+    if price is None:
+        for v in ld_variants:
+            price = _price_from_offers(_offers(v), stored.price.currency)
+            if price is not None:
+                break
+    if price is None:
+        return None
+    if price.price == stored.price.price:
+        price.compare_at_price = stored.price.compare_at_price
+    return price, _apply_ld_availability(stored.variants, ld_variants)
+
+
+def _apply_ld_availability(variants: list[models.Variant], ld_variants: list[dict]) -> list[models.Variant]:
+    """Set each option's availability from JSON-LD variants that carry its value.
+
+    An option matches a variant when its value equals one of the variant's properties
+    (color, size, sku, name) or a whole part of its name, never a substring ("S" is not "Slate").
+    One in-stock match makes an option available. It is only marked unavailable when the
+    listed variants cover every combination carrying its value (e.g. "Navy" in each size)
+    and none is in stock; otherwise an unlisted combination may still sell, so it keeps
+    its stored availability.
+    """
+    if not ld_variants:
+        return variants
+    stock: dict[frozenset, bool] = {}
+    for v in ld_variants:
+        in_stock = next((s for s in map(_in_stock, _offers(v)) if s is not None), None)
+        if in_stock is None:
+            continue
+        values = {str(v.get(k)).strip().lower() for k in ("color", "size", "name", "sku") if v.get(k)}
+        values.update(part for part in _NAME_PARTS_RE.split(str(v.get("name") or "").strip().lower()) if part)
+        key = frozenset(values)
+        stock[key] = stock.get(key, False) or in_stock
+    sizes = [max(len(variant.options), 1) for variant in variants]
+    updated = []
+    for i, variant in enumerate(variants):
+        # Stored combinations that carry one value of this variant.
+        combinations = math.prod(sizes[:i] + sizes[i + 1:])
+        options = []
+        for option in variant.options:
+            value = option.value.strip().lower()
+            matches = [s for values, s in stock.items() if value in values]
+            if any(matches):
+                available = True
+            elif len(matches) >= combinations:
+                available = False
+            else:
+                available = option.available
+            options.append(option.model_copy(update={"available": available}))
+        updated.append(variant.model_copy(update={"options": options}))
+    return updated
+
+
+def apply_llm_refresh(stored: models.Product, refresh: models.PriceRefresh) -> models.Product:
+    """Merge an LLM PriceRefresh: new price, and every known option available unless listed as unavailable."""
+    unavailable = {u.strip().lower() for u in refresh.unavailable}
+    variants = [
+        v.model_copy(update={"options": [
+            o.model_copy(update={"available": f"{v.title}={o.value}".strip().lower() not in unavailable})
+            for o in v.options
+        ]})
+        for v in stored.variants
+    ]
+    return stored.model_copy(update={"price": refresh.price, "variants": variants})
+
+
+def option_keys(product: models.Product) -> list[str]:
+    """Known variant options as "Title=Value" strings for the refresh prompt."""
+    return [f"{v.title}={o.value}" for v in product.variants for o in v.options]
@@ -0,0 +1,179 @@
+"""Model cascade and per-domain routing for the extraction graph.
+
+The cascade is ordered cheapest → strongest. Each extraction step starts at a tier
+chosen from past outcomes for the page's domain and escalates one tier after
+ESCALATE_AFTER failed (or low-confidence) attempts at the current tier.
+
+Outcomes are persisted to data/model_routing.json so routing improves across runs:
+
+  {"<domain>": {"pages": int, "successful_pages": int, "cost_usd": float,
+                "models": {"<model>": {"attempts": int, "successes": int, "cost_usd": float}}}}
+
+routing_report() compares the cascade's blended cost per successful page with an estimate of
+retrying the cheapest model alone (the pre-cascade behaviour); it is added to the run report
+and printed by:
+  python -m scripts.routing
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+# Cheapest first. Prices live in ai.MODEL_PRICES.
+MODEL_CASCADE = ["openai/gpt-5-nano", "openai/gpt-5-mini", "openai/gpt-5"]
+# Failed attempts allowed on one tier before moving to the next.
+ESCALATE_AFTER = 2
+# A domain needs this many attempts on a model before its success rate is trusted.
+ROUTE_MIN_SAMPLES = 3
+# Below this success rate a domain starts on the next tier instead.
+ROUTE_MIN_SUCCESS_RATE = 0.5
+
+ROUTING_PATH = Path(__file__).resolve().parent.parent / "data" / "model_routing.json"
+
+
+def page_domain(soup: "BeautifulSoup", fallback: str | None = None) -> str:
+    """Domain of the page from its canonical link or og:url, without a leading www."""
+    url = None
+    link = soup.find("link", rel="canonical")
+    if link and link.get("href"):
+        url = link["href"]
+    else:
+        meta = soup.find("meta", property="og:url")
+        if meta and meta.get("content"):
+            url = meta["content"]
+    netloc = urlparse(url).netloc.lower() if url else ""
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    return netloc or fallback or "unknown"
+
+
+def load_routing() -> dict:
+    """Load routing stats. Returns {} if the file is missing or unreadable."""
+    if not ROUTING_PATH.exists():
+        return {}
+    try:
+        return json.loads(ROUTING_PATH.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        logger.warning("Could not read %s; starting with empty routing", ROUTING_PATH)
+        return {}
+
+
+def start_tier(domain: str, cascade: list[str], routing: dict | None = None) -> int:
+    """First cascade tier whose history on this domain is unknown or good enough."""
+    routing = load_routing() if routing is None else routing
+    models_stats = routing.get(domain, {}).get("models", {})
+    for i, model in enumerate(cascade):
+        stats = models_stats.get(model)
+        if stats is None or stats.get("attempts", 0) < ROUTE_MIN_SAMPLES:
+            return i
+        if stats["successes"] / stats["attempts"] >= ROUTE_MIN_SUCCESS_RATE:
+            return i
+    return len(cascade) - 1
+
+
+def model_for_attempt(cascade: list[str], tier: int, attempt: int) -> str:
+    """Model to use for the given attempt number, starting from tier."""
+    return cascade[min(tier + attempt // ESCALATE_AFTER, len(cascade) - 1)]
+
+
+def record_outcome(domain: str, attempts: list[dict], success: bool) -> None:
+    """Fold one page's attempts into the routing stats and save them."""
+    routing = load_routing()
+    entry = routing.setdefault(domain, {"pages": 0, "successful_pages": 0, "cost_usd": 0.0, "models": {}})
+    entry["pages"] += 1
+    entry["successful_pages"] += int(success)
+    for a in attempts:
+        stats = entry["models"].setdefault(a["model"], {"attempts": 0, "successes": 0, "cost_usd": 0.0})
+        stats["attempts"] += 1
+        stats["successes"] += int(a["ok"])
+        stats["cost_usd"] += a["cost_usd"]
+        entry["cost_usd"] += a["cost_usd"]
+    ROUTING_PATH.parent.mkdir(parents=True, exist_ok=True)
+    ROUTING_PATH.write_text(json.dumps(routing, indent=2), encoding="utf-8")
+
+
+def blended_cost(entry: dict) -> float | None:
+    """Total spend divided by successful pages for one domain entry (None if no successes)."""
+    if not entry.get("successful_pages"):
+        return None
+    return entry["cost_usd"] / entry["successful_pages"]
+
+
+def single_model_cost(entry: dict, max_retries: int, model: str = MODEL_CASCADE[0]) -> float | None:
+    """Estimated cost per successful page had every step run on model alone, retried up to max_retries times.
+
+    Each attempt on model is treated as an independent trial with the domain's observed success
+    rate and mean cost, and a page needs the domain's observed number of successful steps. None
+    without enough data (no successful page, or model never succeeded on the domain).
+    """
+    stats = entry.get("models", {}).get(model)
+    if not stats or not stats.get("successes") or not entry.get("successful_pages"):
+        return None
+    p = stats["successes"] / stats["attempts"]
+    mean_cost = stats["cost_usd"] / stats["attempts"]
+    steps = sum(m["successes"] for m in entry["models"].values()) / entry["successful_pages"]
+    step_success = 1 - (1 - p) ** max_retries
+    # Expected attempts per step is a geometric series cut off at max_retries.
+    step_cost = mean_cost * step_success / p
+    return steps * step_cost / step_success ** steps
+
+
+def routing_report(max_retries: int, routing: dict | None = None) -> dict:
+    """Blended cost per successful page per domain and overall, next to the cheapest-model-only estimate."""
+    routing = load_routing() if routing is None else routing
+    domains = {}
+    for domain, entry in sorted(routing.items()):
+        baseline = single_model_cost(entry, max_retries)
+        domains[domain] = {
+            "pages": entry.get("pages", 0),
+            "successful_pages": entry.get("successful_pages", 0),
+            "blended_cost_usd": blended_cost(entry),
+            "single_model_cost_usd": baseline,
+        }
+    total = {
+        "pages": sum(e.get("pages", 0) for e in routing.values()),
+        "successful_pages": sum(e.get("successful_pages", 0) for e in routing.values()),
+        "cost_usd": sum(e.get("cost_usd", 0.0) for e in routing.values()),
+    }
+    # Baseline over the domains that have one, weighted by their successful pages.
+    known = [(d["single_model_cost_usd"], d["successful_pages"]) for d in domains.values() if d["single_model_cost_usd"] is not None]
+    known_pages = sum(n for _, n in known)
+    return {
+        "baseline_model": MODEL_CASCADE[0],
+        "blended_cost_usd": blended_cost(total),
+        "single_model_cost_usd": sum(c * n for c, n in known) / known_pages if known_pages else None,
+        "domains": domains,
+    }
+
+
+def main() -> None:
+    from scripts.extract import MAX_RETRIES
+
+    parser = argparse.ArgumentParser(description="Blended cost per successful page vs retrying the cheapest model alone.")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args()
+
+    report = routing_report(MAX_RETRIES)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    def usd(v: float | None) -> str:
+        return f"${v:.6f}" if v is not None else "n/a"
+
+    print(f"{'domain':<32} {'pages':>6} {'ok':>6} {'blended':>12} {report['baseline_model'] + ' only':>24}")
+    for domain, d in report["domains"].items():
+        print(f"{domain:<32} {d['pages']:>6} {d['successful_pages']:>6} {usd(d['blended_cost_usd']):>12} {usd(d['single_model_cost_usd']):>24}")
+    print(f"{'all':<32} {'':>6} {'':>6} {usd(report['blended_cost_usd']):>12} {usd(report['single_model_cost_usd']):>24}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,13 +7,24 @@ Plan:
 - Per run we record: time_seconds, cost_usd, error (if any), product (dict or null).
 - Output: JSON file (and optional stdout summary).
 
+Matrix mode (--matrix): run every model x every data/*.html concurrently, score each
+output field against a golden CSV (default data/data_out.csv) and report per model:
+latency p50/p95, cost per page, success rate and field-level accuracy.
+
+Every run also records its token usage (input / output / reasoning). --wire compact,full
+runs each page in both product-call output formats (models.ProductWire vs models.Product)
+so the per-page output and reasoning tokens can be compared.
+
 Usage:
   python -m scripts.run_model_test [--html path] [--out path] [--models a,b,c]
+  python -m scripts.run_model_test --matrix [--golden path] [--concurrency N] [--models a,b,c] [--wire compact,full]
   Default: one HTML from data/, results to scripts/model_test_results.json.
 """
 import argparse
 import asyncio
+import csv
 import json
+import math
 import sys
 import time
 from pathlib import Path
@@ -21,26 +32,47 @@ from pathlib import Path
 # Add project root for imports
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from scripts.extract import extraction_graph, LLM_COST_LIMIT_USD
+import budget
+import models
+from scripts.extractors import PRODUCT_WIRE, WIRE_FORMATS
+from scripts.extract import get_extraction_graph, LLM_COST_LIMIT_USD, KEY_COLUMN, _product_to_csv_row
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DEFAULT_OUT = Path(__file__).resolve().parent / "model_test_results.json"
+DEFAULT_MATRIX_OUT = Path(__file__).resolve().parent / "model_matrix_results.json"
+DEFAULT_GOLDEN = DATA_DIR / "data_out.csv"
+DEFAULT_CONCURRENCY = 8
+
+# Fields scored in matrix mode and how to compare them (see _field_score).
+NUMBER_FIELDS = ("price", "compare_at_price")
+LIST_FIELDS = ("key_features", "image_urls", "colors")
+TEXT_FIELDS = ("name", "brand", "category", "currency", "description", "video_url")
 
 # Models to test if not passed via CLI (keep small for speed)
 DEFAULT_MODELS = ["openai/gpt-5-nano", "openai/gpt-5-mini"]
 
 
-async def run_one(html_content: str, model: str) -> dict:
-    """Run extraction for one model. Returns {model, time_seconds, cost_usd, error, product}."""
+async def run_one(html_content: str, model: str, wire: str = PRODUCT_WIRE) -> dict:
+    """Run extraction for one model. Returns {model, wire, time_seconds, cost_usd, error, product, usage}."""
     initial = {
         "html_content": html_content,
         "source_filename": None,
+        "skip_dedup": True,
         "llm_cost_limit": LLM_COST_LIMIT_USD,
         "model": model,
+        "wire": wire,
     }
     start = time.perf_counter()
+    with budget.track_usage() as usage:
+        out = await _run_graph(initial, model, start)
+    out["wire"] = wire
+    out["usage"] = usage
+    return out
+
+
+async def _run_graph(initial: dict, model: str, start: float) -> dict:
     try:
-        final = await extraction_graph.ainvoke(initial)
+        final = await get_extraction_graph().ainvoke(initial)
         elapsed = time.perf_counter() - start
         cost = final.get("llm_cost_so_far", 0)
         product = final.get("product")
@@ -79,12 +111,166 @@ async def run_one(html_content: str, model: str) -> dict:
         }
 
 
+def _load_golden(path: Path) -> dict[str, dict]:
+    """Load the golden CSV keyed by filename."""
+    if not path.exists():
+        return {}
+    with open(path, newline="", encoding="utf-8") as f:
+        return {row[KEY_COLUMN]: row for row in csv.DictReader(f) if row.get(KEY_COLUMN)}
+
+
+def _norm(s: str) -> str:
+    return " ".join((s or "").split()).casefold()
+
+
+def _cell_items(field: str, cell: str) -> set[str]:
+    """Comparable items of a list cell: pipe-separated values, or title=value pairs for variants JSON."""
+    if field != "variants":
+        return {_norm(x) for x in cell.split("|") if x.strip()}
+    try:
+        variants = json.loads(cell) if cell else []
+    except json.JSONDecodeError:
+        return set()
+    return {f"{_norm(v['title'])}={_norm(o['value'])}" for v in variants for o in v.get("options", [])}
+
+
+def _field_score(field: str, got: str, expected: str) -> float:
+    """Score one CSV cell in [0, 1]: numbers exact, lists by Jaccard overlap, variants by option overlap, text normalized exact."""
+    if field in NUMBER_FIELDS:
+        if not got and not expected:
+            return 1.0
+        try:
+            return float(math.isclose(float(got), float(expected), abs_tol=0.005))
+        except ValueError:
+            return 0.0
+    if field in LIST_FIELDS or field == "variants":
+        a, b = _cell_items(field, got), _cell_items(field, expected)
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
+    return float(_norm(got) == _norm(expected))
+
+
+def _score_product(product: dict | None, filename: str, golden_row: dict) -> dict[str, float]:
+    """Per-field scores for one extracted product against its golden row (all zero if extraction failed)."""
+    fields = TEXT_FIELDS + NUMBER_FIELDS + LIST_FIELDS + ("variants",)
+    if product is None:
+        return {f: 0.0 for f in fields}
+    row = _product_to_csv_row(models.Product.model_validate(product), filename)
+    return {f: _field_score(f, row.get(f, ""), golden_row.get(f, "")) for f in fields}
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile; None for an empty list."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _mean_tokens(runs: list[dict], key: str) -> float | None:
+    """Mean token count per page for one usage key."""
+    return round(sum(r["usage"][key] for r in runs) / len(runs), 1) if runs else None
+
+
+async def run_matrix(
+    models_list: list[str],
+    html_paths: list[Path],
+    golden: dict[str, dict],
+    concurrency: int,
+    wires: tuple[str, ...] = (PRODUCT_WIRE,),
+) -> dict:
+    """Run models x wire formats x pages concurrently (bounded by concurrency).
+
+    Returns {"runs": [...], "summary": {label: {...}}}; label is the model, suffixed with
+    " [wire]" when more than one wire format is compared.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    pages = {p.name: p.read_text(encoding="utf-8", errors="replace") for p in html_paths}
+
+    async def one(model: str, wire: str, filename: str) -> dict:
+        async with sem:
+            out = await run_one(pages[filename], model, wire)
+        out["filename"] = filename
+        if filename in golden:
+            out["field_scores"] = _score_product(out["product"], filename, golden[filename])
+        print(
+            f"  {model} [{wire}] {filename}: time={out['time_seconds']}s cost=${out.get('cost_usd')} "
+            f"output_tokens={out['usage']['output_tokens']} reasoning_tokens={out['usage']['reasoning_tokens']} "
+            f"error={out.get('error')}",
+            flush=True,
+        )
+        return out
+
+    runs = await asyncio.gather(*(one(m, w, name) for m in models_list for w in wires for name in pages))
+
+    summary = {}
+    for model, wire in [(m, w) for m in models_list for w in wires]:
+        label = model if len(wires) == 1 else f"{model} [{wire}]"
+        model_runs = [r for r in runs if r["model"] == model and r["wire"] == wire]
+        times = [r["time_seconds"] for r in model_runs]
+        costs = [r["cost_usd"] for r in model_runs if r["cost_usd"] is not None]
+        scored = [r["field_scores"] for r in model_runs if "field_scores" in r]
+        field_accuracy = {f: round(sum(s[f] for s in scored) / len(scored), 4) for f in (scored[0] if scored else {})}
+        summary[label] = {
+            "pages": len(model_runs),
+            "success_rate": round(sum(r["error"] is None for r in model_runs) / len(model_runs), 4) if model_runs else None,
+            "latency_p50_s": _percentile(times, 50),
+            "latency_p95_s": _percentile(times, 95),
+            "cost_per_page_usd": round(sum(costs) / len(costs), 6) if costs else None,
+            "accuracy": round(sum(field_accuracy.values()) / len(field_accuracy), 4) if field_accuracy else None,
+            "field_accuracy": field_accuracy,
+            "output_tokens_per_page": _mean_tokens(model_runs, "output_tokens"),
+            "reasoning_tokens_per_page": _mean_tokens(model_runs, "reasoning_tokens"),
+        }
+    return {"runs": runs, "summary": summary}
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run extraction with different models; output time, cost, errors, product.")
     parser.add_argument("--html", type=Path, default=None, help="HTML file path (default: first .html in data/)")
-    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="Output JSON path")
+    parser.add_argument("--out", type=Path, default=None, help="Output JSON path")
     parser.add_argument("--models", type=str, default=",".join(DEFAULT_MODELS), help="Comma-separated model IDs")
+    parser.add_argument("--matrix", action="store_true", help="Run all models x all data/*.html concurrently and score against --golden")
+    parser.add_argument("--golden", type=Path, default=DEFAULT_GOLDEN, help="Golden CSV for matrix scoring (default: data/data_out.csv)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Max concurrent extractions in matrix mode")
+    parser.add_argument(
+        "--wire",
+        type=str,
+        default=PRODUCT_WIRE,
+        help=f"Comma-separated product output formats to run ({', '.join(WIRE_FORMATS)}); e.g. compact,full to compare tokens",
+    )
     args = parser.parse_args()
+    models_list = [m.strip() for m in args.models.split(",") if m.strip()]
+    wires = tuple(w.strip() for w in args.wire.split(",") if w.strip())
+    unknown = [w for w in wires if w not in WIRE_FORMATS]
+    if unknown or not wires:
+        parser.error(f"--wire must be a comma-separated subset of {', '.join(WIRE_FORMATS)}")
+
+    if args.matrix:
+        html_paths = sorted(DATA_DIR.glob("*.html"))
+        if not html_paths:
+            print(f"No .html files found in {DATA_DIR}", file=sys.stderr)
+            sys.exit(1)
+        golden = _load_golden(args.golden)
+        print(
+            f"Matrix: {len(models_list)} models x {len(wires)} formats x {len(html_paths)} pages "
+            f"(golden rows: {len(golden)})",
+            flush=True,
+        )
+        report = asyncio.run(run_matrix(models_list, html_paths, golden, args.concurrency, wires))
+        for label, s in report["summary"].items():
+            print(
+                f"{label}: success={s['success_rate']} p50={s['latency_p50_s']}s p95={s['latency_p95_s']}s "
+                f"cost/page=${s['cost_per_page_usd']} accuracy={s['accuracy']} "
+                f"output_tokens/page={s['output_tokens_per_page']} reasoning_tokens/page={s['reasoning_tokens_per_page']}"
+            )
+        out_path = args.out or DEFAULT_MATRIX_OUT
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Wrote matrix results to {out_path}")
+        return
 
     if args.html is not None:
         html_path = args.html if args.html.is_absolute() else (DATA_DIR / args.html.name)
@@ -96,18 +282,23 @@ def main() -> None:
         sys.exit(1)
 
     html_content = html_path.read_text(encoding="utf-8", errors="replace")
-    models_list = [m.strip() for m in args.models.split(",") if m.strip()]
 
     results = []
     for model in models_list:
-        print(f"Testing {model}...", flush=True)
-        out = asyncio.run(run_one(html_content, model))
-        results.append(out)
-        print(f"  time={out['time_seconds']}s cost=${out.get('cost_usd')} error={out.get('error')}")
-
-    args.out.parent.mkdir(parents=True, exist_ok=True)
-    args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
-    print(f"Wrote {len(results)} results to {args.out}")
+        for wire in wires:
+            print(f"Testing {model} [{wire}]...", flush=True)
+            out = asyncio.run(run_one(html_content, model, wire))
+            results.append(out)
+            print(
+                f"  time={out['time_seconds']}s cost=${out.get('cost_usd')} "
+                f"output_tokens={out['usage']['output_tokens']} reasoning_tokens={out['usage']['reasoning_tokens']} "
+                f"error={out.get('error')}"
+            )
+
+    out_path = args.out or DEFAULT_OUT
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Wrote {len(results)} results to {out_path}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+"""Run-level budget and priority scheduler for batch extraction.
+
+Pages are ordered by priority (highest first), then by expected cost (cheapest first, so a
+budget covers as many pages as possible). A page is only started while the budget minus
+the expected cost of pages already in flight still covers its own expected cost; every LLM
+call inside it goes through the budget.CostGovernor installed here (reserve → settle in
+ai.responses). When the next page no longer fits, or a call is refused, dispatching stops
+and the remaining pages are reported as skipped.
+"""
+
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Awaitable, Callable
+
+import budget
+from scripts.routing import MODEL_CASCADE
+
+logger = logging.getLogger(__name__)
+
+# filter_html output is roughly this fraction of the raw page (scripts, styles and chrome removed).
+FILTERED_HTML_RATIO = 0.35
+# Fixed product prompt text around the HTML, in characters (system prompt + instructions).
+PRODUCT_PROMPT_CHARS = 1_500
+
+
+@lru_cache
+def _category_prompt_chars() -> int:
+    """Fixed category prompt text around the HTML (instruction + full taxonomy), read from prompts on first use."""
+    from prompts import CATEGORY_SYSTEM, CATEGORY_USER
+
+    return len(CATEGORY_SYSTEM) + len(CATEGORY_USER.format(html=""))
+
+
+def estimate_page_cost(raw_html_chars: int, model: str = MODEL_CASCADE[0]) -> float:
+    """Expected USD for one page's category + product calls on model, from raw HTML size."""
+    from ai import MODEL_PRICES
+
+    prices = MODEL_PRICES.get(model, {"input": 0, "output": 0})
+    html_tokens = int(raw_html_chars * FILTERED_HTML_RATIO) // budget.CHARS_PER_TOKEN
+    category = budget.estimate_cost(
+        prices, html_tokens + _category_prompt_chars() // budget.CHARS_PER_TOKEN, budget.EXPECTED_OUTPUT_TOKENS["Category"]
+    )
+    product = budget.estimate_cost(
+        prices, html_tokens + PRODUCT_PROMPT_CHARS // budget.CHARS_PER_TOKEN, budget.EXPECTED_OUTPUT_TOKENS["Product"]
+    )
+    return category + product
+
+
+async def run_batch(
+    names: list[str],
+    process: Callable[[str], Awaitable[object]],
+    budget_usd: float | None,
+    expected_costs: dict[str, float],
+    priorities: dict[str, int] | None = None,
+    concurrency: int = 1,
+) -> dict:
+    """Run process(name) for each page under a run-level budget. Returns a report dict.
+
+    process should raise on failure; budget.BudgetExceeded from inside it stops the run.
+    budget_usd None means unlimited.
+    """
+    priorities = priorities or {}
+    queue = sorted(names, key=lambda n: (-priorities.get(n, 0), expected_costs.get(n, 0.0), n))
+    governor = budget.CostGovernor(budget_usd)
+    pages: dict[str, dict] = {}
+    in_flight: dict[str, float] = {}
+    stop_reason: str | None = None
+    start = time.perf_counter()
+
+    async def run_page(name: str) -> None:
+        nonlocal stop_reason
+        page_start = time.perf_counter()
+        calls_saved = 0
+        with budget.track_page() as spend, budget.track_usage() as usage:
+            try:
+                result = await process(name)
+                status, error = "ok", None
+                if isinstance(result, dict):
+                    calls_saved = result.get("llm_calls_saved", 0)
+            except budget.BudgetExceeded as e:
+                status, error = "budget_exceeded", str(e)
+                stop_reason = stop_reason or f"LLM call refused on {name}: {e}"
+            except Exception as e:
+                status, error = "failed", str(e).split("\n")[0]
+        in_flight.pop(name, None)
+        pages[name] = {
+            "status": status,
+            "priority": priorities.get(name, 0),
+            "expected_cost_usd": round(expected_costs.get(name, 0.0), 6),
+            "cost_usd": round(spend[0], 6),
+            "time_seconds": round(time.perf_counter() - page_start, 3),
+            "llm_calls_saved": calls_saved,
+            "output_tokens": usage["output_tokens"],
+            "reasoning_tokens": usage["reasoning_tokens"],
+            "error": error,
+        }
+
+    with budget.use_governor(governor):
+        running: set[asyncio.Task] = set()
+        for name in queue:
+            if stop_reason:
+                break
+            while len(running) >= concurrency:
+                _, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            expected = expected_costs.get(name, 0.0)
+            if governor.remaining_usd - sum(in_flight.values()) < expected:
+                stop_reason = stop_reason or (
+                    f"budget nearly spent: ${governor.remaining_usd:.4f} left, next page expects ${expected:.4f}"
+                )
+                break
+            in_flight[name] = expected
+            running.add(asyncio.create_task(run_page(name)))
+        if running:
+            await asyncio.wait(running)
+
+    for name in queue:
+        if name not in pages:
+            pages[name] = {"status": "skipped", "priority": priorities.get(name, 0),
+                           "expected_cost_usd": round(expected_costs.get(name, 0.0), 6),
+                           "cost_usd": 0.0, "time_seconds": 0.0, "llm_calls_saved": 0,
+                           "output_tokens": 0, "reasoning_tokens": 0, "error": None}
+    counts = {s: sum(p["status"] == s for p in pages.values()) for s in ("ok", "failed", "budget_exceeded", "skipped")}
+    if stop_reason:
+        logger.warning("Stopped early: %s (%d pages skipped)", stop_reason, counts["skipped"])
+    return {
+        **governor.report(),
+        "stopped_early": stop_reason is not None,
+        "stop_reason": stop_reason,
+        "pages_total": len(queue),
+        **{f"pages_{s}": n for s, n in counts.items()},
+        "llm_calls_saved": sum(p["llm_calls_saved"] for p in pages.values()),
+        "output_tokens": sum(p["output_tokens"] for p in pages.values()),
+        "reasoning_tokens": sum(p["reasoning_tokens"] for p in pages.values()),
+        "cost_per_successful_page_usd": round(governor.spent_usd / counts["ok"], 6) if counts["ok"] else None,
+        "time_seconds": round(time.perf_counter() - start, 3),
+        "pages": {name: pages[name] for name in queue},
+    }
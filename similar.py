@@ -0,0 +1,240 @@
+"""Local "similar products" index: hashed n-gram TF-IDF vectors in sparse NumPy arrays.
+
+Each product's name, description, key_features and category are tokenized into word
+unigrams and bigrams, hashed (crc32, stable across processes) into DIM buckets and
+stored as log-scaled term frequencies. IDF is derived from per-bucket document
+frequencies, so upserting one product only touches its own row and the df counts.
+
+Rows are kept sparse: only a product's non-zero buckets are stored, as parallel
+indices (uint16) / tf (float16) / owner-row (int32) arrays of about 8 bytes per entry,
+so memory stays proportional to the text actually indexed rather than N x DIM. The
+arrays grow with amortized doubling; a replaced row's old entries are zeroed and
+compacted away once they make up half the store. A query scores every row against the
+query row's buckets with one gather + bincount and divides by cached row norms.
+
+The ingest side keeps data/similar/ up to date (see scripts/extract._write_rows): one
+.npy file per array for each catalog version, published by atomically replacing
+CURRENT.json. The API memory-maps those arrays read-only, so --serve workers share one
+copy in the page cache; it builds the index from rows only when none matches the catalog.
+"""
+
+import json
+import os
+import re
+import zlib
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+INDEX_DIR = DATA_DIR / "similar"
+CURRENT_NAME = "CURRENT.json"
+
+DIM = 1024  # must stay <= 65536 (bucket indices are uint16)
+# Relative weight of each field's tokens.
+FIELD_WEIGHTS = {"name": 2.0, "category": 1.5, "key_features": 1.0, "description": 1.0}
+_TOKEN_RE = re.compile(r"\w+")
+_ARRAYS = ("indptr", "indices", "tf", "owner", "df", "norms")
+_MIN_CAPACITY = 1024
+
+
+def _features(row: dict) -> dict[int, float]:
+    """Weighted hashed unigram + bigram counts for one catalog row."""
+    counts: dict[int, float] = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        value = row.get(field) or ""
+        # Catalog rows pipe-join list fields; typed rows (catalog.typed_row) keep them as lists.
+        text = (value if isinstance(value, str) else " ".join(value)).replace("|", " ").replace(">", " ")
+        tokens = _TOKEN_RE.findall(text.lower())
+        grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for g in grams:
+            h = zlib.crc32(g.encode("utf-8")) % DIM
+            counts[h] = counts.get(h, 0.0) + weight
+    return counts
+
+
+def _tf_entries(row: dict) -> tuple[np.ndarray, np.ndarray]:
+    """(bucket indices, log-scaled tf) of one row's non-zero buckets, sorted by bucket."""
+    counts = _features(row)
+    indices = np.fromiter(sorted(counts), dtype=np.uint16, count=len(counts))
+    tf = (1.0 + np.log(np.array([counts[h] for h in indices.tolist()], dtype=np.float32))).astype(np.float16)
+    return indices, tf
+
+
+def _grown(arr: np.ndarray, need: int) -> np.ndarray:
+    """arr itself if it holds need items, else a writable copy with doubled capacity."""
+    if len(arr) >= need and arr.flags.writeable:
+        return arr
+    out = np.zeros(max(need, 2 * len(arr), _MIN_CAPACITY), dtype=arr.dtype)
+    out[:len(arr)] = arr
+    return out
+
+
+class SimilarityIndex:
+    """Incrementally updatable sparse TF-IDF index keyed by filename."""
+
+    def __init__(
+        self,
+        keys: list[str],
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        tf: np.ndarray,
+        owner: np.ndarray,
+        df: np.ndarray,
+        norms: np.ndarray | None = None,
+    ):
+        # Rows start out contiguous (CSR); upserts may move a row to the end of the store.
+        self.keys: list[str] = list(keys)
+        self.positions = {k: i for i, k in enumerate(self.keys)}
+        self._starts = indptr[:-1]
+        self._lengths = np.diff(indptr)
+        self._indices = indices
+        self._tf = tf
+        self._owner = owner
+        self._used = len(indices)
+        self._dead = 0
+        self.df = df
+        self._norms = norms
+
+    @classmethod
+    def build(cls, rows: Iterable[dict], key: str = "filename") -> "SimilarityIndex":
+        rows = [r for r in rows if r.get(key)]
+        entries = [_tf_entries(r) for r in rows]
+        lengths = np.array([len(i) for i, _ in entries], dtype=np.int64)
+        indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        indices = np.concatenate([i for i, _ in entries]) if entries else np.zeros(0, dtype=np.uint16)
+        tf = np.concatenate([t for _, t in entries]) if entries else np.zeros(0, dtype=np.float16)
+        owner = np.repeat(np.arange(len(rows), dtype=np.int32), lengths)
+        df = np.bincount(indices, minlength=DIM).astype(np.int64)
+        return cls([r[key] for r in rows], indptr, indices, tf, owner, df)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def upsert(self, key: str, row: dict) -> None:
+        """Add or replace one product's row, adjusting document frequencies."""
+        indices, tf = _tf_entries(row)
+        if not self.df.flags.writeable:
+            self.df = self.df.copy()
+        i = self.positions.get(key)
+        n = len(self.keys) + (i is None)
+        end = self._used + len(indices)
+        # No-ops unless the arrays are full or memory-mapped read-only.
+        self._starts = _grown(self._starts, n)
+        self._lengths = _grown(self._lengths, n)
+        self._indices = _grown(self._indices, end)
+        self._tf = _grown(self._tf, end)
+        self._owner = _grown(self._owner, end)
+        if i is None:
+            i = len(self.keys)
+            self.positions[key] = i
+            self.keys.append(key)
+        else:
+            start, length = int(self._starts[i]), int(self._lengths[i])
+            self.df[self._indices[start:start + length]] -= 1
+            self._tf[start:start + length] = 0  # dead entries score nothing until compacted
+            self._dead += length
+        self._indices[self._used:end] = indices
+        self._tf[self._used:end] = tf
+        self._owner[self._used:end] = i
+        self._starts[i] = self._used
+        self._lengths[i] = len(indices)
+        self._used = end
+        self.df[indices] += 1
+        self._norms = None
+        if self._dead > self._used // 2:
+            self._compact()
+
+    def _csr(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(indptr, indices, tf, owner) with rows contiguous in key order and no dead entries."""
+        n = len(self.keys)
+        starts, lengths = self._starts[:n], self._lengths[:n]
+        indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        # Position of every live entry in the current store, row by row.
+        take = np.repeat(starts - indptr[:-1], lengths) + np.arange(indptr[-1], dtype=np.int64)
+        owner = np.repeat(np.arange(n, dtype=np.int32), lengths)
+        return indptr, self._indices[take], self._tf[take], owner
+
+    def _compact(self) -> None:
+        indptr, self._indices, self._tf, self._owner = self._csr()
+        self._starts, self._lengths = indptr[:-1], np.diff(indptr)
+        self._used = len(self._indices)
+        self._dead = 0
+
+    def _idf(self) -> np.ndarray:
+        return (np.log((1.0 + len(self.keys)) / (1.0 + self.df)) + 1.0).astype(np.float32)
+
+    def _row_norms(self) -> np.ndarray:
+        """L2 norms of the TF-IDF rows, recomputed only after an upsert."""
+        if self._norms is None:
+            used = self._used
+            weights = self._tf[:used].astype(np.float32) * self._idf()[self._indices[:used]]
+            norms = np.sqrt(np.bincount(self._owner[:used], weights=weights * weights, minlength=len(self.keys)))
+            norms[norms == 0] = 1.0
+            self._norms = norms.astype(np.float32)
+        return self._norms
+
+    def similar(self, key: str, k: int = 10) -> list[tuple[str, float]]:
+        """Top-k (filename, cosine score) most similar to key, excluding itself. Raises KeyError if unknown."""
+        i = self.positions[key]
+        k = min(k, len(self.keys) - 1)
+        if k <= 0:
+            return []
+        idf = self._idf()
+        norms = self._row_norms()
+        start, length = int(self._starts[i]), int(self._lengths[i])
+        query = np.zeros(DIM, dtype=np.float32)
+        buckets = self._indices[start:start + length]
+        query[buckets] = self._tf[start:start + length].astype(np.float32) * idf[buckets] * idf[buckets]
+        used = self._used
+        dots = np.bincount(
+            self._owner[:used], weights=self._tf[:used].astype(np.float32) * query[self._indices[:used]], minlength=len(self.keys)
+        )
+        scores = dots / (norms * norms[i])
+        scores[i] = -np.inf
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.keys[j], float(scores[j])) for j in top]
+
+    def save(self, version: tuple[int, int], directory: Path = INDEX_DIR) -> None:
+        """Write the index (compacted, with its row norms) for a catalog version and publish it as CURRENT."""
+        directory.mkdir(parents=True, exist_ok=True)
+        indptr, indices, tf, owner = self._csr()
+        arrays = {"indptr": indptr, "indices": indices, "tf": tf, "owner": owner, "df": self.df, "norms": self._row_norms()}
+        tag = f"{version[0]}-{version[1]}"
+        files = {}
+        for name, arr in arrays.items():
+            files[name] = f"{tag}.{name}.npy"
+            tmp = directory / (files[name] + ".tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, arr)
+            os.replace(tmp, directory / files[name])
+        meta = {"version": list(version), "dim": DIM, "keys": self.keys, "files": files}
+        tmp = directory / (CURRENT_NAME + ".tmp")
+        tmp.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, directory / CURRENT_NAME)
+        # Workers still mapping an older version keep their (unlinked) files until they re-load.
+        for stale in directory.glob("*.npy"):
+            if not stale.name.startswith(tag + "."):
+                stale.unlink(missing_ok=True)
+
+    @classmethod
+    def load(cls, directory: Path = INDEX_DIR, mmap: bool = False) -> tuple["SimilarityIndex", tuple[int, int]] | None:
+        """(index, version) from disk, or None if missing or built with a different DIM.
+
+        mmap=True maps the arrays read-only (API workers); an upsert copies what it changes.
+        """
+        try:
+            meta = json.loads((directory / CURRENT_NAME).read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if meta.get("dim") != DIM:
+            return None
+        try:
+            arrays = {name: np.load(directory / meta["files"][name], mmap_mode="r" if mmap else None) for name in _ARRAYS}
+        except (OSError, KeyError, ValueError):
+            return None
+        # Row norms depend on df, so they are reused as saved until the first upsert.
+        index = cls(meta["keys"], **arrays)
+        return index, tuple(int(x) for x in meta["version"])
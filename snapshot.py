@@ -0,0 +1,183 @@
+"""Immutable, memory-mappable catalog snapshots shared by API workers.
+
+A snapshot is one file holding the catalog already serialized as the /api/products body
+(plus its gzip variant) and a key table sorted by filename, so each worker mmaps the
+same pages instead of parsing its own copy of data_out.csv:
+
+  header  magic, catalog version, row count, region offsets, content digest
+  table   count x (key_off, key_len, rec_off, rec_len, brand_off, brand_len), sorted by key
+  strings filenames and brands
+  list    b'{"products":[' rec, rec, ... b']}'   (typed records, see catalog.py; slices of this region)
+  gzip    gzip of the list region
+
+Snapshots are written at ingest time to data/snapshots/ and published by atomically
+replacing the CURRENT pointer file; readers re-open when CURRENT changes.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from catalog import dumps as _dumps, typed_row
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "data" / "snapshots"
+CURRENT_NAME = "CURRENT"
+# Older snapshots kept around so workers still on them are not surprised.
+KEEP_SNAPSHOTS = 2
+
+# Version 2: records are the typed API shape (catalog.typed_row), not raw CSV strings.
+_MAGIC = b"CATSNAP2"
+_HEADER = struct.Struct("<8sqqIQQQQQQQ16s")
+_ENTRY = struct.Struct("<QIQIQI")
+_LIST_PREFIX = b'{"products":['
+_LIST_SUFFIX = b"]}"
+
+
+def build_snapshot(rows: Iterable[dict], version: tuple[int, int], directory: Path = SNAPSHOT_DIR, key: str = "filename") -> Path:
+    """Write a snapshot of rows (data_out.csv rows or typed rows) for a catalog version and publish it as CURRENT. Returns its path."""
+    rows = [r for r in rows if r.get(key)]
+    records = [_dumps(typed_row(r)) for r in rows]
+
+    strings = bytearray()
+    string_offsets: dict[str, tuple[int, int]] = {}
+
+    def intern(s: str) -> tuple[int, int]:
+        if s not in string_offsets:
+            b = s.encode("utf-8")
+            string_offsets[s] = (len(strings), len(b))
+            strings.extend(b)
+        return string_offsets[s]
+
+    list_body = bytearray(_LIST_PREFIX)
+    entries = []
+    for i, (row, rec) in enumerate(zip(rows, records)):
+        if i:
+            list_body.extend(b",")
+        rec_off = len(list_body)
+        list_body.extend(rec)
+        entries.append((row[key], intern(row[key]), rec_off, len(rec), intern(row.get("brand") or "")))
+    list_body.extend(_LIST_SUFFIX)
+    entries.sort(key=lambda e: e[0])
+    gzip_body = gzip.compress(bytes(list_body), compresslevel=6, mtime=0)
+    digest = hashlib.sha256(list_body).digest()[:16]
+
+    table_off = _HEADER.size
+    strings_off = table_off + _ENTRY.size * len(entries)
+    list_off = strings_off + len(strings)
+    gzip_off = list_off + len(list_body)
+
+    table = bytearray()
+    for _, (k_off, k_len), rec_off, rec_len, (b_off, b_len) in entries:
+        table.extend(_ENTRY.pack(strings_off + k_off, k_len, list_off + rec_off, rec_len, strings_off + b_off, b_len))
+    header = _HEADER.pack(
+        _MAGIC, version[0], version[1], len(entries),
+        table_off, strings_off, list_off, len(list_body), gzip_off, len(gzip_body), 0, digest,
+    )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"catalog-{version[0]}-{version[1]}.snap"
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        for part in (header, table, strings, list_body, gzip_body):
+            f.write(part)
+    os.replace(tmp, path)
+    _publish(directory, path)
+    logger.info("Wrote catalog snapshot %s (%d products, %d bytes)", path.name, len(entries), gzip_off + len(gzip_body))
+    return path
+
+
+def _publish(directory: Path, path: Path) -> None:
+    """Atomically point CURRENT at path and prune older snapshots."""
+    tmp = directory / (CURRENT_NAME + ".tmp")
+    tmp.write_text(path.name, encoding="utf-8")
+    os.replace(tmp, directory / CURRENT_NAME)
+    old = sorted(directory.glob("catalog-*.snap"), key=lambda p: p.stat().st_mtime_ns)
+    for stale in old[:-KEEP_SNAPSHOTS]:
+        if stale != path:
+            stale.unlink(missing_ok=True)
+
+
+def current_path(directory: Path = SNAPSHOT_DIR) -> Path | None:
+    """Path of the published snapshot, or None if none has been built."""
+    pointer = directory / CURRENT_NAME
+    try:
+        name = pointer.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
+    path = directory / name
+    return path if path.exists() else None
+
+
+class Snapshot:
+    """Read-only view over a memory-mapped snapshot file.
+
+    The listing bodies are memoryviews into the mapping (served without copying); records and
+    keys are small fresh bytes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, mtime_ns, size, self.count, self._table_off, _, self._list_off, self._list_len,
+         self._gzip_off, self._gzip_len, _, digest) = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a catalog snapshot")
+        self.version = (mtime_ns, size)
+        self.digest = digest.hex()
+
+    def _entry(self, i: int) -> tuple[int, int, int, int, int, int]:
+        return _ENTRY.unpack_from(self._mm, self._table_off + i * _ENTRY.size)
+
+    def _key(self, i: int) -> bytes:
+        k_off, k_len, *_ = self._entry(i)
+        return self._mm[k_off:k_off + k_len]
+
+    def list_body(self) -> memoryview:
+        return memoryview(self._mm)[self._list_off:self._list_off + self._list_len]
+
+    def list_gzip_body(self) -> memoryview:
+        return memoryview(self._mm)[self._gzip_off:self._gzip_off + self._gzip_len]
+
+    def find(self, key: str) -> int | None:
+        """Table index of key by binary search, or None."""
+        target = key.encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self._key(lo) == target:
+            return lo
+        return None
+
+    def record(self, i: int) -> bytes:
+        """Serialized JSON object for table index i."""
+        _, _, rec_off, rec_len, _, _ = self._entry(i)
+        return self._mm[rec_off:rec_off + rec_len]
+
+    def brand_records(self, brand: str) -> list[bytes]:
+        """Serialized records whose brand matches exactly, compared as bytes without decoding."""
+        target = brand.encode("utf-8")
+        out = []
+        for i in range(self.count):
+            _, _, rec_off, rec_len, b_off, b_len = self._entry(i)
+            if self._mm[b_off:b_off + b_len] == target:
+                out.append((rec_off, self._mm[rec_off:rec_off + rec_len]))
+        # Keep catalog order, like the CSV-backed listing.
+        return [rec for _, rec in sorted(out)]
+
+    def iter_rows(self) -> Iterator[dict]:
+        """Decoded rows (for building derived indexes when they are missing)."""
+        for i in range(self.count):
+            yield json.loads(self.record(i))
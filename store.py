@@ -0,0 +1,134 @@
+"""Content-addressed store for raw HTML pages.
+
+Pages are deduplicated by SHA-256 of their raw bytes, compressed with zlib and appended
+to pack files (data/store/pack-NNNN.pack). A JSON index maps each digest to its
+(pack, offset, length) and each page name (e.g. "nike.html") to a digest, so reads are
+a single mmap slice + decompress with no per-page files on disk.
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import zlib
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STORE_DIR = Path(__file__).resolve().parent / "data" / "store"
+# Start a new pack file once the current one passes this size.
+PACK_MAX_BYTES = 256 * 1024 * 1024
+COMPRESS_LEVEL = 6
+
+
+class HtmlStore:
+    """Append-only, content-addressed pack store. Not safe for concurrent writers."""
+
+    def __init__(self, root: Path = STORE_DIR):
+        self.root = Path(root)
+        self.index_path = self.root / "index.json"
+        self._maps: dict[str, mmap.mmap] = {}
+        if self.index_path.exists():
+            index = json.loads(self.index_path.read_text(encoding="utf-8"))
+        else:
+            index = {"blobs": {}, "names": {}}
+        self.blobs: dict[str, list] = index["blobs"]  # digest -> [pack, offset, length, raw_size]
+        self.names: dict[str, str] = index["names"]  # page name -> digest
+
+    # ---- writes ----
+    def put(self, data: bytes) -> str:
+        """Store bytes if not already present. Returns the hex digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        if digest in self.blobs:
+            return digest
+        packed = zlib.compress(data, COMPRESS_LEVEL)
+        pack = self._current_pack()
+        path = self.root / pack
+        with open(path, "ab") as f:
+            offset = f.tell()
+            f.write(packed)
+        self._close_map(pack)
+        self.blobs[digest] = [pack, offset, len(packed), len(data)]
+        return digest
+
+    def put_named(self, name: str, data: bytes) -> str:
+        """Store bytes under a page name (re-pointing the name if the content changed). Returns the digest."""
+        digest = self.put(data)
+        self.names[name] = digest
+        return digest
+
+    def add_file(self, path: Path) -> str:
+        """Store a file under its basename. Returns the digest."""
+        return self.put_named(path.name, path.read_bytes())
+
+    def save(self) -> None:
+        """Write the index atomically."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"blobs": self.blobs, "names": self.names}), encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    # ---- reads ----
+    def get(self, digest: str) -> bytes:
+        """Raw bytes for a digest. Raises KeyError if unknown."""
+        pack, offset, length, _ = self.blobs[digest]
+        return zlib.decompress(self._map(pack)[offset:offset + length])
+
+    def get_text(self, name: str) -> str:
+        """Decoded page for a name (UTF-8, undecodable bytes replaced). Raises KeyError if unknown."""
+        return self.get(self.names[name]).decode("utf-8", errors="replace")
+
+    def raw_size(self, name: str) -> int:
+        """Uncompressed size in bytes of a named page. Raises KeyError if unknown."""
+        return self.blobs[self.names[name]][3]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    def stats(self) -> dict:
+        """Counts and sizes: pages, unique blobs, raw vs stored bytes."""
+        return {
+            "pages": len(self.names),
+            "blobs": len(self.blobs),
+            "raw_bytes": sum(b[3] for b in self.blobs.values()),
+            "stored_bytes": sum(b[2] for b in self.blobs.values()),
+        }
+
+    def close(self) -> None:
+        for pack in list(self._maps):
+            self._close_map(pack)
+
+    # ---- pack files ----
+    def _current_pack(self) -> str:
+        self.root.mkdir(parents=True, exist_ok=True)
+        packs = sorted(p.name for p in self.root.glob("pack-*.pack"))
+        if packs and (self.root / packs[-1]).stat().st_size < PACK_MAX_BYTES:
+            return packs[-1]
+        return f"pack-{len(packs):04d}.pack"
+
+    def _map(self, pack: str) -> mmap.mmap:
+        if pack not in self._maps:
+            with open(self.root / pack, "rb") as f:
+                self._maps[pack] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[pack]
+
+    def _close_map(self, pack: str) -> None:
+        m = self._maps.pop(pack, None)
+        if m is not None:
+            m.close()
+
+
+def sync_dir(store: HtmlStore, directory: Path, pattern: str = "*.html") -> list[str]:
+    """Add every matching file in directory to the store and save the index. Returns the page names."""
+    names = []
+    for path in sorted(directory.glob(pattern)):
+        store.add_file(path)
+        names.append(path.name)
+    store.save()
+    s = store.stats()
+    logger.info(
+        "HTML store: %d pages, %d blobs, %.1f MB raw -> %.1f MB stored",
+        s["pages"], s["blobs"], s["raw_bytes"] / 1e6, s["stored_bytes"] / 1e6,
+    )
+    return names
@@ -0,0 +1,71 @@
+"""Google Product Taxonomy shared by models.py (validation) and prompts.py (category prompt).
+
+categories.txt is parsed once, at build time, into taxonomy_data.py: a generated module
+whose tuple literal Python caches as bytecode, so importing it is a single unmarshal
+instead of re-reading and re-parsing the text file in every module and process.
+
+Regenerate after editing categories.txt:
+  python -m taxonomy
+"""
+
+import hashlib
+import sys
+from pathlib import Path
+
+CATEGORIES_FILE = Path(__file__).resolve().parent / "categories.txt"
+ARTIFACT_FILE = Path(__file__).resolve().parent / "taxonomy_data.py"
+
+
+def parse_categories(path: Path = CATEGORIES_FILE) -> tuple[str, ...]:
+    """Category lines from categories.txt in file order, skipping comments and blanks."""
+    if not path.exists():
+        return ()
+    with open(path, "r") as f:
+        return tuple(line for line in (raw.strip() for raw in f) if line and not line.startswith("#"))
+
+
+def _source_digest(path: Path = CATEGORIES_FILE) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else ""
+
+
+def build_artifact(path: Path = ARTIFACT_FILE) -> None:
+    """Write taxonomy_data.py from categories.txt."""
+    categories = parse_categories()
+    lines = [
+        '"""Generated by `python -m taxonomy` from categories.txt. Do not edit."""',
+        "",
+        f"SOURCE_SHA256 = {_source_digest()!r}",
+        "",
+        "CATEGORIES = (",
+        *(f"    {c!r}," for c in categories),
+        ")",
+        "",
+    ]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def _load() -> tuple[str, ...]:
+    try:
+        from taxonomy_data import CATEGORIES as prebuilt
+    except ImportError:
+        return parse_categories()
+    return prebuilt
+
+
+CATEGORIES: tuple[str, ...] = _load()
+VALID_CATEGORIES: frozenset[str] = frozenset(CATEGORIES)
+# Newline-joined list used verbatim in the category system prompt.
+CATEGORY_LIST_TEXT = "\n".join(CATEGORIES)
+
+
+if __name__ == "__main__":
+    if "--check" in sys.argv:
+        from taxonomy_data import SOURCE_SHA256
+
+        if SOURCE_SHA256 != _source_digest():
+            print("taxonomy_data.py is stale; run `python -m taxonomy`", file=sys.stderr)
+            sys.exit(1)
+        print("taxonomy_data.py is up to date")
+    else:
+        build_artifact()
+        print(f"Wrote {ARTIFACT_FILE.name} ({len(parse_categories())} categories)")
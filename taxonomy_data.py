@@ -0,0 +1,5601 @@
+"""Generated by `python -m taxonomy` from categories.txt. Do not edit."""
+
+SOURCE_SHA256 = '6b6d5485349c1a9e6d47c486c3215c875895631d26be96bf903e43fbcad6dcba'
+
+CATEGORIES = (
+    'Animals & Pet Supplies',
+    'Animals & Pet Supplies > Live Animals',
+    'Animals & Pet Supplies > Pet Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Cage Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Cage Accessories > Bird Cage Bird Baths',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Cage Accessories > Bird Cage Food & Water Dishes',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Cages & Stands',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Food',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Gyms & Playstands',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Ladders & Perches',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Toys',
+    'Animals & Pet Supplies > Pet Supplies > Bird Supplies > Bird Treats',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Apparel',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Beds',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Food',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Food > Non-prescription Cat Food',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Food > Prescription Cat Food',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Furniture',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Furniture Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Litter',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Litter Box Liners',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Litter Box Mats',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Litter Boxes',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Toys',
+    'Animals & Pet Supplies > Pet Supplies > Cat Supplies > Cat Treats',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Apparel',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Beds',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Diaper Pads & Liners',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Diapers',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Food',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Food > Non-prescription Dog Food',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Food > Prescription Dog Food',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Houses',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Kennel & Run Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Kennels & Runs',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Toys',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Treadmills',
+    'Animals & Pet Supplies > Pet Supplies > Dog Supplies > Dog Treats',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium & Pond Tubing',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Air Stones & Diffusers',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Cleaning Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Decor',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Filters',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Fish Nets',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Gravel & Substrates',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Lighting',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Overflow Boxes',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Stands',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Temperature Controllers',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquarium Water Treatments',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquariums',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Aquatic Plant Fertilizers',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Fish Feeders',
+    'Animals & Pet Supplies > Pet Supplies > Fish Supplies > Fish Food',
+    'Animals & Pet Supplies > Pet Supplies > Pet Agility Equipment',
+    'Animals & Pet Supplies > Pet Supplies > Pet Apparel Hangers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Bed Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Pet Bells & Charms',
+    'Animals & Pet Supplies > Pet Supplies > Pet Biometric Monitors',
+    'Animals & Pet Supplies > Pet Supplies > Pet Biometric Monitors > Pet Glucose Meters',
+    'Animals & Pet Supplies > Pet Supplies > Pet Biometric Monitors > Pet Pedometers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Biometric Monitors > Pet Thermometers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Bowl Mats',
+    'Animals & Pet Supplies > Pet Supplies > Pet Bowl Stands',
+    'Animals & Pet Supplies > Pet Supplies > Pet Bowls, Feeders & Waterers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Carrier & Crate Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Pet Carriers & Crates',
+    'Animals & Pet Supplies > Pet Supplies > Pet Collars & Harnesses',
+    'Animals & Pet Supplies > Pet Supplies > Pet Containment Systems',
+    'Animals & Pet Supplies > Pet Supplies > Pet Door Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Pet Doors',
+    'Animals & Pet Supplies > Pet Supplies > Pet Eye Drops & Lubricants',
+    'Animals & Pet Supplies > Pet Supplies > Pet First Aid & Emergency Kits',
+    'Animals & Pet Supplies > Pet Supplies > Pet Flea & Tick Control',
+    'Animals & Pet Supplies > Pet Supplies > Pet Food Containers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Food Scoops',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Combs & Brushes',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Fragrances & Deodorizing Sprays',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Hair Clippers & Trimmers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Hair Dryers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Nail Polish',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Nail Tools',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Shampoo & Conditioner',
+    'Animals & Pet Supplies > Pet Supplies > Pet Grooming Supplies > Pet Wipes',
+    'Animals & Pet Supplies > Pet Supplies > Pet Heating Pad Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Pet Heating Pads',
+    'Animals & Pet Supplies > Pet Supplies > Pet ID Tags',
+    'Animals & Pet Supplies > Pet Supplies > Pet Leash Extensions',
+    'Animals & Pet Supplies > Pet Supplies > Pet Leashes',
+    'Animals & Pet Supplies > Pet Supplies > Pet Medical Collars',
+    'Animals & Pet Supplies > Pet Supplies > Pet Medical Tape & Bandages',
+    'Animals & Pet Supplies > Pet Supplies > Pet Medicine',
+    'Animals & Pet Supplies > Pet Supplies > Pet Muzzles',
+    'Animals & Pet Supplies > Pet Supplies > Pet Oral Care Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Pet Playpens',
+    'Animals & Pet Supplies > Pet Supplies > Pet Steps & Ramps',
+    'Animals & Pet Supplies > Pet Supplies > Pet Strollers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Sunscreen',
+    'Animals & Pet Supplies > Pet Supplies > Pet Training Aids',
+    'Animals & Pet Supplies > Pet Supplies > Pet Training Aids > Pet Training Clickers & Treat Dispensers',
+    'Animals & Pet Supplies > Pet Supplies > Pet Training Aids > Pet Training Pad Holders',
+    'Animals & Pet Supplies > Pet Supplies > Pet Training Aids > Pet Training Pads',
+    'Animals & Pet Supplies > Pet Supplies > Pet Training Aids > Pet Training Sprays & Solutions',
+    'Animals & Pet Supplies > Pet Supplies > Pet Vitamins & Supplements',
+    'Animals & Pet Supplies > Pet Supplies > Pet Waste Bag Dispensers & Holders',
+    'Animals & Pet Supplies > Pet Supplies > Pet Waste Bags',
+    'Animals & Pet Supplies > Pet Supplies > Pet Waste Disposal Systems & Tools',
+    'Animals & Pet Supplies > Pet Supplies > Reptile & Amphibian Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Reptile & Amphibian Supplies > Reptile & Amphibian Food',
+    'Animals & Pet Supplies > Pet Supplies > Reptile & Amphibian Supplies > Reptile & Amphibian Habitat Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Reptile & Amphibian Supplies > Reptile & Amphibian Habitat Heating & Lighting',
+    'Animals & Pet Supplies > Pet Supplies > Reptile & Amphibian Supplies > Reptile & Amphibian Habitats',
+    'Animals & Pet Supplies > Pet Supplies > Reptile & Amphibian Supplies > Reptile & Amphibian Substrates',
+    'Animals & Pet Supplies > Pet Supplies > Small Animal Supplies',
+    'Animals & Pet Supplies > Pet Supplies > Small Animal Supplies > Small Animal Bedding',
+    'Animals & Pet Supplies > Pet Supplies > Small Animal Supplies > Small Animal Food',
+    'Animals & Pet Supplies > Pet Supplies > Small Animal Supplies > Small Animal Habitat Accessories',
+    'Animals & Pet Supplies > Pet Supplies > Small Animal Supplies > Small Animal Habitats & Cages',
+    'Animals & Pet Supplies > Pet Supplies > Small Animal Supplies > Small Animal Treats',
+    'Animals & Pet Supplies > Pet Supplies > Vehicle Pet Barriers',
+    'Apparel & Accessories',
+    'Apparel & Accessories > Clothing',
+    'Apparel & Accessories > Clothing > Activewear',
+    'Apparel & Accessories > Clothing > Activewear > American Football Pants',
+    'Apparel & Accessories > Clothing > Activewear > Bicycle Activewear',
+    'Apparel & Accessories > Clothing > Activewear > Bicycle Activewear > Bicycle Bibs',
+    'Apparel & Accessories > Clothing > Activewear > Bicycle Activewear > Bicycle Jerseys',
+    'Apparel & Accessories > Clothing > Activewear > Bicycle Activewear > Bicycle Shorts & Briefs',
+    'Apparel & Accessories > Clothing > Activewear > Bicycle Activewear > Bicycle Skinsuits',
+    'Apparel & Accessories > Clothing > Activewear > Bicycle Activewear > Bicycle Tights',
+    'Apparel & Accessories > Clothing > Activewear > Boxing Shorts',
+    'Apparel & Accessories > Clothing > Activewear > Dance Dresses, Skirts & Costumes',
+    'Apparel & Accessories > Clothing > Activewear > Hunting Clothing',
+    'Apparel & Accessories > Clothing > Activewear > Hunting Clothing > Ghillie Suits',
+    'Apparel & Accessories > Clothing > Activewear > Hunting Clothing > Hunting & Fishing Vests',
+    'Apparel & Accessories > Clothing > Activewear > Hunting Clothing > Hunting & Tactical Pants',
+    'Apparel & Accessories > Clothing > Activewear > Martial Arts Shorts',
+    'Apparel & Accessories > Clothing > Activewear > Motorcycle Protective Clothing',
+    'Apparel & Accessories > Clothing > Activewear > Motorcycle Protective Clothing > Motorcycle Jackets',
+    'Apparel & Accessories > Clothing > Activewear > Motorcycle Protective Clothing > Motorcycle Pants',
+    'Apparel & Accessories > Clothing > Activewear > Motorcycle Protective Clothing > Motorcycle Suits',
+    'Apparel & Accessories > Clothing > Activewear > Paintball Clothing',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Bottoms',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Diaper Covers',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Dresses',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Outerwear',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Outfits',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Sleepwear',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Socks & Tights',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Swimwear',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby & Toddler Tops',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Baby One-Pieces',
+    'Apparel & Accessories > Clothing > Baby & Toddler Clothing > Toddler Underwear',
+    'Apparel & Accessories > Clothing > Dresses',
+    'Apparel & Accessories > Clothing > One-Pieces',
+    'Apparel & Accessories > Clothing > One-Pieces > Jumpsuits & Rompers',
+    'Apparel & Accessories > Clothing > One-Pieces > Leotards & Unitards',
+    'Apparel & Accessories > Clothing > One-Pieces > Overalls',
+    'Apparel & Accessories > Clothing > Outerwear',
+    'Apparel & Accessories > Clothing > Outerwear > Chaps',
+    'Apparel & Accessories > Clothing > Outerwear > Coats & Jackets',
+    'Apparel & Accessories > Clothing > Outerwear > Rain Pants',
+    'Apparel & Accessories > Clothing > Outerwear > Rain Suits',
+    'Apparel & Accessories > Clothing > Outerwear > Snow Pants & Suits',
+    'Apparel & Accessories > Clothing > Outerwear > Vests',
+    'Apparel & Accessories > Clothing > Outfit Sets',
+    'Apparel & Accessories > Clothing > Pants',
+    'Apparel & Accessories > Clothing > Shirts & Tops',
+    'Apparel & Accessories > Clothing > Shorts',
+    'Apparel & Accessories > Clothing > Skirts',
+    'Apparel & Accessories > Clothing > Skirts > Knee-Length Skirts',
+    'Apparel & Accessories > Clothing > Skirts > Long Skirts',
+    'Apparel & Accessories > Clothing > Skirts > Mini Skirts',
+    'Apparel & Accessories > Clothing > Skorts',
+    'Apparel & Accessories > Clothing > Sleepwear & Loungewear',
+    'Apparel & Accessories > Clothing > Sleepwear & Loungewear > Loungewear',
+    'Apparel & Accessories > Clothing > Sleepwear & Loungewear > Nightgowns',
+    'Apparel & Accessories > Clothing > Sleepwear & Loungewear > Pajamas',
+    'Apparel & Accessories > Clothing > Sleepwear & Loungewear > Robes',
+    'Apparel & Accessories > Clothing > Suits',
+    'Apparel & Accessories > Clothing > Suits > Pant Suits',
+    'Apparel & Accessories > Clothing > Suits > Skirt Suits',
+    'Apparel & Accessories > Clothing > Suits > Tuxedos',
+    'Apparel & Accessories > Clothing > Swimwear',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Dirndls',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Hakama Trousers',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Japanese Black Formal Wear',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimono Outerwear',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimono Outerwear > Haori Jackets',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimono Outerwear > Kimono Coats',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimonos',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimonos > Bridal Kimonos',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimonos > Casual Kimonos',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimonos > Furisode Kimonos',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimonos > Iromuji Kimonos',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimonos > Komon Kimonos',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Kimonos > Tomesode & Houmongi Kimonos',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Religious Ceremonial Clothing',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Religious Ceremonial Clothing > Baptism & Communion Dresses',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Saris & Lehengas',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Traditional Leather Pants',
+    'Apparel & Accessories > Clothing > Traditional & Ceremonial Clothing > Yukata',
+    'Apparel & Accessories > Clothing > Underwear & Socks',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Bra Accessories',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Bra Accessories > Bra Strap Pads',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Bra Accessories > Bra Straps & Extenders',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Bra Accessories > Breast Enhancing Inserts',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Bra Accessories > Breast Petals & Concealers',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Bras',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Hosiery',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Jock Straps',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Lingerie',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Lingerie Accessories',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Lingerie Accessories > Garter Belts',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Lingerie Accessories > Garters',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Long Johns',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Petticoats & Pettipants',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Shapewear',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Socks',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Undershirts',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Underwear',
+    'Apparel & Accessories > Clothing > Underwear & Socks > Underwear Slips',
+    'Apparel & Accessories > Clothing > Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Contractor Pants & Coveralls',
+    'Apparel & Accessories > Clothing > Uniforms > Flight Suits',
+    'Apparel & Accessories > Clothing > Uniforms > Food Service Uniforms',
+    "Apparel & Accessories > Clothing > Uniforms > Food Service Uniforms > Chef's Hats",
+    "Apparel & Accessories > Clothing > Uniforms > Food Service Uniforms > Chef's Jackets",
+    "Apparel & Accessories > Clothing > Uniforms > Food Service Uniforms > Chef's Pants",
+    'Apparel & Accessories > Clothing > Uniforms > Military Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > School Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Security Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > American Football Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Baseball Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Basketball Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Cheerleading Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Cricket Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Hockey Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Martial Arts Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Officiating Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Soccer Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Softball Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > Sports Uniforms > Wrestling Uniforms',
+    'Apparel & Accessories > Clothing > Uniforms > White Coats',
+    'Apparel & Accessories > Clothing > Wedding & Bridal Party Dresses',
+    'Apparel & Accessories > Clothing > Wedding & Bridal Party Dresses > Bridal Party Dresses',
+    'Apparel & Accessories > Clothing > Wedding & Bridal Party Dresses > Wedding Dresses',
+    'Apparel & Accessories > Clothing Accessories',
+    'Apparel & Accessories > Clothing Accessories > Arm Warmers & Sleeves',
+    'Apparel & Accessories > Clothing Accessories > Baby & Toddler Clothing Accessories',
+    'Apparel & Accessories > Clothing Accessories > Baby & Toddler Clothing Accessories > Baby & Toddler Belts',
+    'Apparel & Accessories > Clothing Accessories > Baby & Toddler Clothing Accessories > Baby & Toddler Gloves & Mittens',
+    'Apparel & Accessories > Clothing Accessories > Baby & Toddler Clothing Accessories > Baby & Toddler Hats',
+    'Apparel & Accessories > Clothing Accessories > Baby & Toddler Clothing Accessories > Baby Protective Wear',
+    'Apparel & Accessories > Clothing Accessories > Balaclavas',
+    'Apparel & Accessories > Clothing Accessories > Bandanas & Headties',
+    'Apparel & Accessories > Clothing Accessories > Bandanas & Headties > Bandanas',
+    'Apparel & Accessories > Clothing Accessories > Bandanas & Headties > Hair Care Wraps',
+    'Apparel & Accessories > Clothing Accessories > Belt Buckles',
+    'Apparel & Accessories > Clothing Accessories > Belts',
+    'Apparel & Accessories > Clothing Accessories > Bridal Accessories',
+    'Apparel & Accessories > Clothing Accessories > Bridal Accessories > Bridal Veils',
+    'Apparel & Accessories > Clothing Accessories > Button Studs',
+    'Apparel & Accessories > Clothing Accessories > Collar Stays',
+    'Apparel & Accessories > Clothing Accessories > Cufflinks',
+    'Apparel & Accessories > Clothing Accessories > Decorative Fans',
+    'Apparel & Accessories > Clothing Accessories > Earmuffs',
+    'Apparel & Accessories > Clothing Accessories > Gloves & Mittens',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Bun & Volume Shapers',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Combs',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Extensions',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Forks & Sticks',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Nets',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Pins, Claws & Clips',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Pins, Claws & Clips > Barrettes',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Pins, Claws & Clips > Hair Claws & Clips',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Pins, Claws & Clips > Hair Pins',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Hair Wreaths',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Headbands',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Ponytail Holders',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Tiaras',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Wig Accessories',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Wig Accessories > Wig Caps',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Wig Accessories > Wig Glue & Tape',
+    'Apparel & Accessories > Clothing Accessories > Hair Accessories > Wigs',
+    'Apparel & Accessories > Clothing Accessories > Hand Muffs',
+    'Apparel & Accessories > Clothing Accessories > Handkerchiefs',
+    'Apparel & Accessories > Clothing Accessories > Hats',
+    'Apparel & Accessories > Clothing Accessories > Headwear',
+    'Apparel & Accessories > Clothing Accessories > Headwear > Fascinators',
+    'Apparel & Accessories > Clothing Accessories > Headwear > Headdresses',
+    'Apparel & Accessories > Clothing Accessories > Headwear > Turbans',
+    'Apparel & Accessories > Clothing Accessories > Leg Warmers',
+    'Apparel & Accessories > Clothing Accessories > Leis',
+    'Apparel & Accessories > Clothing Accessories > Maternity Belts & Support Bands',
+    'Apparel & Accessories > Clothing Accessories > Neck Gaiters',
+    'Apparel & Accessories > Clothing Accessories > Neckties',
+    'Apparel & Accessories > Clothing Accessories > Pinback Buttons',
+    'Apparel & Accessories > Clothing Accessories > Sashes',
+    'Apparel & Accessories > Clothing Accessories > Scarves & Shawls',
+    'Apparel & Accessories > Clothing Accessories > Scarves & Shawls > Scarves',
+    'Apparel & Accessories > Clothing Accessories > Scarves & Shawls > Shawls',
+    'Apparel & Accessories > Clothing Accessories > Sunglasses',
+    'Apparel & Accessories > Clothing Accessories > Suspenders',
+    'Apparel & Accessories > Clothing Accessories > Tie Clips',
+    'Apparel & Accessories > Clothing Accessories > Traditional Clothing Accessories',
+    'Apparel & Accessories > Clothing Accessories > Traditional Clothing Accessories > Kimono Underclothes',
+    'Apparel & Accessories > Clothing Accessories > Traditional Clothing Accessories > Obi Accessories',
+    'Apparel & Accessories > Clothing Accessories > Traditional Clothing Accessories > Obis',
+    'Apparel & Accessories > Clothing Accessories > Traditional Clothing Accessories > Tabi Socks',
+    'Apparel & Accessories > Clothing Accessories > Wristbands',
+    'Apparel & Accessories > Costumes & Accessories',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Bald Caps',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Costume Accessory Sets',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Costume Capes',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Costume Gloves',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Costume Hats',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Costume Special Effects',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Costume Tobacco Products',
+    'Apparel & Accessories > Costumes & Accessories > Costume Accessories > Pretend Jewelry',
+    'Apparel & Accessories > Costumes & Accessories > Costume Shoes',
+    'Apparel & Accessories > Costumes & Accessories > Costumes',
+    'Apparel & Accessories > Costumes & Accessories > Masks',
+    'Apparel & Accessories > Handbag & Wallet Accessories',
+    'Apparel & Accessories > Handbag & Wallet Accessories > Checkbook Covers',
+    'Apparel & Accessories > Handbag & Wallet Accessories > Keychains',
+    'Apparel & Accessories > Handbag & Wallet Accessories > Lanyards',
+    'Apparel & Accessories > Handbag & Wallet Accessories > Wallet Chains',
+    'Apparel & Accessories > Handbags, Wallets & Cases',
+    'Apparel & Accessories > Handbags, Wallets & Cases > Badge & Pass Holders',
+    'Apparel & Accessories > Handbags, Wallets & Cases > Business Card Cases',
+    'Apparel & Accessories > Handbags, Wallets & Cases > Handbags',
+    'Apparel & Accessories > Handbags, Wallets & Cases > Wallets & Money Clips',
+    'Apparel & Accessories > Jewelry',
+    'Apparel & Accessories > Jewelry > Anklets',
+    'Apparel & Accessories > Jewelry > Body Jewelry',
+    'Apparel & Accessories > Jewelry > Bracelets',
+    'Apparel & Accessories > Jewelry > Brooches & Lapel Pins',
+    'Apparel & Accessories > Jewelry > Charms & Pendants',
+    'Apparel & Accessories > Jewelry > Earrings',
+    'Apparel & Accessories > Jewelry > Jewelry Sets',
+    'Apparel & Accessories > Jewelry > Necklaces',
+    'Apparel & Accessories > Jewelry > Rings',
+    'Apparel & Accessories > Jewelry > Watch Accessories',
+    'Apparel & Accessories > Jewelry > Watch Accessories > Watch Bands',
+    'Apparel & Accessories > Jewelry > Watch Accessories > Watch Stickers & Decals',
+    'Apparel & Accessories > Jewelry > Watch Accessories > Watch Winders',
+    'Apparel & Accessories > Jewelry > Watches',
+    'Apparel & Accessories > Shoe Accessories',
+    'Apparel & Accessories > Shoe Accessories > Boot Liners',
+    'Apparel & Accessories > Shoe Accessories > Gaiters',
+    'Apparel & Accessories > Shoe Accessories > Shoe Covers',
+    'Apparel & Accessories > Shoe Accessories > Shoelaces',
+    'Apparel & Accessories > Shoe Accessories > Spurs',
+    'Apparel & Accessories > Shoes',
+    'Arts & Entertainment',
+    'Arts & Entertainment > Event Tickets',
+    'Arts & Entertainment > Hobbies & Creative Arts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Candle Making Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Drawing & Painting Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Fabric Repair Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Incense Making Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Jewelry Making Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Mosaic Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Needlecraft Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Scrapbooking & Stamping Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Craft Kits > Toy Craft Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Cardstock & Scrapbooking Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Cardstock & Scrapbooking Paper > Cardstock',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Cardstock & Scrapbooking Paper > Scrapbooking Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Construction Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Craft Foil',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Drawing & Painting Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Origami Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Transfer Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Art & Craft Paper > Vellum Paper',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Fasteners & Closures',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Fasteners & Closures > Buttons & Snaps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Fasteners & Closures > Clasps & Hooks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Fasteners & Closures > Eyelets & Grommets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Fasteners & Closures > Hook and Loop Fasteners',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Fasteners & Closures > Zipper Pulls',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Fasteners & Closures > Zippers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze > Art & Craft Paint',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze > Art Fixatives',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze > Art Ink',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze > Ceramic & Pottery Glazes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze > Craft Dyes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze > Ink Pads',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Paint, Ink & Glaze > Paint Mediums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Shapes & Bases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Shapes & Bases > Craft Foam & Styrofoam',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Shapes & Bases > Craft Wood & Shapes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Shapes & Bases > Papier Mache Shapes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Craft Shapes & Bases > Wreath & Floral Frames',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Adhesives & Magnets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Adhesives & Magnets > Craft & Office Glue',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Adhesives & Magnets > Craft Magnets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Adhesives & Magnets > Decorative Tape',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Adhesives & Magnets > Floral Tape',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Adhesives & Magnets > Fusible Tape',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Fibers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Fibers > Jewelry & Beading Cord',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Fibers > Thread & Floss',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Fibers > Unspun Fiber',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Fibers > Yarn',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Wire',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Wire > Craft Pipe Cleaners',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Wire > Floral Wire',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Crafting Wire > Jewelry & Beading Wire',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Appliques & Patches',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Beads',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Bows & Yo-Yos',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Decorative Stickers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Elastic',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Feathers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Jewelry Findings',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Loose Stones',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Rhinestones & Flatbacks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Ribbons & Trim',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Sequins & Glitter',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embellishments & Trims > Sew-in Labels',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Embossing Powder',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Filling & Padding Material',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Filling & Padding Material > Batting & Stuffing',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Filling & Padding Material > Filling Pellets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Filling & Padding Material > Pillow Forms',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Leather & Vinyl',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Pottery & Sculpting Materials',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Pottery & Sculpting Materials > Clay & Modeling Dough',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Pottery & Sculpting Materials > Clay & Modeling Dough > Clay',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Pottery & Sculpting Materials > Clay & Modeling Dough > Modeling Dough',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Pottery & Sculpting Materials > Papier Mache Mixes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Pottery & Sculpting Materials > Plaster Gauze',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Pottery & Sculpting Materials > Pottery Slips',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Raw Candle Wax',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles > Crafting Canvas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles > Crafting Canvas > Needlecraft Canvas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles > Crafting Canvas > Painting Canvas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles > Crafting Canvas > Plastic Canvas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles > Fabric',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles > Interfacing',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Textiles > Printable Fabric',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Wick Tabs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Materials > Wicks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories > Craft Knife Blades',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories > Craft Machine Cases & Covers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories > Sewing Machine Extension Tables',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories > Sewing Machine Feet',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories > Sewing Machine Replacement Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories > Spinning Wheel Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tool Accessories > Stamp Blocks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Blocking Mats',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Blocking Wires',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Color Mixing Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Color Mixing Tools > Palette Knives',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Color Mixing Tools > Palettes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Craft & Office Scissors',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Craft Cutters & Embossers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Craft Knives',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Craft Scoring Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Embossing Heat Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Embossing Pens & Styluses',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Seam Rippers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Cutting & Embossing Tools > Thread & Yarn Cutters',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Decoration Makers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Art Brushes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Brayer Rollers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Decorative Stamps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Drafting Compasses',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Screen Printing Squeegees',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Stencil Machines',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Stencils & Die Cuts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Stitch Markers & Counters',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Textile Art Gauges & Rulers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Craft Measuring & Marking Tools > Wood Burning Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Cutting Mats',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Dress Forms',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Felting Pads & Mats',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Frames, Hoops & Stretchers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Glue Guns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Light Boxes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Needles & Hooks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Needles & Hooks > Crochet Hooks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Needles & Hooks > Hand-Sewing Needles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Needles & Hooks > Knitting Needles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Needles & Hooks > Latch & Locker Hooks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Needles & Hooks > Sewing Machine Needles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Safety Pins',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Straight Pins',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Textile Craft Machines',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Textile Craft Machines > Felting Needles & Machines',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Textile Craft Machines > Hand Looms',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Textile Craft Machines > Mechanical Looms',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Textile Craft Machines > Sewing Machines',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Textile Craft Machines > Spinning Wheels',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thimbles & Sewing Palms',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thimbles & Sewing Palms > Sewing Palms',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thimbles & Sewing Palms > Thimbles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Fiber Cards & Brushes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Hand Spindles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Needle Threaders',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Thread & Yarn Guides',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Thread & Yarn Spools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Thread, Yarn & Bobbin Winders',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Weaving Beaters',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Art & Crafting Tools > Thread & Yarn Tools > Weaving Shuttles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Craft Organization',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Craft Organization > Needle, Pin & Hook Organizers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Craft Organization > Sewing Baskets & Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Craft Organization > Thread & Yarn Organizers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Crafting Patterns & Molds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Crafting Patterns & Molds > Beading Patterns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Crafting Patterns & Molds > Craft Molds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Crafting Patterns & Molds > Felting Molds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Crafting Patterns & Molds > Needlecraft Patterns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Arts & Crafts > Crafting Patterns & Molds > Sewing Patterns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Autographs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Coins & Currency',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Coins & Currency > Collectible Banknotes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Coins & Currency > Collectible Coins',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Trading Cards',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Weapons',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Weapons > Collectible Guns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Weapons > Collectible Knives',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Weapons > Collectible Swords',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Collectible Weapons > Sword Stands & Displays',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Postage Stamps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Rocks & Fossils',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Scale Model Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Scale Models',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Seal Stamps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > American Football Autographed Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > Auto Racing Autographed Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > Baseball & Softball Autographed Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > Basketball Autographed Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > Boxing Autographed Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > Hockey Autographed Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > Soccer Autographed Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Autographed Sports Paraphernalia > Tennis Autographed Sports Paraphernalia',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories > American Football Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories > Auto Racing Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories > Baseball & Softball Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories > Basketball Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories > Hockey Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories > Soccer Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Sports Collectibles > Sports Fan Accessories > Tennis Fan Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Collectibles > Vintage Advertisements',
+    'Arts & Entertainment > Hobbies & Creative Arts > Homebrewing & Winemaking Supplies',
+    'Arts & Entertainment > Hobbies & Creative Arts > Homebrewing & Winemaking Supplies > Beer Brewing Grains & Malts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Homebrewing & Winemaking Supplies > Bottling Bottles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Homebrewing & Winemaking Supplies > Homebrewing & Winemaking Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Homebrewing & Winemaking Supplies > Wine Making',
+    'Arts & Entertainment > Hobbies & Creative Arts > Juggling',
+    'Arts & Entertainment > Hobbies & Creative Arts > Magic & Novelties',
+    'Arts & Entertainment > Hobbies & Creative Arts > Model Making',
+    'Arts & Entertainment > Hobbies & Creative Arts > Model Making > Model Rocketry',
+    'Arts & Entertainment > Hobbies & Creative Arts > Model Making > Model Train Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Model Making > Model Trains & Train Sets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Model Making > Scale Model Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Care & Cleaning > Brass Instrument Care Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Care & Cleaning > Brass Instrument Cleaners & Sanitizers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Care & Cleaning > Brass Instrument Cleaning Tools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Care & Cleaning > Brass Instrument Guards',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Care & Cleaning > Brass Instrument Lubricants',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Care & Cleaning > Brass Instrument Polishing Cloths',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Cases & Gigbags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Mouthpieces',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Mutes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Replacement Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Brass Instrument Accessories > Brass Instrument Straps & Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Conductor Batons',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Electronic Tuners',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Metronomes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Music Benches & Stools',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Music Lyres & Flip Folders',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Music Stand Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Music Stand Accessories > Music Stand Bags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Music Stand Accessories > Music Stand Lights',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Music Stand Accessories > Sheet Music Clips',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Music Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifier Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifier Accessories > Musical Instrument Amplifier Cabinets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifier Accessories > Musical Instrument Amplifier Covers & Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifier Accessories > Musical Instrument Amplifier Footswitches',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifier Accessories > Musical Instrument Amplifier Knobs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifier Accessories > Musical Instrument Amplifier Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifier Accessories > Musical Instrument Amplifier Tubes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Instrument Amplifiers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Keyboard Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Keyboard Accessories > Musical Keyboard Bags & Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Keyboard Accessories > Musical Keyboard Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Musical Keyboard Accessories > Sustain Pedals',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Cymbal & Drum Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Cymbal & Drum Mutes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Heads',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Keys',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Kit Hardware',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Kit Hardware > Bass Drum Beaters',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Kit Hardware > Drum Kit Mounting Hardware',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Kit Hardware > Drum Pedals',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Stick & Brush Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Stick & Brush Accessories > Drum Stick & Brush Bags & Holders',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Drum Sticks & Brushes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Electronic Drum Modules',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Hand Percussion Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Hand Percussion Accessories > Hand Percussion Bags & Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Hand Percussion Accessories > Hand Percussion Stands & Mounts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Percussion Mallets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Percussion Accessories > Percussion Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Acoustic Guitar Pickups',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Capos',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Electric Guitar Pickups',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Cases & Gig Bags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Fittings & Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Humidifiers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Picks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Slides',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Straps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar String Winders',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Strings',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Guitar Accessories > Guitar Tuning Pegs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Bow Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Bows',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Fittings & Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Mutes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Pickups',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > Orchestral String Instrument Accessories > Orchestral String Instrument Strings',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > String Instrument Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > String Instrument Care & Cleaning > Bow Rosin',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > String Instrument Care & Cleaning > String Instrument Cleaning Cloths',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > String Instrument Accessories > String Instrument Care & Cleaning > String Instrument Polish',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Care & Cleaning > Bassoon Swabs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Cases & Gigbags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Parts > Bassoon Bocals',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Parts > Bassoon Small Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Reeds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Bassoon Accessories > Bassoon Straps & Supports',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Care & Cleaning > Clarinet Care Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Care & Cleaning > Clarinet Pad Savers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Care & Cleaning > Clarinet Swabs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Cases & Gigbags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Ligatures & Caps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Parts > Clarinet Barrels',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Parts > Clarinet Bells',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Parts > Clarinet Mouthpieces',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Parts > Clarinet Small Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Pegs & Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Reeds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Clarinet Accessories > Clarinet Straps & Supports',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Care & Cleaning > Flute Care Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Care & Cleaning > Flute Cleaning Rods',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Care & Cleaning > Flute Swabs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Cases & Gigbags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Parts > Flute Headjoints',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Parts > Flute Small Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Flute Accessories > Flute Pegs & Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Harmonica Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Harmonica Accessories > Harmonica Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Harmonica Accessories > Harmonica Holders',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Care & Cleaning > Oboe Care Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Care & Cleaning > Oboe Swabs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Cases & Gigbags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Parts > Oboe Small Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Pegs & Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Reeds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Oboe & English Horn Accessories > Oboe Straps & Supports',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Recorder Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Recorder Accessories > Recorder Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Recorder Accessories > Recorder Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Recorder Accessories > Recorder Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Care & Cleaning',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Care & Cleaning > Saxophone Care Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Care & Cleaning > Saxophone Pad Savers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Care & Cleaning > Saxophone Swabs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Cases & Gigbags',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Ligatures & Caps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Parts > Saxophone Mouthpieces',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Parts > Saxophone Necks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Parts > Saxophone Small Parts',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Pegs & Stands',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Reeds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Saxophone Accessories > Saxophone Straps & Supports',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Woodwind Cork Grease',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Woodwind Polishing Cloths',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Woodwind Reed Cases',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instrument & Orchestra Accessories > Woodwind Instrument Accessories > Woodwind Reed Knives',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Accordions & Concertinas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Bagpipes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Brass Instruments',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Brass Instruments > Alto & Baritone Horns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Brass Instruments > Euphoniums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Brass Instruments > French Horns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Brass Instruments > Trombones',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Brass Instruments > Trumpets & Cornets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Brass Instruments > Tubas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Electronic Musical Instruments',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Electronic Musical Instruments > Audio Samplers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Electronic Musical Instruments > MIDI Controllers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Electronic Musical Instruments > Musical Keyboards',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Electronic Musical Instruments > Sound Synthesizers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Bass Drums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Cymbals',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Drum Kits',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Electronic Drums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Glockenspiels & Xylophones',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Gongs',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Claves & Castanets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Finger & Hand Cymbals',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Bells & Chimes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums > Bongos',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums > Cajons',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums > Congas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums > Frame Drums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums > Goblet Drums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums > Tablas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Hand Drums > Talking Drums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Musical Blocks',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Musical Cowbells',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Musical Scrapers & Ratchets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Musical Shakers',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Musical Triangles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Tambourines',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hand Percussion > Vibraslaps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Hi-Hats',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Practice Pads',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Snare Drums',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Percussion > Tom-Toms',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Pianos',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > String Instruments',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > String Instruments > Cellos',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > String Instruments > Guitars',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > String Instruments > Harps',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > String Instruments > Upright Basses',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > String Instruments > Violas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > String Instruments > Violins',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Bassoons',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Clarinets',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Flutes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Flutophones',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Harmonicas',
+    "Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Jew's Harps",
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Melodicas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Musical Pipes',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Oboes & English Horns',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Ocarinas',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Recorders',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Saxophones',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Tin Whistles',
+    'Arts & Entertainment > Hobbies & Creative Arts > Musical Instruments > Woodwinds > Train Whistles',
+    'Arts & Entertainment > Party & Celebration',
+    'Arts & Entertainment > Party & Celebration > Gift Giving',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Corsage & Boutonnière Pins',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Corsages & Boutonnières',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Fresh Cut Flowers',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Gift Cards & Certificates',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Gift Wrapping',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Gift Wrapping > Gift Bags',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Gift Wrapping > Gift Boxes & Tins',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Gift Wrapping > Gift Tags & Labels',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Gift Wrapping > Tissue Paper',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Gift Wrapping > Wrapping Paper',
+    'Arts & Entertainment > Party & Celebration > Gift Giving > Greeting & Note Cards',
+    'Arts & Entertainment > Party & Celebration > Party Supplies',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Advice Cards',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Balloon Kits',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Balloons',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Banners',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Birthday Candles',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Chair Sashes',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Cocktail Decorations',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Confetti',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Decorative Pom-Poms',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Drinking Games',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Drinking Games > Beer Pong',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Drinking Games > Beer Pong > Beer Pong Tables',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Drinking Straws & Stirrers',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Envelope Seals',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Event Programs',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Fireworks & Firecrackers',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Inflatable Party Decorations',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Invitations',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Noisemakers & Party Blowers',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Party Favors',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Party Favors > Wedding Favors',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Party Games',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Party Hats',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Party Streamers & Curtains',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Party Supply Kits',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Piñatas',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Place Card Holders',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Place Cards',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Response Cards',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Sparklers',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Special Occasion Card Boxes & Holders',
+    'Arts & Entertainment > Party & Celebration > Party Supplies > Spray String',
+    'Arts & Entertainment > Party & Celebration > Special Effects',
+    'Arts & Entertainment > Party & Celebration > Special Effects > Disco Balls',
+    'Arts & Entertainment > Party & Celebration > Special Effects > Fog Machines',
+    'Arts & Entertainment > Party & Celebration > Special Effects > Special Effects Controllers',
+    'Arts & Entertainment > Party & Celebration > Special Effects > Special Effects Light Stands',
+    'Arts & Entertainment > Party & Celebration > Special Effects > Special Effects Lighting',
+    'Arts & Entertainment > Party & Celebration > Trophies & Awards',
+    'Arts & Entertainment > Party & Celebration > Trophies & Awards > Award Certificates',
+    'Arts & Entertainment > Party & Celebration > Trophies & Awards > Award Pins & Medals',
+    'Arts & Entertainment > Party & Celebration > Trophies & Awards > Award Plaques',
+    'Arts & Entertainment > Party & Celebration > Trophies & Awards > Award Ribbons',
+    'Arts & Entertainment > Party & Celebration > Trophies & Awards > Trophies',
+    'Baby & Toddler',
+    'Baby & Toddler > Baby Bathing',
+    'Baby & Toddler > Baby Bathing > Baby Bathtubs & Bath Seats',
+    'Baby & Toddler > Baby Bathing > Shower Visors',
+    'Baby & Toddler > Baby Gift Sets',
+    'Baby & Toddler > Baby Health',
+    'Baby & Toddler > Baby Health > Baby Health & Grooming Kits',
+    'Baby & Toddler > Baby Health > Nasal Aspirators',
+    'Baby & Toddler > Baby Health > Pacifier Clips & Holders',
+    'Baby & Toddler > Baby Health > Pacifier Wipes',
+    'Baby & Toddler > Baby Health > Pacifiers & Teethers',
+    'Baby & Toddler > Baby Safety',
+    'Baby & Toddler > Baby Safety > Baby & Pet Gate Accessories',
+    'Baby & Toddler > Baby Safety > Baby & Pet Gates',
+    'Baby & Toddler > Baby Safety > Baby Monitors',
+    'Baby & Toddler > Baby Safety > Baby Safety Harnesses & Leashes',
+    'Baby & Toddler > Baby Safety > Baby Safety Locks & Guards',
+    'Baby & Toddler > Baby Safety > Baby Safety Rails',
+    'Baby & Toddler > Baby Toys & Activity Equipment',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Alphabet Toys',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Baby Activity Toys',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Baby Bouncers & Rockers',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Baby Jumpers & Swings',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Baby Mobile Accessories',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Baby Mobiles',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Baby Soothers',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Baby Walkers & Entertainers',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Play Mats & Gyms',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Play Mats & Gyms > Play Gyms',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Play Mats & Gyms > Play Mats',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Play Yards',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Push & Pull Toys',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Rattles',
+    'Baby & Toddler > Baby Toys & Activity Equipment > Sorting & Stacking Toys',
+    'Baby & Toddler > Baby Transport',
+    'Baby & Toddler > Baby Transport > Baby & Toddler Car Seats',
+    'Baby & Toddler > Baby Transport > Baby Carriers',
+    'Baby & Toddler > Baby Transport > Baby Strollers',
+    'Baby & Toddler > Baby Transport Accessories',
+    'Baby & Toddler > Baby Transport Accessories > Baby & Toddler Car Seat Accessories',
+    'Baby & Toddler > Baby Transport Accessories > Baby Carrier Accessories',
+    'Baby & Toddler > Baby Transport Accessories > Baby Stroller Accessories',
+    'Baby & Toddler > Baby Transport Accessories > Baby Transport Liners & Sacks',
+    'Baby & Toddler > Baby Transport Accessories > Shopping Cart & High Chair Covers',
+    'Baby & Toddler > Diapering',
+    'Baby & Toddler > Diapering > Baby Wipe Dispensers & Warmers',
+    'Baby & Toddler > Diapering > Baby Wipes',
+    'Baby & Toddler > Diapering > Changing Mat & Tray Covers',
+    'Baby & Toddler > Diapering > Changing Mats & Trays',
+    'Baby & Toddler > Diapering > Diaper Kits',
+    'Baby & Toddler > Diapering > Diaper Liners',
+    'Baby & Toddler > Diapering > Diaper Organizers',
+    'Baby & Toddler > Diapering > Diaper Pail Accessories',
+    'Baby & Toddler > Diapering > Diaper Pails',
+    'Baby & Toddler > Diapering > Diaper Rash Treatments',
+    'Baby & Toddler > Diapering > Diaper Wet Bags',
+    'Baby & Toddler > Diapering > Diapers',
+    'Baby & Toddler > Nursing & Feeding',
+    'Baby & Toddler > Nursing & Feeding > Baby & Toddler Food',
+    'Baby & Toddler > Nursing & Feeding > Baby & Toddler Food > Baby Cereal',
+    'Baby & Toddler > Nursing & Feeding > Baby & Toddler Food > Baby Drinks',
+    'Baby & Toddler > Nursing & Feeding > Baby & Toddler Food > Baby Food',
+    'Baby & Toddler > Nursing & Feeding > Baby & Toddler Food > Baby Formula',
+    'Baby & Toddler > Nursing & Feeding > Baby & Toddler Food > Baby Snacks',
+    'Baby & Toddler > Nursing & Feeding > Baby & Toddler Food > Toddler Nutrition Drinks & Shakes',
+    'Baby & Toddler > Nursing & Feeding > Baby Bottle Nipples & Liners',
+    'Baby & Toddler > Nursing & Feeding > Baby Bottle Nipples & Liners > Baby Bottle Liners',
+    'Baby & Toddler > Nursing & Feeding > Baby Bottle Nipples & Liners > Baby Bottle Nipples',
+    'Baby & Toddler > Nursing & Feeding > Baby Bottles',
+    'Baby & Toddler > Nursing & Feeding > Baby Care Timers',
+    'Baby & Toddler > Nursing & Feeding > Bibs',
+    'Baby & Toddler > Nursing & Feeding > Bottle Warmers & Sterilizers',
+    'Baby & Toddler > Nursing & Feeding > Breast Milk Storage Containers',
+    'Baby & Toddler > Nursing & Feeding > Breast Pump Accessories',
+    'Baby & Toddler > Nursing & Feeding > Breast Pumps',
+    'Baby & Toddler > Nursing & Feeding > Burp Cloths',
+    'Baby & Toddler > Nursing & Feeding > Nursing Covers',
+    'Baby & Toddler > Nursing & Feeding > Nursing Pads & Shields',
+    'Baby & Toddler > Nursing & Feeding > Nursing Pillow Covers',
+    'Baby & Toddler > Nursing & Feeding > Nursing Pillows',
+    'Baby & Toddler > Nursing & Feeding > Sippy Cups',
+    'Baby & Toddler > Potty Training',
+    'Baby & Toddler > Potty Training > Potty Seats',
+    'Baby & Toddler > Potty Training > Potty Training Kits',
+    'Baby & Toddler > Swaddling & Receiving Blankets',
+    'Baby & Toddler > Swaddling & Receiving Blankets > Receiving Blankets',
+    'Baby & Toddler > Swaddling & Receiving Blankets > Swaddling Blankets',
+    'Business & Industrial',
+    'Business & Industrial > Advertising & Marketing',
+    'Business & Industrial > Advertising & Marketing > Brochures',
+    'Business & Industrial > Advertising & Marketing > Trade Show Counters',
+    'Business & Industrial > Advertising & Marketing > Trade Show Displays',
+    'Business & Industrial > Agriculture',
+    'Business & Industrial > Agriculture > Animal Husbandry',
+    'Business & Industrial > Agriculture > Animal Husbandry > Egg Incubators',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Feed',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Feed > Cattle Feed',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Feed > Chicken Feed',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Feed > Goat & Sheep Feed',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Feed > Mixed Herd Feed',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Feed > Pig Feed',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Feeders & Waterers',
+    'Business & Industrial > Agriculture > Animal Husbandry > Livestock Halters',
+    'Business & Industrial > Automation Control Components',
+    'Business & Industrial > Automation Control Components > Programmable Logic Controllers',
+    'Business & Industrial > Automation Control Components > Variable Frequency & Adjustable Speed Drives',
+    'Business & Industrial > Construction',
+    'Business & Industrial > Construction > Surveying',
+    'Business & Industrial > Construction > Traffic Cones & Barrels',
+    'Business & Industrial > Dentistry',
+    'Business & Industrial > Dentistry > Dental Cement',
+    'Business & Industrial > Dentistry > Dental Tools',
+    'Business & Industrial > Dentistry > Dental Tools > Dappen Dishes',
+    'Business & Industrial > Dentistry > Dental Tools > Dental Mirrors',
+    'Business & Industrial > Dentistry > Dental Tools > Dental Tool Sets',
+    'Business & Industrial > Dentistry > Dental Tools > Prophy Cups',
+    'Business & Industrial > Dentistry > Dental Tools > Prophy Heads',
+    'Business & Industrial > Dentistry > Prophy Paste',
+    'Business & Industrial > Film & Television',
+    'Business & Industrial > Finance & Insurance',
+    'Business & Industrial > Finance & Insurance > Bullion',
+    'Business & Industrial > Food Service',
+    'Business & Industrial > Food Service > Bakery Boxes',
+    'Business & Industrial > Food Service > Bus Tubs',
+    'Business & Industrial > Food Service > Check Presenters',
+    'Business & Industrial > Food Service > Concession Food Containers',
+    'Business & Industrial > Food Service > Disposable Lids',
+    'Business & Industrial > Food Service > Disposable Serveware',
+    'Business & Industrial > Food Service > Disposable Serveware > Disposable Serving Trays',
+    'Business & Industrial > Food Service > Disposable Tableware',
+    'Business & Industrial > Food Service > Disposable Tableware > Disposable Bowls',
+    'Business & Industrial > Food Service > Disposable Tableware > Disposable Cups',
+    'Business & Industrial > Food Service > Disposable Tableware > Disposable Cutlery',
+    'Business & Industrial > Food Service > Disposable Tableware > Disposable Plates',
+    'Business & Industrial > Food Service > Food Service Baskets',
+    'Business & Industrial > Food Service > Food Service Carts',
+    'Business & Industrial > Food Service > Food Washers & Dryers',
+    'Business & Industrial > Food Service > Hot Dog Rollers',
+    'Business & Industrial > Food Service > Ice Bins',
+    'Business & Industrial > Food Service > Plate & Dish Warmers',
+    'Business & Industrial > Food Service > Sneeze Guards',
+    'Business & Industrial > Food Service > Take-Out Containers',
+    'Business & Industrial > Food Service > Tilt Skillets',
+    'Business & Industrial > Food Service > Vending Machines',
+    'Business & Industrial > Forestry & Logging',
+    'Business & Industrial > Hairdressing & Cosmetology',
+    'Business & Industrial > Hairdressing & Cosmetology > Hairdressing Capes & Neck Covers',
+    'Business & Industrial > Hairdressing & Cosmetology > Pedicure Chairs',
+    'Business & Industrial > Hairdressing & Cosmetology > Salon Chairs',
+    'Business & Industrial > Heavy Machinery',
+    'Business & Industrial > Heavy Machinery > Chippers',
+    'Business & Industrial > Hotel & Hospitality',
+    'Business & Industrial > Industrial Storage',
+    'Business & Industrial > Industrial Storage > Industrial Cabinets',
+    'Business & Industrial > Industrial Storage > Industrial Shelving',
+    'Business & Industrial > Industrial Storage > Shipping Containers',
+    'Business & Industrial > Industrial Storage > Wire Partitions, Enclosures & Doors',
+    'Business & Industrial > Industrial Storage Accessories',
+    'Business & Industrial > Janitorial Carts & Caddies',
+    'Business & Industrial > Law Enforcement',
+    'Business & Industrial > Law Enforcement > Cuffs',
+    'Business & Industrial > Law Enforcement > Metal Detectors',
+    'Business & Industrial > Manufacturing',
+    'Business & Industrial > Material Handling',
+    'Business & Industrial > Material Handling > Conveyors',
+    'Business & Industrial > Material Handling > Lifts & Hoists',
+    'Business & Industrial > Material Handling > Lifts & Hoists > Hoists, Cranes & Trolleys',
+    'Business & Industrial > Material Handling > Lifts & Hoists > Jacks & Lift Trucks',
+    'Business & Industrial > Material Handling > Lifts & Hoists > Personnel Lifts',
+    'Business & Industrial > Material Handling > Lifts & Hoists > Pulleys, Blocks & Sheaves',
+    'Business & Industrial > Material Handling > Lifts & Hoists > Winches',
+    'Business & Industrial > Material Handling > Pallets & Loading Platforms',
+    'Business & Industrial > Medical',
+    'Business & Industrial > Medical > Hospital Curtains',
+    'Business & Industrial > Medical > Hospital Gowns',
+    'Business & Industrial > Medical > Medical Bedding',
+    'Business & Industrial > Medical > Medical Equipment',
+    'Business & Industrial > Medical > Medical Equipment > Automated External Defibrillators',
+    'Business & Industrial > Medical > Medical Equipment > Gait Belts',
+    'Business & Industrial > Medical > Medical Equipment > Medical Reflex Hammers & Tuning Forks',
+    'Business & Industrial > Medical > Medical Equipment > Medical Stretchers & Gurneys',
+    'Business & Industrial > Medical > Medical Equipment > Otoscopes & Ophthalmoscopes',
+    'Business & Industrial > Medical > Medical Equipment > Patient Lifts',
+    'Business & Industrial > Medical > Medical Equipment > Stethoscopes',
+    'Business & Industrial > Medical > Medical Equipment > Vital Signs Monitor Accessories',
+    'Business & Industrial > Medical > Medical Equipment > Vital Signs Monitors',
+    'Business & Industrial > Medical > Medical Furniture',
+    'Business & Industrial > Medical > Medical Furniture > Chiropractic Tables',
+    'Business & Industrial > Medical > Medical Furniture > Examination Chairs & Tables',
+    'Business & Industrial > Medical > Medical Furniture > Homecare & Hospital Beds',
+    'Business & Industrial > Medical > Medical Furniture > Medical Cabinets',
+    'Business & Industrial > Medical > Medical Furniture > Medical Carts',
+    'Business & Industrial > Medical > Medical Furniture > Medical Carts > Crash Carts',
+    'Business & Industrial > Medical > Medical Furniture > Medical Carts > IV Poles & Carts',
+    'Business & Industrial > Medical > Medical Furniture > Surgical Tables',
+    'Business & Industrial > Medical > Medical Instruments',
+    'Business & Industrial > Medical > Medical Instruments > Medical Forceps',
+    'Business & Industrial > Medical > Medical Instruments > Scalpel Blades',
+    'Business & Industrial > Medical > Medical Instruments > Scalpels',
+    'Business & Industrial > Medical > Medical Instruments > Surgical Needles & Sutures',
+    'Business & Industrial > Medical > Medical Supplies',
+    'Business & Industrial > Medical > Medical Supplies > Disposable Gloves',
+    'Business & Industrial > Medical > Medical Supplies > Finger Cots',
+    'Business & Industrial > Medical > Medical Supplies > Medical Needles & Syringes',
+    'Business & Industrial > Medical > Medical Supplies > Medical Needles & Syringes > Medical Needle & Syringe Sets',
+    'Business & Industrial > Medical > Medical Supplies > Medical Needles & Syringes > Medical Needles',
+    'Business & Industrial > Medical > Medical Supplies > Medical Needles & Syringes > Medical Syringes',
+    'Business & Industrial > Medical > Medical Supplies > Ostomy Supplies',
+    'Business & Industrial > Medical > Medical Supplies > Tongue Depressors',
+    'Business & Industrial > Medical > Medical Teaching Equipment',
+    'Business & Industrial > Medical > Medical Teaching Equipment > Medical & Emergency Response Training Mannequins',
+    'Business & Industrial > Medical > Scrub Caps',
+    'Business & Industrial > Medical > Scrubs',
+    'Business & Industrial > Medical > Surgical Gowns',
+    'Business & Industrial > Mining & Quarrying',
+    'Business & Industrial > Piercing & Tattooing',
+    'Business & Industrial > Piercing & Tattooing > Piercing Supplies',
+    'Business & Industrial > Piercing & Tattooing > Piercing Supplies > Piercing Needles',
+    'Business & Industrial > Piercing & Tattooing > Tattooing Supplies',
+    'Business & Industrial > Piercing & Tattooing > Tattooing Supplies > Tattoo Cover-Ups',
+    'Business & Industrial > Piercing & Tattooing > Tattooing Supplies > Tattooing Inks',
+    'Business & Industrial > Piercing & Tattooing > Tattooing Supplies > Tattooing Machines',
+    'Business & Industrial > Piercing & Tattooing > Tattooing Supplies > Tattooing Needles',
+    'Business & Industrial > Retail',
+    'Business & Industrial > Retail > Clothing Display Racks',
+    'Business & Industrial > Retail > Display Mannequins',
+    'Business & Industrial > Retail > Mannequin Parts',
+    'Business & Industrial > Retail > Money Handling',
+    'Business & Industrial > Retail > Money Handling > Banknote Verifiers',
+    'Business & Industrial > Retail > Money Handling > Cash Register & POS Terminal Accessories',
+    'Business & Industrial > Retail > Money Handling > Cash Register & POS Terminal Accessories > Cash Drawers & Trays',
+    'Business & Industrial > Retail > Money Handling > Cash Register & POS Terminal Accessories > Credit Card Terminals',
+    'Business & Industrial > Retail > Money Handling > Cash Register & POS Terminal Accessories > Signature Capture Pads',
+    'Business & Industrial > Retail > Money Handling > Cash Registers & POS Terminals',
+    'Business & Industrial > Retail > Money Handling > Cash Registers & POS Terminals > Cash Registers',
+    'Business & Industrial > Retail > Money Handling > Cash Registers & POS Terminals > POS Terminals',
+    'Business & Industrial > Retail > Money Handling > Coin & Bill Counters',
+    'Business & Industrial > Retail > Money Handling > Money Changers',
+    'Business & Industrial > Retail > Money Handling > Money Deposit Bags',
+    'Business & Industrial > Retail > Money Handling > Paper Coin Wrappers & Bill Straps',
+    'Business & Industrial > Retail > Paper & Plastic Shopping Bags',
+    'Business & Industrial > Retail > Pricing Guns',
+    'Business & Industrial > Retail > Retail Display Cases',
+    'Business & Industrial > Retail > Retail Display Props & Models',
+    'Business & Industrial > Science & Laboratory',
+    'Business & Industrial > Science & Laboratory > Biochemicals',
+    'Business & Industrial > Science & Laboratory > Dissection Kits',
+    'Business & Industrial > Science & Laboratory > Laboratory Chemicals',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Autoclaves',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Centrifuges',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Dry Ice Makers',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Freeze-Drying Machines',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Laboratory Blenders',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Laboratory Freezers',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Laboratory Funnels',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Laboratory Hot Plates',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Laboratory Ovens',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microscope Accessories',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microscope Accessories > Microscope Cameras',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microscope Accessories > Microscope Eyepieces & Adapters',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microscope Accessories > Microscope Objective Lenses',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microscope Accessories > Microscope Replacement Bulbs',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microscope Accessories > Microscope Slides',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microscopes',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Microtomes',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Spectrometer Accessories',
+    'Business & Industrial > Science & Laboratory > Laboratory Equipment > Spectrometers',
+    'Business & Industrial > Science & Laboratory > Laboratory Specimens',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Beakers',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Graduated Cylinders',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Laboratory Flasks',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Petri Dishes',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Pipettes',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Test Tube Racks',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Test Tubes',
+    'Business & Industrial > Science & Laboratory > Laboratory Supplies > Wash Bottles',
+    'Business & Industrial > Signage',
+    'Business & Industrial > Signage > Business Hour Signs',
+    'Business & Industrial > Signage > Digital Signs',
+    'Business & Industrial > Signage > Electric Signs',
+    'Business & Industrial > Signage > Electric Signs > LED Signs',
+    'Business & Industrial > Signage > Electric Signs > Neon Signs',
+    'Business & Industrial > Signage > Emergency & Exit Signs',
+    'Business & Industrial > Signage > Facility Identification Signs',
+    'Business & Industrial > Signage > Open & Closed Signs',
+    'Business & Industrial > Signage > Parking Signs & Permits',
+    'Business & Industrial > Signage > Policy Signs',
+    'Business & Industrial > Signage > Retail & Sale Signs',
+    'Business & Industrial > Signage > Road & Traffic Signs',
+    'Business & Industrial > Signage > Safety & Warning Signs',
+    'Business & Industrial > Signage > Security Signs',
+    'Business & Industrial > Signage > Sidewalk & Yard Signs',
+    'Business & Industrial > Work Safety Protective Gear',
+    'Business & Industrial > Work Safety Protective Gear > Bullet Proof Vests',
+    'Business & Industrial > Work Safety Protective Gear > Gas Mask & Respirator Accessories',
+    'Business & Industrial > Work Safety Protective Gear > Hardhats',
+    'Business & Industrial > Work Safety Protective Gear > Hazardous Material Suits',
+    'Business & Industrial > Work Safety Protective Gear > Protective Aprons',
+    'Business & Industrial > Work Safety Protective Gear > Protective Eyewear',
+    'Business & Industrial > Work Safety Protective Gear > Protective Masks',
+    'Business & Industrial > Work Safety Protective Gear > Protective Masks > Dust Masks',
+    "Business & Industrial > Work Safety Protective Gear > Protective Masks > Fireman's Masks",
+    'Business & Industrial > Work Safety Protective Gear > Protective Masks > Gas Masks & Respirators',
+    'Business & Industrial > Work Safety Protective Gear > Protective Masks > Medical Masks',
+    'Business & Industrial > Work Safety Protective Gear > Safety Gloves',
+    'Business & Industrial > Work Safety Protective Gear > Safety Knee Pads',
+    'Business & Industrial > Work Safety Protective Gear > Welding Helmets',
+    'Business & Industrial > Work Safety Protective Gear > Work Safety Harnesses',
+    'Business & Industrial > Work Safety Protective Gear > Work Safety Tethers',
+    'Cameras & Optics',
+    'Cameras & Optics > Camera & Optic Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Camera & Optic Replacement Cables',
+    'Cameras & Optics > Camera & Optic Accessories > Camera & Video Camera Lenses',
+    'Cameras & Optics > Camera & Optic Accessories > Camera & Video Camera Lenses > Camera Lenses',
+    'Cameras & Optics > Camera & Optic Accessories > Camera & Video Camera Lenses > Surveillance Camera Lenses',
+    'Cameras & Optics > Camera & Optic Accessories > Camera & Video Camera Lenses > Video Camera Lenses',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Lens Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Lens Accessories > Lens & Filter Adapter Rings',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Lens Accessories > Lens Bags',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Lens Accessories > Lens Caps',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Lens Accessories > Lens Converters',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Lens Accessories > Lens Filters',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Lens Accessories > Lens Hoods',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Accessory Sets',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Bags & Cases',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Body Replacement Panels & Doors',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Digital Backs',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Film',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Flash Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Flashes',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Focus Devices',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Gears',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Grips',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Image Sensors',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Lens Zoom Units',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Remote Controls',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Replacement Buttons & Knobs',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Replacement Screens & Displays',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Silencers & Sound Blimps',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Stabilizers & Supports',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Straps',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Camera Sun Hoods & Viewfinder Attachments',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Flash Brackets',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > On-Camera Monitors',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Surveillance Camera Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Underwater Camera Housing Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Underwater Camera Housings',
+    'Cameras & Optics > Camera & Optic Accessories > Camera Parts & Accessories > Video Camera Lights',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories > Binocular & Monocular Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories > Optics Bags & Cases',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories > Rangefinder Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories > Spotting Scope Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories > Telescope Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories > Thermal Optic Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Optic Accessories > Weapon Scope & Sight Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Tripod & Monopod Accessories',
+    'Cameras & Optics > Camera & Optic Accessories > Tripod & Monopod Accessories > Tripod & Monopod Cases',
+    'Cameras & Optics > Camera & Optic Accessories > Tripod & Monopod Accessories > Tripod & Monopod Heads',
+    'Cameras & Optics > Camera & Optic Accessories > Tripod & Monopod Accessories > Tripod Collars & Mounts',
+    'Cameras & Optics > Camera & Optic Accessories > Tripod & Monopod Accessories > Tripod Handles',
+    'Cameras & Optics > Camera & Optic Accessories > Tripod & Monopod Accessories > Tripod Spreaders',
+    'Cameras & Optics > Camera & Optic Accessories > Tripods & Monopods',
+    'Cameras & Optics > Cameras',
+    'Cameras & Optics > Cameras > Borescopes',
+    'Cameras & Optics > Cameras > Digital Cameras',
+    'Cameras & Optics > Cameras > Disposable Cameras',
+    'Cameras & Optics > Cameras > Film Cameras',
+    'Cameras & Optics > Cameras > Surveillance Cameras',
+    'Cameras & Optics > Cameras > Trail Cameras',
+    'Cameras & Optics > Cameras > Video Cameras',
+    'Cameras & Optics > Cameras > Webcams',
+    'Cameras & Optics > Optics',
+    'Cameras & Optics > Optics > Binoculars',
+    'Cameras & Optics > Optics > Monoculars',
+    'Cameras & Optics > Optics > Rangefinders',
+    'Cameras & Optics > Optics > Scopes',
+    'Cameras & Optics > Optics > Scopes > Spotting Scopes',
+    'Cameras & Optics > Optics > Scopes > Telescopes',
+    'Cameras & Optics > Optics > Scopes > Weapon Scopes & Sights',
+    'Cameras & Optics > Photography',
+    'Cameras & Optics > Photography > Darkroom',
+    'Cameras & Optics > Photography > Darkroom > Developing & Processing Equipment',
+    'Cameras & Optics > Photography > Darkroom > Developing & Processing Equipment > Copystands',
+    'Cameras & Optics > Photography > Darkroom > Developing & Processing Equipment > Darkroom Sinks',
+    'Cameras & Optics > Photography > Darkroom > Developing & Processing Equipment > Developing Tanks & Reels',
+    'Cameras & Optics > Photography > Darkroom > Developing & Processing Equipment > Print Trays, Washers & Dryers',
+    'Cameras & Optics > Photography > Darkroom > Developing & Processing Equipment > Retouching Equipment & Supplies',
+    'Cameras & Optics > Photography > Darkroom > Enlarging Equipment',
+    'Cameras & Optics > Photography > Darkroom > Enlarging Equipment > Darkroom Easels',
+    'Cameras & Optics > Photography > Darkroom > Enlarging Equipment > Darkroom Timers',
+    'Cameras & Optics > Photography > Darkroom > Enlarging Equipment > Focusing Aids',
+    'Cameras & Optics > Photography > Darkroom > Enlarging Equipment > Photographic Analyzers',
+    'Cameras & Optics > Photography > Darkroom > Enlarging Equipment > Photographic Enlargers',
+    'Cameras & Optics > Photography > Darkroom > Photographic Chemicals',
+    'Cameras & Optics > Photography > Darkroom > Photographic Paper',
+    'Cameras & Optics > Photography > Darkroom > Safelights',
+    'Cameras & Optics > Photography > Lighting & Studio',
+    'Cameras & Optics > Photography > Lighting & Studio > Light Meter Accessories',
+    'Cameras & Optics > Photography > Lighting & Studio > Light Meters',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Backgrounds',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Light & Flash Accessories',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Lighting Controls',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Lighting Controls > Flash Diffusers',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Lighting Controls > Flash Reflectors',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Lighting Controls > Lighting Filters & Gobos',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Lighting Controls > Softboxes',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Lights & Flashes',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Stand & Mount Accessories',
+    'Cameras & Optics > Photography > Lighting & Studio > Studio Stands & Mounts',
+    'Cameras & Optics > Photography > Photo Mounting Supplies',
+    'Cameras & Optics > Photography > Photo Negative & Slide Storage',
+    'Electronics',
+    'Electronics > Arcade Equipment',
+    'Electronics > Arcade Equipment > Basketball Arcade Games',
+    'Electronics > Arcade Equipment > Pinball Machine Accessories',
+    'Electronics > Arcade Equipment > Pinball Machines',
+    'Electronics > Arcade Equipment > Skee-Ball Machines',
+    'Electronics > Arcade Equipment > Video Game Arcade Cabinet Accessories',
+    'Electronics > Arcade Equipment > Video Game Arcade Cabinets',
+    'Electronics > Audio',
+    'Electronics > Audio > Audio Accessories',
+    'Electronics > Audio > Audio Accessories > Audio & Video Receiver Accessories',
+    'Electronics > Audio > Audio Accessories > Headphone & Headset Accessories',
+    'Electronics > Audio > Audio Accessories > Headphone & Headset Accessories > Headphone Cushions & Tips',
+    'Electronics > Audio > Audio Accessories > Karaoke System Accessories',
+    'Electronics > Audio > Audio Accessories > Karaoke System Accessories > Karaoke Chips',
+    'Electronics > Audio > Audio Accessories > MP3 Player Accessories',
+    'Electronics > Audio > Audio Accessories > MP3 Player Accessories > MP3 Player & Mobile Phone Accessory Sets',
+    'Electronics > Audio > Audio Accessories > MP3 Player Accessories > MP3 Player Cases',
+    'Electronics > Audio > Audio Accessories > Microphone Accessories',
+    'Electronics > Audio > Audio Accessories > Microphone Stands',
+    'Electronics > Audio > Audio Accessories > Satellite Radio Accessories',
+    'Electronics > Audio > Audio Accessories > Speaker Accessories',
+    'Electronics > Audio > Audio Accessories > Speaker Accessories > Speaker Bags, Covers & Cases',
+    'Electronics > Audio > Audio Accessories > Speaker Accessories > Speaker Components & Kits',
+    'Electronics > Audio > Audio Accessories > Speaker Accessories > Speaker Stand Bags',
+    'Electronics > Audio > Audio Accessories > Speaker Accessories > Speaker Stands & Mounts',
+    'Electronics > Audio > Audio Accessories > Speaker Accessories > Tactile Transducers',
+    'Electronics > Audio > Audio Accessories > Turntable Accessories',
+    'Electronics > Audio > Audio Components',
+    'Electronics > Audio > Audio Components > Audio & Video Receivers',
+    'Electronics > Audio > Audio Components > Audio Amplifiers',
+    'Electronics > Audio > Audio Components > Audio Amplifiers > Headphone Amplifiers',
+    'Electronics > Audio > Audio Components > Audio Amplifiers > Power Amplifiers',
+    'Electronics > Audio > Audio Components > Audio Mixers',
+    'Electronics > Audio > Audio Components > Audio Transmitters',
+    'Electronics > Audio > Audio Components > Audio Transmitters > Bluetooth Transmitters',
+    'Electronics > Audio > Audio Components > Audio Transmitters > FM Transmitters',
+    'Electronics > Audio > Audio Components > Channel Strips',
+    'Electronics > Audio > Audio Components > Direct Boxes',
+    'Electronics > Audio > Audio Components > Headphones & Headsets',
+    'Electronics > Audio > Audio Components > Headphones & Headsets > Headphones',
+    'Electronics > Audio > Audio Components > Headphones & Headsets > Headsets',
+    'Electronics > Audio > Audio Components > Microphones',
+    'Electronics > Audio > Audio Components > Signal Processors',
+    'Electronics > Audio > Audio Components > Signal Processors > Crossovers',
+    'Electronics > Audio > Audio Components > Signal Processors > Effects Processors',
+    'Electronics > Audio > Audio Components > Signal Processors > Equalizers',
+    'Electronics > Audio > Audio Components > Signal Processors > Loudspeaker Management Systems',
+    'Electronics > Audio > Audio Components > Signal Processors > Microphone Preamps',
+    'Electronics > Audio > Audio Components > Signal Processors > Noise Gates & Compressors',
+    'Electronics > Audio > Audio Components > Signal Processors > Phono Preamps',
+    'Electronics > Audio > Audio Components > Speakers',
+    'Electronics > Audio > Audio Components > Studio Recording Bundles',
+    'Electronics > Audio > Audio Players & Recorders',
+    'Electronics > Audio > Audio Players & Recorders > Boomboxes',
+    'Electronics > Audio > Audio Players & Recorders > CD Players & Recorders',
+    'Electronics > Audio > Audio Players & Recorders > Cassette Players & Recorders',
+    'Electronics > Audio > Audio Players & Recorders > Home Theater Systems',
+    'Electronics > Audio > Audio Players & Recorders > Jukeboxes',
+    'Electronics > Audio > Audio Players & Recorders > Karaoke Systems',
+    'Electronics > Audio > Audio Players & Recorders > MP3 Players',
+    'Electronics > Audio > Audio Players & Recorders > MiniDisc Players & Recorders',
+    'Electronics > Audio > Audio Players & Recorders > Multitrack Recorders',
+    'Electronics > Audio > Audio Players & Recorders > Radios',
+    'Electronics > Audio > Audio Players & Recorders > Reel-to-Reel Tape Players & Recorders',
+    'Electronics > Audio > Audio Players & Recorders > Stereo Systems',
+    'Electronics > Audio > Audio Players & Recorders > Turntables & Record Players',
+    'Electronics > Audio > Audio Players & Recorders > Voice Recorders',
+    'Electronics > Audio > Bullhorns',
+    'Electronics > Audio > DJ & Specialty Audio',
+    'Electronics > Audio > DJ & Specialty Audio > DJ CD Players',
+    'Electronics > Audio > DJ & Specialty Audio > DJ Systems',
+    'Electronics > Audio > Public Address Systems',
+    'Electronics > Audio > Stage Equipment',
+    'Electronics > Audio > Stage Equipment > Wireless Transmitters',
+    'Electronics > Circuit Boards & Components',
+    'Electronics > Circuit Boards & Components > Circuit Board Accessories',
+    'Electronics > Circuit Boards & Components > Circuit Decoders & Encoders',
+    'Electronics > Circuit Boards & Components > Circuit Prototyping',
+    'Electronics > Circuit Boards & Components > Circuit Prototyping > Breadboards',
+    'Electronics > Circuit Boards & Components > Electronic Filters',
+    'Electronics > Circuit Boards & Components > Passive Circuit Components',
+    'Electronics > Circuit Boards & Components > Passive Circuit Components > Capacitors',
+    'Electronics > Circuit Boards & Components > Passive Circuit Components > Electronic Oscillators',
+    'Electronics > Circuit Boards & Components > Passive Circuit Components > Inductors',
+    'Electronics > Circuit Boards & Components > Passive Circuit Components > Resistors',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Camera Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Computer Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Computer Circuit Boards > Computer Inverter Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Computer Circuit Boards > Hard Drive Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Computer Circuit Boards > Motherboards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Development Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Exercise Machine Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Household Appliance Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Pool & Spa Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Printer, Copier, & Fax Machine Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Scanner Circuit Boards',
+    'Electronics > Circuit Boards & Components > Printed Circuit Boards > Television Circuit Boards',
+    'Electronics > Circuit Boards & Components > Semiconductors',
+    'Electronics > Circuit Boards & Components > Semiconductors > Diodes',
+    'Electronics > Circuit Boards & Components > Semiconductors > Integrated Circuits & Chips',
+    'Electronics > Circuit Boards & Components > Semiconductors > Microcontrollers',
+    'Electronics > Circuit Boards & Components > Semiconductors > Transistors',
+    'Electronics > Communications',
+    'Electronics > Communications > Answering Machines',
+    'Electronics > Communications > Caller IDs',
+    'Electronics > Communications > Communication Radio Accessories',
+    'Electronics > Communications > Communication Radios',
+    'Electronics > Communications > Communication Radios > CB Radios',
+    'Electronics > Communications > Communication Radios > Radio Scanners',
+    'Electronics > Communications > Communication Radios > Two-Way Radios',
+    'Electronics > Communications > Intercom Accessories',
+    'Electronics > Communications > Intercoms',
+    'Electronics > Communications > Pagers',
+    'Electronics > Communications > Telephony',
+    'Electronics > Communications > Telephony > Conference Phones',
+    'Electronics > Communications > Telephony > Corded Phones',
+    'Electronics > Communications > Telephony > Cordless Phones',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Camera Accessories',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Cases',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Charms & Straps',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Pre-Paid Cards & SIM Cards',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Pre-Paid Cards & SIM Cards > Mobile Phone Pre-Paid Cards',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Pre-Paid Cards & SIM Cards > SIM Cards',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Replacement Parts',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > Mobile Phone Stands',
+    'Electronics > Communications > Telephony > Mobile Phone Accessories > SIM Card Ejection Tools',
+    'Electronics > Communications > Telephony > Mobile Phones',
+    'Electronics > Communications > Telephony > Mobile Phones > Contract Mobile Phones',
+    'Electronics > Communications > Telephony > Mobile Phones > Pre-paid Mobile Phones',
+    'Electronics > Communications > Telephony > Mobile Phones > Unlocked Mobile Phones',
+    'Electronics > Communications > Telephony > Satellite Phones',
+    'Electronics > Communications > Telephony > Telephone Accessories',
+    'Electronics > Communications > Telephony > Telephone Accessories > Phone Cards',
+    'Electronics > Communications > Video Conferencing',
+    'Electronics > Components',
+    'Electronics > Components > Accelerometers',
+    'Electronics > Components > Converters',
+    'Electronics > Components > Converters > Audio Converters',
+    'Electronics > Components > Converters > Scan Converters',
+    'Electronics > Components > Electronics Component Connectors',
+    'Electronics > Components > Modulators',
+    'Electronics > Components > Splitters',
+    'Electronics > Computers',
+    'Electronics > Computers > Barebone Computers',
+    'Electronics > Computers > Computer Servers',
+    'Electronics > Computers > Desktop Computers',
+    'Electronics > Computers > Handheld Devices',
+    'Electronics > Computers > Handheld Devices > Data Collectors',
+    'Electronics > Computers > Handheld Devices > E-Book Readers',
+    'Electronics > Computers > Handheld Devices > PDAs',
+    'Electronics > Computers > Interactive Kiosks',
+    'Electronics > Computers > Laptops',
+    'Electronics > Computers > Smart Glasses',
+    'Electronics > Computers > Tablet Computers',
+    'Electronics > Computers > Thin & Zero Clients',
+    'Electronics > Computers > Thin & Zero Clients > Thin Client Computers',
+    'Electronics > Computers > Thin & Zero Clients > Zero Client Computers',
+    'Electronics > Computers > Touch Table Computers',
+    'Electronics > Electronics Accessories',
+    'Electronics > Electronics Accessories > Adapters',
+    'Electronics > Electronics Accessories > Adapters > Audio & Video Cable Adapters & Couplers',
+    'Electronics > Electronics Accessories > Adapters > Memory Card Adapters',
+    'Electronics > Electronics Accessories > Adapters > USB Adapters',
+    'Electronics > Electronics Accessories > Antenna Accessories',
+    'Electronics > Electronics Accessories > Antenna Accessories > Antenna Mounts & Brackets',
+    'Electronics > Electronics Accessories > Antenna Accessories > Antenna Rotators',
+    'Electronics > Electronics Accessories > Antenna Accessories > Satellite LNBs',
+    'Electronics > Electronics Accessories > Antennas',
+    'Electronics > Electronics Accessories > Audio & Video Splitters & Switches',
+    'Electronics > Electronics Accessories > Audio & Video Splitters & Switches > DVI Splitters & Switches',
+    'Electronics > Electronics Accessories > Audio & Video Splitters & Switches > HDMI Splitters & Switches',
+    'Electronics > Electronics Accessories > Audio & Video Splitters & Switches > VGA Splitters & Switches',
+    'Electronics > Electronics Accessories > Blank Media',
+    'Electronics > Electronics Accessories > Cable Management',
+    'Electronics > Electronics Accessories > Cable Management > Cable Clips',
+    'Electronics > Electronics Accessories > Cable Management > Cable Tie Guns',
+    'Electronics > Electronics Accessories > Cable Management > Cable Trays',
+    'Electronics > Electronics Accessories > Cable Management > Patch Panels',
+    'Electronics > Electronics Accessories > Cable Management > Wire & Cable Identification Markers',
+    'Electronics > Electronics Accessories > Cable Management > Wire & Cable Sleeves',
+    'Electronics > Electronics Accessories > Cable Management > Wire & Cable Ties',
+    'Electronics > Electronics Accessories > Cables',
+    'Electronics > Electronics Accessories > Cables > Audio & Video Cables',
+    'Electronics > Electronics Accessories > Cables > KVM Cables',
+    'Electronics > Electronics Accessories > Cables > Network Cables',
+    'Electronics > Electronics Accessories > Cables > Storage & Data Transfer Cables',
+    'Electronics > Electronics Accessories > Cables > System & Power Cables',
+    'Electronics > Electronics Accessories > Cables > Telephone Cables',
+    'Electronics > Electronics Accessories > Computer Accessories',
+    'Electronics > Electronics Accessories > Computer Accessories > Computer Accessory Sets',
+    'Electronics > Electronics Accessories > Computer Accessories > Computer Covers & Skins',
+    'Electronics > Electronics Accessories > Computer Accessories > Computer Risers & Stands',
+    'Electronics > Electronics Accessories > Computer Accessories > Handheld Device Accessories',
+    'Electronics > Electronics Accessories > Computer Accessories > Handheld Device Accessories > E-Book Reader Accessories',
+    'Electronics > Electronics Accessories > Computer Accessories > Handheld Device Accessories > E-Book Reader Accessories > E-Book Reader Cases',
+    'Electronics > Electronics Accessories > Computer Accessories > Handheld Device Accessories > PDA Accessories',
+    'Electronics > Electronics Accessories > Computer Accessories > Handheld Device Accessories > PDA Accessories > PDA Cases',
+    'Electronics > Electronics Accessories > Computer Accessories > Keyboard & Mouse Wrist Rests',
+    'Electronics > Electronics Accessories > Computer Accessories > Keyboard Trays & Platforms',
+    'Electronics > Electronics Accessories > Computer Accessories > Laptop Docking Stations',
+    'Electronics > Electronics Accessories > Computer Accessories > Mouse Pads',
+    'Electronics > Electronics Accessories > Computer Accessories > Stylus Pen Nibs & Refills',
+    'Electronics > Electronics Accessories > Computer Accessories > Stylus Pens',
+    'Electronics > Electronics Accessories > Computer Accessories > Tablet Computer Docks & Stands',
+    'Electronics > Electronics Accessories > Computer Components',
+    'Electronics > Electronics Accessories > Computer Components > Blade Server Enclosures',
+    'Electronics > Electronics Accessories > Computer Components > Computer Backplates & I/O Shields',
+    'Electronics > Electronics Accessories > Computer Components > Computer Power Supplies',
+    'Electronics > Electronics Accessories > Computer Components > Computer Processors',
+    'Electronics > Electronics Accessories > Computer Components > Computer Racks & Mounts',
+    'Electronics > Electronics Accessories > Computer Components > Computer Starter Kits',
+    'Electronics > Electronics Accessories > Computer Components > Computer System Cooling Parts',
+    'Electronics > Electronics Accessories > Computer Components > Desktop Computer & Server Cases',
+    'Electronics > Electronics Accessories > Computer Components > E-Book Reader Parts',
+    'Electronics > Electronics Accessories > Computer Components > E-Book Reader Parts > E-Book Reader Screens & Screen Digitizers',
+    'Electronics > Electronics Accessories > Computer Components > I/O Cards & Adapters',
+    'Electronics > Electronics Accessories > Computer Components > I/O Cards & Adapters > Audio Cards & Adapters',
+    'Electronics > Electronics Accessories > Computer Components > I/O Cards & Adapters > Computer Interface Cards & Adapters',
+    'Electronics > Electronics Accessories > Computer Components > I/O Cards & Adapters > Riser Cards',
+    'Electronics > Electronics Accessories > Computer Components > I/O Cards & Adapters > TV Tuner Cards & Adapters',
+    'Electronics > Electronics Accessories > Computer Components > I/O Cards & Adapters > Video Cards & Adapters',
+    'Electronics > Electronics Accessories > Computer Components > Input Device Accessories',
+    'Electronics > Electronics Accessories > Computer Components > Input Device Accessories > Barcode Scanner Stands',
+    'Electronics > Electronics Accessories > Computer Components > Input Device Accessories > Game Controller Accessories',
+    'Electronics > Electronics Accessories > Computer Components > Input Device Accessories > Keyboard Keys & Caps',
+    'Electronics > Electronics Accessories > Computer Components > Input Device Accessories > Mice & Trackball Accessories',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Barcode Scanners',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Digital Note Taking Pens',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Electronic Card Readers',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Fingerprint Readers',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Game Controllers',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Game Controllers > Game Racing Wheels',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Game Controllers > Game Remotes',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Game Controllers > Gaming Pads',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Game Controllers > Joystick Controllers',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Game Controllers > Musical Instrument Game Controllers',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Gesture Control Input Devices',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Graphics Tablets',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > KVM Switches',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Keyboards',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Memory Card Readers',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Mice & Trackballs',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Numeric Keypads',
+    'Electronics > Electronics Accessories > Computer Components > Input Devices > Touchpads',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts > Laptop Hinges',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts > Laptop Housings & Trim',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts > Laptop Replacement Cables',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts > Laptop Replacement Keyboards',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts > Laptop Replacement Screens',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts > Laptop Replacement Speakers',
+    'Electronics > Electronics Accessories > Computer Components > Laptop Parts > Laptop Screen Digitizers',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Disk Duplicators',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Disk Duplicators > CD/DVD Duplicators',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Disk Duplicators > Hard Drive Duplicators',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Disk Duplicators > USB Drive Duplicators',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Floppy Drives',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Hard Drive Accessories',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Hard Drive Accessories > Hard Drive Carrying Cases',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Hard Drive Accessories > Hard Drive Docks',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Hard Drive Accessories > Hard Drive Enclosures & Mounts',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Hard Drive Arrays',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Hard Drives',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Network Storage Systems',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Optical Drives',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > Tape Drives',
+    'Electronics > Electronics Accessories > Computer Components > Storage Devices > USB Flash Drives',
+    'Electronics > Electronics Accessories > Computer Components > Tablet Computer Parts',
+    'Electronics > Electronics Accessories > Computer Components > Tablet Computer Parts > Tablet Computer Housings & Trim',
+    'Electronics > Electronics Accessories > Computer Components > Tablet Computer Parts > Tablet Computer Replacement Speakers',
+    'Electronics > Electronics Accessories > Computer Components > Tablet Computer Parts > Tablet Computer Screens & Screen Digitizers',
+    'Electronics > Electronics Accessories > Computer Components > USB & FireWire Hubs',
+    'Electronics > Electronics Accessories > Electronics Cleaners',
+    'Electronics > Electronics Accessories > Electronics Films & Shields',
+    'Electronics > Electronics Accessories > Electronics Films & Shields > Electronics Stickers & Decals',
+    'Electronics > Electronics Accessories > Electronics Films & Shields > Keyboard Protectors',
+    'Electronics > Electronics Accessories > Electronics Films & Shields > Privacy Filters',
+    'Electronics > Electronics Accessories > Electronics Films & Shields > Screen Protectors',
+    'Electronics > Electronics Accessories > Memory',
+    'Electronics > Electronics Accessories > Memory > Cache Memory',
+    'Electronics > Electronics Accessories > Memory > Flash Memory',
+    'Electronics > Electronics Accessories > Memory > Flash Memory > Flash Memory Cards',
+    'Electronics > Electronics Accessories > Memory > RAM',
+    'Electronics > Electronics Accessories > Memory > ROM',
+    'Electronics > Electronics Accessories > Memory > Video Memory',
+    'Electronics > Electronics Accessories > Memory Accessories',
+    'Electronics > Electronics Accessories > Memory Accessories > Memory Cases',
+    'Electronics > Electronics Accessories > Mobile Phone & Tablet Tripods & Monopods',
+    'Electronics > Electronics Accessories > Power',
+    'Electronics > Electronics Accessories > Power > Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > Camera Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > Cordless Phone Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > E-Book Reader Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > General Purpose Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > Laptop Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > MP3 Player Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > Mobile Phone Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > PDA Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > Tablet Computer Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > UPS Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > Video Camera Batteries',
+    'Electronics > Electronics Accessories > Power > Batteries > Video Game Console & Controller Batteries',
+    'Electronics > Electronics Accessories > Power > Battery Accessories',
+    'Electronics > Electronics Accessories > Power > Battery Accessories > Battery Charge Controllers',
+    'Electronics > Electronics Accessories > Power > Battery Accessories > Battery Holders',
+    'Electronics > Electronics Accessories > Power > Battery Accessories > Camera Battery Chargers',
+    'Electronics > Electronics Accessories > Power > Battery Accessories > General Purpose Battery Chargers',
+    'Electronics > Electronics Accessories > Power > Battery Accessories > General Purpose Battery Testers',
+    'Electronics > Electronics Accessories > Power > Fuel Cells',
+    'Electronics > Electronics Accessories > Power > Power Adapter & Charger Accessories',
+    'Electronics > Electronics Accessories > Power > Power Adapters & Chargers',
+    'Electronics > Electronics Accessories > Power > Power Control Units',
+    'Electronics > Electronics Accessories > Power > Power Strips & Surge Suppressors',
+    'Electronics > Electronics Accessories > Power > Power Supply Enclosures',
+    'Electronics > Electronics Accessories > Power > Surge Protection Devices',
+    'Electronics > Electronics Accessories > Power > Travel Converters & Adapters',
+    'Electronics > Electronics Accessories > Power > UPS',
+    'Electronics > Electronics Accessories > Power > UPS Accessories',
+    'Electronics > Electronics Accessories > Remote Controls',
+    'Electronics > Electronics Accessories > Signal Boosters',
+    'Electronics > Electronics Accessories > Signal Jammers',
+    'Electronics > Electronics Accessories > Signal Jammers > GPS Jammers',
+    'Electronics > Electronics Accessories > Signal Jammers > Mobile Phone Jammers',
+    'Electronics > Electronics Accessories > Signal Jammers > Radar Jammers',
+    'Electronics > GPS Accessories',
+    'Electronics > GPS Accessories > GPS Cases',
+    'Electronics > GPS Accessories > GPS Mounts',
+    'Electronics > GPS Navigation Systems',
+    'Electronics > GPS Tracking Devices',
+    'Electronics > Marine Electronics',
+    'Electronics > Marine Electronics > Fish Finders',
+    'Electronics > Marine Electronics > Marine Audio & Video Receivers',
+    'Electronics > Marine Electronics > Marine Chartplotters & GPS',
+    'Electronics > Marine Electronics > Marine Radar',
+    'Electronics > Marine Electronics > Marine Radios',
+    'Electronics > Marine Electronics > Marine Speakers',
+    'Electronics > Networking',
+    'Electronics > Networking > Bridges & Routers',
+    'Electronics > Networking > Bridges & Routers > Network Bridges',
+    'Electronics > Networking > Bridges & Routers > VoIP Gateways & Routers',
+    'Electronics > Networking > Bridges & Routers > Wireless Access Points',
+    'Electronics > Networking > Bridges & Routers > Wireless Routers',
+    'Electronics > Networking > Concentrators & Multiplexers',
+    'Electronics > Networking > Hubs & Switches',
+    'Electronics > Networking > Modem Accessories',
+    'Electronics > Networking > Modems',
+    'Electronics > Networking > Network Cards & Adapters',
+    'Electronics > Networking > Network Security & Firewall Devices',
+    'Electronics > Networking > Power Over Ethernet Adapters',
+    'Electronics > Networking > Print Servers',
+    'Electronics > Networking > Repeaters & Transceivers',
+    'Electronics > Print, Copy, Scan & Fax',
+    'Electronics > Print, Copy, Scan & Fax > 3D Printer Accessories',
+    'Electronics > Print, Copy, Scan & Fax > 3D Printers',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables > Printer Drums & Drum Kits',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables > Printer Filters',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables > Printer Maintenance Kits',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables > Printer Ribbons',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables > Printheads',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables > Toner & Inkjet Cartridge Refills',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Consumables > Toner & Inkjet Cartridges',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Duplexers',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Memory',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer Stands',
+    'Electronics > Print, Copy, Scan & Fax > Printer, Copier & Fax Machine Accessories > Printer, Copier & Fax Machine Replacement Parts',
+    'Electronics > Print, Copy, Scan & Fax > Printers, Copiers & Fax Machines',
+    'Electronics > Print, Copy, Scan & Fax > Scanner Accessories',
+    'Electronics > Print, Copy, Scan & Fax > Scanners',
+    'Electronics > Radar Detectors',
+    'Electronics > Speed Radars',
+    'Electronics > Toll Collection Devices',
+    'Electronics > Video',
+    'Electronics > Video > Computer Monitors',
+    'Electronics > Video > Projectors',
+    'Electronics > Video > Projectors > Multimedia Projectors',
+    'Electronics > Video > Projectors > Overhead Projectors',
+    'Electronics > Video > Projectors > Slide Projectors',
+    'Electronics > Video > Satellite & Cable TV',
+    'Electronics > Video > Satellite & Cable TV > Cable TV Receivers',
+    'Electronics > Video > Satellite & Cable TV > Satellite Receivers',
+    'Electronics > Video > Televisions',
+    'Electronics > Video > Video Accessories',
+    'Electronics > Video > Video Accessories > 3D Glasses',
+    'Electronics > Video > Video Accessories > Computer Monitor Accessories',
+    'Electronics > Video > Video Accessories > Computer Monitor Accessories > Color Calibrators',
+    'Electronics > Video > Video Accessories > Projector Accessories',
+    'Electronics > Video > Video Accessories > Projector Accessories > Projection & Tripod Skirts',
+    'Electronics > Video > Video Accessories > Projector Accessories > Projection Screen Stands',
+    'Electronics > Video > Video Accessories > Projector Accessories > Projection Screens',
+    'Electronics > Video > Video Accessories > Projector Accessories > Projector Mounts',
+    'Electronics > Video > Video Accessories > Projector Accessories > Projector Replacement Lamps',
+    'Electronics > Video > Video Accessories > Rewinders',
+    'Electronics > Video > Video Accessories > Television Parts & Accessories',
+    'Electronics > Video > Video Accessories > Television Parts & Accessories > TV & Monitor Mounts',
+    'Electronics > Video > Video Accessories > Television Parts & Accessories > TV Converter Boxes',
+    'Electronics > Video > Video Accessories > Television Parts & Accessories > TV Replacement Lamps',
+    'Electronics > Video > Video Accessories > Television Parts & Accessories > TV Replacement Speakers',
+    'Electronics > Video > Video Editing Hardware & Production Equipment',
+    'Electronics > Video > Video Multiplexers',
+    'Electronics > Video > Video Players & Recorders',
+    'Electronics > Video > Video Players & Recorders > DVD & Blu-ray Players',
+    'Electronics > Video > Video Players & Recorders > DVD Recorders',
+    'Electronics > Video > Video Players & Recorders > Digital Video Recorders',
+    'Electronics > Video > Video Players & Recorders > Streaming & Home Media Players',
+    'Electronics > Video > Video Players & Recorders > VCRs',
+    'Electronics > Video > Video Servers',
+    'Electronics > Video > Video Transmitters',
+    'Electronics > Video Game Console Accessories',
+    'Electronics > Video Game Console Accessories > Home Game Console Accessories',
+    'Electronics > Video Game Console Accessories > Portable Game Console Accessories',
+    'Electronics > Video Game Consoles',
+    'Food, Beverages & Tobacco',
+    'Food, Beverages & Tobacco > Beverages',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Beer',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Bitters',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Cocktail Mixes',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Cocktail Mixes > Frozen Cocktail Mixes',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Cocktail Mixes > Shelf-stable Cocktail Mixes',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Flavored Alcoholic Beverages',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Hard Cider',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Absinthe',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Brandy',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Gin',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Liqueurs',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Rum',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Shochu & Soju',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Shochu & Soju > Shochu',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Shochu & Soju > Soju',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Tequila',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Vodka',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Liquor & Spirits > Whiskey',
+    'Food, Beverages & Tobacco > Beverages > Alcoholic Beverages > Wine',
+    'Food, Beverages & Tobacco > Beverages > Buttermilk',
+    'Food, Beverages & Tobacco > Beverages > Coffee',
+    'Food, Beverages & Tobacco > Beverages > Eggnog',
+    'Food, Beverages & Tobacco > Beverages > Fruit Flavored Drinks',
+    'Food, Beverages & Tobacco > Beverages > Hot Chocolate',
+    'Food, Beverages & Tobacco > Beverages > Juice',
+    'Food, Beverages & Tobacco > Beverages > Milk',
+    'Food, Beverages & Tobacco > Beverages > Non-Dairy Milk',
+    'Food, Beverages & Tobacco > Beverages > Powdered Beverage Mixes',
+    'Food, Beverages & Tobacco > Beverages > Soda',
+    'Food, Beverages & Tobacco > Beverages > Sports & Energy Drinks',
+    'Food, Beverages & Tobacco > Beverages > Tea & Infusions',
+    'Food, Beverages & Tobacco > Beverages > Vinegar Drinks',
+    'Food, Beverages & Tobacco > Beverages > Water',
+    'Food, Beverages & Tobacco > Beverages > Water > Carbonated Water',
+    'Food, Beverages & Tobacco > Beverages > Water > Carbonated Water > Flavored Carbonated Water',
+    'Food, Beverages & Tobacco > Beverages > Water > Carbonated Water > Unflavored Carbonated Water',
+    'Food, Beverages & Tobacco > Beverages > Water > Distilled Water',
+    'Food, Beverages & Tobacco > Beverages > Water > Flat Mineral Water',
+    'Food, Beverages & Tobacco > Beverages > Water > Spring Water',
+    'Food, Beverages & Tobacco > Food Items',
+    'Food, Beverages & Tobacco > Food Items > Bakery',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Bagels',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Bakery Assortments',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Breads & Buns',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Cakes & Dessert Bars',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Coffee Cakes',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Cookies',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Cupcakes',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Donuts',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Fudge',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Ice Cream Cones',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Muffins',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Pastries & Scones',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Pies & Tarts',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Taco Shells & Tostadas',
+    'Food, Beverages & Tobacco > Food Items > Bakery > Tortillas & Wraps',
+    'Food, Beverages & Tobacco > Food Items > Candied & Chocolate Covered Fruit',
+    'Food, Beverages & Tobacco > Food Items > Candy & Chocolate',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Cocktail Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Curry Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Dessert Toppings',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Dessert Toppings > Fruit Toppings',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Dessert Toppings > Ice Cream Syrup',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Fish Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Gravy',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Honey',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Horseradish Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Hot Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Ketchup',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Marinades & Grilling Sauces',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Mayonnaise',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Mustard',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Olives & Capers',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Pasta Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Pickled Fruits & Vegetables',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Pizza Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Relish & Chutney',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Salad Dressing',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Satay Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Soy Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Sweet and Sour Sauces',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Syrup',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Tahini',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Tartar Sauce',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > White & Cream Sauces',
+    'Food, Beverages & Tobacco > Food Items > Condiments & Sauces > Worcestershire Sauce',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Baking Chips',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Baking Chocolate',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Baking Flavors & Extracts',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Baking Mixes',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Baking Powder',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Baking Soda',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Batter & Coating Mixes',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Bean Paste',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Bread Crumbs',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Canned & Dry Milk',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Cookie Decorating Kits',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Cooking Oils',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Cooking Starch',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Cooking Wine',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Corn Syrup',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Dough',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Dough > Bread & Pastry Dough',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Dough > Cookie & Brownie Dough',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Dough > Pie Crusts',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Edible Baking Decorations',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Egg Replacers',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Floss Sugar',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Flour',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Food Coloring',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Frosting & Icing',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Lemon & Lime Juice',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Marshmallows',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Meal',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Molasses',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Pie & Pastry Fillings',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Shortening & Lard',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Starter Cultures',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Sugar & Sweeteners',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Tapioca Pearls',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Tomato Paste',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Unflavored Gelatin',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Vinegar',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Waffle & Pancake Mixes',
+    'Food, Beverages & Tobacco > Food Items > Cooking & Baking Ingredients > Yeast',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Butter & Margarine',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Cheese',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Coffee Creamer',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Cottage Cheese',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Cream',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Sour Cream',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Whipped Cream',
+    'Food, Beverages & Tobacco > Food Items > Dairy Products > Yogurt',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Apple Butter',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Cheese Dips & Spreads',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Cream Cheese',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Guacamole',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Hummus',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Jams & Jellies',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Nut Butters',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Salsa',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Tapenade',
+    'Food, Beverages & Tobacco > Food Items > Dips & Spreads > Vegetable Dip',
+    'Food, Beverages & Tobacco > Food Items > Food Gift Baskets',
+    'Food, Beverages & Tobacco > Food Items > Frozen Desserts & Novelties',
+    'Food, Beverages & Tobacco > Food Items > Frozen Desserts & Novelties > Ice Cream & Frozen Yogurt',
+    'Food, Beverages & Tobacco > Food Items > Frozen Desserts & Novelties > Ice Cream Novelties',
+    'Food, Beverages & Tobacco > Food Items > Frozen Desserts & Novelties > Ice Pops',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Canned & Jarred Fruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Canned & Jarred Vegetables',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Canned & Prepared Beans',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Dried Fruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Dried Vegetables',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Dry Beans',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Apples',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Atemoyas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Avocados',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Babacos',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Bananas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Berries',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Breadfruit',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Cactus Pears',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Cherimoyas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits > Grapefruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits > Kumquats',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits > Lemons',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits > Limequats',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits > Limes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits > Oranges',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Citrus Fruits > Tangelos',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Coconuts',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Dates',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Feijoas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Figs',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Fruit Mixes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Grapes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Guavas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Homely Fruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Kiwis',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Longan',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Loquats',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Lychees',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Madroño',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Mamey',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Mangosteens',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Melons',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Papayas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Passion Fruit',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Pears',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Persimmons',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Physalis',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Pineapples',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Pitahayas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Pomegranates',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Quince',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Rambutans',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Sapodillo',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Sapote',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Soursops',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Starfruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Stone Fruits',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Stone Fruits > Apricots',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Stone Fruits > Cherries',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Stone Fruits > Mangoes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Stone Fruits > Peaches & Nectarines',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Stone Fruits > Plumcots',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Stone Fruits > Plums',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Sugar Apples',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Fruits > Tamarindo',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Arracachas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Artichokes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Asparagus',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Beans',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Beets',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Borage',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Broccoli',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Brussel Sprouts',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Cabbage',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Cactus Leaves',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Cardoon',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Carrots',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Cauliflower',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Celery',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Celery Roots',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Corn',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Cucumbers',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Eggplants',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Fennel Bulbs',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Fiddlehead Ferns',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Gai Choy',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Gai Lan',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Garlic',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Ginger Root',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Gobo Root',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Arugula',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Beet Greens',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Bok Choy',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Chard',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Chicory',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Choy Sum',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Kale',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Lettuce',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > On Choy',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Salad Mixes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Spinach',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Greens > Yu Choy',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Horseradish Root',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Jicama',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Kohlrabi',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Leeks',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Lotus Roots',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Malangas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Mushrooms',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Okra',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Onions',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Parsley Roots',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Parsnips',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Peas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Peppers',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Potatoes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Radishes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Rhubarb',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Shallots',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Sprouts',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Squashes & Gourds',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Sugar Cane',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Sunchokes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Sweet Potatoes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Tamarillos',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Taro Root',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Tomatoes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Turnips & Rutabagas',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Vegetable Mixes',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Water Chestnuts',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Watercress',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Wheatgrass',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Yams',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fresh & Frozen Vegetables > Yuca Root',
+    'Food, Beverages & Tobacco > Food Items > Fruits & Vegetables > Fruit Sauces',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Amaranth',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Barley',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Buckwheat',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Cereal & Granola',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Couscous',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Millet',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Oats, Grits & Hot Cereal',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Quinoa',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Rice',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Rye',
+    'Food, Beverages & Tobacco > Food Items > Grains, Rice & Cereal > Wheat',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Eggs',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Eggs > Egg Whites',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Eggs > Liquid & Frozen Eggs',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Eggs > Prepared Eggs',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Eggs > Whole Eggs',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Meat',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Meat > Canned Meats',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Meat > Fresh & Frozen Meats',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Meat > Lunch & Deli Meats',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Seafood',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Seafood > Canned Seafood',
+    'Food, Beverages & Tobacco > Food Items > Meat, Seafood & Eggs > Seafood > Fresh & Frozen Seafood',
+    'Food, Beverages & Tobacco > Food Items > Nuts & Seeds',
+    'Food, Beverages & Tobacco > Food Items > Pasta & Noodles',
+    'Food, Beverages & Tobacco > Food Items > Prepared Foods',
+    'Food, Beverages & Tobacco > Food Items > Prepared Foods > Prepared Appetizers & Side Dishes',
+    'Food, Beverages & Tobacco > Food Items > Prepared Foods > Prepared Meals & Entrées',
+    'Food, Beverages & Tobacco > Food Items > Seasonings & Spices',
+    'Food, Beverages & Tobacco > Food Items > Seasonings & Spices > Herbs & Spices',
+    'Food, Beverages & Tobacco > Food Items > Seasonings & Spices > MSG',
+    'Food, Beverages & Tobacco > Food Items > Seasonings & Spices > Pepper',
+    'Food, Beverages & Tobacco > Food Items > Seasonings & Spices > Salt',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Breadsticks',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Cereal & Granola Bars',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Cereal & Granola Bars > Cereal Bars',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Cereal & Granola Bars > Granola Bars',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Cheese Puffs',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Chips',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Crackers',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Croutons',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Fruit Snacks',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Jerky',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Popcorn',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Pork Rinds',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Pretzels',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Pudding & Gelatin Snacks',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Puffed Rice Cakes',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Salad Toppings',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Sesame Sticks',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Snack Cakes',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Sticky Rice Cakes',
+    'Food, Beverages & Tobacco > Food Items > Snack Foods > Trail & Snack Mixes',
+    'Food, Beverages & Tobacco > Food Items > Soups & Broths',
+    'Food, Beverages & Tobacco > Food Items > Tofu, Soy & Vegetarian Products',
+    'Food, Beverages & Tobacco > Food Items > Tofu, Soy & Vegetarian Products > Cheese Alternatives',
+    'Food, Beverages & Tobacco > Food Items > Tofu, Soy & Vegetarian Products > Meat Alternatives',
+    'Food, Beverages & Tobacco > Food Items > Tofu, Soy & Vegetarian Products > Seitan',
+    'Food, Beverages & Tobacco > Food Items > Tofu, Soy & Vegetarian Products > Tempeh',
+    'Food, Beverages & Tobacco > Food Items > Tofu, Soy & Vegetarian Products > Tofu',
+    'Food, Beverages & Tobacco > Tobacco Products',
+    'Food, Beverages & Tobacco > Tobacco Products > Chewing Tobacco',
+    'Food, Beverages & Tobacco > Tobacco Products > Cigarettes',
+    'Food, Beverages & Tobacco > Tobacco Products > Cigars',
+    'Food, Beverages & Tobacco > Tobacco Products > Loose Tobacco',
+    'Food, Beverages & Tobacco > Tobacco Products > Smoking Pipes',
+    'Food, Beverages & Tobacco > Tobacco Products > Vaporizers & Electronic Cigarettes',
+    'Food, Beverages & Tobacco > Tobacco Products > Vaporizers & Electronic Cigarettes > Electronic Cigarettes',
+    'Food, Beverages & Tobacco > Tobacco Products > Vaporizers & Electronic Cigarettes > Vaporizers',
+    'Furniture',
+    'Furniture > Baby & Toddler Furniture',
+    'Furniture > Baby & Toddler Furniture > Baby & Toddler Furniture Sets',
+    'Furniture > Baby & Toddler Furniture > Bassinet & Cradle Accessories',
+    'Furniture > Baby & Toddler Furniture > Bassinets & Cradles',
+    'Furniture > Baby & Toddler Furniture > Changing Tables',
+    'Furniture > Baby & Toddler Furniture > Crib & Toddler Bed Accessories',
+    'Furniture > Baby & Toddler Furniture > Crib & Toddler Bed Accessories > Crib Bumpers & Liners',
+    'Furniture > Baby & Toddler Furniture > Crib & Toddler Bed Accessories > Crib Conversion Kits',
+    'Furniture > Baby & Toddler Furniture > Cribs & Toddler Beds',
+    'Furniture > Baby & Toddler Furniture > High Chair & Booster Seat Accessories',
+    'Furniture > Baby & Toddler Furniture > High Chairs & Booster Seats',
+    'Furniture > Beds & Accessories',
+    'Furniture > Beds & Accessories > Bed & Bed Frame Accessories',
+    'Furniture > Beds & Accessories > Beds & Bed Frames',
+    'Furniture > Beds & Accessories > Headboards & Footboards',
+    'Furniture > Beds & Accessories > Mattress Foundations',
+    'Furniture > Beds & Accessories > Mattresses',
+    'Furniture > Benches',
+    'Furniture > Benches > Kitchen & Dining Benches',
+    'Furniture > Benches > Storage & Entryway Benches',
+    'Furniture > Benches > Vanity Benches',
+    'Furniture > Cabinets & Storage',
+    'Furniture > Cabinets & Storage > Armoires & Wardrobes',
+    'Furniture > Cabinets & Storage > Buffets & Sideboards',
+    'Furniture > Cabinets & Storage > China Cabinets & Hutches',
+    'Furniture > Cabinets & Storage > Dressers',
+    'Furniture > Cabinets & Storage > File Cabinets',
+    'Furniture > Cabinets & Storage > Ironing Centers',
+    'Furniture > Cabinets & Storage > Kitchen Cabinets',
+    'Furniture > Cabinets & Storage > Magazine Racks',
+    'Furniture > Cabinets & Storage > Media Storage Cabinets & Racks',
+    'Furniture > Cabinets & Storage > Storage Cabinets & Lockers',
+    'Furniture > Cabinets & Storage > Storage Chests',
+    'Furniture > Cabinets & Storage > Storage Chests > Hope Chests',
+    'Furniture > Cabinets & Storage > Storage Chests > Toy Chests',
+    'Furniture > Cabinets & Storage > Vanities',
+    'Furniture > Cabinets & Storage > Vanities > Bathroom Vanities',
+    'Furniture > Cabinets & Storage > Vanities > Bedroom Vanities',
+    'Furniture > Cabinets & Storage > Wine & Liquor Cabinets',
+    'Furniture > Cabinets & Storage > Wine Racks',
+    'Furniture > Carts & Islands',
+    'Furniture > Carts & Islands > Kitchen & Dining Carts',
+    'Furniture > Carts & Islands > Kitchen Islands',
+    'Furniture > Chair Accessories',
+    'Furniture > Chair Accessories > Hanging Chair Replacement Parts',
+    'Furniture > Chairs',
+    'Furniture > Chairs > Arm Chairs, Recliners & Sleeper Chairs',
+    'Furniture > Chairs > Bean Bag Chairs',
+    'Furniture > Chairs > Chaises',
+    'Furniture > Chairs > Electric Massaging Chairs',
+    'Furniture > Chairs > Floor Chairs',
+    'Furniture > Chairs > Folding Chairs & Stools',
+    'Furniture > Chairs > Gaming Chairs',
+    'Furniture > Chairs > Hanging Chairs',
+    'Furniture > Chairs > Kitchen & Dining Room Chairs',
+    'Furniture > Chairs > Rocking Chairs',
+    'Furniture > Chairs > Slipper Chairs',
+    'Furniture > Chairs > Table & Bar Stools',
+    'Furniture > Entertainment Centers & TV Stands',
+    'Furniture > Furniture Sets',
+    'Furniture > Furniture Sets > Bathroom Furniture Sets',
+    'Furniture > Furniture Sets > Bedroom Furniture Sets',
+    'Furniture > Furniture Sets > Kitchen & Dining Furniture Sets',
+    'Furniture > Furniture Sets > Living Room Furniture Sets',
+    'Furniture > Futon Frames',
+    'Furniture > Futon Pads',
+    'Furniture > Futons',
+    'Furniture > Office Furniture',
+    'Furniture > Office Furniture > Desks',
+    'Furniture > Office Furniture > Office Chairs',
+    'Furniture > Office Furniture > Office Furniture Sets',
+    'Furniture > Office Furniture > Workspace Tables',
+    'Furniture > Office Furniture > Workspace Tables > Art & Drafting Tables',
+    'Furniture > Office Furniture > Workspace Tables > Conference Room Tables',
+    'Furniture > Office Furniture > Workstations & Cubicles',
+    'Furniture > Office Furniture Accessories',
+    'Furniture > Office Furniture Accessories > Desk Parts & Accessories',
+    'Furniture > Office Furniture Accessories > Office Chair Accessories',
+    'Furniture > Office Furniture Accessories > Workstation & Cubicle Accessories',
+    'Furniture > Ottomans',
+    'Furniture > Outdoor Furniture',
+    'Furniture > Outdoor Furniture > Outdoor Beds',
+    'Furniture > Outdoor Furniture > Outdoor Furniture Sets',
+    'Furniture > Outdoor Furniture > Outdoor Ottomans',
+    'Furniture > Outdoor Furniture > Outdoor Seating',
+    'Furniture > Outdoor Furniture > Outdoor Seating > Outdoor Benches',
+    'Furniture > Outdoor Furniture > Outdoor Seating > Outdoor Chairs',
+    'Furniture > Outdoor Furniture > Outdoor Seating > Outdoor Sectional Sofa Units',
+    'Furniture > Outdoor Furniture > Outdoor Seating > Outdoor Sofas',
+    'Furniture > Outdoor Furniture > Outdoor Seating > Sunloungers',
+    'Furniture > Outdoor Furniture > Outdoor Storage Boxes',
+    'Furniture > Outdoor Furniture > Outdoor Tables',
+    'Furniture > Outdoor Furniture Accessories',
+    'Furniture > Outdoor Furniture Accessories > Outdoor Furniture Covers',
+    'Furniture > Room Divider Accessories',
+    'Furniture > Room Dividers',
+    'Furniture > Shelving',
+    'Furniture > Shelving > Bookcases & Standing Shelves',
+    'Furniture > Shelving > Wall Shelves & Ledges',
+    'Furniture > Shelving Accessories',
+    'Furniture > Shelving Accessories > Replacement Shelves',
+    'Furniture > Sofa Accessories',
+    'Furniture > Sofa Accessories > Chair & Sofa Supports',
+    'Furniture > Sofa Accessories > Sectional Sofa Units',
+    'Furniture > Sofas',
+    'Furniture > Table Accessories',
+    'Furniture > Table Accessories > Table Legs',
+    'Furniture > Table Accessories > Table Tops',
+    'Furniture > Tables',
+    'Furniture > Tables > Accent Tables',
+    'Furniture > Tables > Accent Tables > Coffee Tables',
+    'Furniture > Tables > Accent Tables > End Tables',
+    'Furniture > Tables > Accent Tables > Sofa Tables',
+    'Furniture > Tables > Activity Tables',
+    'Furniture > Tables > Folding Tables',
+    'Furniture > Tables > Kitchen & Dining Room Tables',
+    'Furniture > Tables > Kotatsu',
+    'Furniture > Tables > Nightstands',
+    'Furniture > Tables > Poker & Game Tables',
+    'Furniture > Tables > Sewing Machine Tables',
+    'Hardware',
+    'Hardware > Building Consumables',
+    'Hardware > Building Consumables > Chemicals',
+    'Hardware > Building Consumables > Chemicals > Acid Neutralizers',
+    'Hardware > Building Consumables > Chemicals > Ammonia',
+    'Hardware > Building Consumables > Chemicals > Chimney Cleaners',
+    'Hardware > Building Consumables > Chemicals > Concrete & Masonry Cleaners',
+    'Hardware > Building Consumables > Chemicals > De-icers',
+    'Hardware > Building Consumables > Chemicals > Deck & Fence Cleaners',
+    'Hardware > Building Consumables > Chemicals > Drain Cleaners',
+    'Hardware > Building Consumables > Chemicals > Electrical Freeze Sprays',
+    'Hardware > Building Consumables > Chemicals > Lighter Fluid',
+    'Hardware > Building Consumables > Chemicals > Septic Tank & Cesspool Treatments',
+    'Hardware > Building Consumables > Hardware Glue & Adhesives',
+    'Hardware > Building Consumables > Hardware Tape',
+    'Hardware > Building Consumables > Lubricants',
+    'Hardware > Building Consumables > Masonry Consumables',
+    'Hardware > Building Consumables > Masonry Consumables > Bricks & Concrete Blocks',
+    'Hardware > Building Consumables > Masonry Consumables > Cement, Mortar & Concrete Mixes',
+    'Hardware > Building Consumables > Masonry Consumables > Grout',
+    'Hardware > Building Consumables > Painting Consumables',
+    'Hardware > Building Consumables > Painting Consumables > Paint',
+    'Hardware > Building Consumables > Painting Consumables > Paint Binders',
+    'Hardware > Building Consumables > Painting Consumables > Primers',
+    'Hardware > Building Consumables > Painting Consumables > Stains',
+    'Hardware > Building Consumables > Painting Consumables > Varnishes & Finishes',
+    'Hardware > Building Consumables > Plumbing Primer',
+    'Hardware > Building Consumables > Protective Coatings & Sealants',
+    'Hardware > Building Consumables > Solder & Flux',
+    'Hardware > Building Consumables > Solvents, Strippers & Thinners',
+    'Hardware > Building Consumables > Wall Patching Compounds & Plaster',
+    'Hardware > Building Materials',
+    'Hardware > Building Materials > Countertops',
+    'Hardware > Building Materials > Door Hardware',
+    'Hardware > Building Materials > Door Hardware > Door Bells & Chimes',
+    'Hardware > Building Materials > Door Hardware > Door Closers',
+    'Hardware > Building Materials > Door Hardware > Door Frames',
+    'Hardware > Building Materials > Door Hardware > Door Keyhole Escutcheons',
+    'Hardware > Building Materials > Door Hardware > Door Knobs & Handles',
+    'Hardware > Building Materials > Door Hardware > Door Knockers',
+    'Hardware > Building Materials > Door Hardware > Door Push Plates',
+    'Hardware > Building Materials > Door Hardware > Door Stops',
+    'Hardware > Building Materials > Door Hardware > Door Strikes',
+    'Hardware > Building Materials > Doors',
+    'Hardware > Building Materials > Doors > Garage Doors',
+    'Hardware > Building Materials > Doors > Home Doors',
+    'Hardware > Building Materials > Drywall',
+    'Hardware > Building Materials > Flooring & Carpet',
+    'Hardware > Building Materials > Glass',
+    'Hardware > Building Materials > Handrails & Railing Systems',
+    'Hardware > Building Materials > Hatches',
+    'Hardware > Building Materials > Insulation',
+    'Hardware > Building Materials > Lumber & Sheet Stock',
+    'Hardware > Building Materials > Molding',
+    'Hardware > Building Materials > Rebar & Remesh',
+    'Hardware > Building Materials > Roofing',
+    'Hardware > Building Materials > Roofing > Gutter Accessories',
+    'Hardware > Building Materials > Roofing > Gutters',
+    'Hardware > Building Materials > Roofing > Roof Flashings',
+    'Hardware > Building Materials > Roofing > Roofing Shingles & Tiles',
+    'Hardware > Building Materials > Shutters',
+    'Hardware > Building Materials > Siding',
+    'Hardware > Building Materials > Sound Dampening Panels & Foam',
+    'Hardware > Building Materials > Staircases',
+    'Hardware > Building Materials > Wall & Ceiling Tile',
+    'Hardware > Building Materials > Wall Paneling',
+    'Hardware > Building Materials > Weather Stripping & Weatherization Supplies',
+    'Hardware > Building Materials > Window Hardware',
+    'Hardware > Building Materials > Window Hardware > Window Cranks',
+    'Hardware > Building Materials > Window Hardware > Window Frames',
+    'Hardware > Building Materials > Windows',
+    'Hardware > Fencing & Barriers',
+    'Hardware > Fencing & Barriers > Fence & Gate Accessories',
+    'Hardware > Fencing & Barriers > Fence Panels',
+    'Hardware > Fencing & Barriers > Fence Pickets',
+    'Hardware > Fencing & Barriers > Fence Posts & Rails',
+    'Hardware > Fencing & Barriers > Garden Borders & Edging',
+    'Hardware > Fencing & Barriers > Gates',
+    'Hardware > Fencing & Barriers > Lattice',
+    'Hardware > Fencing & Barriers > Safety & Crowd Control Barriers',
+    'Hardware > Fuel',
+    'Hardware > Fuel > Home Heating Oil',
+    'Hardware > Fuel > Kerosene',
+    'Hardware > Fuel > Kerosene > Clear Kerosene',
+    'Hardware > Fuel > Kerosene > Dyed Kerosene',
+    'Hardware > Fuel > Propane',
+    'Hardware > Fuel Containers & Tanks',
+    'Hardware > Hardware Accessories',
+    'Hardware > Hardware Accessories > Brackets & Reinforcement Braces',
+    'Hardware > Hardware Accessories > Cabinet Hardware',
+    'Hardware > Hardware Accessories > Cabinet Hardware > Cabinet & Furniture Keyhole Escutcheons',
+    'Hardware > Hardware Accessories > Cabinet Hardware > Cabinet Backplates',
+    'Hardware > Hardware Accessories > Cabinet Hardware > Cabinet Catches',
+    'Hardware > Hardware Accessories > Cabinet Hardware > Cabinet Doors',
+    'Hardware > Hardware Accessories > Cabinet Hardware > Cabinet Knobs & Handles',
+    'Hardware > Hardware Accessories > Casters',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope > Bungee Cords',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope > Chains',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope > Pull Chains',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope > Ropes & Hardware Cable',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope > Tie Down Straps',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope > Twine',
+    'Hardware > Hardware Accessories > Chain, Wire & Rope > Utility Wire',
+    'Hardware > Hardware Accessories > Coils',
+    'Hardware > Hardware Accessories > Concrete Molds',
+    'Hardware > Hardware Accessories > Dowel Pins & Rods',
+    'Hardware > Hardware Accessories > Drawer Slides',
+    'Hardware > Hardware Accessories > Drop Cloths',
+    'Hardware > Hardware Accessories > Filters & Screens',
+    'Hardware > Hardware Accessories > Flagging & Caution Tape',
+    'Hardware > Hardware Accessories > Gas Hoses',
+    'Hardware > Hardware Accessories > Ground Spikes',
+    'Hardware > Hardware Accessories > Hardware Fasteners',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Drywall Anchors',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Nails',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Nuts & Bolts',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Rivets',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Screw Posts',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Screws',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Threaded Rods',
+    'Hardware > Hardware Accessories > Hardware Fasteners > Washers',
+    'Hardware > Hardware Accessories > Hinges',
+    'Hardware > Hardware Accessories > Hooks, Buckles & Fasteners',
+    'Hardware > Hardware Accessories > Hooks, Buckles & Fasteners > Chain Connectors & Links',
+    'Hardware > Hardware Accessories > Hooks, Buckles & Fasteners > Gear Ties',
+    'Hardware > Hardware Accessories > Hooks, Buckles & Fasteners > Lifting Hooks, Clamps & Shackles',
+    'Hardware > Hardware Accessories > Hooks, Buckles & Fasteners > Utility Buckles',
+    'Hardware > Hardware Accessories > Lubrication Hoses',
+    'Hardware > Hardware Accessories > Metal Casting Molds',
+    'Hardware > Hardware Accessories > Moving & Soundproofing Blankets & Covers',
+    'Hardware > Hardware Accessories > Pneumatic Hoses',
+    'Hardware > Hardware Accessories > Post Base Plates',
+    'Hardware > Hardware Accessories > Springs',
+    'Hardware > Hardware Accessories > Tarps',
+    'Hardware > Hardware Accessories > Tool Storage & Organization',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Garden Hose Storage',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Tool & Equipment Belts',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Tool Bags',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Tool Boxes',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Tool Cabinets & Chests',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Tool Organizer Liners & Inserts',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Tool Sheaths',
+    'Hardware > Hardware Accessories > Tool Storage & Organization > Work Benches',
+    'Hardware > Hardware Accessories > Wall Jacks & Braces',
+    'Hardware > Hardware Pumps',
+    'Hardware > Hardware Pumps > Home Appliance Pumps',
+    'Hardware > Hardware Pumps > Pool, Fountain & Pond Pumps',
+    'Hardware > Hardware Pumps > Sprinkler, Booster & Irrigation System Pumps',
+    'Hardware > Hardware Pumps > Sump, Sewage & Effluent Pumps',
+    'Hardware > Hardware Pumps > Utility Pumps',
+    'Hardware > Hardware Pumps > Well Pumps & Systems',
+    'Hardware > Heating, Ventilation & Air Conditioning',
+    'Hardware > Heating, Ventilation & Air Conditioning > Air & Filter Dryers',
+    'Hardware > Heating, Ventilation & Air Conditioning > Air Ducts',
+    'Hardware > Heating, Ventilation & Air Conditioning > HVAC Controls',
+    'Hardware > Heating, Ventilation & Air Conditioning > HVAC Controls > Control Panels',
+    'Hardware > Heating, Ventilation & Air Conditioning > HVAC Controls > Humidistats',
+    'Hardware > Heating, Ventilation & Air Conditioning > HVAC Controls > Thermostats',
+    'Hardware > Heating, Ventilation & Air Conditioning > Vents & Flues',
+    'Hardware > Locks & Keys',
+    'Hardware > Locks & Keys > Key Blanks',
+    'Hardware > Locks & Keys > Key Caps',
+    'Hardware > Locks & Keys > Key Card Entry Systems',
+    'Hardware > Locks & Keys > Locks & Latches',
+    'Hardware > Plumbing',
+    'Hardware > Plumbing > Plumbing Fittings & Supports',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Gaskets & O-Rings',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > In-Wall Carriers & Mounting Frames',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Nozzles',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Pipe Adapters & Bushings',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Pipe Caps & Plugs',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Pipe Connectors',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Plumbing Flanges',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Plumbing Pipe Clamps',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Plumbing Regulators',
+    'Hardware > Plumbing > Plumbing Fittings & Supports > Plumbing Valves',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Bathtub Accessories',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Bathtub Accessories > Bathtub Bases & Feet',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Bathtub Accessories > Bathtub Skirts',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Bathtub Accessories > Bathtub Spouts',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components > Drain Covers & Strainers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components > Drain Frames',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components > Drain Liners',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components > Drain Openers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components > Drain Rods',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components > Plumbing Traps',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drain Components > Plumbing Wastes',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Drains',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Faucet Accessories',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Faucet Accessories > Faucet Aerators',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Faucet Accessories > Faucet Handles & Controls',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Fixture Plates',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Bathtub & Shower Jets',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Electric & Power Showers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Shower Arms & Connectors',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Shower Bases',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Shower Columns',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Shower Doors & Enclosures',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Shower Heads',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Shower Walls & Surrounds',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Shower Parts > Shower Water Filters',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Sink Accessories',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Sink Accessories > Sink Legs',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Ballcocks & Flappers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Bidet Faucets & Sprayers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Toilet & Bidet Seats',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Toilet Seat Covers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Toilet Seat Lid Covers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Toilet Tank Covers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Toilet Tank Levers',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Toilet Tanks',
+    'Hardware > Plumbing > Plumbing Fixture Hardware & Parts > Toilet & Bidet Accessories > Toilet Trim',
+    'Hardware > Plumbing > Plumbing Fixtures',
+    'Hardware > Plumbing > Plumbing Fixtures > Bathroom Suites',
+    'Hardware > Plumbing > Plumbing Fixtures > Bathtubs',
+    'Hardware > Plumbing > Plumbing Fixtures > Faucets',
+    'Hardware > Plumbing > Plumbing Fixtures > Shower Stalls & Kits',
+    'Hardware > Plumbing > Plumbing Fixtures > Sinks',
+    'Hardware > Plumbing > Plumbing Fixtures > Sinks > Bathroom Sinks',
+    'Hardware > Plumbing > Plumbing Fixtures > Sinks > Kitchen & Utility Sinks',
+    'Hardware > Plumbing > Plumbing Fixtures > Toilets & Bidets',
+    'Hardware > Plumbing > Plumbing Fixtures > Toilets & Bidets > Bidets',
+    'Hardware > Plumbing > Plumbing Fixtures > Toilets & Bidets > Toilets',
+    'Hardware > Plumbing > Plumbing Fixtures > Toilets & Bidets > Urinals',
+    'Hardware > Plumbing > Plumbing Hoses & Supply Lines',
+    'Hardware > Plumbing > Plumbing Pipes',
+    'Hardware > Plumbing > Plumbing Repair Kits',
+    'Hardware > Plumbing > Water Dispensing & Filtration',
+    'Hardware > Plumbing > Water Dispensing & Filtration > In-Line Water Filters',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Dispensers',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Dispensers > Drinking Fountains',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Dispensers > Water Chillers',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Distillers',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Filtration Accessories',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Filtration Accessories > Water Filter Cartridges',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Filtration Accessories > Water Filter Housings',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Softener Salt',
+    'Hardware > Plumbing > Water Dispensing & Filtration > Water Softeners',
+    'Hardware > Plumbing > Water Levelers',
+    'Hardware > Plumbing > Water Timers',
+    'Hardware > Plumbing > Well Supplies',
+    'Hardware > Power & Electrical Supplies',
+    'Hardware > Power & Electrical Supplies > Armatures, Rotors & Stators',
+    'Hardware > Power & Electrical Supplies > Ballasts & Starters',
+    'Hardware > Power & Electrical Supplies > Carbon Brushes',
+    'Hardware > Power & Electrical Supplies > Circuit Breaker Panels',
+    'Hardware > Power & Electrical Supplies > Conduit & Housings',
+    'Hardware > Power & Electrical Supplies > Conduit & Housings > Electrical Conduit',
+    'Hardware > Power & Electrical Supplies > Conduit & Housings > Heat-Shrink Tubing',
+    'Hardware > Power & Electrical Supplies > Electrical Motors',
+    'Hardware > Power & Electrical Supplies > Electrical Mount Boxes & Brackets',
+    'Hardware > Power & Electrical Supplies > Electrical Plug Caps',
+    'Hardware > Power & Electrical Supplies > Electrical Switches',
+    'Hardware > Power & Electrical Supplies > Electrical Switches > Light Switches',
+    'Hardware > Power & Electrical Supplies > Electrical Switches > Specialty Electrical Switches & Relays',
+    'Hardware > Power & Electrical Supplies > Electrical Wires & Cable',
+    'Hardware > Power & Electrical Supplies > Extension Cord Accessories',
+    'Hardware > Power & Electrical Supplies > Extension Cords',
+    'Hardware > Power & Electrical Supplies > Generator Accessories',
+    'Hardware > Power & Electrical Supplies > Generators',
+    'Hardware > Power & Electrical Supplies > Home Automation Kits',
+    'Hardware > Power & Electrical Supplies > Phone & Data Jacks',
+    'Hardware > Power & Electrical Supplies > Power Converters',
+    'Hardware > Power & Electrical Supplies > Power Inlets',
+    'Hardware > Power & Electrical Supplies > Power Inverters',
+    'Hardware > Power & Electrical Supplies > Power Outlets & Sockets',
+    'Hardware > Power & Electrical Supplies > Solar Energy Kits',
+    'Hardware > Power & Electrical Supplies > Solar Panels',
+    'Hardware > Power & Electrical Supplies > Voltage Transformers & Regulators',
+    'Hardware > Power & Electrical Supplies > Wall Plates & Covers',
+    'Hardware > Power & Electrical Supplies > Wall Socket Controls & Sensors',
+    'Hardware > Power & Electrical Supplies > Wire Caps & Nuts',
+    'Hardware > Power & Electrical Supplies > Wire Terminals & Connectors',
+    'Hardware > Small Engines',
+    'Hardware > Storage Tanks',
+    'Hardware > Tool Accessories',
+    'Hardware > Tool Accessories > Abrasive Blaster Accessories',
+    'Hardware > Tool Accessories > Abrasive Blaster Accessories > Sandblasting Cabinets',
+    'Hardware > Tool Accessories > Axe Accessories',
+    'Hardware > Tool Accessories > Axe Accessories > Axe Handles',
+    'Hardware > Tool Accessories > Axe Accessories > Axe Heads',
+    'Hardware > Tool Accessories > Cutter Accessories',
+    'Hardware > Tool Accessories > Cutter Accessories > Nibbler Dies',
+    'Hardware > Tool Accessories > Drill & Screwdriver Accessories',
+    'Hardware > Tool Accessories > Drill & Screwdriver Accessories > Drill & Screwdriver Bits',
+    'Hardware > Tool Accessories > Drill & Screwdriver Accessories > Drill Bit Extensions',
+    'Hardware > Tool Accessories > Drill & Screwdriver Accessories > Drill Bit Sharpeners',
+    'Hardware > Tool Accessories > Drill & Screwdriver Accessories > Drill Chucks',
+    'Hardware > Tool Accessories > Drill & Screwdriver Accessories > Drill Stands & Guides',
+    'Hardware > Tool Accessories > Drill & Screwdriver Accessories > Hole Saws',
+    'Hardware > Tool Accessories > Driver Accessories',
+    'Hardware > Tool Accessories > Flashlight Accessories',
+    'Hardware > Tool Accessories > Grinder Accessories',
+    'Hardware > Tool Accessories > Grinder Accessories > Grinding Wheels & Points',
+    'Hardware > Tool Accessories > Hammer Accessories',
+    'Hardware > Tool Accessories > Hammer Accessories > Air Hammer Accessories',
+    'Hardware > Tool Accessories > Hammer Accessories > Hammer Handles',
+    'Hardware > Tool Accessories > Hammer Accessories > Hammer Heads',
+    'Hardware > Tool Accessories > Industrial Staples',
+    'Hardware > Tool Accessories > Jigs',
+    'Hardware > Tool Accessories > Magnetizers & Demagnetizers',
+    'Hardware > Tool Accessories > Mattock & Pickaxe Accessories',
+    'Hardware > Tool Accessories > Mattock & Pickaxe Accessories > Mattock & Pickaxe Handles',
+    'Hardware > Tool Accessories > Measuring Tool & Sensor Accessories',
+    'Hardware > Tool Accessories > Measuring Tool & Sensor Accessories > Electrical Testing Tool Accessories',
+    'Hardware > Tool Accessories > Measuring Tool & Sensor Accessories > Gas Detector Accessories',
+    'Hardware > Tool Accessories > Measuring Tool & Sensor Accessories > Measuring Scale Accessories',
+    'Hardware > Tool Accessories > Measuring Tool & Sensor Accessories > Multimeter Accessories',
+    'Hardware > Tool Accessories > Mixing Tool Paddles',
+    'Hardware > Tool Accessories > Paint Tool Accessories',
+    'Hardware > Tool Accessories > Paint Tool Accessories > Airbrush Accessories',
+    'Hardware > Tool Accessories > Paint Tool Accessories > Paint Brush Cleaning Solutions',
+    'Hardware > Tool Accessories > Paint Tool Accessories > Paint Roller Accessories',
+    'Hardware > Tool Accessories > Power Tool Batteries',
+    'Hardware > Tool Accessories > Power Tool Chargers',
+    'Hardware > Tool Accessories > Router Accessories',
+    'Hardware > Tool Accessories > Router Accessories > Router Bits',
+    'Hardware > Tool Accessories > Router Accessories > Router Tables',
+    'Hardware > Tool Accessories > Sanding Accessories',
+    'Hardware > Tool Accessories > Sanding Accessories > Sandpaper & Sanding Sponges',
+    'Hardware > Tool Accessories > Saw Accessories',
+    'Hardware > Tool Accessories > Saw Accessories > Band Saw Accessories',
+    'Hardware > Tool Accessories > Saw Accessories > Handheld Circular Saw Accessories',
+    'Hardware > Tool Accessories > Saw Accessories > Jigsaw Accessories',
+    'Hardware > Tool Accessories > Saw Accessories > Miter Saw Accessories',
+    'Hardware > Tool Accessories > Saw Accessories > Table Saw Accessories',
+    'Hardware > Tool Accessories > Shaper Accessories',
+    'Hardware > Tool Accessories > Shaper Accessories > Shaper Cutters',
+    'Hardware > Tool Accessories > Soldering Iron Accessories',
+    'Hardware > Tool Accessories > Soldering Iron Accessories > Soldering Iron Stands',
+    'Hardware > Tool Accessories > Soldering Iron Accessories > Soldering Iron Tips',
+    'Hardware > Tool Accessories > Tool Blades',
+    'Hardware > Tool Accessories > Tool Blades > Cutter & Scraper Blades',
+    'Hardware > Tool Accessories > Tool Blades > Saw Blades',
+    'Hardware > Tool Accessories > Tool Handle Wedges',
+    'Hardware > Tool Accessories > Tool Safety Tethers',
+    'Hardware > Tool Accessories > Tool Sockets',
+    'Hardware > Tool Accessories > Tool Stands',
+    'Hardware > Tool Accessories > Tool Stands > Saw Stands',
+    'Hardware > Tool Accessories > Wedge Tools',
+    'Hardware > Tool Accessories > Welding Accessories',
+    'Hardware > Tools',
+    'Hardware > Tools > Abrasive Blasters',
+    'Hardware > Tools > Anvils',
+    'Hardware > Tools > Axes',
+    'Hardware > Tools > Carpentry Jointers',
+    'Hardware > Tools > Carving Chisels & Gouges',
+    'Hardware > Tools > Caulking Tools',
+    'Hardware > Tools > Chimney Brushes',
+    'Hardware > Tools > Compactors',
+    'Hardware > Tools > Compressors',
+    'Hardware > Tools > Concrete Brooms',
+    'Hardware > Tools > Cutters',
+    'Hardware > Tools > Cutters > Bolt Cutters',
+    'Hardware > Tools > Cutters > Glass Cutters',
+    'Hardware > Tools > Cutters > Handheld Metal Shears & Nibblers',
+    'Hardware > Tools > Cutters > Nippers',
+    'Hardware > Tools > Cutters > Pipe Cutters',
+    'Hardware > Tools > Cutters > Rebar Cutters',
+    'Hardware > Tools > Cutters > Tile & Shingle Cutters',
+    'Hardware > Tools > Cutters > Utility Knives',
+    'Hardware > Tools > Deburrers',
+    'Hardware > Tools > Dollies & Hand Trucks',
+    'Hardware > Tools > Drills',
+    'Hardware > Tools > Drills > Augers',
+    'Hardware > Tools > Drills > Drill Presses',
+    'Hardware > Tools > Drills > Handheld Power Drills',
+    'Hardware > Tools > Drills > Mortisers',
+    'Hardware > Tools > Drills > Pneumatic Drills',
+    'Hardware > Tools > Electrician Fish Tape',
+    'Hardware > Tools > Flashlights & Headlamps',
+    'Hardware > Tools > Flashlights & Headlamps > Flashlights',
+    'Hardware > Tools > Flashlights & Headlamps > Headlamps',
+    'Hardware > Tools > Grease Guns',
+    'Hardware > Tools > Grinders',
+    'Hardware > Tools > Grips',
+    'Hardware > Tools > Hammers',
+    'Hardware > Tools > Hammers > Manual Hammers',
+    'Hardware > Tools > Hammers > Powered Hammers',
+    'Hardware > Tools > Handheld Power Mixers',
+    'Hardware > Tools > Hardware Torches',
+    'Hardware > Tools > Heat Guns',
+    'Hardware > Tools > Impact Wrenches & Drivers',
+    'Hardware > Tools > Industrial Vibrators',
+    'Hardware > Tools > Inspection Mirrors',
+    'Hardware > Tools > Ladders & Scaffolding',
+    'Hardware > Tools > Ladders & Scaffolding > Ladder Carts',
+    'Hardware > Tools > Ladders & Scaffolding > Ladders',
+    'Hardware > Tools > Ladders & Scaffolding > Scaffolding',
+    'Hardware > Tools > Ladders & Scaffolding > Step Stools',
+    'Hardware > Tools > Ladders & Scaffolding > Work Platforms',
+    'Hardware > Tools > Lathes',
+    'Hardware > Tools > Light Bulb Changers',
+    'Hardware > Tools > Lighters & Matches',
+    'Hardware > Tools > Log Splitters',
+    'Hardware > Tools > Magnetic Sweepers',
+    'Hardware > Tools > Marking Tools',
+    'Hardware > Tools > Masonry Tools',
+    'Hardware > Tools > Masonry Tools > Brick Tools',
+    'Hardware > Tools > Masonry Tools > Cement Mixers',
+    'Hardware > Tools > Masonry Tools > Construction Lines',
+    'Hardware > Tools > Masonry Tools > Floats',
+    'Hardware > Tools > Masonry Tools > Grout Sponges',
+    'Hardware > Tools > Masonry Tools > Masonry Edgers & Groovers',
+    'Hardware > Tools > Masonry Tools > Masonry Jointers',
+    'Hardware > Tools > Masonry Tools > Masonry Trowels',
+    'Hardware > Tools > Masonry Tools > Power Trowels',
+    'Hardware > Tools > Mattocks & Pickaxes',
+    'Hardware > Tools > Measuring Tools & Sensors',
+    'Hardware > Tools > Measuring Tools & Sensors > Air Quality Meters',
+    'Hardware > Tools > Measuring Tools & Sensors > Altimeters',
+    'Hardware > Tools > Measuring Tools & Sensors > Anemometers',
+    'Hardware > Tools > Measuring Tools & Sensors > Barometers',
+    'Hardware > Tools > Measuring Tools & Sensors > Calipers',
+    'Hardware > Tools > Measuring Tools & Sensors > Cruising Rods',
+    'Hardware > Tools > Measuring Tools & Sensors > Distance Meters',
+    'Hardware > Tools > Measuring Tools & Sensors > Dividers',
+    'Hardware > Tools > Measuring Tools & Sensors > Electrical Testing Tools',
+    'Hardware > Tools > Measuring Tools & Sensors > Flow Meters & Controllers',
+    'Hardware > Tools > Measuring Tools & Sensors > Gas Detectors',
+    'Hardware > Tools > Measuring Tools & Sensors > Gauges',
+    'Hardware > Tools > Measuring Tools & Sensors > Geiger Counters',
+    'Hardware > Tools > Measuring Tools & Sensors > Hygrometers',
+    'Hardware > Tools > Measuring Tools & Sensors > Infrared Thermometers',
+    'Hardware > Tools > Measuring Tools & Sensors > Knife Guides',
+    'Hardware > Tools > Measuring Tools & Sensors > Levels',
+    'Hardware > Tools > Measuring Tools & Sensors > Levels > Bubble Levels',
+    'Hardware > Tools > Measuring Tools & Sensors > Levels > Laser Levels',
+    'Hardware > Tools > Measuring Tools & Sensors > Levels > Sight Levels',
+    'Hardware > Tools > Measuring Tools & Sensors > Measuring Scales',
+    'Hardware > Tools > Measuring Tools & Sensors > Measuring Wheels',
+    'Hardware > Tools > Measuring Tools & Sensors > Moisture Meters',
+    'Hardware > Tools > Measuring Tools & Sensors > Probes & Finders',
+    'Hardware > Tools > Measuring Tools & Sensors > Protractors',
+    'Hardware > Tools > Measuring Tools & Sensors > Rebar Locators',
+    'Hardware > Tools > Measuring Tools & Sensors > Rulers',
+    'Hardware > Tools > Measuring Tools & Sensors > Seismometer',
+    'Hardware > Tools > Measuring Tools & Sensors > Sound Meters',
+    'Hardware > Tools > Measuring Tools & Sensors > Squares',
+    'Hardware > Tools > Measuring Tools & Sensors > Straight Edges',
+    'Hardware > Tools > Measuring Tools & Sensors > Stud Sensors',
+    'Hardware > Tools > Measuring Tools & Sensors > Tape Measures',
+    'Hardware > Tools > Measuring Tools & Sensors > Theodolites',
+    'Hardware > Tools > Measuring Tools & Sensors > Thermal Imaging Cameras',
+    'Hardware > Tools > Measuring Tools & Sensors > Thermocouples & Thermopiles',
+    'Hardware > Tools > Measuring Tools & Sensors > Transducers',
+    'Hardware > Tools > Measuring Tools & Sensors > UV Light Meters',
+    'Hardware > Tools > Measuring Tools & Sensors > Vibration Meters',
+    'Hardware > Tools > Measuring Tools & Sensors > Weather Forecasters & Stations',
+    'Hardware > Tools > Measuring Tools & Sensors > pH Meters',
+    'Hardware > Tools > Milling Machines',
+    'Hardware > Tools > Multifunction Power Tools',
+    'Hardware > Tools > Nail Pullers',
+    'Hardware > Tools > Nailers & Staplers',
+    'Hardware > Tools > Oil Filter Drains',
+    'Hardware > Tools > Paint Tools',
+    'Hardware > Tools > Paint Tools > Airbrushes',
+    'Hardware > Tools > Paint Tools > Paint Brushes',
+    'Hardware > Tools > Paint Tools > Paint Edgers',
+    'Hardware > Tools > Paint Tools > Paint Rollers',
+    'Hardware > Tools > Paint Tools > Paint Shakers',
+    'Hardware > Tools > Paint Tools > Paint Sponges',
+    'Hardware > Tools > Paint Tools > Paint Sprayers',
+    'Hardware > Tools > Paint Tools > Paint Strainers',
+    'Hardware > Tools > Paint Tools > Paint Trays',
+    'Hardware > Tools > Pickup Tools',
+    'Hardware > Tools > Pipe & Bar Benders',
+    'Hardware > Tools > Pipe & Tube Cleaners',
+    'Hardware > Tools > Pipe Brushes',
+    'Hardware > Tools > Planers',
+    'Hardware > Tools > Planes',
+    'Hardware > Tools > Pliers',
+    'Hardware > Tools > Plungers',
+    'Hardware > Tools > Polishers & Buffers',
+    'Hardware > Tools > Post Hole Diggers',
+    'Hardware > Tools > Pry Bars',
+    'Hardware > Tools > Punches & Awls',
+    'Hardware > Tools > Putty Knives & Scrapers',
+    'Hardware > Tools > Reamers',
+    'Hardware > Tools > Riveting Tools',
+    'Hardware > Tools > Riveting Tools > Rivet Guns',
+    'Hardware > Tools > Riveting Tools > Rivet Pliers',
+    'Hardware > Tools > Routing Tools',
+    'Hardware > Tools > Sanders',
+    'Hardware > Tools > Sanding Blocks',
+    'Hardware > Tools > Saw Horses',
+    'Hardware > Tools > Saws',
+    'Hardware > Tools > Saws > Band Saws',
+    'Hardware > Tools > Saws > Cut-Off Saws',
+    'Hardware > Tools > Saws > Hand Saws',
+    'Hardware > Tools > Saws > Handheld Circular Saws',
+    'Hardware > Tools > Saws > Jigsaws',
+    'Hardware > Tools > Saws > Masonry & Tile Saws',
+    'Hardware > Tools > Saws > Miter Saws',
+    'Hardware > Tools > Saws > Panel Saws',
+    'Hardware > Tools > Saws > Reciprocating Saws',
+    'Hardware > Tools > Saws > Scroll Saws',
+    'Hardware > Tools > Saws > Table Saws',
+    'Hardware > Tools > Screwdrivers',
+    'Hardware > Tools > Shapers',
+    'Hardware > Tools > Sharpeners',
+    'Hardware > Tools > Socket Drivers',
+    'Hardware > Tools > Soldering Irons',
+    'Hardware > Tools > Tap Reseaters',
+    'Hardware > Tools > Taps & Dies',
+    'Hardware > Tools > Threading Machines',
+    'Hardware > Tools > Tool Clamps & Vises',
+    'Hardware > Tools > Tool Files',
+    'Hardware > Tools > Tool Keys',
+    'Hardware > Tools > Tool Knives',
+    'Hardware > Tools > Tool Sets',
+    'Hardware > Tools > Tool Sets > Hand Tool Sets',
+    'Hardware > Tools > Tool Sets > Power Tool Combo Sets',
+    'Hardware > Tools > Welding Guns & Plasma Cutters',
+    'Hardware > Tools > Wire & Cable Hand Tools',
+    'Hardware > Tools > Work Lights',
+    'Hardware > Tools > Wrenches',
+    'Health & Beauty',
+    'Health & Beauty > Health Care',
+    'Health & Beauty > Health Care > Acupuncture',
+    'Health & Beauty > Health Care > Acupuncture > Acupuncture Models',
+    'Health & Beauty > Health Care > Acupuncture > Acupuncture Needles',
+    'Health & Beauty > Health Care > Bed Pans',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Activity Monitor Accessories',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Blood Glucose Meter Accessories',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Blood Glucose Meter Accessories > Blood Glucose Control Solution',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Blood Glucose Meter Accessories > Blood Glucose Test Strips',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Blood Glucose Meter Accessories > Lancing Devices',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Blood Pressure Monitor Accessories',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Blood Pressure Monitor Accessories > Blood Pressure Monitor Cuffs',
+    'Health & Beauty > Health Care > Biometric Monitor Accessories > Body Weight Scale Accessories',
+    'Health & Beauty > Health Care > Biometric Monitors',
+    'Health & Beauty > Health Care > Biometric Monitors > Activity Monitors',
+    'Health & Beauty > Health Care > Biometric Monitors > Blood Glucose Meters',
+    'Health & Beauty > Health Care > Biometric Monitors > Blood Pressure Monitors',
+    'Health & Beauty > Health Care > Biometric Monitors > Body Fat Analyzers',
+    'Health & Beauty > Health Care > Biometric Monitors > Body Weight Scales',
+    'Health & Beauty > Health Care > Biometric Monitors > Breathalyzers',
+    'Health & Beauty > Health Care > Biometric Monitors > Cholesterol Analyzers',
+    'Health & Beauty > Health Care > Biometric Monitors > Fertility Monitors and Ovulation Tests',
+    'Health & Beauty > Health Care > Biometric Monitors > Fertility Monitors and Ovulation Tests > Fertility Tests & Monitors',
+    'Health & Beauty > Health Care > Biometric Monitors > Fertility Monitors and Ovulation Tests > Ovulation Tests',
+    'Health & Beauty > Health Care > Biometric Monitors > Medical Thermometers',
+    'Health & Beauty > Health Care > Biometric Monitors > Prenatal Heart Rate Monitors',
+    'Health & Beauty > Health Care > Biometric Monitors > Pulse Oximeters',
+    'Health & Beauty > Health Care > Condoms',
+    'Health & Beauty > Health Care > Conductivity Gels & Lotions',
+    'Health & Beauty > Health Care > Contraceptive Cases',
+    'Health & Beauty > Health Care > First Aid',
+    'Health & Beauty > Health Care > First Aid > Antiseptics & Cleaning Supplies',
+    'Health & Beauty > Health Care > First Aid > Cast & Bandage Protectors',
+    'Health & Beauty > Health Care > First Aid > Eye Wash Supplies',
+    'Health & Beauty > Health Care > First Aid > First Aid Kits',
+    'Health & Beauty > Health Care > First Aid > Hot & Cold Therapies',
+    'Health & Beauty > Health Care > First Aid > Hot & Cold Therapies > Heat Rubs',
+    'Health & Beauty > Health Care > First Aid > Hot & Cold Therapies > Heating Pads',
+    'Health & Beauty > Health Care > First Aid > Hot & Cold Therapies > Ice Packs',
+    'Health & Beauty > Health Care > First Aid > Medical Tape & Bandages',
+    'Health & Beauty > Health Care > Fitness & Nutrition',
+    'Health & Beauty > Health Care > Fitness & Nutrition > Nutrition Bars',
+    'Health & Beauty > Health Care > Fitness & Nutrition > Nutrition Drinks & Shakes',
+    'Health & Beauty > Health Care > Fitness & Nutrition > Nutrition Gels & Chews',
+    'Health & Beauty > Health Care > Fitness & Nutrition > Nutritional Food Purées',
+    'Health & Beauty > Health Care > Fitness & Nutrition > Tube Feeding Supplements',
+    'Health & Beauty > Health Care > Fitness & Nutrition > Vitamins & Supplements',
+    'Health & Beauty > Health Care > Hearing Aids',
+    'Health & Beauty > Health Care > Incontinence Aids',
+    'Health & Beauty > Health Care > Light Therapy Lamps',
+    'Health & Beauty > Health Care > Medical Alarm Systems',
+    'Health & Beauty > Health Care > Medical Identification Tags & Jewelry',
+    'Health & Beauty > Health Care > Medical Tests',
+    'Health & Beauty > Health Care > Medical Tests > Allergy Test Kits',
+    'Health & Beauty > Health Care > Medical Tests > Blood Typing Test Kits',
+    'Health & Beauty > Health Care > Medical Tests > Drug Tests',
+    'Health & Beauty > Health Care > Medical Tests > HIV Tests',
+    'Health & Beauty > Health Care > Medical Tests > Pregnancy Tests',
+    'Health & Beauty > Health Care > Medical Tests > Urinary Tract Infection Tests',
+    'Health & Beauty > Health Care > Medicine & Drugs',
+    'Health & Beauty > Health Care > Mobility & Accessibility',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Equipment',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Equipment > Mobility Scooters',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Equipment > Stair Lifts',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Equipment > Transfer Boards & Sheets',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Equipment > Wheelchairs',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Equipment Accessories',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Furniture & Fixtures',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Accessibility Furniture & Fixtures > Shower Benches & Seats',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Walking Aid Accessories',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Walking Aids',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Walking Aids > Canes & Walking Sticks',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Walking Aids > Crutches',
+    'Health & Beauty > Health Care > Mobility & Accessibility > Walking Aids > Walkers',
+    'Health & Beauty > Health Care > Occupational & Physical Therapy Equipment',
+    'Health & Beauty > Health Care > Occupational & Physical Therapy Equipment > Electrical Muscle Stimulators',
+    'Health & Beauty > Health Care > Occupational & Physical Therapy Equipment > Therapeutic Swings',
+    'Health & Beauty > Health Care > Pillboxes',
+    'Health & Beauty > Health Care > Respiratory Care',
+    'Health & Beauty > Health Care > Respiratory Care > Nebulizers',
+    'Health & Beauty > Health Care > Respiratory Care > Oxygen Tanks',
+    'Health & Beauty > Health Care > Respiratory Care > PAP Machines',
+    'Health & Beauty > Health Care > Respiratory Care > PAP Masks',
+    'Health & Beauty > Health Care > Respiratory Care > Steam Inhalers',
+    'Health & Beauty > Health Care > Specimen Cups',
+    'Health & Beauty > Health Care > Spermicides',
+    'Health & Beauty > Health Care > Stump Shrinkers',
+    'Health & Beauty > Health Care > Supports & Braces',
+    'Health & Beauty > Health Care > Surgical Lubricants',
+    'Health & Beauty > Jewelry Cleaning & Care',
+    'Health & Beauty > Jewelry Cleaning & Care > Jewelry Cleaning Solutions & Polishes',
+    'Health & Beauty > Jewelry Cleaning & Care > Jewelry Cleaning Tools',
+    'Health & Beauty > Jewelry Cleaning & Care > Jewelry Holders',
+    'Health & Beauty > Jewelry Cleaning & Care > Jewelry Steam Cleaners',
+    'Health & Beauty > Jewelry Cleaning & Care > Watch Repair Kits',
+    'Health & Beauty > Personal Care',
+    'Health & Beauty > Personal Care > Back Care',
+    'Health & Beauty > Personal Care > Back Care > Back & Lumbar Support Cushions',
+    'Health & Beauty > Personal Care > Cosmetics',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Adult Hygienic Wipes',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Bar Soap',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Bath Additives',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Bath Brushes',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Bath Sponges & Loofahs',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Body Wash',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Hand Sanitizers & Wipes',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Liquid Hand Soap',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Powdered Hand Soap',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body > Shower Caps',
+    'Health & Beauty > Personal Care > Cosmetics > Bath & Body Gift Sets',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Sets',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tool Cleansers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Double Eyelid Glue & Tape',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Eyebrow Stencils',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Eyelash Curler Refills',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Eyelash Curlers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Face Mirrors',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Facial Blotting Paper',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > False Eyelash Accessories',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > False Eyelash Accessories > False Eyelash Adhesive',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > False Eyelash Accessories > False Eyelash Applicators',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > False Eyelash Accessories > False Eyelash Remover',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Makeup Brushes',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Makeup Sponges',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Makeup Tools > Refillable Makeup Palettes & Cases',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Cuticle Pushers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Cuticle Scissors',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Manicure & Pedicure Spacers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Manicure Tool Sets',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Nail Buffers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Nail Clippers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Nail Drill Accessories',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Nail Drills',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Nail Dryers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Nail Tools > Nail Files & Emery Boards',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Facial Saunas',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Foot Files',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Lotion & Sunscreen Applicators',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Pumice Stones',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Skin Care Extractors',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Skin Care Rollers',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Skin Cleansing Brush Heads',
+    'Health & Beauty > Personal Care > Cosmetics > Cosmetic Tools > Skin Care Tools > Skin Cleansing Brushes & Systems',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Body Makeup',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Body Makeup > Body & Hair Glitter',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Body Makeup > Body Paint & Foundation',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Costume & Stage Makeup',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > Eye Primer',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > Eye Shadow',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > Eyebrow Enhancers',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > Eyeliner',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > False Eyelashes',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > Lash & Brow Growth Treatments',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > Mascara',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Eye Makeup > Mascara Primer',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Face Makeup',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Face Makeup > Blushes & Bronzers',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Face Makeup > Face Powder',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Face Makeup > Face Primer',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Face Makeup > Foundations & Concealers',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Face Makeup > Highlighters & Luminizers',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Lip Makeup',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Lip Makeup > Lip & Cheek Stains',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Lip Makeup > Lip Gloss',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Lip Makeup > Lip Liner',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Lip Makeup > Lip Primer',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Lip Makeup > Lipstick',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Makeup Finishing Sprays',
+    'Health & Beauty > Personal Care > Cosmetics > Makeup > Temporary Tattoos',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > Cuticle Cream & Oil',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > False Nails',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > Manicure Glue',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > Nail Art Kits & Accessories',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > Nail Polish Drying Drops & Sprays',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > Nail Polish Removers',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > Nail Polish Thinners',
+    'Health & Beauty > Personal Care > Cosmetics > Nail Care > Nail Polishes',
+    'Health & Beauty > Personal Care > Cosmetics > Perfume & Cologne',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Acne Treatments & Kits',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Anti-Aging Skin Care Kits',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Body Oil',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Body Powder',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Compressed Skin Care Mask Sheets',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Facial Cleansers',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Facial Cleansing Kits',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Facial Pore Strips',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Lip Balms & Treatments',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Lip Balms & Treatments > Lip Balms',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Lip Balms & Treatments > Medicated Lip Treatments',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Lotion & Moisturizer',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Makeup Removers',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Petroleum Jelly',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Skin Care Masks & Peels',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Skin Insect Repellent',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Sunscreen',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Tanning Products',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Tanning Products > Self Tanner',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Tanning Products > Tanning Oil & Lotion',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Toners & Astringents',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Toners & Astringents > Astringents',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Toners & Astringents > Toners',
+    'Health & Beauty > Personal Care > Cosmetics > Skin Care > Wart Removers',
+    'Health & Beauty > Personal Care > Cotton Balls',
+    'Health & Beauty > Personal Care > Cotton Swabs',
+    'Health & Beauty > Personal Care > Deodorant & Anti-Perspirant',
+    'Health & Beauty > Personal Care > Deodorant & Anti-Perspirant > Anti-Perspirant',
+    'Health & Beauty > Personal Care > Deodorant & Anti-Perspirant > Deodorant',
+    'Health & Beauty > Personal Care > Ear Care',
+    'Health & Beauty > Personal Care > Ear Care > Ear Candles',
+    'Health & Beauty > Personal Care > Ear Care > Ear Drops',
+    'Health & Beauty > Personal Care > Ear Care > Ear Dryers',
+    'Health & Beauty > Personal Care > Ear Care > Ear Picks & Spoons',
+    'Health & Beauty > Personal Care > Ear Care > Ear Syringes',
+    'Health & Beauty > Personal Care > Ear Care > Ear Wax Removal Kits',
+    'Health & Beauty > Personal Care > Ear Care > Earplug Dispensers',
+    'Health & Beauty > Personal Care > Ear Care > Earplugs',
+    'Health & Beauty > Personal Care > Enema Kits & Supplies',
+    'Health & Beauty > Personal Care > Feminine Sanitary Supplies',
+    'Health & Beauty > Personal Care > Feminine Sanitary Supplies > Feminine Deodorant',
+    'Health & Beauty > Personal Care > Feminine Sanitary Supplies > Feminine Douches & Creams',
+    'Health & Beauty > Personal Care > Feminine Sanitary Supplies > Feminine Pads & Protectors',
+    'Health & Beauty > Personal Care > Feminine Sanitary Supplies > Menstrual Cups',
+    'Health & Beauty > Personal Care > Feminine Sanitary Supplies > Tampons',
+    'Health & Beauty > Personal Care > Foot Care',
+    'Health & Beauty > Personal Care > Foot Care > Bunion Care Supplies',
+    'Health & Beauty > Personal Care > Foot Care > Corn & Callus Care Supplies',
+    'Health & Beauty > Personal Care > Foot Care > Foot Odor Removers',
+    'Health & Beauty > Personal Care > Foot Care > Insoles & Inserts',
+    'Health & Beauty > Personal Care > Foot Care > Toe Spacers',
+    'Health & Beauty > Personal Care > Hair Care',
+    'Health & Beauty > Personal Care > Hair Care > Hair Care Kits',
+    'Health & Beauty > Personal Care > Hair Care > Hair Color',
+    'Health & Beauty > Personal Care > Hair Care > Hair Color Removers',
+    'Health & Beauty > Personal Care > Hair Care > Hair Coloring Accessories',
+    'Health & Beauty > Personal Care > Hair Care > Hair Loss Concealers',
+    'Health & Beauty > Personal Care > Hair Care > Hair Loss Treatments',
+    'Health & Beauty > Personal Care > Hair Care > Hair Permanents & Straighteners',
+    'Health & Beauty > Personal Care > Hair Care > Hair Shears',
+    'Health & Beauty > Personal Care > Hair Care > Hair Steamers & Heat Caps',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Products',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tool Accessories',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tool Accessories > Hair Curler Clips & Pins',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tool Accessories > Hair Dryer Accessories',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tool Accessories > Hair Iron Accessories',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tools',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tools > Combs & Brushes',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tools > Curling Irons',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tools > Hair Curlers',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tools > Hair Dryers',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tools > Hair Straighteners',
+    'Health & Beauty > Personal Care > Hair Care > Hair Styling Tools > Hair Styling Tool Sets',
+    'Health & Beauty > Personal Care > Hair Care > Shampoo & Conditioner',
+    'Health & Beauty > Personal Care > Hair Care > Shampoo & Conditioner > Conditioners',
+    'Health & Beauty > Personal Care > Hair Care > Shampoo & Conditioner > Shampoo',
+    'Health & Beauty > Personal Care > Hair Care > Shampoo & Conditioner > Shampoo & Conditioner Sets',
+    'Health & Beauty > Personal Care > Massage & Relaxation',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Back Scratchers',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Eye Pillows',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massage Chairs',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massage Oil',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massage Stone Warmers',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massage Stones',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massage Tables',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massagers',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massagers > Electric Massagers',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massagers > Manual Massage Tools',
+    'Health & Beauty > Personal Care > Massage & Relaxation > Massagers > Massage Cushions',
+    'Health & Beauty > Personal Care > Oral Care',
+    'Health & Beauty > Personal Care > Oral Care > Breath Spray',
+    'Health & Beauty > Personal Care > Oral Care > Dental Floss',
+    'Health & Beauty > Personal Care > Oral Care > Dental Mouthguards',
+    'Health & Beauty > Personal Care > Oral Care > Dental Water Jet Replacement Tips',
+    'Health & Beauty > Personal Care > Oral Care > Dental Water Jets',
+    'Health & Beauty > Personal Care > Oral Care > Denture Adhesives',
+    'Health & Beauty > Personal Care > Oral Care > Denture Cleaners',
+    'Health & Beauty > Personal Care > Oral Care > Denture Repair Kits',
+    'Health & Beauty > Personal Care > Oral Care > Dentures',
+    'Health & Beauty > Personal Care > Oral Care > Gum Stimulators',
+    'Health & Beauty > Personal Care > Oral Care > Mouthwash',
+    'Health & Beauty > Personal Care > Oral Care > Orthodontic Appliance Cases',
+    'Health & Beauty > Personal Care > Oral Care > Power Flossers',
+    'Health & Beauty > Personal Care > Oral Care > Teeth Whiteners',
+    'Health & Beauty > Personal Care > Oral Care > Tongue Scrapers',
+    'Health & Beauty > Personal Care > Oral Care > Toothbrush Accessories',
+    'Health & Beauty > Personal Care > Oral Care > Toothbrush Accessories > Toothbrush Covers',
+    'Health & Beauty > Personal Care > Oral Care > Toothbrush Accessories > Toothbrush Replacement Heads',
+    'Health & Beauty > Personal Care > Oral Care > Toothbrush Accessories > Toothbrush Sanitizers',
+    'Health & Beauty > Personal Care > Oral Care > Toothbrushes',
+    'Health & Beauty > Personal Care > Oral Care > Toothpaste',
+    'Health & Beauty > Personal Care > Oral Care > Toothpaste Squeezers & Dispensers',
+    'Health & Beauty > Personal Care > Oral Care > Toothpicks',
+    'Health & Beauty > Personal Care > Personal Lubricants',
+    'Health & Beauty > Personal Care > Shaving & Grooming',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Aftershave',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Body & Facial Hair Bleach',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Electric Razor Accessories',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Electric Razors',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Clipper & Trimmer Accessories',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Clippers & Trimmers',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Removal',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Removal > Depilatories',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Removal > Electrolysis Devices',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Removal > Epilators',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Removal > Hair Removal Wax Warmers',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Removal > Laser & IPL Hair Removal Devices',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Hair Removal > Waxing Kits & Supplies',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Razors & Razor Blades',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Shaving Bowls & Mugs',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Shaving Brushes',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Shaving Cream',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Shaving Kits',
+    'Health & Beauty > Personal Care > Shaving & Grooming > Styptic Pencils',
+    'Health & Beauty > Personal Care > Sleeping Aids',
+    'Health & Beauty > Personal Care > Sleeping Aids > Eye Masks',
+    'Health & Beauty > Personal Care > Sleeping Aids > Snoring & Sleep Apnea Aids',
+    'Health & Beauty > Personal Care > Sleeping Aids > Travel Pillows',
+    'Health & Beauty > Personal Care > Sleeping Aids > White Noise Machines',
+    'Health & Beauty > Personal Care > Spray Tanning Tents',
+    'Health & Beauty > Personal Care > Tanning Beds',
+    'Health & Beauty > Personal Care > Tweezers',
+    'Health & Beauty > Personal Care > Vision Care',
+    'Health & Beauty > Personal Care > Vision Care > Contact Lens Care',
+    'Health & Beauty > Personal Care > Vision Care > Contact Lens Care > Contact Lens Care Kits',
+    'Health & Beauty > Personal Care > Vision Care > Contact Lens Care > Contact Lens Cases',
+    'Health & Beauty > Personal Care > Vision Care > Contact Lens Care > Contact Lens Solution',
+    'Health & Beauty > Personal Care > Vision Care > Contact Lenses',
+    'Health & Beauty > Personal Care > Vision Care > Eye Drops & Lubricants',
+    'Health & Beauty > Personal Care > Vision Care > Eyeglass Lenses',
+    'Health & Beauty > Personal Care > Vision Care > Eyeglasses',
+    'Health & Beauty > Personal Care > Vision Care > Eyewear Accessories',
+    'Health & Beauty > Personal Care > Vision Care > Eyewear Accessories > Eyewear Cases & Holders',
+    'Health & Beauty > Personal Care > Vision Care > Eyewear Accessories > Eyewear Lens Cleaning Solutions',
+    'Health & Beauty > Personal Care > Vision Care > Eyewear Accessories > Eyewear Replacement Parts',
+    'Health & Beauty > Personal Care > Vision Care > Eyewear Accessories > Eyewear Straps & Chains',
+    'Health & Beauty > Personal Care > Vision Care > Sunglass Lenses',
+    'Home & Garden',
+    'Home & Garden > Bathroom Accessories',
+    'Home & Garden > Bathroom Accessories > Bath Caddies',
+    'Home & Garden > Bathroom Accessories > Bath Mats & Rugs',
+    'Home & Garden > Bathroom Accessories > Bath Pillows',
+    'Home & Garden > Bathroom Accessories > Bathroom Accessory Mounts',
+    'Home & Garden > Bathroom Accessories > Bathroom Accessory Sets',
+    'Home & Garden > Bathroom Accessories > Facial Tissue Holders',
+    'Home & Garden > Bathroom Accessories > Hand Dryer Accessories',
+    'Home & Garden > Bathroom Accessories > Hand Dryers',
+    'Home & Garden > Bathroom Accessories > Medicine Cabinets',
+    'Home & Garden > Bathroom Accessories > Robe Hooks',
+    'Home & Garden > Bathroom Accessories > Safety Grab Bars',
+    'Home & Garden > Bathroom Accessories > Shower Curtain Rings',
+    'Home & Garden > Bathroom Accessories > Shower Curtains',
+    'Home & Garden > Bathroom Accessories > Shower Rods',
+    'Home & Garden > Bathroom Accessories > Soap & Lotion Dispensers',
+    'Home & Garden > Bathroom Accessories > Soap Dishes & Holders',
+    'Home & Garden > Bathroom Accessories > Toilet Brush Replacement Heads',
+    'Home & Garden > Bathroom Accessories > Toilet Brushes & Holders',
+    'Home & Garden > Bathroom Accessories > Toilet Paper Holders',
+    'Home & Garden > Bathroom Accessories > Toothbrush Holders',
+    'Home & Garden > Bathroom Accessories > Towel Racks & Holders',
+    'Home & Garden > Business & Home Security',
+    'Home & Garden > Business & Home Security > Dummy Surveillance Cameras',
+    'Home & Garden > Business & Home Security > Home Alarm Systems',
+    'Home & Garden > Business & Home Security > Motion Sensors',
+    'Home & Garden > Business & Home Security > Safety & Security Mirrors',
+    'Home & Garden > Business & Home Security > Security Lights',
+    'Home & Garden > Business & Home Security > Security Monitors & Recorders',
+    'Home & Garden > Business & Home Security > Security Safe Accessories',
+    'Home & Garden > Business & Home Security > Security Safes',
+    'Home & Garden > Business & Home Security > Security System Sensors',
+    'Home & Garden > Decor',
+    'Home & Garden > Decor > Address Signs',
+    'Home & Garden > Decor > Artificial Flora',
+    'Home & Garden > Decor > Artificial Food',
+    'Home & Garden > Decor > Artwork',
+    'Home & Garden > Decor > Artwork > Decorative Tapestries',
+    'Home & Garden > Decor > Artwork > Posters, Prints, & Visual Artwork',
+    'Home & Garden > Decor > Artwork > Sculptures & Statues',
+    'Home & Garden > Decor > Backrest Pillows',
+    'Home & Garden > Decor > Baskets',
+    'Home & Garden > Decor > Bird & Wildlife Feeder Accessories',
+    'Home & Garden > Decor > Bird & Wildlife Feeders',
+    'Home & Garden > Decor > Bird & Wildlife Feeders > Bird Feeders',
+    'Home & Garden > Decor > Bird & Wildlife Feeders > Butterfly Feeders',
+    'Home & Garden > Decor > Bird & Wildlife Feeders > Squirrel Feeders',
+    'Home & Garden > Decor > Bird & Wildlife House Accessories',
+    'Home & Garden > Decor > Bird & Wildlife Houses',
+    'Home & Garden > Decor > Bird & Wildlife Houses > Bat Houses',
+    'Home & Garden > Decor > Bird & Wildlife Houses > Birdhouses',
+    'Home & Garden > Decor > Bird & Wildlife Houses > Butterfly Houses',
+    'Home & Garden > Decor > Bird Baths',
+    'Home & Garden > Decor > Bookends',
+    'Home & Garden > Decor > Cardboard Cutouts',
+    'Home & Garden > Decor > Chair & Sofa Cushions',
+    'Home & Garden > Decor > Clock Parts',
+    'Home & Garden > Decor > Clocks',
+    'Home & Garden > Decor > Clocks > Alarm Clocks',
+    'Home & Garden > Decor > Clocks > Desk & Shelf Clocks',
+    'Home & Garden > Decor > Clocks > Floor & Grandfather Clocks',
+    'Home & Garden > Decor > Clocks > Wall Clocks',
+    'Home & Garden > Decor > Coat & Hat Racks',
+    'Home & Garden > Decor > Decorative Bells',
+    'Home & Garden > Decor > Decorative Bottles',
+    'Home & Garden > Decor > Decorative Bowls',
+    'Home & Garden > Decor > Decorative Jars',
+    'Home & Garden > Decor > Decorative Plaques',
+    'Home & Garden > Decor > Decorative Plates',
+    'Home & Garden > Decor > Decorative Trays',
+    'Home & Garden > Decor > Door Mats',
+    'Home & Garden > Decor > Dreamcatchers',
+    'Home & Garden > Decor > Dried Flowers',
+    'Home & Garden > Decor > Ecospheres',
+    'Home & Garden > Decor > Figurines',
+    'Home & Garden > Decor > Finials',
+    'Home & Garden > Decor > Flag & Windsock Accessories',
+    'Home & Garden > Decor > Flag & Windsock Accessories > Flag & Windsock Pole Lights',
+    'Home & Garden > Decor > Flag & Windsock Accessories > Flag & Windsock Pole Mounting Hardware & Kits',
+    'Home & Garden > Decor > Flag & Windsock Accessories > Flag & Windsock Poles',
+    'Home & Garden > Decor > Flags & Windsocks',
+    'Home & Garden > Decor > Flameless Candles',
+    'Home & Garden > Decor > Fountains & Ponds',
+    'Home & Garden > Decor > Fountains & Ponds > Fountain & Pond Accessories',
+    'Home & Garden > Decor > Fountains & Ponds > Fountains & Waterfalls',
+    'Home & Garden > Decor > Fountains & Ponds > Ponds',
+    'Home & Garden > Decor > Garden & Stepping Stones',
+    'Home & Garden > Decor > Growth Charts',
+    'Home & Garden > Decor > Home Decor Decals',
+    'Home & Garden > Decor > Home Fragrance Accessories',
+    'Home & Garden > Decor > Home Fragrance Accessories > Candle & Oil Warmers',
+    'Home & Garden > Decor > Home Fragrance Accessories > Candle Holders',
+    'Home & Garden > Decor > Home Fragrance Accessories > Candle Snuffers',
+    'Home & Garden > Decor > Home Fragrance Accessories > Incense Holders',
+    'Home & Garden > Decor > Home Fragrances',
+    'Home & Garden > Decor > Home Fragrances > Air Fresheners',
+    'Home & Garden > Decor > Home Fragrances > Candles',
+    'Home & Garden > Decor > Home Fragrances > Fragrance Oil',
+    'Home & Garden > Decor > Home Fragrances > Incense',
+    'Home & Garden > Decor > Home Fragrances > Potpourri',
+    'Home & Garden > Decor > Home Fragrances > Wax Tarts',
+    'Home & Garden > Decor > Hourglasses',
+    'Home & Garden > Decor > House Numbers & Letters',
+    'Home & Garden > Decor > Lawn Ornaments & Garden Sculptures',
+    'Home & Garden > Decor > Mail Slots',
+    'Home & Garden > Decor > Mailbox Accessories',
+    'Home & Garden > Decor > Mailbox Accessories > Mailbox Covers',
+    'Home & Garden > Decor > Mailbox Accessories > Mailbox Enclosures',
+    'Home & Garden > Decor > Mailbox Accessories > Mailbox Flags',
+    'Home & Garden > Decor > Mailbox Accessories > Mailbox Posts',
+    'Home & Garden > Decor > Mailbox Accessories > Mailbox Replacement Doors',
+    'Home & Garden > Decor > Mailboxes',
+    'Home & Garden > Decor > Mirrors',
+    'Home & Garden > Decor > Music Boxes',
+    'Home & Garden > Decor > Napkin Rings',
+    'Home & Garden > Decor > Novelty Signs',
+    'Home & Garden > Decor > Ottoman Cushions',
+    'Home & Garden > Decor > Picture Frames',
+    'Home & Garden > Decor > Piggy Banks & Money Jars',
+    'Home & Garden > Decor > Rain Chains',
+    'Home & Garden > Decor > Rain Gauges',
+    'Home & Garden > Decor > Refrigerator Magnets',
+    'Home & Garden > Decor > Rugs',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Advent Calendars',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Christmas Tree Skirts',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Christmas Tree Stands',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Easter Egg Decorating Kits',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Holiday Ornament Displays & Stands',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Holiday Ornament Hooks',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Holiday Ornaments',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Holiday Stocking Hangers',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Holiday Stockings',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Japanese Traditional Dolls',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Nativity Sets',
+    'Home & Garden > Decor > Seasonal & Holiday Decorations > Seasonal Village Sets & Accessories',
+    'Home & Garden > Decor > Shadow Boxes',
+    'Home & Garden > Decor > Slipcovers',
+    'Home & Garden > Decor > Snow Globes',
+    'Home & Garden > Decor > Suncatchers',
+    'Home & Garden > Decor > Sundials',
+    'Home & Garden > Decor > Throw Pillows',
+    'Home & Garden > Decor > Trunks',
+    'Home & Garden > Decor > Vase Fillers & Table Scatters',
+    'Home & Garden > Decor > Vases',
+    'Home & Garden > Decor > Wallpaper',
+    'Home & Garden > Decor > Weather Vanes & Roof Decor',
+    'Home & Garden > Decor > Wind Chimes',
+    'Home & Garden > Decor > Wind Wheels & Spinners',
+    'Home & Garden > Decor > Window Magnets',
+    'Home & Garden > Decor > Window Treatment Accessories',
+    'Home & Garden > Decor > Window Treatment Accessories > Curtain & Drape Rings',
+    'Home & Garden > Decor > Window Treatment Accessories > Curtain & Drape Rods',
+    'Home & Garden > Decor > Window Treatment Accessories > Curtain Holdbacks & Tassels',
+    'Home & Garden > Decor > Window Treatment Accessories > Window Treatment Replacement Parts',
+    'Home & Garden > Decor > Window Treatments',
+    'Home & Garden > Decor > Window Treatments > Curtains & Drapes',
+    'Home & Garden > Decor > Window Treatments > Stained Glass Panels',
+    'Home & Garden > Decor > Window Treatments > Window Blinds & Shades',
+    'Home & Garden > Decor > Window Treatments > Window Films',
+    'Home & Garden > Decor > Window Treatments > Window Screens',
+    'Home & Garden > Decor > Window Treatments > Window Valances & Cornices',
+    'Home & Garden > Decor > World Globes',
+    'Home & Garden > Decor > Wreaths & Garlands',
+    'Home & Garden > Emergency Preparedness',
+    'Home & Garden > Emergency Preparedness > Earthquake Alarms',
+    'Home & Garden > Emergency Preparedness > Emergency Blankets',
+    'Home & Garden > Emergency Preparedness > Emergency Food Kits',
+    'Home & Garden > Emergency Preparedness > Emergency Tools & Kits',
+    'Home & Garden > Emergency Preparedness > Furniture Anchors',
+    'Home & Garden > Fireplace & Wood Stove Accessories',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Bellows',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Fireplace & Wood Stove Grates',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Fireplace Andirons',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Fireplace Reflectors',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Fireplace Screens',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Fireplace Tools',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Firewood & Fuel',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Hearth Pads',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Log Rack & Carrier Accessories',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Log Racks & Carriers',
+    'Home & Garden > Fireplace & Wood Stove Accessories > Wood Stove Fans & Blowers',
+    'Home & Garden > Fireplaces',
+    'Home & Garden > Flood, Fire & Gas Safety',
+    'Home & Garden > Flood, Fire & Gas Safety > Fire Alarm Control Panels',
+    'Home & Garden > Flood, Fire & Gas Safety > Fire Alarms',
+    'Home & Garden > Flood, Fire & Gas Safety > Fire Extinguisher & Equipment Storage',
+    'Home & Garden > Flood, Fire & Gas Safety > Fire Extinguishers',
+    'Home & Garden > Flood, Fire & Gas Safety > Fire Sprinklers',
+    'Home & Garden > Flood, Fire & Gas Safety > Heat Detectors',
+    'Home & Garden > Flood, Fire & Gas Safety > Smoke & Carbon Monoxide Detectors',
+    'Home & Garden > Flood, Fire & Gas Safety > Smoke & Carbon Monoxide Detectors > Carbon Monoxide Detectors',
+    'Home & Garden > Flood, Fire & Gas Safety > Smoke & Carbon Monoxide Detectors > Smoke Detectors',
+    'Home & Garden > Flood, Fire & Gas Safety > Water & Flood Detectors',
+    'Home & Garden > Household Appliance Accessories',
+    'Home & Garden > Household Appliance Accessories > Air Conditioner Accessories',
+    'Home & Garden > Household Appliance Accessories > Air Conditioner Accessories > Air Conditioner Covers',
+    'Home & Garden > Household Appliance Accessories > Air Conditioner Accessories > Air Conditioner Filters',
+    'Home & Garden > Household Appliance Accessories > Air Purifier Accessories',
+    'Home & Garden > Household Appliance Accessories > Air Purifier Accessories > Air Purifier Filters',
+    'Home & Garden > Household Appliance Accessories > Dehumidifier Accessories',
+    'Home & Garden > Household Appliance Accessories > Fan Accessories',
+    'Home & Garden > Household Appliance Accessories > Floor & Steam Cleaner Accessories',
+    'Home & Garden > Household Appliance Accessories > Furnace & Boiler Accessories',
+    'Home & Garden > Household Appliance Accessories > Heating Radiator Accessories',
+    'Home & Garden > Household Appliance Accessories > Heating Radiator Accessories > Heating Radiator Reflectors',
+    'Home & Garden > Household Appliance Accessories > Humidifier Accessories',
+    'Home & Garden > Household Appliance Accessories > Humidifier Accessories > Humidifier Filters',
+    'Home & Garden > Household Appliance Accessories > Laundry Appliance Accessories',
+    'Home & Garden > Household Appliance Accessories > Laundry Appliance Accessories > Garment Steamer Accessories',
+    'Home & Garden > Household Appliance Accessories > Laundry Appliance Accessories > Iron Accessories',
+    'Home & Garden > Household Appliance Accessories > Laundry Appliance Accessories > Steam Press Accessories',
+    'Home & Garden > Household Appliance Accessories > Laundry Appliance Accessories > Washer & Dryer Accessories',
+    'Home & Garden > Household Appliance Accessories > Patio Heater Accessories',
+    'Home & Garden > Household Appliance Accessories > Patio Heater Accessories > Patio Heater Covers',
+    'Home & Garden > Household Appliance Accessories > Vacuum Accessories',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories > Anode Rods',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories > Hot Water Tanks',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories > Water Heater Elements',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories > Water Heater Expansion Tanks',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories > Water Heater Pans',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories > Water Heater Stacks',
+    'Home & Garden > Household Appliance Accessories > Water Heater Accessories > Water Heater Vents',
+    'Home & Garden > Household Appliances',
+    'Home & Garden > Household Appliances > Climate Control Appliances',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Air Conditioners',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Air Purifiers',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Dehumidifiers',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Duct Heaters',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Evaporative Coolers',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Fans',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Fans > Ceiling Fans',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Fans > Desk & Pedestal Fans',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Fans > Powered Hand Fans & Misters',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Fans > Ventilation Fans',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Fans > Wall Mount Fans',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Furnaces & Boilers',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Heating Radiators',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Humidifiers',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Outdoor Misting Systems',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Patio Heaters',
+    'Home & Garden > Household Appliances > Climate Control Appliances > Space Heaters',
+    'Home & Garden > Household Appliances > Floor & Carpet Dryers',
+    'Home & Garden > Household Appliances > Floor & Steam Cleaners',
+    'Home & Garden > Household Appliances > Floor & Steam Cleaners > Carpet Shampooers',
+    'Home & Garden > Household Appliances > Floor & Steam Cleaners > Carpet Steamers',
+    'Home & Garden > Household Appliances > Floor & Steam Cleaners > Floor Scrubbers',
+    'Home & Garden > Household Appliances > Floor & Steam Cleaners > Steam Mops',
+    'Home & Garden > Household Appliances > Floor Polishers & Buffers',
+    'Home & Garden > Household Appliances > Futon Dryers',
+    'Home & Garden > Household Appliances > Garage Door Keypads & Remotes',
+    'Home & Garden > Household Appliances > Garage Door Openers',
+    'Home & Garden > Household Appliances > Laundry Appliances',
+    'Home & Garden > Household Appliances > Laundry Appliances > Dryers',
+    'Home & Garden > Household Appliances > Laundry Appliances > Garment Steamers',
+    'Home & Garden > Household Appliances > Laundry Appliances > Irons & Ironing Systems',
+    'Home & Garden > Household Appliances > Laundry Appliances > Laundry Combo Units',
+    'Home & Garden > Household Appliances > Laundry Appliances > Steam Presses',
+    'Home & Garden > Household Appliances > Laundry Appliances > Washing Machines',
+    'Home & Garden > Household Appliances > Ultrasonic Cleaners',
+    'Home & Garden > Household Appliances > Vacuums',
+    'Home & Garden > Household Appliances > Wallpaper Steamers',
+    'Home & Garden > Household Appliances > Water Heaters',
+    'Home & Garden > Household Supplies',
+    'Home & Garden > Household Supplies > Drawer & Shelf Liners',
+    'Home & Garden > Household Supplies > Floor Protection Films & Runners',
+    'Home & Garden > Household Supplies > Furniture Floor Protectors',
+    'Home & Garden > Household Supplies > Garage Floor Mats',
+    'Home & Garden > Household Supplies > Garbage Bags',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Broom & Mop Handles',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Broom Heads',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Brooms',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Buckets',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Carpet Sweepers',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Cleaning Gloves',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Duster Refills',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Dusters',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Dustpans',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Fabric & Upholstery Protectors',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > All-Purpose Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Carpet Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Descalers & Decalcifiers',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Dish Detergent & Soap',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Dishwasher Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Fabric & Upholstery Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Floor Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Furniture Cleaners & Polish',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Glass & Surface Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Glass & Surface Cleaners > Glass Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Glass & Surface Cleaners > Muti-surface Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Household Disinfectants',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Oven & Grill Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Pet Odor & Stain Removers',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Rinse Aids',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Stainless Steel Cleaners & Polishes',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Toilet Bowl Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Tub & Tile Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Household Cleaning Products > Washing Machine Cleaners',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Mop Heads & Refills',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Mops',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Scrub Brush Heads & Refills',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Scrub Brushes',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Shop Towels & General-Purpose Cleaning Cloths',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Sponges & Scouring Pads',
+    'Home & Garden > Household Supplies > Household Cleaning Supplies > Squeegees',
+    'Home & Garden > Household Supplies > Household Paper Products',
+    'Home & Garden > Household Supplies > Household Paper Products > Facial Tissues',
+    'Home & Garden > Household Supplies > Household Paper Products > Paper Napkins',
+    'Home & Garden > Household Supplies > Household Paper Products > Paper Towels',
+    'Home & Garden > Household Supplies > Household Paper Products > Toilet Paper',
+    'Home & Garden > Household Supplies > Household Thermometers',
+    'Home & Garden > Household Supplies > Laundry Supplies',
+    'Home & Garden > Household Supplies > Laundry Supplies > Bleach',
+    'Home & Garden > Household Supplies > Laundry Supplies > Clothespins',
+    'Home & Garden > Household Supplies > Laundry Supplies > Dry Cleaning Kits',
+    'Home & Garden > Household Supplies > Laundry Supplies > Drying Racks & Hangers',
+    'Home & Garden > Household Supplies > Laundry Supplies > Fabric Refreshers',
+    'Home & Garden > Household Supplies > Laundry Supplies > Fabric Shavers',
+    'Home & Garden > Household Supplies > Laundry Supplies > Fabric Softeners & Dryer Sheets',
+    'Home & Garden > Household Supplies > Laundry Supplies > Fabric Stain Removers',
+    'Home & Garden > Household Supplies > Laundry Supplies > Fabric Starch',
+    'Home & Garden > Household Supplies > Laundry Supplies > Garment Shields',
+    'Home & Garden > Household Supplies > Laundry Supplies > Iron Rests',
+    'Home & Garden > Household Supplies > Laundry Supplies > Ironing Board Pads & Covers',
+    'Home & Garden > Household Supplies > Laundry Supplies > Ironing Board Replacement Parts',
+    'Home & Garden > Household Supplies > Laundry Supplies > Ironing Boards',
+    'Home & Garden > Household Supplies > Laundry Supplies > Laundry Balls',
+    'Home & Garden > Household Supplies > Laundry Supplies > Laundry Baskets',
+    'Home & Garden > Household Supplies > Laundry Supplies > Laundry Detergent',
+    'Home & Garden > Household Supplies > Laundry Supplies > Laundry Wash Bags & Frames',
+    'Home & Garden > Household Supplies > Laundry Supplies > Lint Rollers',
+    'Home & Garden > Household Supplies > Laundry Supplies > Wrinkle Releasers & Anti-Static Sprays',
+    'Home & Garden > Household Supplies > Moisture Absorbers',
+    'Home & Garden > Household Supplies > Pest Control',
+    'Home & Garden > Household Supplies > Pest Control > Fly Swatters',
+    'Home & Garden > Household Supplies > Pest Control > Pest Control Traps',
+    'Home & Garden > Household Supplies > Pest Control > Pesticides',
+    'Home & Garden > Household Supplies > Pest Control > Repellents',
+    'Home & Garden > Household Supplies > Pest Control > Repellents > Animal & Pet Repellents',
+    'Home & Garden > Household Supplies > Pest Control > Repellents > Household Insect Repellents',
+    'Home & Garden > Household Supplies > Rug Pads',
+    'Home & Garden > Household Supplies > Shoe Care & Tools',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Boot Pulls',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Bags',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Brushes',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Care Kits',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Dryers',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Horns & Dressing Aids',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Polishers',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Polishes & Waxes',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Scrapers',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Treatments & Dyes',
+    'Home & Garden > Household Supplies > Shoe Care & Tools > Shoe Trees & Shapers',
+    'Home & Garden > Household Supplies > Stair Treads',
+    'Home & Garden > Household Supplies > Storage & Organization',
+    'Home & Garden > Household Supplies > Storage & Organization > Clothing & Closet Storage',
+    'Home & Garden > Household Supplies > Storage & Organization > Clothing & Closet Storage > Charging Valets',
+    'Home & Garden > Household Supplies > Storage & Organization > Clothing & Closet Storage > Closet Organizers & Garment Racks',
+    'Home & Garden > Household Supplies > Storage & Organization > Clothing & Closet Storage > Clothes Valets',
+    'Home & Garden > Household Supplies > Storage & Organization > Clothing & Closet Storage > Hangers',
+    'Home & Garden > Household Supplies > Storage & Organization > Clothing & Closet Storage > Hat Boxes',
+    'Home & Garden > Household Supplies > Storage & Organization > Clothing & Closet Storage > Shoe Racks & Organizers',
+    'Home & Garden > Household Supplies > Storage & Organization > Flatware Chests',
+    'Home & Garden > Household Supplies > Storage & Organization > Household Drawer Organizer Inserts',
+    'Home & Garden > Household Supplies > Storage & Organization > Household Storage Bags',
+    'Home & Garden > Household Supplies > Storage & Organization > Household Storage Caddies',
+    'Home & Garden > Household Supplies > Storage & Organization > Household Storage Containers',
+    'Home & Garden > Household Supplies > Storage & Organization > Household Storage Drawers',
+    'Home & Garden > Household Supplies > Storage & Organization > Photo Storage',
+    'Home & Garden > Household Supplies > Storage & Organization > Photo Storage > Photo Albums',
+    'Home & Garden > Household Supplies > Storage & Organization > Photo Storage > Photo Storage Boxes',
+    'Home & Garden > Household Supplies > Storage & Organization > Storage Hooks & Racks',
+    'Home & Garden > Household Supplies > Storage & Organization > Storage Hooks & Racks > Ironing Board Hooks & Racks',
+    'Home & Garden > Household Supplies > Storage & Organization > Storage Hooks & Racks > Umbrella Stands & Racks',
+    'Home & Garden > Household Supplies > Storage & Organization > Storage Hooks & Racks > Utility Hooks',
+    'Home & Garden > Household Supplies > Trash Compactor Accessories',
+    'Home & Garden > Household Supplies > Waste Containment',
+    'Home & Garden > Household Supplies > Waste Containment > Dumpsters',
+    'Home & Garden > Household Supplies > Waste Containment > Hazardous Waste Containers',
+    'Home & Garden > Household Supplies > Waste Containment > Recycling Containers',
+    'Home & Garden > Household Supplies > Waste Containment > Trash Cans & Wastebaskets',
+    'Home & Garden > Household Supplies > Waste Containment Accessories',
+    'Home & Garden > Household Supplies > Waste Containment Accessories > Waste Container Carts',
+    'Home & Garden > Household Supplies > Waste Containment Accessories > Waste Container Enclosures',
+    'Home & Garden > Household Supplies > Waste Containment Accessories > Waste Container Labels & Signs',
+    'Home & Garden > Household Supplies > Waste Containment Accessories > Waste Container Lids',
+    'Home & Garden > Household Supplies > Waste Containment Accessories > Waste Container Wheels',
+    'Home & Garden > Kitchen & Dining',
+    'Home & Garden > Kitchen & Dining > Barware',
+    'Home & Garden > Kitchen & Dining > Barware > Absinthe Fountains',
+    'Home & Garden > Kitchen & Dining > Barware > Beer Dispensers & Taps',
+    'Home & Garden > Kitchen & Dining > Barware > Beverage Chilling Cubes & Sticks',
+    'Home & Garden > Kitchen & Dining > Barware > Beverage Tubs & Chillers',
+    'Home & Garden > Kitchen & Dining > Barware > Bottle Caps',
+    'Home & Garden > Kitchen & Dining > Barware > Bottle Stoppers & Savers',
+    'Home & Garden > Kitchen & Dining > Barware > Coaster Holders',
+    'Home & Garden > Kitchen & Dining > Barware > Coasters',
+    'Home & Garden > Kitchen & Dining > Barware > Cocktail & Barware Tool Sets',
+    'Home & Garden > Kitchen & Dining > Barware > Cocktail Shakers & Tools',
+    'Home & Garden > Kitchen & Dining > Barware > Cocktail Shakers & Tools > Bar Ice Picks',
+    'Home & Garden > Kitchen & Dining > Barware > Cocktail Shakers & Tools > Bottle Openers',
+    'Home & Garden > Kitchen & Dining > Barware > Cocktail Shakers & Tools > Cocktail Shakers',
+    'Home & Garden > Kitchen & Dining > Barware > Cocktail Shakers & Tools > Cocktail Strainers',
+    'Home & Garden > Kitchen & Dining > Barware > Cocktail Shakers & Tools > Muddlers',
+    'Home & Garden > Kitchen & Dining > Barware > Corkscrews',
+    'Home & Garden > Kitchen & Dining > Barware > Decanters',
+    'Home & Garden > Kitchen & Dining > Barware > Foil Cutters',
+    'Home & Garden > Kitchen & Dining > Barware > Wine Aerators',
+    'Home & Garden > Kitchen & Dining > Barware > Wine Bottle Holders',
+    'Home & Garden > Kitchen & Dining > Barware > Wine Glass Charms',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Bakeware Sets',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Baking & Cookie Sheets',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Bread Pans & Molds',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Broiling Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Cake Pans & Molds',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Muffin & Pastry Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Pie & Quiche Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Pizza Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Pizza Stones',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Ramekins & Souffle Dishes',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware > Roasting Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware Accessories',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware Accessories > Baking Mats & Liners',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware Accessories > Baking Weights',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Bakeware Accessories > Roasting Pan Racks',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware & Bakeware Combo Sets',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Casserole Dishes',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Cookware Sets',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Crêpe & Blini Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Double Boilers',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Dutch Ovens',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Fermentation & Pickling Crocks',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Griddles & Grill Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Grill Presses',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Paella Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Pressure Cookers & Canners',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Saucepans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Sauté Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Skillets & Frying Pans',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Stock Pots',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Stovetop Kettles',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Tagines & Clay Cooking Pots',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware > Woks',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories > Pot & Pan Handles',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories > Pot & Pan Lids',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories > Pressure Cooker & Canner Accessories',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories > Steamer Baskets',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories > Wok Accessories',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories > Wok Accessories > Wok Brushes',
+    'Home & Garden > Kitchen & Dining > Cookware & Bakeware > Cookware Accessories > Wok Accessories > Wok Rings',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Airpots',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Canteens',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Coolers',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Drink Sleeves',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Drink Sleeves > Can & Bottle Sleeves',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Drink Sleeves > Cup Sleeves',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Flasks',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Insulated Bags',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Lunch Boxes & Totes',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Picnic Baskets',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Replacement Drink Lids',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Thermoses',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Water Bottles',
+    'Home & Garden > Kitchen & Dining > Food & Beverage Carriers > Wine Carrier Bags',
+    'Home & Garden > Kitchen & Dining > Food Storage',
+    'Home & Garden > Kitchen & Dining > Food Storage > Bread Boxes & Bags',
+    'Home & Garden > Kitchen & Dining > Food Storage > Candy Buckets',
+    'Home & Garden > Kitchen & Dining > Food Storage > Cookie Jars',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Container Covers',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Storage Bags',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Storage Containers',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Wraps',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Wraps > Foil',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Wraps > Parchment Paper',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Wraps > Plastic Wrap',
+    'Home & Garden > Kitchen & Dining > Food Storage > Food Wraps > Wax Paper',
+    'Home & Garden > Kitchen & Dining > Food Storage > Honey Jars',
+    'Home & Garden > Kitchen & Dining > Food Storage Accessories',
+    'Home & Garden > Kitchen & Dining > Food Storage Accessories > Food & Beverage Labels',
+    'Home & Garden > Kitchen & Dining > Food Storage Accessories > Food Wrap Dispensers',
+    'Home & Garden > Kitchen & Dining > Food Storage Accessories > Oxygen Absorbers',
+    'Home & Garden > Kitchen & Dining > Food Storage Accessories > Twist Ties & Bag Clips',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Breadmaker Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Decanter Warmers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Decanters',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Filter Baskets',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Filters',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Grinder Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Grinders',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Maker & Espresso Machine Replacement Parts',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Coffee Maker Water Filters',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Frothing Pitchers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Coffee Maker & Espresso Machine Accessories > Portafilters',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Cooktop, Oven & Range Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Cotton Candy Machine Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Deep Fryer Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Dishwasher Parts & Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Electric Kettle Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Electric Skillet & Wok Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Fondue Set Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Fondue Set Accessories > Cooking Gel Fuels',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Fondue Set Accessories > Fondue Forks',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Fondue Set Accessories > Fondue Pot Stands',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Food Dehydrator Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Food Dehydrator Accessories > Food Dehydrator Sheets',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Food Dehydrator Accessories > Food Dehydrator Trays',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Food Grinder Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Food Mixer & Blender Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Freezer Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Garbage Disposal Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Ice Cream Maker Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Ice Cream Maker Accessories > Ice Cream Maker Freezer Bowls',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Ice Crusher & Shaver Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Ice Maker Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Juicer Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Microwave Oven Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Charcoal Briquettes',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Charcoal Chimneys',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Outdoor Grill Carts',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Outdoor Grill Covers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Outdoor Grill Racks & Toppers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Outdoor Grill Replacement Parts',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Outdoor Grill Spits & Baskets',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Outdoor Grilling Planks',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Outdoor Grill Accessories > Smoking Chips & Pellets',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Pasta Maker Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Popcorn Maker Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Portable Cooking Stove Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Range Hood Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Refrigerator Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Soda Maker Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Steam Table Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Steam Table Accessories > Steam Table Pan Covers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Steam Table Accessories > Steam Table Pans',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Toaster Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Vacuum Sealer Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Vacuum Sealer Accessories > Vacuum Sealer Bags',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Waffle Iron Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Water Cooler Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Water Cooler Accessories > Water Cooler Bottles',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Wine Fridge Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliance Accessories > Yogurt Maker Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Beverage Warmers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Breadmakers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Chocolate Tempering Machines',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Coffee Makers & Espresso Machines',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Coffee Makers & Espresso Machines > Drip Coffee Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Coffee Makers & Espresso Machines > Electric & Stovetop Espresso Pots',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Coffee Makers & Espresso Machines > Espresso Machines',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Coffee Makers & Espresso Machines > French Presses',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Coffee Makers & Espresso Machines > Percolators',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Coffee Makers & Espresso Machines > Vacuum Coffee Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Cooktops',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Cotton Candy Machines',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Deep Fryers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Deli Slicers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Dishwashers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Electric Griddles & Grills',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Electric Kettles',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Electric Skillets & Woks',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Fondue Pots & Sets',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Cookers & Steamers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Cookers & Steamers > Egg Cookers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Cookers & Steamers > Food Steamers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Cookers & Steamers > Rice Cookers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Cookers & Steamers > Slow Cookers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Cookers & Steamers > Thermal Cookers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Cookers & Steamers > Water Ovens',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Dehydrators',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Grinders & Mills',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Mixers & Blenders',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Smokers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Warmers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Warmers > Chafing Dishes',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Warmers > Food Heat Lamps',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Warmers > Rice Keepers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Food Warmers > Steam Tables',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Freezers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Frozen Drink Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Garbage Disposals',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Gas Griddles',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Hot Drink Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Hot Plates',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Ice Cream Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Ice Crushers & Shavers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Ice Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Juicers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Knife Sharpeners',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Microwave Ovens',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Milk Frothers & Steamers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Mochi Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Outdoor Grills',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Ovens',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Pasta Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Popcorn Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Portable Cooking Stoves',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Range Hoods',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Ranges',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Refrigerators',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Roaster Ovens & Rotisseries',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Soda Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Soy Milk Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Tea Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Countertop & Toaster Ovens',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Donut Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Muffin & Cupcake Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Pizza Makers & Ovens',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Pizzelle Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Pretzel Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Sandwich Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Toasters',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Tortilla & Flatbread Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Toasters & Grills > Waffle Irons',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Trash Compactors',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Vacuum Sealers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Water Coolers',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Water Filters',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Wine Fridges',
+    'Home & Garden > Kitchen & Dining > Kitchen Appliances > Yogurt Makers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Aprons',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Baking Peels',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Basters',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Basting Brushes',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Beverage Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cake Decorating Supplies',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cake Servers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Can Crushers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Can Openers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Carving Forks',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Channel Knives',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Colanders & Strainers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Condiment Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cookie Cutters',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cookie Presses',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cooking Thermometer Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cooking Thermometers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cooking Timers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cooking Torches',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cooling Racks',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Cutting Boards',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Dish Racks & Drain Boards',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Dough Wheels',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Electric Knife Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Electric Knife Accessories > Electric Knife Replacement Blades',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Electric Knives',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Flour Sifters',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food & Drink Stencils',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Crackers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Crackers > Lobster & Crab Crackers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Crackers > Nutcrackers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Crackers > Nutcrackers > Decorative Nutcrackers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Graters & Zesters',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Peelers & Corers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Steaming Bags',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Food Sticks & Skewers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Funnels',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Garlic Presses',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Gelatin Molds',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Ice Cube Trays',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Jerky Guns',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Knives',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Molds',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Can Organizers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Drinkware Holders',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Kitchen Cabinet Organizers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Kitchen Counter & Beverage Station Organizers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Kitchen Utensil Holders & Racks',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Knife Blocks & Holders',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Napkin Holders & Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Paper Towel Holders & Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Pot Racks',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Spice Organizers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Straw Holders & Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Sugar Caddies',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Toothpick Holders & Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Organizers > Utensil & Flatware Trays',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Scrapers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Scrapers > Bench Scrapers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Scrapers > Bowl Scrapers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Scrapers > Grill Scrapers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Shears',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Slicers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Kitchen Utensil Sets',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Ladles',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Mashers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Measuring Cups & Spoons',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Meat Tenderizers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Mixing Bowls',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Mortars & Pestles',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Oil & Vinegar Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Oven Bags',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Oven Mitts & Pot Holders',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Pasta Molds & Stamps',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Pastry Blenders',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Pastry Cloths',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Pizza Cutter Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Pizza Cutters',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Ricers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Rolling Pin Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Rolling Pin Accessories > Rolling Pin Covers & Sleeves',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Rolling Pin Accessories > Rolling Pin Rings',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Rolling Pins',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Salad Dressing Mixers & Shakers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Salad Spinners',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Scoops',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Scoops > Ice Cream Scoops',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Scoops > Ice Scoops',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Scoops > Melon Ballers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Scoops > Popcorn & French Fry Scoops',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Sink Caddies',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Sink Mats & Grids',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Slotted Spoons',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Spatulas',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Spice Grinder Accessories',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Spice Grinders',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Spoon Rests',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Sugar Dispensers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Sushi Mats',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Tea Strainers',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Tongs',
+    'Home & Garden > Kitchen & Dining > Kitchen Tools & Utensils > Whisks',
+    'Home & Garden > Kitchen & Dining > Prefabricated Kitchens & Kitchenettes',
+    'Home & Garden > Kitchen & Dining > Tableware',
+    'Home & Garden > Kitchen & Dining > Tableware > Coffee & Tea Sets',
+    'Home & Garden > Kitchen & Dining > Tableware > Coffee Servers & Tea Pots',
+    'Home & Garden > Kitchen & Dining > Tableware > Dinnerware',
+    'Home & Garden > Kitchen & Dining > Tableware > Dinnerware > Bowls',
+    'Home & Garden > Kitchen & Dining > Tableware > Dinnerware > Dinnerware Sets',
+    'Home & Garden > Kitchen & Dining > Tableware > Dinnerware > Plates',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Beer Glasses',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Coffee & Tea Cups',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Coffee & Tea Saucers',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Drinkware Sets',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Mugs',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Shot Glasses',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Stemware',
+    'Home & Garden > Kitchen & Dining > Tableware > Drinkware > Tumblers',
+    'Home & Garden > Kitchen & Dining > Tableware > Flatware',
+    'Home & Garden > Kitchen & Dining > Tableware > Flatware > Chopstick Accessories',
+    'Home & Garden > Kitchen & Dining > Tableware > Flatware > Chopsticks',
+    'Home & Garden > Kitchen & Dining > Tableware > Flatware > Flatware Sets',
+    'Home & Garden > Kitchen & Dining > Tableware > Flatware > Forks',
+    'Home & Garden > Kitchen & Dining > Tableware > Flatware > Spoons',
+    'Home & Garden > Kitchen & Dining > Tableware > Flatware > Table Knives',
+    'Home & Garden > Kitchen & Dining > Tableware > Salt & Pepper Shakers',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Butter Dishes',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Cake Boards',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Cake Stands',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Egg Cups',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Gravy Boats',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Punch Bowls',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Serving Pitchers & Carafes',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Serving Platters',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Serving Trays',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Sugar Bowls & Creamers',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware > Tureens',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware Accessories',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware Accessories > Punch Bowl Stands',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware Accessories > Tureen Lids',
+    'Home & Garden > Kitchen & Dining > Tableware > Serveware Accessories > Tureen Stands',
+    'Home & Garden > Kitchen & Dining > Tableware > Tablecloth Clips & Weights',
+    'Home & Garden > Kitchen & Dining > Tableware > Trivets',
+    'Home & Garden > Lawn & Garden',
+    'Home & Garden > Lawn & Garden > Gardening',
+    'Home & Garden > Lawn & Garden > Gardening > Composting',
+    'Home & Garden > Lawn & Garden > Gardening > Composting > Compost',
+    'Home & Garden > Lawn & Garden > Gardening > Composting > Compost Aerators',
+    'Home & Garden > Lawn & Garden > Gardening > Composting > Composters',
+    'Home & Garden > Lawn & Garden > Gardening > Disease Control',
+    'Home & Garden > Lawn & Garden > Gardening > Fertilizers',
+    'Home & Garden > Lawn & Garden > Gardening > Garden Pot Saucers & Trays',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Accessories',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Accessories > Gardening Scooters, Seats & Kneelers',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Accessories > Gardening Totes',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Accessories > Potting Benches',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tool Accessories',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tool Accessories > Gardening Tool Handles',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tool Accessories > Gardening Tool Heads',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tool Accessories > Wheelbarrow Parts',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Bulb Planting Tools',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Cultivating Tools',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Gardening Forks',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Gardening Sickles & Machetes',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Gardening Trowels',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Lawn & Garden Sprayers',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Lawn Rollers',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Pruning Saws',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Pruning Shears',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Rakes',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Shovels & Spades',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Spreaders',
+    'Home & Garden > Lawn & Garden > Gardening > Gardening Tools > Wheelbarrows',
+    'Home & Garden > Lawn & Garden > Gardening > Greenhouses',
+    'Home & Garden > Lawn & Garden > Gardening > Herbicides',
+    'Home & Garden > Lawn & Garden > Gardening > Landscape Fabric',
+    'Home & Garden > Lawn & Garden > Gardening > Landscape Fabric Accessories',
+    'Home & Garden > Lawn & Garden > Gardening > Landscape Fabric Accessories > Landscape Fabric Staples & Pins',
+    'Home & Garden > Lawn & Garden > Gardening > Landscape Fabric Accessories > Landscape Fabric Tape',
+    'Home & Garden > Lawn & Garden > Gardening > Mulch',
+    'Home & Garden > Lawn & Garden > Gardening > Plant Cages & Supports',
+    'Home & Garden > Lawn & Garden > Gardening > Plant Stands',
+    'Home & Garden > Lawn & Garden > Gardening > Pot & Planter Liners',
+    'Home & Garden > Lawn & Garden > Gardening > Pots & Planters',
+    'Home & Garden > Lawn & Garden > Gardening > Rain Barrels',
+    'Home & Garden > Lawn & Garden > Gardening > Sands & Soils',
+    'Home & Garden > Lawn & Garden > Gardening > Sands & Soils > Sand',
+    'Home & Garden > Lawn & Garden > Gardening > Sands & Soils > Soil',
+    'Home & Garden > Lawn & Garden > Outdoor Living',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Awning Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Awnings',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Hammock Parts & Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Hammocks',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Blankets',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Blankets > Beach Mats',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Blankets > Picnic Blankets',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Blankets > Poncho Liners',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Canopies & Gazebos',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Canopy & Gazebo Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Canopy & Gazebo Accessories > Canopy & Gazebo Enclosure Kits',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Canopy & Gazebo Accessories > Canopy & Gazebo Frames',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Canopy & Gazebo Accessories > Canopy & Gazebo Tops',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Canopy & Gazebo Accessories > Canopy Poles',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Canopy & Gazebo Accessories > Canopy Weights',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Garden Arches, Trellises, Arbors & Pergolas',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Garden Bridges',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Structures > Sheds, Garages & Carports',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Umbrella & Sunshade Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Umbrella & Sunshade Accessories > Outdoor Umbrella & Sunshade Fabric',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Umbrella & Sunshade Accessories > Outdoor Umbrella Bases',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Umbrella & Sunshade Accessories > Outdoor Umbrella Covers',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Umbrella & Sunshade Accessories > Outdoor Umbrella Enclosure Kits',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Umbrella & Sunshade Accessories > Outdoor Umbrella Lights',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Outdoor Umbrellas & Sunshades',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Porch Swing Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Living > Porch Swings',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Chainsaws',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Grass Edgers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Hedge Trimmers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Lawn Aerators & Dethatchers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Lawn Mowers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Lawn Mowers > Riding Mowers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Lawn Mowers > Robotic Mowers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Lawn Mowers > Tow-Behind Mowers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Lawn Mowers > Walk-Behind Mowers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Lawn Vacuums',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Leaf Blowers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Outdoor Power Equipment Base Units',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Outdoor Power Equipment Sets',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Power Sweepers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Power Tillers & Cultivators',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Pressure Washers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Snow Blowers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Tractors',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment > Weed Trimmers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Chainsaw Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Chainsaw Accessories > Chainsaw Bars',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Chainsaw Accessories > Chainsaw Chains',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Grass Edger Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Hedge Trimmer Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Brush Mower Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Bags',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Belts',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Blades',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Covers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Mulch Kits',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Mulch Plugs & Plates',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Pulleys & Idlers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Tire Tubes',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Tires',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Mower Wheels',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Striping Kits',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Lawn Mower Accessories > Lawn Sweepers',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Leaf Blower Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Leaf Blower Accessories > Leaf Blower Tubes',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Multifunction Outdoor Power Equipment Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Multifunction Outdoor Power Equipment Attachments > Grass Edger Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Multifunction Outdoor Power Equipment Attachments > Ground & Leaf Blower Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Multifunction Outdoor Power Equipment Attachments > Hedge Trimmer Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Multifunction Outdoor Power Equipment Attachments > Pole Saw Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Multifunction Outdoor Power Equipment Attachments > Tiller & Cultivator Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Multifunction Outdoor Power Equipment Attachments > Weed Trimmer Attachments',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Outdoor Power Equipment Batteries',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Pressure Washer Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Snow Blower Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Tractor Parts & Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Tractor Parts & Accessories > Tractor Tires',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Tractor Parts & Accessories > Tractor Wheels',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Weed Trimmer Accessories',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Weed Trimmer Accessories > Weed Trimmer Blades & Spools',
+    'Home & Garden > Lawn & Garden > Outdoor Power Equipment Accessories > Weed Trimmer Accessories > Weed Trimmer Spool Covers',
+    'Home & Garden > Lawn & Garden > Snow Removal',
+    'Home & Garden > Lawn & Garden > Snow Removal > Ice Scrapers & Snow Brushes',
+    'Home & Garden > Lawn & Garden > Snow Removal > Snow Shovels',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Garden Hose Fittings & Valves',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Garden Hose Spray Nozzles',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Garden Hoses',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Sprinkler Accessories',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Sprinkler Accessories > Sprinkler Controls',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Sprinkler Accessories > Sprinkler Valves',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Sprinklers & Sprinkler Heads',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Watering Can Accesssories',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Watering Cans',
+    'Home & Garden > Lawn & Garden > Watering & Irrigation > Watering Globes & Spikes',
+    'Home & Garden > Lighting',
+    'Home & Garden > Lighting > Emergency Lighting',
+    'Home & Garden > Lighting > Floating & Submersible Lights',
+    'Home & Garden > Lighting > Flood & Spot Lights',
+    'Home & Garden > Lighting > In-Ground Lights',
+    'Home & Garden > Lighting > Lamps',
+    'Home & Garden > Lighting > Landscape Pathway Lighting',
+    'Home & Garden > Lighting > Light Bulbs',
+    'Home & Garden > Lighting > Light Bulbs > Compact Fluorescent Lamps',
+    'Home & Garden > Lighting > Light Bulbs > Fluorescent Tubes',
+    'Home & Garden > Lighting > Light Bulbs > Incandescent Light Bulbs',
+    'Home & Garden > Lighting > Light Bulbs > LED Light Bulbs',
+    'Home & Garden > Lighting > Light Ropes & Strings',
+    'Home & Garden > Lighting > Lighting Fixtures',
+    'Home & Garden > Lighting > Lighting Fixtures > Cabinet Light Fixtures',
+    'Home & Garden > Lighting > Lighting Fixtures > Ceiling Light Fixtures',
+    'Home & Garden > Lighting > Lighting Fixtures > Chandeliers',
+    'Home & Garden > Lighting > Lighting Fixtures > Wall Light Fixtures',
+    'Home & Garden > Lighting > Night Lights & Ambient Lighting',
+    'Home & Garden > Lighting > Picture Lights',
+    'Home & Garden > Lighting > Tiki Torches & Oil Lamps',
+    'Home & Garden > Lighting > Track Lighting',
+    'Home & Garden > Lighting > Track Lighting > Track Lighting Accessories',
+    'Home & Garden > Lighting > Track Lighting > Track Lighting Fixtures',
+    'Home & Garden > Lighting > Track Lighting > Track Lighting Rails',
+    'Home & Garden > Lighting Accessories',
+    'Home & Garden > Lighting Accessories > Lamp Post Bases',
+    'Home & Garden > Lighting Accessories > Lamp Post Mounts',
+    'Home & Garden > Lighting Accessories > Lamp Shades',
+    'Home & Garden > Lighting Accessories > Lighting Timers',
+    'Home & Garden > Lighting Accessories > Oil Lamp Fuel',
+    'Home & Garden > Linens & Bedding',
+    'Home & Garden > Linens & Bedding > Bedding',
+    'Home & Garden > Linens & Bedding > Bedding > Bed Canopies',
+    'Home & Garden > Linens & Bedding > Bedding > Bed Sheets',
+    'Home & Garden > Linens & Bedding > Bedding > Bedskirts',
+    'Home & Garden > Linens & Bedding > Bedding > Blankets',
+    'Home & Garden > Linens & Bedding > Bedding > Duvet Covers',
+    'Home & Garden > Linens & Bedding > Bedding > Mattress Protectors',
+    'Home & Garden > Linens & Bedding > Bedding > Mattress Protectors > Mattress Encasements',
+    'Home & Garden > Linens & Bedding > Bedding > Mattress Protectors > Mattress Pads',
+    'Home & Garden > Linens & Bedding > Bedding > Nap Mats',
+    'Home & Garden > Linens & Bedding > Bedding > Pillowcases & Shams',
+    'Home & Garden > Linens & Bedding > Bedding > Pillows',
+    'Home & Garden > Linens & Bedding > Bedding > Quilts & Comforters',
+    'Home & Garden > Linens & Bedding > Kitchen Linens Sets',
+    'Home & Garden > Linens & Bedding > Table Linens',
+    'Home & Garden > Linens & Bedding > Table Linens > Cloth Napkins',
+    'Home & Garden > Linens & Bedding > Table Linens > Doilies',
+    'Home & Garden > Linens & Bedding > Table Linens > Placemats',
+    'Home & Garden > Linens & Bedding > Table Linens > Table Runners',
+    'Home & Garden > Linens & Bedding > Table Linens > Table Skirts',
+    'Home & Garden > Linens & Bedding > Table Linens > Tablecloths',
+    'Home & Garden > Linens & Bedding > Towels',
+    'Home & Garden > Linens & Bedding > Towels > Bath Towels & Washcloths',
+    'Home & Garden > Linens & Bedding > Towels > Beach Towels',
+    'Home & Garden > Linens & Bedding > Towels > Kitchen Towels',
+    'Home & Garden > Parasols & Rain Umbrellas',
+    'Home & Garden > Plants',
+    'Home & Garden > Plants > Aquatic Plants',
+    'Home & Garden > Plants > Flowers',
+    'Home & Garden > Plants > Indoor & Outdoor Plants',
+    'Home & Garden > Plants > Indoor & Outdoor Plants > Bushes & Shrubs',
+    'Home & Garden > Plants > Indoor & Outdoor Plants > Landscaping & Garden Plants',
+    'Home & Garden > Plants > Indoor & Outdoor Plants > Potted Houseplants',
+    'Home & Garden > Plants > Plant & Herb Growing Kits',
+    'Home & Garden > Plants > Seeds',
+    'Home & Garden > Plants > Seeds > Plant & Flower Bulbs',
+    'Home & Garden > Plants > Seeds > Seeds & Seed Tape',
+    'Home & Garden > Plants > Trees',
+    'Home & Garden > Pool & Spa',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Diving Boards',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool & Spa Chlorine Generators',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool & Spa Filters',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool & Spa Maintenance Kits',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Brushes & Brooms',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Cleaner Hoses',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Cleaners & Chemicals',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Cover Accessories',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Covers & Ground Cloths',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Deck Kits',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Floats & Loungers',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Heaters',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Ladders, Steps & Ramps',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Liners',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Skimmers',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Sweeps & Vacuums',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Toys',
+    'Home & Garden > Pool & Spa > Pool & Spa Accessories > Pool Water Slides',
+    'Home & Garden > Pool & Spa > Sauna Accessories',
+    'Home & Garden > Pool & Spa > Sauna Accessories > Sauna Buckets & Ladles',
+    'Home & Garden > Pool & Spa > Sauna Accessories > Sauna Heaters',
+    'Home & Garden > Pool & Spa > Sauna Accessories > Sauna Kits',
+    'Home & Garden > Pool & Spa > Saunas',
+    'Home & Garden > Pool & Spa > Spas',
+    'Home & Garden > Pool & Spa > Swimming Pools',
+    'Home & Garden > Smoking Accessories',
+    'Home & Garden > Smoking Accessories > Ashtrays',
+    'Home & Garden > Smoking Accessories > Cigar Cases',
+    'Home & Garden > Smoking Accessories > Cigar Cutters & Punches',
+    'Home & Garden > Smoking Accessories > Cigarette Cases',
+    'Home & Garden > Smoking Accessories > Cigarette Holders',
+    'Home & Garden > Smoking Accessories > Humidor Accessories',
+    'Home & Garden > Smoking Accessories > Humidors',
+    'Home & Garden > Umbrella Sleeves & Cases',
+    'Home & Garden > Wood Stoves',
+    'Luggage & Bags',
+    'Luggage & Bags > Backpacks',
+    'Luggage & Bags > Briefcases',
+    'Luggage & Bags > Cosmetic & Toiletry Bags',
+    'Luggage & Bags > Diaper Bags',
+    'Luggage & Bags > Dry Boxes',
+    'Luggage & Bags > Duffel Bags',
+    'Luggage & Bags > Fanny Packs',
+    'Luggage & Bags > Garment Bags',
+    'Luggage & Bags > Luggage Accessories',
+    'Luggage & Bags > Luggage Accessories > Dry Box Liners & Inserts',
+    'Luggage & Bags > Luggage Accessories > Luggage Covers',
+    'Luggage & Bags > Luggage Accessories > Luggage Racks & Stands',
+    'Luggage & Bags > Luggage Accessories > Luggage Straps',
+    'Luggage & Bags > Luggage Accessories > Luggage Tags',
+    'Luggage & Bags > Luggage Accessories > Packing Organizers',
+    'Luggage & Bags > Luggage Accessories > Travel Bottles & Containers',
+    'Luggage & Bags > Luggage Accessories > Travel Pouches',
+    'Luggage & Bags > Messenger Bags',
+    'Luggage & Bags > Shopping Totes',
+    'Luggage & Bags > Suitcases',
+    'Luggage & Bags > Train Cases',
+    'Mature',
+    'Mature > Erotic',
+    'Mature > Erotic > Erotic Books',
+    'Mature > Erotic > Erotic Clothing',
+    'Mature > Erotic > Erotic DVDs & Videos',
+    'Mature > Erotic > Erotic Food & Edibles',
+    'Mature > Erotic > Erotic Games',
+    'Mature > Erotic > Erotic Magazines',
+    'Mature > Erotic > Pole Dancing Kits',
+    'Mature > Erotic > Sex Toys',
+    'Mature > Weapons',
+    'Mature > Weapons > Brass Knuckles',
+    'Mature > Weapons > Clubs & Batons',
+    'Mature > Weapons > Combat Knives',
+    'Mature > Weapons > Gun Care & Accessories',
+    'Mature > Weapons > Gun Care & Accessories > Ammunition',
+    'Mature > Weapons > Gun Care & Accessories > Ammunition Cases & Holders',
+    'Mature > Weapons > Gun Care & Accessories > Gun Cases & Range Bags',
+    'Mature > Weapons > Gun Care & Accessories > Gun Cleaning',
+    'Mature > Weapons > Gun Care & Accessories > Gun Cleaning > Gun Cleaning Cloths & Swabs',
+    'Mature > Weapons > Gun Care & Accessories > Gun Cleaning > Gun Cleaning Patches',
+    'Mature > Weapons > Gun Care & Accessories > Gun Cleaning > Gun Cleaning Solvents',
+    'Mature > Weapons > Gun Care & Accessories > Gun Grips',
+    'Mature > Weapons > Gun Care & Accessories > Gun Holsters',
+    'Mature > Weapons > Gun Care & Accessories > Gun Lights',
+    'Mature > Weapons > Gun Care & Accessories > Gun Rails',
+    'Mature > Weapons > Gun Care & Accessories > Gun Slings',
+    'Mature > Weapons > Gun Care & Accessories > Reloading Supplies & Equipment',
+    'Mature > Weapons > Gun Care & Accessories > Reloading Supplies & Equipment > Ammunition Reloading Presses',
+    'Mature > Weapons > Guns',
+    'Mature > Weapons > Mace & Pepper Spray',
+    'Mature > Weapons > Nunchucks',
+    'Mature > Weapons > Spears',
+    'Mature > Weapons > Staff & Stick Weapons',
+    'Mature > Weapons > Stun Guns & Tasers',
+    'Mature > Weapons > Swords',
+    'Mature > Weapons > Throwing Stars',
+    'Mature > Weapons > Whips',
+    'Media',
+    'Media > Books',
+    'Media > Books > Audiobooks',
+    'Media > Books > E-books',
+    'Media > Books > Print Books',
+    'Media > Carpentry & Woodworking Project Plans',
+    'Media > DVDs & Videos',
+    'Media > DVDs & Videos > Film & Television DVDs',
+    'Media > DVDs & Videos > Film & Television Digital Downloads',
+    'Media > DVDs & Videos > Film & Television VHS Tapes',
+    'Media > Magazines & Newspapers',
+    'Media > Magazines & Newspapers > Magazines',
+    'Media > Magazines & Newspapers > Newspapers',
+    'Media > Music & Sound Recordings',
+    'Media > Music & Sound Recordings > Digital Music Downloads',
+    'Media > Music & Sound Recordings > Music CDs',
+    'Media > Music & Sound Recordings > Music Cassette Tapes',
+    'Media > Music & Sound Recordings > Records & LPs',
+    'Media > Music & Sound Recordings > Spoken Word & Field Recordings',
+    'Media > Product Manuals',
+    'Media > Product Manuals > Camera & Optics Manuals',
+    'Media > Product Manuals > Electronics Manuals',
+    'Media > Product Manuals > Exercise & Fitness Equipment Manuals',
+    'Media > Product Manuals > Household Appliance Manuals',
+    'Media > Product Manuals > Kitchen Appliance Manuals',
+    'Media > Product Manuals > Model & Toys Manuals',
+    'Media > Product Manuals > Office Supply Manuals',
+    'Media > Product Manuals > Power Tool & Equipment Manuals',
+    'Media > Product Manuals > Vehicle Service Manuals',
+    'Media > Sheet Music',
+    'Office Supplies',
+    'Office Supplies > Book Accessories',
+    'Office Supplies > Book Accessories > Book Covers',
+    'Office Supplies > Book Accessories > Book Lights',
+    'Office Supplies > Book Accessories > Book Stands & Rests',
+    'Office Supplies > Book Accessories > Bookmarks',
+    'Office Supplies > Desk Pads & Blotters',
+    'Office Supplies > Filing & Organization',
+    'Office Supplies > Filing & Organization > Address Books',
+    'Office Supplies > Filing & Organization > Binding Supplies',
+    'Office Supplies > Filing & Organization > Binding Supplies > Binder Accessories',
+    'Office Supplies > Filing & Organization > Binding Supplies > Binder Accessories > Binder Rings',
+    'Office Supplies > Filing & Organization > Binding Supplies > Binder Accessories > Index Dividers',
+    'Office Supplies > Filing & Organization > Binding Supplies > Binder Accessories > Sheet Protectors',
+    'Office Supplies > Filing & Organization > Binding Supplies > Binders',
+    'Office Supplies > Filing & Organization > Binding Supplies > Binding Combs & Spines',
+    'Office Supplies > Filing & Organization > Binding Supplies > Binding Machines',
+    'Office Supplies > Filing & Organization > Business Card Books',
+    'Office Supplies > Filing & Organization > Business Card Stands',
+    'Office Supplies > Filing & Organization > CD/DVD Cases & Organizers',
+    'Office Supplies > Filing & Organization > Calendars, Organizers & Planners',
+    'Office Supplies > Filing & Organization > Card Files',
+    'Office Supplies > Filing & Organization > Card Sleeves',
+    'Office Supplies > Filing & Organization > Cash Boxes',
+    'Office Supplies > Filing & Organization > Desk Organizers',
+    'Office Supplies > Filing & Organization > File Boxes',
+    'Office Supplies > Filing & Organization > File Folders',
+    'Office Supplies > Filing & Organization > Folders & Report Covers',
+    'Office Supplies > Filing & Organization > Folders & Report Covers > Pocket Folders',
+    'Office Supplies > Filing & Organization > Folders & Report Covers > Report Covers',
+    'Office Supplies > Filing & Organization > Greeting Card Organizers',
+    'Office Supplies > Filing & Organization > Mail Sorters',
+    'Office Supplies > Filing & Organization > Pen & Pencil Cases',
+    'Office Supplies > Filing & Organization > Portfolios & Padfolios',
+    'Office Supplies > Filing & Organization > Portfolios & Padfolios > Padfolios',
+    'Office Supplies > Filing & Organization > Portfolios & Padfolios > Portfolios',
+    'Office Supplies > Filing & Organization > Recipe Card Boxes',
+    'Office Supplies > General Office Supplies',
+    'Office Supplies > General Office Supplies > Brass Fasteners',
+    'Office Supplies > General Office Supplies > Correction Fluids, Pens & Tapes',
+    'Office Supplies > General Office Supplies > Correction Fluids, Pens & Tapes > Correction Fluids',
+    'Office Supplies > General Office Supplies > Correction Fluids, Pens & Tapes > Correction Pens',
+    'Office Supplies > General Office Supplies > Correction Fluids, Pens & Tapes > Correction Tapes',
+    'Office Supplies > General Office Supplies > Erasers',
+    'Office Supplies > General Office Supplies > Labels & Tags',
+    'Office Supplies > General Office Supplies > Labels & Tags > Address Labels',
+    'Office Supplies > General Office Supplies > Labels & Tags > Folder Tabs',
+    'Office Supplies > General Office Supplies > Labels & Tags > Label Clips',
+    'Office Supplies > General Office Supplies > Labels & Tags > Label Tapes & Refill Rolls',
+    'Office Supplies > General Office Supplies > Labels & Tags > Shipping Labels',
+    'Office Supplies > General Office Supplies > Labels & Tags > Shipping Tags',
+    'Office Supplies > General Office Supplies > Laminating Film, Pouches & Sheets',
+    'Office Supplies > General Office Supplies > Mounting Putty',
+    'Office Supplies > General Office Supplies > Office Tape',
+    'Office Supplies > General Office Supplies > Paper Clips & Clamps',
+    'Office Supplies > General Office Supplies > Paper Clips & Clamps > Binder Clips',
+    'Office Supplies > General Office Supplies > Paper Clips & Clamps > Paper Clips',
+    'Office Supplies > General Office Supplies > Paper Products',
+    'Office Supplies > General Office Supplies > Paper Products > Binder Paper',
+    'Office Supplies > General Office Supplies > Paper Products > Blank ID Cards',
+    'Office Supplies > General Office Supplies > Paper Products > Business Cards',
+    'Office Supplies > General Office Supplies > Paper Products > Business Forms & Receipts',
+    'Office Supplies > General Office Supplies > Paper Products > Checks',
+    'Office Supplies > General Office Supplies > Paper Products > Cover Paper',
+    'Office Supplies > General Office Supplies > Paper Products > Envelopes',
+    'Office Supplies > General Office Supplies > Paper Products > Index Cards',
+    'Office Supplies > General Office Supplies > Paper Products > Notebooks & Notepads',
+    'Office Supplies > General Office Supplies > Paper Products > Post Cards',
+    'Office Supplies > General Office Supplies > Paper Products > Printer & Copier Paper',
+    'Office Supplies > General Office Supplies > Paper Products > Receipt & Adding Machine Paper Rolls',
+    'Office Supplies > General Office Supplies > Paper Products > Stationery',
+    'Office Supplies > General Office Supplies > Paper Products > Sticky Notes',
+    'Office Supplies > General Office Supplies > Rubber Bands',
+    'Office Supplies > General Office Supplies > Staples',
+    'Office Supplies > General Office Supplies > Tacks & Pushpins',
+    'Office Supplies > Impulse Sealers',
+    'Office Supplies > Lap Desks',
+    'Office Supplies > Name Plates',
+    'Office Supplies > Office & Chair Mats',
+    'Office Supplies > Office & Chair Mats > Anti-Fatigue Mats',
+    'Office Supplies > Office & Chair Mats > Chair Mats',
+    'Office Supplies > Office & Chair Mats > Office Mats',
+    'Office Supplies > Office Carts',
+    'Office Supplies > Office Carts > AV Carts',
+    'Office Supplies > Office Carts > Book Carts',
+    'Office Supplies > Office Carts > File Carts',
+    'Office Supplies > Office Carts > Mail Carts',
+    'Office Supplies > Office Carts > Utility Carts',
+    'Office Supplies > Office Equipment',
+    'Office Supplies > Office Equipment > Calculator Accessories',
+    'Office Supplies > Office Equipment > Calculators',
+    'Office Supplies > Office Equipment > Calculators > Basic Calculators',
+    'Office Supplies > Office Equipment > Calculators > Construction Calculators',
+    'Office Supplies > Office Equipment > Calculators > Financial Calculators',
+    'Office Supplies > Office Equipment > Calculators > Graphing Calculators',
+    'Office Supplies > Office Equipment > Calculators > Scientific Calculators',
+    'Office Supplies > Office Equipment > Electronic Dictionaries & Translators',
+    'Office Supplies > Office Equipment > Label Makers',
+    'Office Supplies > Office Equipment > Laminators',
+    'Office Supplies > Office Equipment > Office Shredders',
+    'Office Supplies > Office Equipment > Postage Meters',
+    'Office Supplies > Office Equipment > Time & Attendance Clocks',
+    'Office Supplies > Office Equipment > Transcribers & Dictation Systems',
+    'Office Supplies > Office Equipment > Typewriters',
+    'Office Supplies > Office Instruments',
+    'Office Supplies > Office Instruments > Call Bells',
+    'Office Supplies > Office Instruments > Clipboards',
+    'Office Supplies > Office Instruments > Letter Openers',
+    'Office Supplies > Office Instruments > Magnifiers',
+    'Office Supplies > Office Instruments > Office Rubber Stamps',
+    'Office Supplies > Office Instruments > Pencil Sharpeners',
+    'Office Supplies > Office Instruments > Staple Removers',
+    'Office Supplies > Office Instruments > Staplers',
+    'Office Supplies > Office Instruments > Tape Dispensers',
+    'Office Supplies > Office Instruments > Writing & Drawing Instrument Accessories',
+    'Office Supplies > Office Instruments > Writing & Drawing Instrument Accessories > Marker & Highlighter Ink Refills',
+    'Office Supplies > Office Instruments > Writing & Drawing Instrument Accessories > Marker & Highlighter Ink Refills > Highlighter Refills',
+    'Office Supplies > Office Instruments > Writing & Drawing Instrument Accessories > Marker & Highlighter Ink Refills > Marker Refills',
+    'Office Supplies > Office Instruments > Writing & Drawing Instrument Accessories > Pen Ink & Refills',
+    'Office Supplies > Office Instruments > Writing & Drawing Instrument Accessories > Pencil Lead & Refills',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Art Charcoals',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Chalk',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Crayons',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Markers & Highlighters',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Markers & Highlighters > Highlighters',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Markers & Highlighters > Markers',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Multifunction Writing Instruments',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pastels',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils > Pen & Pencil Sets',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils > Pencils',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils > Pencils > Art Pencils',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils > Pencils > Writing Pencils',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils > Pencils > Writing Pencils > Mechanical Pencils',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils > Pencils > Writing Pencils > Wooden Pencils',
+    'Office Supplies > Office Instruments > Writing & Drawing Instruments > Pens & Pencils > Pens',
+    'Office Supplies > Paper Handling',
+    'Office Supplies > Paper Handling > Fingertip Grips',
+    'Office Supplies > Paper Handling > Hole Punches',
+    'Office Supplies > Paper Handling > Paper Folding Machines',
+    'Office Supplies > Paper Handling > Paper Joggers',
+    'Office Supplies > Paper Handling > Paperweights',
+    'Office Supplies > Paper Handling > Pencil Boards',
+    'Office Supplies > Presentation Supplies',
+    'Office Supplies > Presentation Supplies > Chalkboards',
+    'Office Supplies > Presentation Supplies > Display Boards',
+    'Office Supplies > Presentation Supplies > Display Boards > Bulletin Board Accessories',
+    'Office Supplies > Presentation Supplies > Display Boards > Bulletin Board Accessories > Bulletin Board Trim',
+    'Office Supplies > Presentation Supplies > Display Boards > Bulletin Board Accessories > Bulletin Board Trim Sets',
+    'Office Supplies > Presentation Supplies > Display Boards > Bulletin Boards',
+    'Office Supplies > Presentation Supplies > Display Boards > Foam Boards',
+    'Office Supplies > Presentation Supplies > Display Boards > Mounting Boards',
+    'Office Supplies > Presentation Supplies > Display Boards > Poster Boards',
+    'Office Supplies > Presentation Supplies > Document Cameras',
+    'Office Supplies > Presentation Supplies > Dry-Erase Boards',
+    'Office Supplies > Presentation Supplies > Easel Pads',
+    'Office Supplies > Presentation Supplies > Easels',
+    'Office Supplies > Presentation Supplies > Laser Pointers',
+    'Office Supplies > Presentation Supplies > Lecterns',
+    'Office Supplies > Presentation Supplies > Transparencies',
+    'Office Supplies > Presentation Supplies > Wireless Presenters',
+    'Office Supplies > Shipping Supplies',
+    'Office Supplies > Shipping Supplies > Moving & Shipping Boxes',
+    'Office Supplies > Shipping Supplies > Packing Materials',
+    'Office Supplies > Shipping Supplies > Packing Tape',
+    'Religious & Ceremonial',
+    'Religious & Ceremonial > Memorial Ceremony Supplies',
+    'Religious & Ceremonial > Memorial Ceremony Supplies > Memorial Urns',
+    'Religious & Ceremonial > Religious Items',
+    'Religious & Ceremonial > Religious Items > Prayer Beads',
+    'Religious & Ceremonial > Religious Items > Prayer Cards',
+    'Religious & Ceremonial > Religious Items > Religious Altars',
+    'Religious & Ceremonial > Religious Items > Religious Veils',
+    'Religious & Ceremonial > Religious Items > Tarot Cards',
+    'Religious & Ceremonial > Wedding Ceremony Supplies',
+    'Religious & Ceremonial > Wedding Ceremony Supplies > Aisle Runners',
+    'Religious & Ceremonial > Wedding Ceremony Supplies > Flower Girl Baskets',
+    'Religious & Ceremonial > Wedding Ceremony Supplies > Ring Pillows & Holders',
+    'Software',
+    'Software > Computer Software',
+    'Software > Computer Software > Antivirus & Security Software',
+    'Software > Computer Software > Business & Productivity Software',
+    'Software > Computer Software > Compilers & Programming Tools',
+    'Software > Computer Software > Computer Utilities & Maintenance Software',
+    'Software > Computer Software > Dictionary & Translation Software',
+    'Software > Computer Software > Educational Software',
+    'Software > Computer Software > Financial, Tax & Accounting Software',
+    'Software > Computer Software > GPS Map Data & Software',
+    'Software > Computer Software > Handheld & PDA Software',
+    'Software > Computer Software > Multimedia & Design Software',
+    'Software > Computer Software > Multimedia & Design Software > 3D Modeling Software',
+    'Software > Computer Software > Multimedia & Design Software > Animation Editing Software',
+    'Software > Computer Software > Multimedia & Design Software > Graphic Design & Illustration Software',
+    'Software > Computer Software > Multimedia & Design Software > Home & Interior Design Software',
+    'Software > Computer Software > Multimedia & Design Software > Home Publishing Software',
+    'Software > Computer Software > Multimedia & Design Software > Media Viewing Software',
+    'Software > Computer Software > Multimedia & Design Software > Music Composition Software',
+    'Software > Computer Software > Multimedia & Design Software > Sound Editing Software',
+    'Software > Computer Software > Multimedia & Design Software > Video Editing Software',
+    'Software > Computer Software > Multimedia & Design Software > Web Design Software',
+    'Software > Computer Software > Network Software',
+    'Software > Computer Software > Office Application Software',
+    'Software > Computer Software > Operating Systems',
+    'Software > Computer Software > Restore Disks',
+    'Software > Digital Goods & Currency',
+    'Software > Digital Goods & Currency > Computer Icons',
+    'Software > Digital Goods & Currency > Desktop Wallpaper',
+    'Software > Digital Goods & Currency > Digital Artwork',
+    'Software > Digital Goods & Currency > Document Templates',
+    'Software > Digital Goods & Currency > Fonts',
+    'Software > Digital Goods & Currency > Stock Photographs & Video Footage',
+    'Software > Digital Goods & Currency > Virtual Currency',
+    'Software > Video Game Software',
+    'Sporting Goods',
+    'Sporting Goods > Athletics',
+    'Sporting Goods > Athletics > American Football',
+    'Sporting Goods > Athletics > American Football > American Football Gloves',
+    'Sporting Goods > Athletics > American Football > American Football Goal Posts',
+    'Sporting Goods > Athletics > American Football > American Football Kicking Tees & Holders',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Girdles',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Helmet Accessories',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Helmet Accessories > American Football Chin Straps',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Helmet Accessories > American Football Face Masks',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Helmet Accessories > American Football Helmet Padding',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Helmet Accessories > American Football Helmet Visors',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Helmets',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Neck Rolls',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Rib Protection Shirts & Vests',
+    'Sporting Goods > Athletics > American Football > American Football Protective Gear > American Football Shoulder Pads',
+    'Sporting Goods > Athletics > American Football > American Football Training Equipment',
+    'Sporting Goods > Athletics > American Football > American Football Training Equipment > American Football Dummies & Sleds',
+    'Sporting Goods > Athletics > American Football > American Footballs',
+    'Sporting Goods > Athletics > Baseball & Softball',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Bases & Plates',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Batting Gloves',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Gloves & Mitts',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Pitching Mats',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Pitching Mounds',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Protective Gear',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Protective Gear > Baseball & Softball Batting Helmets',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Protective Gear > Baseball & Softball Chest Protectors',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Protective Gear > Baseball & Softball Leg Guards',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Protective Gear > Catchers Equipment Sets',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball & Softball Protective Gear > Catchers Helmets & Masks',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseball Bats',
+    'Sporting Goods > Athletics > Baseball & Softball > Baseballs',
+    'Sporting Goods > Athletics > Baseball & Softball > Pitching Machines',
+    'Sporting Goods > Athletics > Baseball & Softball > Softball Bats',
+    'Sporting Goods > Athletics > Baseball & Softball > Softballs',
+    'Sporting Goods > Athletics > Basketball',
+    'Sporting Goods > Athletics > Basketball > Basketball Hoop Parts & Accessories',
+    'Sporting Goods > Athletics > Basketball > Basketball Hoop Parts & Accessories > Basketball Backboards',
+    'Sporting Goods > Athletics > Basketball > Basketball Hoop Parts & Accessories > Basketball Hoop Padding',
+    'Sporting Goods > Athletics > Basketball > Basketball Hoop Parts & Accessories > Basketball Hoop Posts',
+    'Sporting Goods > Athletics > Basketball > Basketball Hoop Parts & Accessories > Basketball Nets',
+    'Sporting Goods > Athletics > Basketball > Basketball Hoop Parts & Accessories > Basketball Rims',
+    'Sporting Goods > Athletics > Basketball > Basketball Hoops',
+    'Sporting Goods > Athletics > Basketball > Basketball Training Aids',
+    'Sporting Goods > Athletics > Basketball > Basketballs',
+    'Sporting Goods > Athletics > Boxing & Martial Arts',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Protective Gear',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Protective Gear > Boxing & MMA Hand Wraps',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Protective Gear > Boxing & Martial Arts Arm Guards',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Protective Gear > Boxing & Martial Arts Body Protectors',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Protective Gear > Boxing & Martial Arts Headgear',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Protective Gear > Boxing Gloves & Mitts',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Protective Gear > MMA Shin Guards',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Training Equipment',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Training Equipment > Boxing & MMA Punch Mitts',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Training Equipment > Grappling Dummies',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Training Equipment > Punching & Training Bag Accessories',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Training Equipment > Punching & Training Bags',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing & Martial Arts Training Equipment > Strike Shields',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing Ring Parts',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Boxing Rings',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Martial Arts Belts',
+    'Sporting Goods > Athletics > Boxing & Martial Arts > Martial Arts Weapons',
+    'Sporting Goods > Athletics > Broomball Equipment',
+    'Sporting Goods > Athletics > Cheerleading',
+    'Sporting Goods > Athletics > Cheerleading > Cheerleading Pom Poms',
+    'Sporting Goods > Athletics > Coaching & Officiating',
+    'Sporting Goods > Athletics > Coaching & Officiating > Captains Armbands',
+    'Sporting Goods > Athletics > Coaching & Officiating > Field & Court Boundary Markers',
+    'Sporting Goods > Athletics > Coaching & Officiating > Flip Coins & Discs',
+    'Sporting Goods > Athletics > Coaching & Officiating > Linesman Flags',
+    'Sporting Goods > Athletics > Coaching & Officiating > Penalty Cards & Flags',
+    'Sporting Goods > Athletics > Coaching & Officiating > Pitch Counters',
+    'Sporting Goods > Athletics > Coaching & Officiating > Referee Stands & Chairs',
+    'Sporting Goods > Athletics > Coaching & Officiating > Referee Wallets',
+    'Sporting Goods > Athletics > Coaching & Officiating > Scoreboards',
+    'Sporting Goods > Athletics > Coaching & Officiating > Sport & Safety Whistles',
+    'Sporting Goods > Athletics > Coaching & Officiating > Umpire Indicators',
+    'Sporting Goods > Athletics > Cricket',
+    'Sporting Goods > Athletics > Cricket > Cricket Balls',
+    'Sporting Goods > Athletics > Cricket > Cricket Bat Accessories',
+    'Sporting Goods > Athletics > Cricket > Cricket Bat Accessories > Cricket Bat Grips',
+    'Sporting Goods > Athletics > Cricket > Cricket Bats',
+    'Sporting Goods > Athletics > Cricket > Cricket Equipment Sets',
+    'Sporting Goods > Athletics > Cricket > Cricket Protective Gear',
+    'Sporting Goods > Athletics > Cricket > Cricket Protective Gear > Cricket Gloves',
+    'Sporting Goods > Athletics > Cricket > Cricket Protective Gear > Cricket Helmets',
+    'Sporting Goods > Athletics > Cricket > Cricket Protective Gear > Cricket Leg Guards',
+    'Sporting Goods > Athletics > Cricket > Cricket Stumps',
+    'Sporting Goods > Athletics > Dancing',
+    'Sporting Goods > Athletics > Dancing > Ballet Barres',
+    'Sporting Goods > Athletics > Fencing',
+    'Sporting Goods > Athletics > Fencing > Fencing Protective Gear',
+    'Sporting Goods > Athletics > Fencing > Fencing Protective Gear > Fencing Gloves & Cuffs',
+    'Sporting Goods > Athletics > Fencing > Fencing Protective Gear > Fencing Jackets & Lamés',
+    'Sporting Goods > Athletics > Fencing > Fencing Protective Gear > Fencing Masks',
+    'Sporting Goods > Athletics > Fencing > Fencing Weapons',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey & Lacrosse Protective Gear',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey & Lacrosse Protective Gear > Field Hockey & Lacrosse Gloves',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey & Lacrosse Protective Gear > Field Hockey & Lacrosse Helmets',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey & Lacrosse Protective Gear > Field Hockey & Lacrosse Masks & Goggles',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey & Lacrosse Protective Gear > Field Hockey & Lacrosse Pads',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey Balls',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey Goals',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Field Hockey Sticks',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Balls',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Equipment Sets',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Goals',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Stick Parts',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Stick Parts > Lacrosse Mesh & String',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Stick Parts > Lacrosse Stick Heads',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Stick Parts > Lacrosse Stick Shafts',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Sticks',
+    'Sporting Goods > Athletics > Field Hockey & Lacrosse > Lacrosse Training Aids',
+    'Sporting Goods > Athletics > Figure Skating & Hockey',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Balls & Pucks',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Goals',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Elbow Pads',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Gloves',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Goalie Equipment Sets',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Helmets',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Pants',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Shin Guards & Leg Pads',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Shoulder Pads & Chest Protectors',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Protective Gear > Hockey Suspenders & Belts',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Sledges',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Stick Care',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Stick Parts',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Stick Parts > Hockey Stick Blades',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Stick Parts > Hockey Stick Shafts',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Hockey Sticks',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Ice Skate Parts & Accessories',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Ice Skate Parts & Accessories > Figure Skate Boots',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Ice Skate Parts & Accessories > Ice Skate Blades',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Ice Skate Parts & Accessories > Ice Skate Sharpeners',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Ice Skate Parts & Accessories > Skate Blade Guards',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Ice Skate Parts & Accessories > Skate Lace Tighteners',
+    'Sporting Goods > Athletics > Figure Skating & Hockey > Ice Skates',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Altitude Training Masks',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Athletic Cups',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Ball Carrying Bags & Carts',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Ball Pump Accessories',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Ball Pump Accessories > Ball Pump Needles',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Ball Pumps',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Exercise & Gym Mat Storage Racks & Carts',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Grip Spray & Chalk',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Gym Mats',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Practice Nets & Screens',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Speed & Agility Ladders & Hurdles',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Sports & Agility Cones',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Sports Megaphones',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Sports Mouthguards',
+    'Sporting Goods > Athletics > General Purpose Athletic Equipment > Stadium Seats & Cushions',
+    'Sporting Goods > Athletics > Gymnastics',
+    'Sporting Goods > Athletics > Gymnastics > Gymnastics Bars & Balance Beams',
+    'Sporting Goods > Athletics > Gymnastics > Gymnastics Protective Gear',
+    'Sporting Goods > Athletics > Gymnastics > Gymnastics Protective Gear > Gymnastics Grips',
+    'Sporting Goods > Athletics > Gymnastics > Gymnastics Rings',
+    'Sporting Goods > Athletics > Gymnastics > Gymnastics Springboards',
+    'Sporting Goods > Athletics > Gymnastics > Pommel Horses',
+    'Sporting Goods > Athletics > Gymnastics > Vaulting Horses',
+    'Sporting Goods > Athletics > Racquetball & Squash',
+    'Sporting Goods > Athletics > Racquetball & Squash > Racquetball & Squash Balls',
+    'Sporting Goods > Athletics > Racquetball & Squash > Racquetball & Squash Eyewear',
+    'Sporting Goods > Athletics > Racquetball & Squash > Racquetball & Squash Gloves',
+    'Sporting Goods > Athletics > Racquetball & Squash > Racquetball Racquets',
+    'Sporting Goods > Athletics > Racquetball & Squash > Squash Racquets',
+    'Sporting Goods > Athletics > Rounders',
+    'Sporting Goods > Athletics > Rounders > Rounders Bats',
+    'Sporting Goods > Athletics > Rounders > Rounders Gloves',
+    'Sporting Goods > Athletics > Rugby',
+    'Sporting Goods > Athletics > Rugby > Rugby Balls',
+    'Sporting Goods > Athletics > Rugby > Rugby Gloves',
+    'Sporting Goods > Athletics > Rugby > Rugby Posts',
+    'Sporting Goods > Athletics > Rugby > Rugby Protective Gear',
+    'Sporting Goods > Athletics > Rugby > Rugby Protective Gear > Rugby Headgear',
+    'Sporting Goods > Athletics > Rugby > Rugby Training Aids',
+    'Sporting Goods > Athletics > Soccer',
+    'Sporting Goods > Athletics > Soccer > Soccer Balls',
+    'Sporting Goods > Athletics > Soccer > Soccer Corner Flags',
+    'Sporting Goods > Athletics > Soccer > Soccer Gloves',
+    'Sporting Goods > Athletics > Soccer > Soccer Goal Accessories',
+    'Sporting Goods > Athletics > Soccer > Soccer Goals',
+    'Sporting Goods > Athletics > Soccer > Soccer Protective Gear',
+    'Sporting Goods > Athletics > Soccer > Soccer Protective Gear > Soccer Shin Guards',
+    'Sporting Goods > Athletics > Team Handball',
+    'Sporting Goods > Athletics > Team Handball > Handballs',
+    'Sporting Goods > Athletics > Tennis',
+    'Sporting Goods > Athletics > Tennis > Tennis Ball Hoppers & Carts',
+    'Sporting Goods > Athletics > Tennis > Tennis Ball Machines',
+    'Sporting Goods > Athletics > Tennis > Tennis Ball Savers',
+    'Sporting Goods > Athletics > Tennis > Tennis Balls',
+    'Sporting Goods > Athletics > Tennis > Tennis Nets',
+    'Sporting Goods > Athletics > Tennis > Tennis Racquet Accessories',
+    'Sporting Goods > Athletics > Tennis > Tennis Racquet Accessories > Racquet Vibration Dampeners',
+    'Sporting Goods > Athletics > Tennis > Tennis Racquet Accessories > Tennis Racquet Bags',
+    'Sporting Goods > Athletics > Tennis > Tennis Racquet Accessories > Tennis Racquet Grips & Tape',
+    'Sporting Goods > Athletics > Tennis > Tennis Racquet Accessories > Tennis Racquet Grommets',
+    'Sporting Goods > Athletics > Tennis > Tennis Racquet Accessories > Tennis Racquet String',
+    'Sporting Goods > Athletics > Tennis > Tennis Racquets',
+    'Sporting Goods > Athletics > Track & Field',
+    'Sporting Goods > Athletics > Track & Field > Discus',
+    'Sporting Goods > Athletics > Track & Field > High Jump Crossbars',
+    'Sporting Goods > Athletics > Track & Field > High Jump Pits',
+    'Sporting Goods > Athletics > Track & Field > Javelins',
+    'Sporting Goods > Athletics > Track & Field > Pole Vault Pits',
+    'Sporting Goods > Athletics > Track & Field > Relay Batons',
+    'Sporting Goods > Athletics > Track & Field > Shot Puts',
+    'Sporting Goods > Athletics > Track & Field > Starter Pistols',
+    'Sporting Goods > Athletics > Track & Field > Throwing Hammers',
+    'Sporting Goods > Athletics > Track & Field > Track Hurdles',
+    'Sporting Goods > Athletics > Track & Field > Track Starting Blocks',
+    'Sporting Goods > Athletics > Track & Field > Vaulting Poles',
+    'Sporting Goods > Athletics > Volleyball',
+    'Sporting Goods > Athletics > Volleyball > Volleyball Nets',
+    'Sporting Goods > Athletics > Volleyball > Volleyball Protective Gear',
+    'Sporting Goods > Athletics > Volleyball > Volleyball Protective Gear > Volleyball Knee Pads',
+    'Sporting Goods > Athletics > Volleyball > Volleyball Training Aids',
+    'Sporting Goods > Athletics > Volleyball > Volleyballs',
+    'Sporting Goods > Athletics > Wallyball Equipment',
+    'Sporting Goods > Athletics > Water Polo',
+    'Sporting Goods > Athletics > Water Polo > Water Polo Balls',
+    'Sporting Goods > Athletics > Water Polo > Water Polo Caps',
+    'Sporting Goods > Athletics > Water Polo > Water Polo Goals',
+    'Sporting Goods > Athletics > Wrestling',
+    'Sporting Goods > Athletics > Wrestling > Wrestling Protective Gear',
+    'Sporting Goods > Athletics > Wrestling > Wrestling Protective Gear > Wrestling Headgear',
+    'Sporting Goods > Athletics > Wrestling > Wrestling Protective Gear > Wrestling Knee Pads',
+    'Sporting Goods > Exercise & Fitness',
+    'Sporting Goods > Exercise & Fitness > Ab Wheels & Rollers',
+    'Sporting Goods > Exercise & Fitness > Aerobic Steps',
+    'Sporting Goods > Exercise & Fitness > Balance Trainers',
+    'Sporting Goods > Exercise & Fitness > Cardio',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machine Accessories',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machine Accessories > Elliptical Trainer Accessories',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machine Accessories > Exercise Bike Accessories',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machine Accessories > Rowing Machine Accessories',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machine Accessories > Stair Climber & Stepper Accessories',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machine Accessories > Treadmill Accessories',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines > Elliptical Trainers',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines > Exercise Bikes',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines > Rowing Machines',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines > Stair Climbers & Steppers',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines > Stair Climbers & Steppers > Stair Climbers',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines > Stair Climbers & Steppers > Stair Steppers',
+    'Sporting Goods > Exercise & Fitness > Cardio > Cardio Machines > Treadmills',
+    'Sporting Goods > Exercise & Fitness > Cardio > Jump Ropes',
+    'Sporting Goods > Exercise & Fitness > Exercise Balls',
+    'Sporting Goods > Exercise & Fitness > Exercise Bands',
+    'Sporting Goods > Exercise & Fitness > Exercise Benches',
+    'Sporting Goods > Exercise & Fitness > Exercise Equipment Mats',
+    'Sporting Goods > Exercise & Fitness > Exercise Machine & Equipment Sets',
+    'Sporting Goods > Exercise & Fitness > Exercise Wedges',
+    'Sporting Goods > Exercise & Fitness > Foam Roller Accessories',
+    'Sporting Goods > Exercise & Fitness > Foam Roller Accessories > Foam Roller Storage Bags',
+    'Sporting Goods > Exercise & Fitness > Foam Rollers',
+    'Sporting Goods > Exercise & Fitness > Hand Exercisers',
+    'Sporting Goods > Exercise & Fitness > Inversion Tables & Systems',
+    'Sporting Goods > Exercise & Fitness > Medicine Balls',
+    'Sporting Goods > Exercise & Fitness > Power Towers',
+    'Sporting Goods > Exercise & Fitness > Push Up & Pull Up Bars',
+    'Sporting Goods > Exercise & Fitness > Reaction Balls',
+    'Sporting Goods > Exercise & Fitness > Speed & Resistance Parachutes',
+    'Sporting Goods > Exercise & Fitness > Sport Safety Lights & Reflectors',
+    'Sporting Goods > Exercise & Fitness > Stopwatches',
+    'Sporting Goods > Exercise & Fitness > Suspension Trainers',
+    'Sporting Goods > Exercise & Fitness > Vibration Exercise Machines',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Free Weight Accessories',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Free Weight Accessories > Free Weight Storage Racks',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Free Weight Accessories > Weight Bar Collars',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Free Weight Accessories > Weight Bars',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Free Weights',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Weight Lifting Belts',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Weight Lifting Gloves & Hand Supports',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Weight Lifting Machine & Exercise Bench Accessories',
+    'Sporting Goods > Exercise & Fitness > Weight Lifting > Weight Lifting Machines & Racks',
+    'Sporting Goods > Exercise & Fitness > Weighted Clothing',
+    'Sporting Goods > Exercise & Fitness > Yoga & Pilates',
+    'Sporting Goods > Exercise & Fitness > Yoga & Pilates > Pilates Machines',
+    'Sporting Goods > Exercise & Fitness > Yoga & Pilates > Yoga & Pilates Blocks',
+    'Sporting Goods > Exercise & Fitness > Yoga & Pilates > Yoga & Pilates Mats',
+    'Sporting Goods > Exercise & Fitness > Yoga & Pilates > Yoga & Pilates Towels',
+    'Sporting Goods > Exercise & Fitness > Yoga & Pilates > Yoga Mat Bags & Straps',
+    'Sporting Goods > Indoor Games',
+    'Sporting Goods > Indoor Games > Air Hockey',
+    'Sporting Goods > Indoor Games > Air Hockey > Air Hockey Equipment',
+    'Sporting Goods > Indoor Games > Air Hockey > Air Hockey Table Parts',
+    'Sporting Goods > Indoor Games > Air Hockey > Air Hockey Tables',
+    'Sporting Goods > Indoor Games > Billiards',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Ball Racks',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Balls',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Cue Accessories',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Cue Accessories > Billiard Cue Cases',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Cue Accessories > Billiard Cue Chalk',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Cue Accessories > Billiard Cue Racks',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Cues & Bridges',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Gloves',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Table Lights',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Table Parts & Accessories',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Table Parts & Accessories > Billiard Pockets',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Table Parts & Accessories > Billiard Table Brushes',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Table Parts & Accessories > Billiard Table Cloth',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Table Parts & Accessories > Billiard Table Covers',
+    'Sporting Goods > Indoor Games > Billiards > Billiard Tables',
+    'Sporting Goods > Indoor Games > Bowling',
+    'Sporting Goods > Indoor Games > Bowling > Bowling Ball Bags',
+    'Sporting Goods > Indoor Games > Bowling > Bowling Balls',
+    'Sporting Goods > Indoor Games > Bowling > Bowling Gloves',
+    'Sporting Goods > Indoor Games > Bowling > Bowling Pins',
+    'Sporting Goods > Indoor Games > Bowling > Bowling Wrist Supports',
+    'Sporting Goods > Indoor Games > Foosball',
+    'Sporting Goods > Indoor Games > Foosball > Foosball Balls',
+    'Sporting Goods > Indoor Games > Foosball > Foosball Table Parts & Accessories',
+    'Sporting Goods > Indoor Games > Foosball > Foosball Tables',
+    'Sporting Goods > Indoor Games > Multi-Game Tables',
+    'Sporting Goods > Indoor Games > Ping Pong',
+    'Sporting Goods > Indoor Games > Ping Pong > Ping Pong Balls',
+    'Sporting Goods > Indoor Games > Ping Pong > Ping Pong Nets & Posts',
+    'Sporting Goods > Indoor Games > Ping Pong > Ping Pong Paddle Accessories',
+    'Sporting Goods > Indoor Games > Ping Pong > Ping Pong Paddles & Sets',
+    'Sporting Goods > Indoor Games > Ping Pong > Ping Pong Robot Accessories',
+    'Sporting Goods > Indoor Games > Ping Pong > Ping Pong Robots',
+    'Sporting Goods > Indoor Games > Ping Pong > Ping Pong Tables',
+    'Sporting Goods > Indoor Games > Table Shuffleboard',
+    'Sporting Goods > Indoor Games > Table Shuffleboard > Shuffleboard Tables',
+    'Sporting Goods > Indoor Games > Table Shuffleboard > Table Shuffleboard Powder',
+    'Sporting Goods > Indoor Games > Table Shuffleboard > Table Shuffleboard Pucks',
+    'Sporting Goods > Indoor Games > Throwing Darts',
+    'Sporting Goods > Indoor Games > Throwing Darts > Dart Backboards',
+    'Sporting Goods > Indoor Games > Throwing Darts > Dart Parts',
+    'Sporting Goods > Indoor Games > Throwing Darts > Dart Parts > Dart Flights',
+    'Sporting Goods > Indoor Games > Throwing Darts > Dart Parts > Dart Shafts',
+    'Sporting Goods > Indoor Games > Throwing Darts > Dart Parts > Dart Tips',
+    'Sporting Goods > Indoor Games > Throwing Darts > Dartboards',
+    'Sporting Goods > Indoor Games > Throwing Darts > Darts',
+    'Sporting Goods > Outdoor Recreation',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Boating Gloves',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Canoe Accessories',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Canoes',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Kayak Accessories',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Kayaks',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Paddle Leashes',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Paddles & Oars',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Pedal Boats',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Row Boats',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Rafting > Whitewater Rafts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Drysuits',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Life Jacket Accessories',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Life Jackets',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Rash Guards & Swim Shirts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Water Sport Helmets',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Wetsuit Pieces',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Wetsuit Pieces > Wetsuit Bottoms',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Wetsuit Pieces > Wetsuit Hoods, Gloves & Boots',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Wetsuit Pieces > Wetsuit Tops',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Boating & Water Sport Apparel > Wetsuits',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Buoyancy Compensators',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Dive Computers',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Diving & Snorkeling Equipment Sets',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Diving & Snorkeling Fins',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Diving & Snorkeling Masks',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Diving Belts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Diving Knives & Shears',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Diving Regulators',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Diving & Snorkeling > Snorkels',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Kitesurfing',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Kitesurfing > Kiteboard Cases',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Kitesurfing > Kiteboard Parts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Kitesurfing > Kiteboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Kitesurfing > Kitesurfing & Windsurfing Harnesses',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Kitesurfing > Kitesurfing Kites',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Bodyboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Paddleboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Skimboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Surf Leashes',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Surfboard Cases & Bags',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Surfboard Fins',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Surfboard Wax',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Surfboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Surfing Gloves',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Surfing > Surfing Tail Pads',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Child Swimming Aids',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Hand Paddles',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Kickboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Pull Buoys',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swim Belts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swim Caps',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swim Gloves',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swim Goggle & Mask Accessories',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swim Goggles & Masks',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swim Weights',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swimming Fins',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swimming Fins > Monofins',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swimming Fins > Training Fins',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swimming Machines',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Swimming > Swimming Nose Clips',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Kneeboarding',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Kneeboarding > Kneeboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Towable Rafts & Tubes',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Towed Water Sport Gloves',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Wakeboarding',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Wakeboarding > Kiteboard & Wakeboard Bindings',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Wakeboarding > Wakeboard Parts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Wakeboarding > Wakeboards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Water Skiing',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Water Skiing > Sit-Down Hydrofoils',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Water Skiing > Water Ski Bindings',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Water Skiing > Water Ski Cases & Bags',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Water Skiing > Water Skis',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Towed Water Sports > Water Sport Tow Cables',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Watercraft Storage Racks',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Watercraft Storage Racks > Boat Storage Racks',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Watercraft Storage Racks > Water Sport Board Storage Racks',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Windsurfing',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Windsurfing > Windsurfing Board Parts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Windsurfing > Windsurfing Board Parts > Windsurfing Board Fins',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Windsurfing > Windsurfing Board Parts > Windsurfing Board Masts',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Windsurfing > Windsurfing Boards',
+    'Sporting Goods > Outdoor Recreation > Boating & Water Sports > Windsurfing > Windsurfing Sails',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camp Furniture',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camp Furniture > Air Mattress & Sleeping Pad Accessories',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camp Furniture > Air Mattresses',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camp Furniture > Cots',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camping Cookware & Dinnerware',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camping Lights & Lanterns',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camping Tools',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camping Tools > Hunting & Survival Knives',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Camping Tools > Multifunction Tools & Knives',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Chemical Hand Warmers',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Compression Sacks',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Hiking Pole Accessories',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Hiking Poles',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Mosquito Nets & Insect Screens',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Navigational Compasses',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Portable Toilets & Showers',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Portable Toilets & Showers > Portable Showers & Privacy Enclosures',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Portable Toilets & Showers > Portable Toilets & Urination Devices',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Portable Water Filters & Purifiers',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Sleeping Bag Liners',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Sleeping Bags',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Sleeping Pads',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Tent Accessories',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Tent Accessories > Inner Tents',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Tent Accessories > Tent Footprints',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Tent Accessories > Tent Poles & Stakes',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Tent Accessories > Tent Vestibules',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Tents',
+    'Sporting Goods > Outdoor Recreation > Camping & Hiking > Windbreaks',
+    'Sporting Goods > Outdoor Recreation > Climbing',
+    'Sporting Goods > Outdoor Recreation > Climbing > Belay Devices',
+    'Sporting Goods > Outdoor Recreation > Climbing > Carabiners',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Apparel & Accessories',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Apparel & Accessories > Climbing Gloves',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Apparel & Accessories > Climbing Helmets',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Apparel & Accessories > Crampons',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Ascenders & Descenders',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Chalk Bags',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Crash Pads',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Harnesses',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Protection Devices',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Rope',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Rope Bags',
+    'Sporting Goods > Outdoor Recreation > Climbing > Climbing Webbing',
+    'Sporting Goods > Outdoor Recreation > Climbing > Ice Climbing Tools',
+    'Sporting Goods > Outdoor Recreation > Climbing > Ice Screws',
+    'Sporting Goods > Outdoor Recreation > Climbing > Indoor Climbing Holds',
+    'Sporting Goods > Outdoor Recreation > Climbing > Quickdraws',
+    'Sporting Goods > Outdoor Recreation > Cycling',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Bags & Panniers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Baskets',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Bells & Horns',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Cages',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Child Seat Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Child Seats',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Computer Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Computers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Covers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Fenders',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Front & Rear Racks',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Handlebar Grips & Decor',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Locks',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Mirrors',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Pumps',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Saddle Pads & Seat Covers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Shock Pumps',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Spoke Beads',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Stands & Storage',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Tire Repair Supplies & Kits',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Toe Straps & Clips',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Tools',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Trailers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Trainers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Training Wheels',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Transport Bags & Cases',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Bicycle Water Sport Board Racks',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Accessories > Electric Bicycle Conversion Kits',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Brake Parts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Brake Parts > Bicycle Brake Calipers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Brake Parts > Bicycle Brake Levers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Brake Parts > Bicycle Brake Rotors',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Brake Parts > Bicycle Brake Sets',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Cable Housings',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Cables',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Bottom Brackets',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Cassettes & Freewheels',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Chainrings',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Chains',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Cranks',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Derailleurs',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Pedals',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Drivetrain Parts > Bicycle Shifters',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Forks',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Frames',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Groupsets',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Handlebar Extensions',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Handlebars',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Headset Parts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Headset Parts > Bicycle Headset Bearings',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Headset Parts > Bicycle Headset Spacers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Headsets',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Kickstands',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Saddles',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Seatpost Clamps',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Seatposts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Small Parts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Stems',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Tire Valve Adapters',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Tire Valve Caps',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Tire Valves',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Tires',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Tubes',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Foot Pegs',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Hub Parts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Hubs',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Rim Strips',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Spokes',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Wheel Axles & Skewers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Wheel Nipples',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheel Parts > Bicycle Wheel Rims',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycle Parts > Bicycle Wheels',
+    'Sporting Goods > Outdoor Recreation > Cycling > Bicycles',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Cleat Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Cleat Accessories > Bicycle Cleat Bolts',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Cleat Accessories > Bicycle Cleat Covers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Cleat Accessories > Bicycle Cleat Shims & Wedges',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Cleats',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Gloves',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Helmet Parts & Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Helmets',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Protective Pads',
+    'Sporting Goods > Outdoor Recreation > Cycling > Cycling Apparel & Accessories > Bicycle Shoe Covers',
+    'Sporting Goods > Outdoor Recreation > Cycling > Tricycle Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Tricycles',
+    'Sporting Goods > Outdoor Recreation > Cycling > Unicycle Accessories',
+    'Sporting Goods > Outdoor Recreation > Cycling > Unicycles',
+    'Sporting Goods > Outdoor Recreation > Equestrian',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Blankets & Sheets',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Boots & Leg Wraps',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Feed',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Fly Masks',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Grooming',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Grooming > Horse Clippers & Trimmers',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Grooming > Horse Grooming Combs, Brushes & Mitts',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Treats',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Vitamins & Supplements',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Care > Horse Wormers',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Bridle Bits',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Bridles',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Cinches',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Horse Halters',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Horse Harnesses',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Horse Leads',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Reins',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Saddles',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack > Stirrups',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack Accessories',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack Accessories > Horse Tack Boxes',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack Accessories > Saddle Accessories',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack Accessories > Saddle Accessories > Saddle Bags & Panniers',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack Accessories > Saddle Accessories > Saddle Covers & Cases',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack Accessories > Saddle Accessories > Saddle Pads & Blankets',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Horse Tack Accessories > Saddle Accessories > Saddle Racks',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Riding Apparel & Accessories',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Riding Apparel & Accessories > Equestrian Gloves',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Riding Apparel & Accessories > Equestrian Helmets',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Riding Apparel & Accessories > Riding Crops & Whips',
+    'Sporting Goods > Outdoor Recreation > Equestrian > Riding Apparel & Accessories > Riding Pants',
+    'Sporting Goods > Outdoor Recreation > Fishing',
+    'Sporting Goods > Outdoor Recreation > Fishing > Bite Alarms',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing & Hunting Waders',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Bait & Chum Containers',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Gaffs',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Hook Removal Tools',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Lines & Leaders',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Nets',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Reel Accessories',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Reel Accessories > Fishing Reel Bags & Cases',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Reel Accessories > Fishing Reel Lubricants',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Reel Accessories > Fishing Reel Replacement Spools',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Reels',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Rod Accessories',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Rod Accessories > Fishing Rod Bags & Cases',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Rod Accessories > Fishing Rod Holders & Storage Racks',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Rods',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Spears',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Tackle',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Tackle > Fishing Baits & Lures',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Tackle > Fishing Floats',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Tackle > Fishing Hooks',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Tackle > Fishing Sinkers',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Tackle > Fishing Snaps & Swivels',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fishing Traps',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fly Tying Materials',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fly Tying Materials > Fishing Beads',
+    'Sporting Goods > Outdoor Recreation > Fishing > Fly Tying Materials > Fishing Yarn',
+    'Sporting Goods > Outdoor Recreation > Fishing > Live Bait',
+    'Sporting Goods > Outdoor Recreation > Fishing > Tackle Bags & Boxes',
+    'Sporting Goods > Outdoor Recreation > Golf',
+    'Sporting Goods > Outdoor Recreation > Golf > Divot Tools',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Accessory Sets',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Bag Accessories',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Bag Accessories > Golf Bag Carts',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Bag Accessories > Golf Bag Covers & Cases',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Bags',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Ball Markers',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Balls',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Club Parts & Accessories',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Club Parts & Accessories > Golf Club Grips',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Club Parts & Accessories > Golf Club Headcovers',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Club Parts & Accessories > Golf Club Shafts',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Clubs',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Flags',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Gloves',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Tees',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Towels',
+    'Sporting Goods > Outdoor Recreation > Golf > Golf Training Aids',
+    'Sporting Goods > Outdoor Recreation > Hang Gliding & Skydiving',
+    'Sporting Goods > Outdoor Recreation > Hang Gliding & Skydiving > Air Suits',
+    'Sporting Goods > Outdoor Recreation > Hang Gliding & Skydiving > Hang Gliders',
+    'Sporting Goods > Outdoor Recreation > Hang Gliding & Skydiving > Parachutes',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Archery Armguards',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Archery Gloves & Releases',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Archery Targets',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Arrow Parts & Accessories',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Arrow Parts & Accessories > Arrow Fletchings',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Arrow Parts & Accessories > Arrow Nocks',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Arrow Parts & Accessories > Broadheads & Field Points',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Arrows & Bolts',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Bow & Crossbow Accessories',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Bows & Crossbows',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Bows & Crossbows > Compound Bows',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Bows & Crossbows > Crossbows',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Bows & Crossbows > Recurve & Longbows',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Archery > Quivers',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Clay Pigeon Shooting',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Clay Pigeon Shooting > Clay Pigeon Throwers',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Clay Pigeon Shooting > Clay Pigeons',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting & Shooting Protective Gear',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting & Shooting Protective Gear > Hunting & Shooting Gloves',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting & Shooting Protective Gear > Hunting & Shooting Jackets',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Animal Traps',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Hearing Enhancers',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Hunting Blinds & Screens',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Hunting Dog Equipment',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Tree Stands',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Wild Game Feeders',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Wildlife Attractants',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Wildlife Attractants > Cover Scents & Scent Attractants',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Wildlife Attractants > Hunting & Wildlife Calls',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Wildlife Attractants > Hunting & Wildlife Decoys',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Hunting > Wildlife Attractants > Wildlife Bait, Feed & Minerals',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Airsoft',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Airsoft > Airsoft Gun Parts & Accessories',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Airsoft > Airsoft Gun Parts & Accessories > Airsoft Gun Batteries',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Airsoft > Airsoft Guns',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Airsoft > Airsoft Pellets',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball & Airsoft Protective Gear',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball & Airsoft Protective Gear > Paintball & Airsoft Gloves',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball & Airsoft Protective Gear > Paintball & Airsoft Goggles & Masks',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball & Airsoft Protective Gear > Paintball & Airsoft Pads',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball & Airsoft Protective Gear > Paintball & Airsoft Vests',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Grenade Launchers',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Grenades',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Gun Parts & Accessories',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Gun Parts & Accessories > Paintball Air Tanks',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Gun Parts & Accessories > Paintball Gun Barrels',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Gun Parts & Accessories > Paintball Gun Drop Forwards',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Gun Parts & Accessories > Paintball Hoppers',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Guns',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintball Harnesses & Packs',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Paintball & Airsoft > Paintball > Paintballs',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Shooting & Range Accessories',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Shooting & Range Accessories > Shooting Rests',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Shooting & Range Accessories > Shooting Sticks & Bipods',
+    'Sporting Goods > Outdoor Recreation > Hunting & Shooting > Shooting & Range Accessories > Shooting Targets',
+    'Sporting Goods > Outdoor Recreation > Hydration System Accessories',
+    'Sporting Goods > Outdoor Recreation > Hydration Systems',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating > Inline & Roller Skating Protective Gear',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating > Inline & Roller Skating Protective Gear > Roller Skating Pads',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating > Inline Skate Parts',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating > Inline Skates',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating > Roller Skate Parts',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating > Roller Skates',
+    'Sporting Goods > Outdoor Recreation > Inline & Roller Skating > Roller Skis',
+    'Sporting Goods > Outdoor Recreation > Kite Buggying',
+    'Sporting Goods > Outdoor Recreation > Kite Buggying > Kite Buggies',
+    'Sporting Goods > Outdoor Recreation > Kite Buggying > Kite Buggy Accessories',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Badminton',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Badminton > Badminton Nets',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Badminton > Badminton Racquets & Sets',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Badminton > Shuttlecocks',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Deck Shuffleboard',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Deck Shuffleboard > Deck Shuffleboard Cues',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Deck Shuffleboard > Deck Shuffleboard Pucks',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Disc Golf',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Disc Golf > Disc Golf Bags',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Disc Golf > Disc Golf Baskets',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Lawn Games',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Paddle Ball Sets',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Pickleball',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Pickleball > Pickleball Paddles',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Pickleball > Pickleballs',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Platform & Paddle Tennis',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Platform & Paddle Tennis > Platform & Paddle Tennis Paddles',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Platform & Paddle Tennis > Platform Tennis Balls',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Tetherball',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Tetherball > Tetherball Poles',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Tetherball > Tetherball Sets',
+    'Sporting Goods > Outdoor Recreation > Outdoor Games > Tetherball > Tetherballs',
+    'Sporting Goods > Outdoor Recreation > Riding Scooters',
+    'Sporting Goods > Outdoor Recreation > Skateboarding',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skate Rails',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skate Ramps',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboard Parts',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboard Parts > Skateboard Decks',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboard Parts > Skateboard Small Parts',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboard Parts > Skateboard Trucks',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboard Parts > Skateboard Wheels',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboarding Protective Gear',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboarding Protective Gear > Skate Helmets',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboarding Protective Gear > Skateboarding Gloves',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboarding Protective Gear > Skateboarding Pads',
+    'Sporting Goods > Outdoor Recreation > Skateboarding > Skateboards',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Avalanche Safety',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Avalanche Safety > Avalanche Probes',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Avalanche Safety > Avalanche Safety Airbags',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Bags',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Goggle Accessories',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Goggle Accessories > Ski & Snowboard Goggle Lenses',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Goggles',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Helmets',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Leashes',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Storage Racks',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Tuning Tools',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski & Snowboard Wax',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski Binding Parts',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski Bindings',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski Boots',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Ski Poles',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Skis',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Skis > Cross-Country Skis',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Skis > Downhill Skis',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Snowboard Binding Parts',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Snowboard Bindings',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Snowboard Boots',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Skiing & Snowboarding > Snowboards',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Sleds',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Snowshoeing',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Snowshoeing > Snowshoe Bindings',
+    'Sporting Goods > Outdoor Recreation > Winter Sports & Activities > Snowshoeing > Snowshoes',
+    'Toys & Games',
+    'Toys & Games > Game Timers',
+    'Toys & Games > Games',
+    'Toys & Games > Games > Battle Top Accessories',
+    'Toys & Games > Games > Battle Tops',
+    'Toys & Games > Games > Bingo Sets',
+    'Toys & Games > Games > Blackjack & Craps Sets',
+    'Toys & Games > Games > Board Games',
+    'Toys & Games > Games > Card Game Accessories',
+    'Toys & Games > Games > Card Games',
+    'Toys & Games > Games > Dexterity Games',
+    'Toys & Games > Games > Dice Sets & Games',
+    'Toys & Games > Games > Poker Chip Accessories',
+    'Toys & Games > Games > Poker Chip Accessories > Poker Chip Carriers & Trays',
+    'Toys & Games > Games > Poker Chips & Sets',
+    'Toys & Games > Games > Portable Electronic Games',
+    'Toys & Games > Games > Roulette Wheels & Sets',
+    'Toys & Games > Games > Slot Machines',
+    'Toys & Games > Games > Tile Games',
+    'Toys & Games > Outdoor Play Equipment',
+    'Toys & Games > Outdoor Play Equipment > Inflatable Bouncer Accessories',
+    'Toys & Games > Outdoor Play Equipment > Inflatable Bouncers',
+    'Toys & Games > Outdoor Play Equipment > Play Swings',
+    'Toys & Games > Outdoor Play Equipment > Play Tents & Tunnels',
+    'Toys & Games > Outdoor Play Equipment > Playhouses',
+    'Toys & Games > Outdoor Play Equipment > Pogo Sticks',
+    'Toys & Games > Outdoor Play Equipment > Sandboxes',
+    'Toys & Games > Outdoor Play Equipment > See Saws',
+    'Toys & Games > Outdoor Play Equipment > Slides',
+    'Toys & Games > Outdoor Play Equipment > Stilts',
+    'Toys & Games > Outdoor Play Equipment > Swing Set & Playset Accessories',
+    'Toys & Games > Outdoor Play Equipment > Swing Sets & Playsets',
+    'Toys & Games > Outdoor Play Equipment > Trampoline Accessories',
+    'Toys & Games > Outdoor Play Equipment > Trampolines',
+    'Toys & Games > Outdoor Play Equipment > Water Play Equipment',
+    'Toys & Games > Outdoor Play Equipment > Water Play Equipment > Play Sprinkers',
+    'Toys & Games > Outdoor Play Equipment > Water Play Equipment > Water Parks & Slides',
+    'Toys & Games > Outdoor Play Equipment > Water Play Equipment > Water Tables',
+    'Toys & Games > Puzzles',
+    'Toys & Games > Puzzles > Jigsaw Puzzle Accessories',
+    'Toys & Games > Puzzles > Jigsaw Puzzles',
+    'Toys & Games > Puzzles > Mechanical Puzzles',
+    'Toys & Games > Puzzles > Wooden & Pegged Puzzles',
+    'Toys & Games > Toys',
+    'Toys & Games > Toys > Activity Toys',
+    'Toys & Games > Toys > Activity Toys > Ball & Cup Games',
+    'Toys & Games > Toys > Activity Toys > Bouncy Balls',
+    'Toys & Games > Toys > Activity Toys > Bubble Blowing Solution',
+    'Toys & Games > Toys > Activity Toys > Bubble Blowing Toys',
+    'Toys & Games > Toys > Activity Toys > Coiled Spring Toys',
+    'Toys & Games > Toys > Activity Toys > Marbles',
+    'Toys & Games > Toys > Activity Toys > Paddle Ball Toys',
+    'Toys & Games > Toys > Activity Toys > Ribbon & Streamer Toys',
+    'Toys & Games > Toys > Activity Toys > Spinning Tops',
+    'Toys & Games > Toys > Activity Toys > Toy Jacks',
+    'Toys & Games > Toys > Activity Toys > Yo-Yo Parts & Accessories',
+    'Toys & Games > Toys > Activity Toys > Yo-Yos',
+    'Toys & Games > Toys > Art & Drawing Toys',
+    'Toys & Games > Toys > Art & Drawing Toys > Play Dough & Putty',
+    'Toys & Games > Toys > Art & Drawing Toys > Toy Drawing Tablets',
+    'Toys & Games > Toys > Ball Pit Accessories',
+    'Toys & Games > Toys > Ball Pit Accessories > Ball Pit Balls',
+    'Toys & Games > Toys > Ball Pits',
+    'Toys & Games > Toys > Bath Toys',
+    'Toys & Games > Toys > Beach & Sand Toys',
+    'Toys & Games > Toys > Building Toys',
+    'Toys & Games > Toys > Building Toys > Construction Set Toys',
+    'Toys & Games > Toys > Building Toys > Foam Blocks',
+    'Toys & Games > Toys > Building Toys > Interlocking Blocks',
+    'Toys & Games > Toys > Building Toys > Marble Track Sets',
+    'Toys & Games > Toys > Building Toys > Wooden Blocks',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Action & Toy Figures',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Bobblehead Figures',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Doll & Action Figure Accessories',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Dollhouse Accessories',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Dollhouses',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Dolls',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Paper & Magnetic Dolls',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Puppet & Puppet Theater Accessories',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Puppet Theaters',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Puppets & Marionettes',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Stuffed Animals',
+    'Toys & Games > Toys > Dolls, Playsets & Toy Figures > Toy Playsets',
+    'Toys & Games > Toys > Educational Toys',
+    'Toys & Games > Toys > Educational Toys > Ant Farms',
+    'Toys & Games > Toys > Educational Toys > Astronomy Toys & Models',
+    'Toys & Games > Toys > Educational Toys > Bug Collecting Kits',
+    'Toys & Games > Toys > Educational Toys > Educational Flash Cards',
+    'Toys & Games > Toys > Educational Toys > Reading Toys',
+    'Toys & Games > Toys > Educational Toys > Science & Exploration Sets',
+    'Toys & Games > Toys > Educational Toys > Toy Abacuses',
+    'Toys & Games > Toys > Executive Toys',
+    'Toys & Games > Toys > Executive Toys > Magnet Toys',
+    'Toys & Games > Toys > Flying Toy Accessories',
+    'Toys & Games > Toys > Flying Toy Accessories > Kite Accessories',
+    'Toys & Games > Toys > Flying Toy Accessories > Kite Accessories > Kite Line Reels & Winders',
+    'Toys & Games > Toys > Flying Toys',
+    'Toys & Games > Toys > Flying Toys > Air & Water Rockets',
+    'Toys & Games > Toys > Flying Toys > Kites',
+    'Toys & Games > Toys > Flying Toys > Toy Gliders',
+    'Toys & Games > Toys > Flying Toys > Toy Parachutes',
+    'Toys & Games > Toys > Musical Toys',
+    'Toys & Games > Toys > Musical Toys > Toy Instruments',
+    'Toys & Games > Toys > Play Vehicle Accessories',
+    'Toys & Games > Toys > Play Vehicle Accessories > Toy Race Car & Track Accessories',
+    'Toys & Games > Toys > Play Vehicle Accessories > Toy Train Accessories',
+    'Toys & Games > Toys > Play Vehicles',
+    'Toys & Games > Toys > Play Vehicles > Toy Airplanes',
+    'Toys & Games > Toys > Play Vehicles > Toy Boats',
+    'Toys & Games > Toys > Play Vehicles > Toy Cars',
+    'Toys & Games > Toys > Play Vehicles > Toy Helicopters',
+    'Toys & Games > Toys > Play Vehicles > Toy Motorcycles',
+    'Toys & Games > Toys > Play Vehicles > Toy Race Car & Track Sets',
+    'Toys & Games > Toys > Play Vehicles > Toy Spaceships',
+    'Toys & Games > Toys > Play Vehicles > Toy Trains & Train Sets',
+    'Toys & Games > Toys > Play Vehicles > Toy Trucks & Construction Vehicles',
+    'Toys & Games > Toys > Pretend Play',
+    'Toys & Games > Toys > Pretend Play > Play Money & Banking',
+    'Toys & Games > Toys > Pretend Play > Pretend Electronics',
+    'Toys & Games > Toys > Pretend Play > Pretend Housekeeping',
+    'Toys & Games > Toys > Pretend Play > Pretend Lawn & Garden',
+    'Toys & Games > Toys > Pretend Play > Pretend Professions & Role Playing',
+    'Toys & Games > Toys > Pretend Play > Pretend Shopping & Grocery',
+    'Toys & Games > Toys > Pretend Play > Toy Kitchens & Play Food',
+    'Toys & Games > Toys > Pretend Play > Toy Kitchens & Play Food > Play Food',
+    'Toys & Games > Toys > Pretend Play > Toy Kitchens & Play Food > Toy Cookware',
+    'Toys & Games > Toys > Pretend Play > Toy Kitchens & Play Food > Toy Kitchens',
+    'Toys & Games > Toys > Pretend Play > Toy Kitchens & Play Food > Toy Tableware',
+    'Toys & Games > Toys > Pretend Play > Toy Tools',
+    'Toys & Games > Toys > Remote Control Toy Accessories',
+    'Toys & Games > Toys > Remote Control Toys',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Airships & Blimps',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Boats & Watercraft',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Cars & Trucks',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Helicopters',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Motorcycles',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Planes',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Robots',
+    'Toys & Games > Toys > Remote Control Toys > Remote Control Tanks',
+    'Toys & Games > Toys > Riding Toy Accessories',
+    'Toys & Games > Toys > Riding Toys',
+    'Toys & Games > Toys > Riding Toys > Electric Riding Vehicles',
+    'Toys & Games > Toys > Riding Toys > Hobby Horses',
+    'Toys & Games > Toys > Riding Toys > Push & Pedal Riding Vehicles',
+    'Toys & Games > Toys > Riding Toys > Rocking & Spring Riding Toys',
+    'Toys & Games > Toys > Riding Toys > Wagons',
+    'Toys & Games > Toys > Robotic Toys',
+    'Toys & Games > Toys > Sports Toy Accessories',
+    'Toys & Games > Toys > Sports Toy Accessories > Fitness Toy Accessories',
+    'Toys & Games > Toys > Sports Toy Accessories > Fitness Toy Accessories > Hula Hoop Accessories',
+    'Toys & Games > Toys > Sports Toys',
+    'Toys & Games > Toys > Sports Toys > American Football Toys',
+    'Toys & Games > Toys > Sports Toys > Baseball Toys',
+    'Toys & Games > Toys > Sports Toys > Basketball Toys',
+    'Toys & Games > Toys > Sports Toys > Boomerangs',
+    'Toys & Games > Toys > Sports Toys > Bowling Toys',
+    'Toys & Games > Toys > Sports Toys > Fingerboards & Fingerboard Sets',
+    'Toys & Games > Toys > Sports Toys > Fishing Toys',
+    'Toys & Games > Toys > Sports Toys > Fitness Toys',
+    'Toys & Games > Toys > Sports Toys > Fitness Toys > Hula Hoops',
+    'Toys & Games > Toys > Sports Toys > Flying Discs',
+    'Toys & Games > Toys > Sports Toys > Footbags',
+    'Toys & Games > Toys > Sports Toys > Golf Toys',
+    'Toys & Games > Toys > Sports Toys > Hockey Toys',
+    'Toys & Games > Toys > Sports Toys > Playground Balls',
+    'Toys & Games > Toys > Sports Toys > Racquet Sport Toys',
+    'Toys & Games > Toys > Toy Gift Baskets',
+    'Toys & Games > Toys > Toy Weapon & Gadget Accessories',
+    'Toys & Games > Toys > Toy Weapons & Gadgets',
+    'Toys & Games > Toys > Visual Toys',
+    'Toys & Games > Toys > Visual Toys > Kaleidoscopes',
+    'Toys & Games > Toys > Visual Toys > Prisms',
+    'Toys & Games > Toys > Wind-Up Toys',
+    'Vehicles & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Aircraft Parts & Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle A/V Players & In-Dash Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Amplifiers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Cassette Adapters',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Cassette Players',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Equalizers & Crossovers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Parking Cameras',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Speakerphones',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Speakers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Subwoofers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Electronics > Motor Vehicle Video Monitor Mounts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Braking',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Carpet & Upholstery',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Climate Control',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Controls',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Engine Oil Circulation',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Engine Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Engines',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Exhaust',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Frame & Body Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Fuel Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Interior Fittings',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Lighting',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Mirrors',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Power & Electrical Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Seating',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Sensors & Gauges',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Suspension Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Towing',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Transmission & Drivetrain Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Rims & Wheels',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Rims & Wheels > Automotive Rims & Wheels',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Rims & Wheels > Motorcycle Rims & Wheels',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Rims & Wheels > Off-Road and All-Terrain Vehicle Rims & Wheels',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Tire Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Tires',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Tires > Automotive Tires',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Tires > Motorcycle Tires',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Tires > Off-Road and All-Terrain Vehicle Tires',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Wheel Systems > Motor Vehicle Wheel Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Motor Vehicle Parts > Motor Vehicle Window Parts & Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Portable Fuel Cans',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Cleaning',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Cleaning > Car Wash Brushes',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Cleaning > Car Wash Solutions',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Cleaning > Vehicle Carpet & Upholstery Cleaners',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Cleaning > Vehicle Fuel Injection Cleaning Kits',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Cleaning > Vehicle Glass Cleaners',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Cleaning > Vehicle Waxes, Polishes & Protectants',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Golf Cart Enclosures',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Motor Vehicle Windshield Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Tonneau Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Hardtops',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Soft Tops',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Storage Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Storage Covers > Automotive Storage Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Storage Covers > Golf Cart Storage Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Storage Covers > Motorcycle Storage Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Storage Covers > Recreational Vehicle Storage Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Covers > Vehicle Storage Covers > Watercraft Storage Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Bumper Stickers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Air Fresheners',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Antenna Balls',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Dashboard Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Decals',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Decor Accessory Sets',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Display Flags',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Emblems & Hood Ornaments',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Hitch Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle License Plate Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle License Plate Frames',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle License Plate Mounts & Holders',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle License Plates',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Magnets',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Rear View Mirror Ornaments',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Shift Boots',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Shift Knobs',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Steering Wheel Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Decor > Vehicle Wraps',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Antifreeze',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Brake Fluid',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Cooling System Additives',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Engine Degreasers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Fuel System Cleaners',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Greases',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Hydraulic Clutch Fluid',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Motor Oil',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Performance Additives',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Power Steering Fluid',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Transmission Fluid',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Fluids > Vehicle Windshield Fluid',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Paint',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Paint > Motor Vehicle Body Paint',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Paint > Motor Vehicle Brake Caliper Paint',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Motor Vehicle Brake Service Kits',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Motor Vehicle Clutch Alignment & Removal Tools',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Vehicle Battery Chargers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Vehicle Battery Testers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Vehicle Body Filler',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Vehicle Diagnostic Scanners',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Vehicle Jump Starters',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Vehicle Jumper Cables',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Vehicle Tire Repair & Tire Changing Tools',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Maintenance, Care & Decor > Vehicle Repair & Specialty Tools > Windshield Repair Kits',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Chest & Back Protectors',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Elbow & Wrist Guards',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Gloves',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Goggles',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Hand Guards',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Helmet Parts & Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Helmets',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Kidney Belts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Knee & Shin Guards',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Motorcycle Protective Gear > Motorcycle Neck Braces',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Off-Road & All-Terrain Vehicle Protective Gear',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Off-Road & All-Terrain Vehicle Protective Gear > ATV & UTV Bar Pads',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Automotive Alarm Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Automotive Alarm Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Motorcycle Alarms & Locks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Door Locks & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Door Locks & Parts > Vehicle Door Lock Actuators',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Door Locks & Parts > Vehicle Door Lock Knobs',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Door Locks & Parts > Vehicle Door Locks & Locking Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Hitch Locks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Immobilizers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Remote Keyless Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Steering Wheel Locks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Alarms & Locks > Vehicle Wheel Clamps',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Car Window Nets',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Emergency Road Flares',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Motor Vehicle Airbag Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Motor Vehicle Roll Cages & Bars',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Vehicle Seat Belt Buckles',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Vehicle Seat Belt Covers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Vehicle Seat Belt Straps',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Vehicle Seat Belts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Vehicle Warning Whips',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Safety & Security > Vehicle Safety Equipment > Vehicle Wheel Chocks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Cargo Nets',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Rack Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Rack Accessories > Vehicle Bicycle Rack Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Rack Accessories > Vehicle Ski & Snowboard Rack Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Base Rack Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Bicycle Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Boat Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Cargo Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Fishing Rod Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Gun Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Motorcycle & Scooter Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Ski & Snowboard Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Carrying Racks > Vehicle Water Sport Board Racks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Loading Ramps',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Trailers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Trailers > Boat Trailers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Trailers > Horse & Livestock Trailers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Trailers > Travel Trailers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motor Vehicle Trailers > Utility & Cargo Trailers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Motorcycle Bags & Panniers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Truck Bed Storage Boxes & Organizers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Vehicle Headrest Hangers & Hooks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Vehicle Storage & Cargo > Vehicle Organizers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Anchor Chains',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Anchor Lines & Ropes',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Anchor Windlasses',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Anchors',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Boat Hooks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Boat Ladders',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Dock Cleats',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Docking & Anchoring > Dock Steps',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Sailboat Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Care',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Care > Watercraft Cleaners',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Care > Watercraft Polishes',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Alternators',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Carburetors & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Engine Controls',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Ignition Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Impellers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Motor Locks',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Motor Mounts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Pistons & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engine Parts > Watercraft Propellers',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Engines & Motors',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Exhaust Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Exhaust Parts > Watercraft Manifolds',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Exhaust Parts > Watercraft Mufflers & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Fuel Systems',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Fuel Systems > Watercraft Fuel Lines & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Fuel Systems > Watercraft Fuel Meters',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Fuel Systems > Watercraft Fuel Pumps & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Fuel Systems > Watercraft Fuel Tanks & Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Lighting',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Steering Parts',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Steering Parts > Watercraft Steering Cables',
+    'Vehicles & Parts > Vehicle Parts & Accessories > Watercraft Parts & Accessories > Watercraft Steering Parts > Watercraft Steering Wheels',
+    'Vehicles & Parts > Vehicles',
+    'Vehicles & Parts > Vehicles > Aircraft',
+    'Vehicles & Parts > Vehicles > Motor Vehicles',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Cars, Trucks & Vans',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Golf Carts',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Motorcycles & Scooters',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Off-Road and All-Terrain Vehicles',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Off-Road and All-Terrain Vehicles > ATVs & UTVs',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Off-Road and All-Terrain Vehicles > Go Karts & Dune Buggies',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Recreational Vehicles',
+    'Vehicles & Parts > Vehicles > Motor Vehicles > Snowmobiles',
+    'Vehicles & Parts > Vehicles > Watercraft',
+    'Vehicles & Parts > Vehicles > Watercraft > Motor Boats',
+    'Vehicles & Parts > Vehicles > Watercraft > Personal Watercraft',
+    'Vehicles & Parts > Vehicles > Watercraft > Sailboats',
+    'Vehicles & Parts > Vehicles > Watercraft > Yachts',
+)
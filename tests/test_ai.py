@@ -0,0 +1,55 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+import ai
+import models
+
+# A provider payload the SDK tolerates but Response.model_validate rejects (usage details incomplete).
+PAYLOAD = {
+    "id": "resp_1",
+    "model": "openai/gpt-5-nano",
+    "output": [
+        {"type": "reasoning", "summary": []},
+        {"type": "message", "content": [{"type": "output_text", "text": '{"name": 42}'}]},
+    ],
+    "usage": {
+        "input_tokens": 1_000_000,
+        "input_tokens_details": {},
+        "output_tokens": 1_000_000,
+        "output_tokens_details": {"reasoning_tokens": 0},
+    },
+}
+
+
+class _Raw:
+    http_response = SimpleNamespace(json=lambda: PAYLOAD)
+
+    def parse(self):
+        models.Category.model_validate({"name": 42})
+
+
+class _Client:
+    def __init__(self):
+        async def parse(**kwargs):
+            return _Raw()
+
+        self.responses = SimpleNamespace(with_raw_response=SimpleNamespace(parse=parse))
+
+
+def test_failed_validation_keeps_answer_id_and_cost(monkeypatch):
+    monkeypatch.setattr(ai, "_get_client", lambda: _Client())
+    with pytest.raises(ai.OutputValidationError) as info:
+        asyncio.run(ai._responses("openai/gpt-5-nano", "html", models.Category))
+    e = info.value
+    assert e.output_text == '{"name": 42}'
+    assert e.response_id == "resp_1"
+    assert e.cost == pytest.approx(0.05 + 0.40)
+    assert "name" in str(e)
+
+
+def test_failed_response_without_usage_costs_nothing():
+    failed = ai._failed_response({"id": "resp_2", "output": []})
+    assert (failed.id, failed.output_text, failed.usage) == ("resp_2", "", None)
+    assert ai._log_usage(failed) == 0.0
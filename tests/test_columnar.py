@@ -0,0 +1,26 @@
+from scripts import columnar
+
+
+def _product(brand: str, category: str) -> dict:
+    return {"name": "Tee", "brand": brand, "category": {"name": category}, "price": {"price": 10.0, "currency": "USD"}}
+
+
+def test_upsert_keeps_the_exported_layout(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, "PRODUCTS_PATH", tmp_path / "products.json")
+    out = tmp_path / "catalog"
+    columnar.export_catalog({"a.html": _product("Acme", "Apparel & Accessories > Clothing")}, "category", "arrow", out)
+
+    columnar.upsert_product("b.html", _product("Other", "Home & Garden > Decor"), out)
+    assert columnar.load_layout(out) == ("category", "arrow")
+    assert sorted(p.relative_to(out).as_posix() for p in out.rglob("part-0*")) == [
+        "category=Apparel%20%26%20Accessories/part-0.arrow",
+        "category=Home%20%26%20Garden/part-0.arrow",
+    ]
+
+
+def test_upsert_without_export_records_the_default_layout(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, "PRODUCTS_PATH", tmp_path / "products.json")
+    out = tmp_path / "catalog"
+    columnar.upsert_product("a.html", _product("Acme", "Apparel & Accessories"), out)
+    assert columnar.load_layout(out) == (columnar.DEFAULT_PARTITION, columnar.DEFAULT_FORMAT)
+    assert (out / "brand=Acme" / "part-0.parquet").exists()
@@ -0,0 +1,138 @@
+import asyncio
+
+import models
+import scripts.extract as extract
+
+
+class _Empty:
+    """Runnable whose model refuses: no parsed output, but the call is still charged."""
+
+    def __init__(self):
+        self.models: list[str] = []
+
+    async def ainvoke(self, inp: dict):
+        self.models.append(inp["model"])
+        return None, 0.001
+
+
+def _state(**kwargs) -> dict:
+    return {
+        "html_filtered": "<p>page</p>",
+        "html_content": "<p>page</p>",
+        "category": models.Category(name="Apparel & Accessories"),
+        "cascade": extract.MODEL_CASCADE,
+        "category_tier": 0,
+        "product_tier": 0,
+        **kwargs,
+    }
+
+
+def _stored() -> models.Product:
+    return models.Product(
+        name="Tee",
+        price=models.Price(price=30.0, currency="USD"),
+        description="",
+        key_features=[],
+        image_urls=["https://example.com/tee.jpg"],
+        category=models.Category(name="Apparel & Accessories"),
+        brand="Acme",
+        colors=[],
+        variants=[],
+    )
+
+
+def _run(node, router, state: dict, repeat: str) -> tuple[str, dict]:
+    """Run node until router leaves it; returns (next node, final state)."""
+    while True:
+        state.update(asyncio.run(node(state)))
+        route = router(state)
+        if route != repeat:
+            return route, state
+
+
+def test_empty_product_output_retries_and_escalates(monkeypatch):
+    runnable = _Empty()
+    monkeypatch.setattr(extract, "_runnables", lambda: {"product": runnable})
+    route, state = _run(extract._extract_product_node, extract._after_product, _state(), "extract_product")
+    assert route == "__end__"
+    assert state["product_attempt"] == extract.MAX_RETRIES
+    assert runnable.models == ["openai/gpt-5-nano"] * 2 + ["openai/gpt-5-mini"] * 2 + ["openai/gpt-5"]
+    assert state["llm_cost_so_far"] == 0.005
+
+
+def test_empty_category_output_is_a_failed_attempt(monkeypatch):
+    monkeypatch.setattr(extract, "_runnables", lambda: {"category": _Empty()})
+    update = asyncio.run(extract._extract_category_node(_state(category=None)))
+    assert update["category_attempt"] == 1
+    assert update["category_retry_error"] == extract.EMPTY_OUTPUT_ERROR
+    assert update["attempts"][0]["ok"] is False
+
+
+def test_empty_diff_falls_back_to_full_extraction(monkeypatch, tmp_path):
+    from scripts.fingerprints import FingerprintIndex
+
+    stored = _stored()
+    index = FingerprintIndex(tmp_path / "fingerprints.json")
+    index.upsert("a.html", [0] * 64, None, stored.model_dump())
+    monkeypatch.setattr(extract, "_fingerprint_index", lambda: index)
+    monkeypatch.setattr(extract, "_runnables", lambda: {"diff": _Empty()})
+    route, state = _run(
+        extract._extract_diff_node, extract._after_diff, _state(duplicate_of="a.html", duplicate_similarity=0.9), "extract_diff"
+    )
+    assert route == "extract_category"
+    assert state["diff_attempt"] == extract.DIFF_MAX_RETRIES
+    assert state.get("product") is None
+
+
+def test_empty_refresh_falls_back_to_full_extraction(monkeypatch):
+    stored = _stored()
+    monkeypatch.setattr(extract, "_runnables", lambda: {"refresh": _Empty()})
+    # No JSON-LD in the page, so every attempt goes to the LLM.
+    route, state = _run(
+        extract._refresh_price_node, extract._after_refresh, _state(refresh_product=stored.model_dump()), "refresh_price"
+    )
+    assert route == "prepare_context"
+    assert state["refresh_attempt"] == extract.REFRESH_MAX_RETRIES
+    assert state.get("refresh_source") is None
+
+
+class _Capture:
+    def __init__(self):
+        self.inputs: list[dict] = []
+
+    async def ainvoke(self, inp: dict):
+        self.inputs.append(inp)
+        return models.Category(name="Apparel & Accessories"), 0.0
+
+
+def test_category_retry_resends_page_without_stateful_provider(monkeypatch):
+    runnable = _Capture()
+    monkeypatch.setattr(extract, "_runnables", lambda: {"category": runnable})
+    context = {"output": '{"name": "x"}', "response_id": "resp_1", "model": "openai/gpt-5-nano"}
+    state = _state(category=None, category_retry_error="bad", category_retry_context=context, category_attempt=1)
+
+    monkeypatch.setattr(extract, "STATEFUL_RESPONSES", False)
+    asyncio.run(extract._extract_category_node(state))
+    monkeypatch.setattr(extract, "STATEFUL_RESPONSES", True)
+    asyncio.run(extract._extract_category_node(state))
+    assert "retry_context" not in runnable.inputs[0]
+    assert runnable.inputs[1]["retry_context"] == context
+
+
+def test_batched_output_writes_all_rows_once(monkeypatch):
+    writes = []
+    monkeypatch.setattr(extract, "_write_rows", lambda products: writes.append(dict(products)))
+
+    async def run():
+        with extract.batched_output():
+            # Pages run as separate tasks under the scheduler; they share the batch.
+            await asyncio.gather(*(asyncio.create_task(_upsert(name)) for name in ("a.html", "b.html")))
+            assert writes == []
+
+    async def _upsert(name):
+        extract._upsert_row(name, _stored())
+
+    asyncio.run(run())
+    assert [sorted(w) for w in writes] == [["a.html", "b.html"]]
+    extract._upsert_row("c.html", _stored())
+    assert sorted(writes[1]) == ["c.html"]
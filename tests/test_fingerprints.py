@@ -0,0 +1,100 @@
+from scripts.fingerprints import (
+    DIFF_THRESHOLD,
+    NUM_PERM,
+    FingerprintIndex,
+    content_digest,
+    signature,
+    similarity,
+)
+
+WORDS = [f"word{i}" for i in range(400)]
+
+
+def _page(words: list[str]) -> str:
+    return "<div><p>" + " ".join(words) + "</p></div>"
+
+
+def _index(tmp_path, **pages: str) -> FingerprintIndex:
+    index = FingerprintIndex(tmp_path / "fingerprints.json")
+    for name, html in pages.items():
+        index.upsert(name, signature(html), content_digest(html), {"name": name})
+    return index
+
+
+def test_signature_is_deterministic_and_ignores_markup():
+    sig = signature(_page(WORDS))
+    assert len(sig) == NUM_PERM
+    assert sig == signature(_page(WORDS))
+    assert sig == signature("<section>" + " ".join(WORDS).upper() + "</section>")
+
+
+def test_signature_needs_enough_text():
+    assert signature("<p>too short</p>") is None
+
+
+def test_similarity_tracks_shared_text():
+    base = signature(_page(WORDS))
+    variant = signature(_page(WORDS[:-2] + ["slate", "m"]))
+    unrelated = signature(_page([f"other{i}" for i in range(400)]))
+    assert similarity(base, base) == 1.0
+    assert similarity(base, variant) >= DIFF_THRESHOLD
+    assert similarity(base, unrelated) < DIFF_THRESHOLD
+
+
+def test_nearest_excludes_the_page_itself(tmp_path):
+    index = _index(tmp_path, **{"a.html": _page(WORDS)})
+    sig = signature(_page(WORDS))
+    assert index.nearest(sig) == ("a.html", 1.0)
+    assert index.nearest(sig, exclude="a.html") is None
+
+
+def test_identical_page_is_reused(tmp_path):
+    html = _page(WORDS)
+    index = _index(tmp_path, **{"a.html": html})
+    assert index.duplicate(signature(html), content_digest(html), exclude="b.html") == ("a.html", 1.0, "reuse")
+
+
+def test_variant_page_is_diffed_not_reused(tmp_path):
+    index = _index(tmp_path, **{"navy.html": _page(WORDS[:-1] + ["navy"])})
+    html = _page(WORDS[:-1] + ["slate"])
+    match = index.duplicate(signature(html), content_digest(html), exclude="slate.html")
+    assert match is not None
+    name, score, kind = match
+    assert (name, kind) == ("navy.html", "diff")
+    assert score >= DIFF_THRESHOLD
+
+
+def test_signature_equal_but_different_html_is_not_reused(tmp_path):
+    index = _index(tmp_path, **{"a.html": _page(WORDS)})
+    html = _page(WORDS) + "<span>price 42</span>"
+    assert index.duplicate(signature(_page(WORDS)), content_digest(html), exclude="b.html")[2] == "diff"
+
+
+def test_unrelated_page_is_extracted_from_scratch(tmp_path):
+    index = _index(tmp_path, **{"a.html": _page(WORDS)})
+    html = _page([f"other{i}" for i in range(400)])
+    assert index.duplicate(signature(html), content_digest(html), exclude="b.html") is None
+
+
+def test_reloaded_index_keeps_digests(tmp_path):
+    html = _page(WORDS)
+    _index(tmp_path, **{"a.html": html}).save()
+    reloaded = FingerprintIndex(tmp_path / "fingerprints.json")
+    assert reloaded.exact(content_digest(html)) == "a.html"
+    assert reloaded.exact(content_digest(html), exclude="a.html") is None
+
+
+def test_after_prepare_routes_on_duplicate_kind():
+    from scripts.extract import _after_prepare
+
+    assert _after_prepare({"duplicate_kind": "reuse", "duplicate_similarity": 1.0}) == "reuse_product"
+    assert _after_prepare({"duplicate_kind": "diff", "duplicate_similarity": 0.99}) == "extract_diff"
+    assert _after_prepare({"duplicate_kind": None, "duplicate_similarity": 0.5}) == "extract_category"
+
+
+def test_refreshed_product_is_stored_but_no_longer_reused(tmp_path):
+    html = _page(WORDS)
+    index = _index(tmp_path, **{"a.html": html})
+    index.update_product("a.html", {"name": "a.html", "price": 10})
+    assert index.product("a.html") == {"name": "a.html", "price": 10}
+    assert index.duplicate(signature(html), content_digest(html), exclude="b.html")[2] == "diff"
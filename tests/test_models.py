@@ -0,0 +1,48 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+import models
+
+
+def _product() -> models.Product:
+    return models.Product(
+        name="Tee",
+        price=models.Price(price=30.0, currency="USD", compare_at_price=40.0),
+        description="Cotton tee",
+        key_features=["Soft"],
+        image_urls=["https://example.com/tee.jpg"],
+        category=models.Category(name="Apparel & Accessories"),
+        brand="Acme",
+        colors=["Slate"],
+        variants=[
+            models.Variant(title="Size", options=[
+                models.OptionEntry(value="S"),
+                models.OptionEntry(value="M", available=False, price=32.0),
+            ]),
+        ],
+    )
+
+
+def test_wire_round_trip_is_lossless():
+    product = _product()
+    wire = models.ProductWire.from_product(product)
+    assert wire.to_product(product.category.name) == product
+
+
+def test_misaligned_option_prices_are_rejected():
+    with pytest.raises(ValidationError, match="vp has 1 prices for 2 options"):
+        models.VariantWire(t="Size", v=["S", "M"], vp=[32.0])
+
+
+def test_out_of_range_unavailable_index_is_rejected():
+    with pytest.raises(ValidationError, match=r"na indexes \[2\] are out of range"):
+        models.VariantWire(t="Size", v=["S", "M"], na=[2])
+
+
+def test_invalid_wire_fails_product_wire_parse():
+    data = models.ProductWire.from_product(_product()).model_dump()
+    data["var"][0]["na"] = [5]
+    with pytest.raises(ValidationError):
+        models.ProductWire.model_validate_json(json.dumps(data))
@@ -0,0 +1,27 @@
+from fastapi import Request
+
+from api.routers import products
+
+
+def _request(**headers) -> Request:
+    raw = [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def _payload() -> products._Payload:
+    return products._Payload(b'{"products":[' + b'{"name":"Tee"},' * 200 + b'{}]}')
+
+
+def test_gzip_follows_accept_encoding_q_values():
+    payload = _payload()
+    assert products._respond(_request(accept_encoding="gzip, br"), payload).headers.get("content-encoding") == "gzip"
+    assert products._respond(_request(accept_encoding="gzip;q=0, br"), payload).headers.get("content-encoding") is None
+    assert products._respond(_request(accept_encoding="*;q=0.5"), payload).headers.get("content-encoding") == "gzip"
+    assert products._respond(_request(accept_encoding="*, gzip;q=0"), payload).headers.get("content-encoding") is None
+
+
+def test_if_none_match_accepts_weak_tags_and_lists():
+    payload = _payload()
+    assert products._respond(_request(if_none_match=f'"other", W/{payload.etag}'), payload).status_code == 304
+    assert products._respond(_request(if_none_match=f"W/{payload.gzip_etag}"), payload).status_code == 304
+    assert products._respond(_request(if_none_match='"other"'), payload).status_code == 200
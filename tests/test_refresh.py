@@ -0,0 +1,66 @@
+import json
+
+import models
+from scripts import refresh
+
+
+def _stored() -> models.Product:
+    return models.Product(
+        name="Tee",
+        price=models.Price(price=30.0, currency="USD"),
+        description="",
+        key_features=[],
+        image_urls=["https://example.com/tee.jpg"],
+        category=models.Category(name="Apparel & Accessories"),
+        brand="Acme",
+        colors=["Slate", "Navy"],
+        variants=[
+            models.Variant(title="Color", options=[models.OptionEntry(value="Slate"), models.OptionEntry(value="Navy")]),
+            models.Variant(title="Size", options=[models.OptionEntry(value="S"), models.OptionEntry(value="M")]),
+        ],
+    )
+
+
+def _page(variants: list[dict]) -> str:
+    ld = {"@type": "ProductGroup", "name": "Tee", "offers": {"price": "28.00", "priceCurrency": "USD"}, "hasVariant": variants}
+    return f'<script type="application/ld+json">{json.dumps(ld)}</script>'
+
+
+def _availability(product_variants: list[models.Variant]) -> dict[str, bool]:
+    return {o.value: o.available for v in product_variants for o in v.options}
+
+
+def test_option_is_not_matched_by_word_prefix():
+    html = _page([
+        {"name": "Tee - Slate / M", "size": "M", "offers": {"availability": "https://schema.org/InStock"}},
+        {"name": "Tee - Slate / S", "size": "S", "offers": {"availability": "https://schema.org/InStock"}},
+        {"name": "Tee - Navy / S", "size": "S", "offers": {"availability": "https://schema.org/OutOfStock"}},
+        {"name": "Tee - Navy / M", "size": "M", "offers": {"availability": "https://schema.org/OutOfStock"}},
+    ])
+    price, variants = refresh.price_from_json_ld(html, _stored())
+    assert price.price == 28.0
+    assert _availability(variants) == {"Slate": True, "Navy": False, "S": True, "M": True}
+
+
+def test_option_matches_whole_name_parts():
+    html = _page([
+        {"name": "Tee - Slate / X-Large", "offers": {"availability": "https://schema.org/OutOfStock"}},
+        {"name": "Tee - Navy / X-Large", "offers": {"availability": "https://schema.org/OutOfStock"}},
+    ])
+    stored = _stored()
+    stored.variants[1].options.append(models.OptionEntry(value="X-Large"))
+    _, variants = refresh.price_from_json_ld(html, stored)
+    availability = _availability(variants)
+    assert availability["X-Large"] is False
+    # Slate and Navy are out of stock in X-Large only; their S and M variants are not listed.
+    assert availability["Slate"] is True and availability["Navy"] is True
+    assert availability["S"] is True
+
+
+def test_partially_listed_value_keeps_stored_availability():
+    html = _page([
+        {"name": "Tee - Navy / S", "offers": {"availability": "https://schema.org/OutOfStock"}},
+    ])
+    _, variants = refresh.price_from_json_ld(html, _stored())
+    # Navy / M and Slate / S are unlisted, so neither Navy nor S is known to be sold out.
+    assert _availability(variants) == {"Slate": True, "Navy": True, "S": True, "M": True}